@@ -0,0 +1,116 @@
+"""Base tables emenda_pix, emenda_history and user_preferences
+
+Até aqui essas tabelas eram criadas só por init_db (create_all). Criadas
+aqui no formato anterior às migrações seguintes, para que `alembic upgrade
+head` funcione num banco vazio; em bancos já criados por create_all a
+migração não faz nada.
+
+Revision ID: 1a7f3c9e5b20
+Revises: ef33e86f64db
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1a7f3c9e5b20'
+down_revision = 'ef33e86f64db'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('emenda_pix'):
+        op.create_table('emenda_pix',
+        sa.Column('id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('numero_emenda', sa.String(length=50), nullable=False),
+        sa.Column('ano', sa.Integer(), nullable=False),
+        sa.Column('tipo', sa.String(length=50), nullable=False),
+        sa.Column('autor_nome', sa.String(length=200), nullable=False),
+        sa.Column('autor_partido', sa.String(length=50), nullable=True),
+        sa.Column('autor_uf', sa.String(length=2), nullable=True),
+        sa.Column('destinatario_tipo', sa.String(length=50), nullable=False),
+        sa.Column('destinatario_nome', sa.String(length=200), nullable=False),
+        sa.Column('destinatario_uf', sa.String(length=2), nullable=True),
+        sa.Column('destinatario_cnpj', sa.String(length=18), nullable=True),
+        sa.Column('valor_aprovado', sa.Float(), nullable=False),
+        sa.Column('valor_empenhado', sa.Float(), nullable=True),
+        sa.Column('valor_liquidado', sa.Float(), nullable=True),
+        sa.Column('valor_pago', sa.Float(), nullable=True),
+        sa.Column('objetivo', sa.Text(), nullable=True),
+        sa.Column('area', sa.String(length=100), nullable=True),
+        sa.Column('descricao_detalhada', sa.Text(), nullable=True),
+        sa.Column('status_execucao', sa.String(length=50), nullable=False),
+        sa.Column('percentual_executado', sa.Float(), nullable=True),
+        sa.Column('data_inicio', sa.DateTime(), nullable=True),
+        sa.Column('data_prevista_conclusao', sa.DateTime(), nullable=True),
+        sa.Column('data_real_conclusao', sa.DateTime(), nullable=True),
+        sa.Column('plano_trabalho', sa.JSON(), nullable=True),
+        sa.Column('numero_metas', sa.Integer(), nullable=True),
+        sa.Column('metas_concluidas', sa.Integer(), nullable=True),
+        sa.Column('alertas', sa.JSON(), nullable=True),
+        sa.Column('analise_ia', sa.JSON(), nullable=True),
+        sa.Column('risco_desvio', sa.Float(), nullable=True),
+        sa.Column('tem_noticias', sa.Boolean(), nullable=True),
+        sa.Column('noticias_relacionadas', sa.JSON(), nullable=True),
+        sa.Column('documentos_comprobatórios', sa.JSON(), nullable=True),
+        sa.Column('fotos_georreferenciadas', sa.JSON(), nullable=True),
+        sa.Column('validacao_geofencing', sa.Boolean(), nullable=True),
+        sa.Column('processo_sei', sa.String(length=100), nullable=True),
+        sa.Column('link_portal_transparencia', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('last_sync', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_emenda_pix_numero_emenda'), 'emenda_pix', ['numero_emenda'], unique=True)
+        op.create_index(op.f('ix_emenda_pix_ano'), 'emenda_pix', ['ano'], unique=False)
+        op.create_index(op.f('ix_emenda_pix_autor_nome'), 'emenda_pix', ['autor_nome'], unique=False)
+
+    if not inspector.has_table('emenda_history'):
+        op.create_table('emenda_history',
+        sa.Column('id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('emenda_id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('status_anterior', sa.String(length=50), nullable=True),
+        sa.Column('status_novo', sa.String(length=50), nullable=False),
+        sa.Column('percentual_anterior', sa.Float(), nullable=True),
+        sa.Column('percentual_novo', sa.Float(), nullable=False),
+        sa.Column('valor_pago_anterior', sa.Float(), nullable=True),
+        sa.Column('valor_pago_novo', sa.Float(), nullable=True),
+        sa.Column('changed_by', sa.String(length=255), nullable=True),
+        sa.Column('change_reason', sa.String(length=500), nullable=True),
+        sa.Column('extra_data', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['emenda_id'], ['emenda_pix.id']),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_emenda_history_emenda_id'), 'emenda_history', ['emenda_id'], unique=False)
+        op.create_index(op.f('ix_emenda_history_created_at'), 'emenda_history', ['created_at'], unique=False)
+
+    if not inspector.has_table('user_preferences'):
+        op.create_table('user_preferences',
+        sa.Column('id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('user_email', sa.String(length=255), nullable=False),
+        sa.Column('user_phone', sa.String(length=20), nullable=True),
+        sa.Column('email_notifications_enabled', sa.Boolean(), nullable=True),
+        sa.Column('sms_notifications_enabled', sa.Boolean(), nullable=True),
+        sa.Column('notify_on_delay', sa.Boolean(), nullable=True),
+        sa.Column('notify_on_status_change', sa.Boolean(), nullable=True),
+        sa.Column('notify_on_risk_alert', sa.Boolean(), nullable=True),
+        sa.Column('favorite_emendas', sa.JSON(), nullable=True),
+        sa.Column('preferences', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_user_preferences_user_email'), 'user_preferences', ['user_email'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_table('user_preferences')
+    op.drop_table('emenda_history')
+    op.drop_table('emenda_pix')
@@ -0,0 +1,28 @@
+"""Add (created_at, id) index for keyset pagination on emenda_pix
+
+Revision ID: 3b8f1c2d9a47
+Revises: 1a7f3c9e5b20
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8f1c2d9a47'
+down_revision = '1a7f3c9e5b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # emenda_pix é criada por init_db (create_all); IF NOT EXISTS mantém
+    # a migração idempotente em bancos novos e existentes
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_pix_created_at_id "
+        "ON emenda_pix (created_at, id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_emenda_pix_created_at_id")
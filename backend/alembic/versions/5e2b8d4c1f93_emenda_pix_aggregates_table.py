@@ -0,0 +1,53 @@
+"""Create emenda_pix_aggregates
+
+Tabela de agregados do placar, antes criada só por init_db. Precisa existir
+antes da migração de busca por trigramas, que adiciona chave_busca a ela.
+
+Revision ID: 5e2b8d4c1f93
+Revises: 3b8f1c2d9a47
+Create Date: 2026-10-16 09:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2b8d4c1f93'
+down_revision = '3b8f1c2d9a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table('emenda_pix_aggregates'):
+        return
+
+    op.create_table('emenda_pix_aggregates',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('dimensao', sa.String(length=20), nullable=False),
+    sa.Column('chave', sa.String(length=200), nullable=False),
+    sa.Column('uf', sa.String(length=2), nullable=True),
+    sa.Column('area', sa.String(length=100), nullable=True),
+    sa.Column('ano', sa.Integer(), nullable=False),
+    sa.Column('total_emendas', sa.Integer(), nullable=False),
+    sa.Column('valor_total_aprovado', sa.Float(), nullable=False),
+    sa.Column('valor_total_pago', sa.Float(), nullable=False),
+    sa.Column('valor_total_executado', sa.Float(), nullable=False),
+    sa.Column('soma_percentual_executado', sa.Float(), nullable=False),
+    sa.Column('emendas_atrasadas', sa.Integer(), nullable=False),
+    sa.Column('total_alertas', sa.Integer(), nullable=False),
+    sa.Column('status_pendente', sa.Integer(), nullable=False),
+    sa.Column('status_em_execucao', sa.Integer(), nullable=False),
+    sa.Column('status_concluida', sa.Integer(), nullable=False),
+    sa.Column('status_atrasada', sa.Integer(), nullable=False),
+    sa.Column('status_cancelada', sa.Integer(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_emenda_pix_aggregates_dimensao_chave', 'emenda_pix_aggregates', ['dimensao', 'chave'], unique=False)
+    op.create_index('ix_emenda_pix_aggregates_dimensao_ano', 'emenda_pix_aggregates', ['dimensao', 'ano'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table('emenda_pix_aggregates')
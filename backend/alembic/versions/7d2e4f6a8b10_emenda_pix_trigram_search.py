@@ -0,0 +1,55 @@
+"""Accent-insensitive search columns and pg_trgm indexes on emenda_pix
+
+Revision ID: 7d2e4f6a8b10
+Revises: 5e2b8d4c1f93
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2e4f6a8b10'
+down_revision = '5e2b8d4c1f93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+
+    # Colunas normalizadas (lower(unaccent(...))); novas escritas são
+    # normalizadas pelo repositório (normalize_search_text)
+    op.execute("ALTER TABLE emenda_pix ADD COLUMN IF NOT EXISTS autor_nome_busca VARCHAR(200)")
+    op.execute("ALTER TABLE emenda_pix ADD COLUMN IF NOT EXISTS destinatario_nome_busca VARCHAR(200)")
+    op.execute(
+        "UPDATE emenda_pix SET "
+        "autor_nome_busca = lower(unaccent(autor_nome)), "
+        "destinatario_nome_busca = lower(unaccent(destinatario_nome))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_pix_autor_nome_busca_trgm "
+        "ON emenda_pix USING gin (autor_nome_busca gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_pix_destinatario_nome_busca_trgm "
+        "ON emenda_pix USING gin (destinatario_nome_busca gin_trgm_ops)"
+    )
+
+    # Busca do Placar de Transparência
+    op.execute("ALTER TABLE emenda_pix_aggregates ADD COLUMN IF NOT EXISTS chave_busca VARCHAR(200)")
+    op.execute("UPDATE emenda_pix_aggregates SET chave_busca = lower(unaccent(chave))")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_pix_aggregates_chave_busca_trgm "
+        "ON emenda_pix_aggregates USING gin (chave_busca gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_emenda_pix_aggregates_chave_busca_trgm")
+    op.execute("ALTER TABLE emenda_pix_aggregates DROP COLUMN IF EXISTS chave_busca")
+    op.execute("DROP INDEX IF EXISTS ix_emenda_pix_destinatario_nome_busca_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_emenda_pix_autor_nome_busca_trgm")
+    op.execute("ALTER TABLE emenda_pix DROP COLUMN IF EXISTS destinatario_nome_busca")
+    op.execute("ALTER TABLE emenda_pix DROP COLUMN IF EXISTS autor_nome_busca")
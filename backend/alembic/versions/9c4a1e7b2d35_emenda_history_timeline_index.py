@@ -0,0 +1,33 @@
+"""Add (emenda_id, created_at) index for emenda_history timelines
+
+Revision ID: 9c4a1e7b2d35
+Revises: 7d2e4f6a8b10
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4a1e7b2d35'
+down_revision = '7d2e4f6a8b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # emenda_history é criada por init_db (create_all)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_history_emenda_id_created_at "
+        "ON emenda_history (emenda_id, created_at)"
+    )
+    # Coberto pelo índice composto (prefixo emenda_id)
+    op.execute("DROP INDEX IF EXISTS ix_emenda_history_emenda_id")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_history_emenda_id "
+        "ON emenda_history (emenda_id)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_emenda_history_emenda_id_created_at")
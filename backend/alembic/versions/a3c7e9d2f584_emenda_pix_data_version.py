@@ -0,0 +1,29 @@
+"""Add emenda_pix_data_version deletion counter
+
+Revision ID: a3c7e9d2f584
+Revises: e8b3f5a2c917
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c7e9d2f584'
+down_revision = 'e8b3f5a2c917'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Remoções entram na versão dos dados (ETags) sem count(*) na emenda_pix
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS emenda_pix_data_version ("
+        "id INTEGER PRIMARY KEY, "
+        "deletions BIGINT NOT NULL DEFAULT 0, "
+        "last_deleted_at TIMESTAMP WITHOUT TIME ZONE)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS emenda_pix_data_version")
@@ -0,0 +1,48 @@
+"""Persist Trust Score columns on emenda_pix
+
+Revision ID: b7e5d2c8f413
+Revises: 9c4a1e7b2d35
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e5d2c8f413'
+down_revision = '9c4a1e7b2d35'
+branch_labels = None
+depends_on = None
+
+
+TRUST_COLUMNS = (
+    ("trust_score", "DOUBLE PRECISION"),
+    ("trust_level", "VARCHAR(20)"),
+    ("trust_execucao", "DOUBLE PRECISION"),
+    ("trust_tempo", "DOUBLE PRECISION"),
+    ("trust_documentacao", "DOUBLE PRECISION"),
+    ("trust_risco", "DOUBLE PRECISION"),
+    ("trust_historico", "DOUBLE PRECISION"),
+    ("trust_inputs_hash", "VARCHAR(32)"),
+    ("trust_computed_at", "TIMESTAMP WITHOUT TIME ZONE"),
+)
+
+
+def upgrade() -> None:
+    for name, type_ in TRUST_COLUMNS:
+        op.execute(f"ALTER TABLE emenda_pix ADD COLUMN IF NOT EXISTS {name} {type_}")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_pix_trust_score_id "
+        "ON emenda_pix (trust_score, id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_pix_trust_level "
+        "ON emenda_pix (trust_level)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_emenda_pix_trust_level")
+    op.execute("DROP INDEX IF EXISTS ix_emenda_pix_trust_score_id")
+    for name, _ in reversed(TRUST_COLUMNS):
+        op.execute(f"ALTER TABLE emenda_pix DROP COLUMN IF EXISTS {name}")
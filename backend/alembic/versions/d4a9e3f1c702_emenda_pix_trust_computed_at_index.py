@@ -0,0 +1,27 @@
+"""Add trust_computed_at index for the emenda data version
+
+Revision ID: d4a9e3f1c702
+Revises: b7e5d2c8f413
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a9e3f1c702'
+down_revision = 'b7e5d2c8f413'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # max(trust_computed_at) entra nos ETags das listagens
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_pix_trust_computed_at "
+        "ON emenda_pix (trust_computed_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_emenda_pix_trust_computed_at")
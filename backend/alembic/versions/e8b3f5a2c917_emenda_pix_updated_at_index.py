@@ -0,0 +1,27 @@
+"""Add updated_at index for the emenda data version
+
+Revision ID: e8b3f5a2c917
+Revises: d4a9e3f1c702
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b3f5a2c917'
+down_revision = 'd4a9e3f1c702'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # max(updated_at) entra nos ETags das listagens
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emenda_pix_updated_at "
+        "ON emenda_pix (updated_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_emenda_pix_updated_at")
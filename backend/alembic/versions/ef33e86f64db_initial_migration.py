@@ -17,6 +17,10 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # Bancos criados por init_db (create_all) já têm a tabela
+    if sa.inspect(op.get_bind()).has_table('legislations'):
+        return
+
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table('legislations',
     sa.Column('id', sa.UUID(as_uuid=False), nullable=False),
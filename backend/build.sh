@@ -7,5 +7,8 @@ echo "🔨 Building VigiaPix Backend..."
 pip install --upgrade pip
 pip install -r requirements.txt
 
+# Apply database migrations
+alembic upgrade head
+
 echo "✅ Build complete!"
 
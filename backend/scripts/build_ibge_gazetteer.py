@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Regenera o gazetteer de municípios usado no geofencing
+
+Ferramenta de manutenção: o arquivo gerado é versionado no repositório e os
+deploys não rodam este script. Rode quando o IBGE criar ou renomear
+municípios e revise o diff antes de commitar.
+
+Nome, código e UF vêm da API de localidades do IBGE; os centroides (latitude
+e longitude da sede municipal, também do IBGE) vêm da compilação
+kelvins/municipios-brasileiros, fixada num commit para que os dados só mudem
+quando o commit mudar. Grava src/infrastructure/validation/data/municipios.csv.gz
+(ou o caminho de IBGE_GAZETTEER_PATH).
+
+    python scripts/build_ibge_gazetteer.py --centroides-sha <sha do commit> [--output caminho.csv.gz]
+"""
+import argparse
+import csv
+import gzip
+import io
+import os
+import re
+import sys
+
+import httpx
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.validation.gazetteer import FIELDS, GAZETTEER_PATH
+
+IBGE_MUNICIPIOS_URL = "https://servicodados.ibge.gov.br/api/v1/localidades/municipios"
+# {sha}: commit completo de kelvins/municipios-brasileiros (nunca um branch)
+CENTROIDES_URL = "https://raw.githubusercontent.com/kelvins/municipios-brasileiros/{sha}/csv/municipios.csv"
+COMMIT_SHA = re.compile(r"^[0-9a-f]{40}$")
+TOTAL_ESPERADO = 5570
+
+
+def fetch_municipios(client: httpx.Client) -> dict:
+    """codigo_ibge -> (nome, uf)"""
+    response = client.get(IBGE_MUNICIPIOS_URL)
+    response.raise_for_status()
+    return {m["id"]: (m["nome"], _uf(m)) for m in response.json()}
+
+
+def _uf(municipio: dict) -> str:
+    # Municípios recentes podem vir sem microrregião; a região imediata sempre vem
+    if municipio.get("microrregiao"):
+        return municipio["microrregiao"]["mesorregiao"]["UF"]["sigla"]
+    return municipio["regiao-imediata"]["regiao-intermediaria"]["UF"]["sigla"]
+
+
+def fetch_centroides(client: httpx.Client, sha: str) -> dict:
+    """codigo_ibge -> (latitude, longitude), do commit `sha`"""
+    response = client.get(CENTROIDES_URL.format(sha=sha))
+    response.raise_for_status()
+    return {
+        int(row["codigo_ibge"]): (float(row["latitude"]), float(row["longitude"]))
+        for row in csv.DictReader(io.StringIO(response.text))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--output", default=str(GAZETTEER_PATH))
+    parser.add_argument(
+        "--centroides-sha", required=True,
+        help="commit (SHA completo) de kelvins/municipios-brasileiros com os centroides"
+    )
+    args = parser.parse_args()
+
+    if not COMMIT_SHA.match(args.centroides_sha):
+        parser.error("--centroides-sha deve ser o SHA completo (40 caracteres hex) de um commit")
+
+    with httpx.Client(timeout=60.0, follow_redirects=True) as client:
+        municipios = fetch_municipios(client)
+        centroides = fetch_centroides(client, args.centroides_sha)
+
+    sem_centroide = sorted(set(municipios) - set(centroides))
+    if sem_centroide:
+        print(f"⚠️  {len(sem_centroide)} municípios sem centroide (ignorados): {sem_centroide[:10]}")
+
+    rows = [
+        (codigo, nome, uf, *centroides[codigo])
+        for codigo, (nome, uf) in sorted(municipios.items())
+        if codigo in centroides
+    ]
+    if len(rows) < TOTAL_ESPERADO:
+        print(f"⚠️  Esperados {TOTAL_ESPERADO} municípios, gerados {len(rows)}")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    # mtime=0: o mesmo conteúdo gera o mesmo arquivo (diff só quando os dados mudam)
+    with gzip.GzipFile(args.output, "wb", mtime=0) as raw:
+        with io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            writer.writerows(rows)
+
+    print(f"✅ {len(rows)} municípios gravados em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
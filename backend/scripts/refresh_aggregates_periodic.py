@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Script para recálculo periódico dos agregados do Placar de Transparência
+
+Os agregados são atualizados a cada escrita, mas "atrasada" depende da data:
+uma emenda que passa da data prevista de conclusão sem nenhuma escrita só
+entra em emendas_atrasadas no próximo recálculo completo. Rodar diariamente
+mantém o placar e os benchmarks com no máximo um dia de defasagem nesse
+contador.
+
+Exemplo de crontab (executar diariamente à 0h05):
+5 0 * * * /usr/bin/python3 /path/to/backend/scripts/refresh_aggregates_periodic.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.infrastructure.persistence.postgres.database import AsyncSessionLocal, init_db, close_db
+from src.infrastructure.persistence.postgres.emenda_aggregate_repository_impl import PostgresEmendaAggregateRepository
+import structlog
+
+logger = structlog.get_logger()
+
+
+async def refresh_aggregates():
+    """Recalcula todos os agregados de emendas"""
+    try:
+        await init_db()
+
+        async with AsyncSessionLocal() as session:
+            logger.info("refresh_aggregates_periodic_started")
+            await PostgresEmendaAggregateRepository(session).refresh_all()
+
+        logger.info("refresh_aggregates_periodic_completed")
+        print("✅ Agregados do placar recalculados")
+        return 0
+
+    except Exception as e:
+        logger.error("refresh_aggregates_periodic_error", error=str(e))
+        print(f"❌ Erro fatal: {str(e)}")
+        return 1
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(refresh_aggregates())
+    sys.exit(exit_code)
@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.infrastructure.persistence.postgres.database import AsyncSessionLocal, init_db, close_db
 from src.infrastructure.persistence.postgres.emenda_pix_repository_impl import PostgresEmendaPixRepository
 from src.application.use_cases.emenda_pix.sync_emendas_portal import SyncEmendasPortalUseCase
+from src.application.use_cases.emenda_pix.refresh_trust_scores import RefreshTrustScoresUseCase
 import structlog
 
 logger = structlog.get_logger()
@@ -49,18 +50,27 @@ async def sync_emendas():
             )
             
             if result["success"]:
+                # Recalcular agregados do placar/benchmarks (inclui contagem de
+                # atrasadas, que muda com a passagem do tempo)
+                await repository.refresh_aggregates()
+                # Trust Scores das emendas novas, alteradas ou que passaram do prazo
+                trust = await RefreshTrustScoresUseCase(repository).execute()
+                
                 logger.info(
                     "sync_periodic_completed",
                     total_fetched=result["total_fetched"],
                     total_saved=result["total_saved"],
                     total_updated=result["total_updated"],
+                    total_unchanged=result["total_unchanged"],
                     total_errors=result["total_errors"]
                 )
                 print(f"✅ Sincronização concluída:")
                 print(f"   - Buscadas: {result['total_fetched']}")
                 print(f"   - Novas: {result['total_saved']}")
                 print(f"   - Atualizadas: {result['total_updated']}")
+                print(f"   - Sem alteração: {result['total_unchanged']}")
                 print(f"   - Erros: {result['total_errors']}")
+                print(f"   - Trust Scores recalculados: {trust.get('updated', 0)}")
                 return 0
             else:
                 logger.error("sync_periodic_failed", message=result["message"])
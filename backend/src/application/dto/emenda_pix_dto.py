@@ -1,6 +1,7 @@
 """Emenda Pix DTOs"""
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from pydantic import BaseModel, TypeAdapter
+from typing import Optional, List, Dict, Sequence, Tuple
+from typing_extensions import TypedDict
 from datetime import datetime
 
 
@@ -63,6 +64,10 @@ class EmendaPixDTO(BaseModel):
     processo_sei: Optional[str] = None  # Número do processo no CEIS
     link_portal_transparencia: Optional[str] = None
     
+    # Trust Score persistido (recalculado em lote)
+    trust_score: Optional[float] = None
+    trust_level: Optional[str] = None
+    
     # Timestamps
     created_at: datetime
     updated_at: datetime
@@ -72,10 +77,79 @@ class EmendaPixDTO(BaseModel):
         from_attributes = True
 
 
+# Projeção padrão dos endpoints de lista/busca: o que a listagem exibe
+EMENDA_LIST_FIELDS: Tuple[str, ...] = (
+    "id", "numero_emenda", "ano", "tipo",
+    "autor_nome", "autor_partido", "autor_uf",
+    "destinatario_tipo", "destinatario_nome", "destinatario_uf",
+    "valor_aprovado", "valor_pago", "objetivo", "area",
+    "status_execucao", "percentual_executado", "alertas",
+    "created_at", "updated_at",
+)
+
+
+def resolve_fields(fields: Optional[str]) -> List[str]:
+    """
+    Resolve the fields= query parameter (comma-separated EmendaPixDTO fields)
+    
+    None/empty -> EMENDA_LIST_FIELDS; 'all' or '*' -> every field.
+    `id` is always included. Raises ValueError on unknown fields.
+    """
+    if not fields or not fields.strip():
+        return list(EMENDA_LIST_FIELDS)
+    if fields.strip() in ("all", "*"):
+        return list(EmendaPixDTO.model_fields)
+    
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in EmendaPixDTO.model_fields]
+    if unknown:
+        raise ValueError(f"Campos desconhecidos em fields: {', '.join(unknown)}")
+    return ["id"] + [f for f in dict.fromkeys(requested) if f != "id"]
+
+
+# Item das respostas com fields=: só as chaves pedidas (TypedDict parcial)
+EmendaPixFields = TypedDict(
+    "EmendaPixFields",
+    {name: Optional[field.annotation] for name, field in EmendaPixDTO.model_fields.items()},
+    total=False
+)
+
+# Conversão em lote: uma única chamada de validação para a página inteira
+_FIELDS_ITEMS_ADAPTER = TypeAdapter(List[EmendaPixFields])
+
+
+def to_fields_items(entities: Sequence, fields: List[str]) -> List[Dict]:
+    """Build the list items (dicts with only `fields`) in one TypeAdapter call"""
+    return _FIELDS_ITEMS_ADAPTER.validate_python(
+        [{name: getattr(entity, name) for name in fields} for entity in entities]
+    )
+
+
 class EmendaPixListResponse(BaseModel):
     """Response for list emendas"""
-    items: List[EmendaPixDTO]
+    items: List[EmendaPixFields]  # apenas os campos pedidos em fields=
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Cursor opaco para a próxima página (keyset)
+    total_is_estimate: bool = False  # True quando total vem das estatísticas do banco
+
 
+def to_list_response(
+    entities: Sequence,
+    fields: List[str],
+    total: int,
+    limit: int,
+    offset: int = 0,
+    next_cursor: Optional[str] = None,
+    total_is_estimate: bool = False
+) -> Dict:
+    """EmendaPixListResponse content as a plain dict, ready for json_response"""
+    return {
+        "items": to_fields_items(entities, fields),
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor,
+        "total_is_estimate": total_is_estimate,
+    }
@@ -2,12 +2,86 @@
 Use case para calcular Trust Score (Índice de Integridade) de uma emenda
 """
 from typing import Dict, List
+import numpy as np
 import structlog
 
 from src.domain.entities.emenda_pix import EmendaPix
 
 logger = structlog.get_logger()
 
+# Peso de cada fator no Trust Score
+TRUST_WEIGHTS = {
+    "execucao": 0.30,
+    "tempo": 0.20,
+    "documentacao": 0.20,
+    "risco": 0.20,
+    "historico": 0.10,
+}
+
+# Score do fator histórico por status de execução (demais status: 50)
+HISTORY_STATUS_SCORES = {
+    "concluida": 100.0,
+    "em_execucao": 80.0,
+    "pendente": 60.0,
+    "atrasada": 40.0,
+    "cancelada": 0.0
+}
+
+# Limite inferior de cada nível, do maior para o menor
+TRUST_LEVELS = (
+    (80, "excelente"),
+    (60, "bom"),
+    (40, "regular"),
+    (20, "ruim"),
+)
+LOWEST_TRUST_LEVEL = "crítico"
+
+
+def calculate_trust_scores(
+    percentual_executado: np.ndarray,
+    atrasada: np.ndarray,
+    documentos: np.ndarray,
+    risco_desvio: np.ndarray,
+    status_execucao: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Trust Score de várias emendas de uma vez (mesmas regras de calculate)
+    
+    Args:
+        percentual_executado: Percentual executado (0-100)
+        atrasada: Resultado de EmendaPix.esta_atrasada()
+        documentos: Quantidade de documentos comprobatórios
+        risco_desvio: Risco de desvio (0-1, NaN quando não analisado)
+        status_execucao: Status de execução
+    
+    Returns:
+        dict com trust_score, trust_level e o score de cada fator (arrays)
+    """
+    p = np.asarray(percentual_executado, dtype=np.float64)
+    atrasada = np.asarray(atrasada, dtype=bool)
+    docs = np.asarray(documentos, dtype=np.int64)
+    risco = np.asarray(risco_desvio, dtype=np.float64)
+    status = np.asarray(status_execucao, dtype=object)
+    
+    factors = {
+        "execucao": np.select([p >= 100, p >= 80, p >= 50, p >= 20], [100.0, 90.0, 70.0, 50.0], 30.0),
+        "tempo": np.where(atrasada, np.select([p < 50, p < 80], [30.0, 60.0], 80.0), 100.0),
+        "documentacao": np.select([docs >= 5, docs >= 3, docs >= 2, docs >= 1], [100.0, 80.0, 60.0, 40.0], 0.0),
+        "risco": np.where(np.isnan(risco), 80.0, np.clip((1 - risco) * 100, 0.0, 100.0)),
+        "historico": np.array(
+            [HISTORY_STATUS_SCORES.get(s, 50.0) for s in status], dtype=np.float64
+        ).reshape(p.shape),
+    }
+    
+    score = 100.0 - sum((100.0 - factors[name]) * weight for name, weight in TRUST_WEIGHTS.items())
+    score = np.clip(score, 0.0, 100.0)
+    level = np.select(
+        [score >= threshold for threshold, _ in TRUST_LEVELS],
+        [name for _, name in TRUST_LEVELS],
+        LOWEST_TRUST_LEVEL
+    )
+    return {"trust_score": score, "trust_level": level, **factors}
+
 
 class CalculateTrustScoreUseCase:
     """Calcula Trust Score (0-100) baseado em múltiplos fatores"""
@@ -171,16 +245,7 @@ class CalculateTrustScoreUseCase:
         """Calcula score de histórico (0-100)"""
         # Por enquanto, baseado em status
         # Em produção, analisar histórico de mudanças
-        
-        status_scores = {
-            "concluida": 100.0,
-            "em_execucao": 80.0,
-            "pendente": 60.0,
-            "atrasada": 40.0,
-            "cancelada": 0.0
-        }
-        
-        return status_scores.get(emenda.status_execucao, 50.0)
+        return HISTORY_STATUS_SCORES.get(emenda.status_execucao, 50.0)
     
     def _get_execution_details(self, emenda: EmendaPix) -> str:
         """Detalhes do fator execução"""
@@ -216,16 +281,10 @@ class CalculateTrustScoreUseCase:
     
     def _get_score_level(self, score: float) -> str:
         """Determina nível do score"""
-        if score >= 80:
-            return "excelente"
-        elif score >= 60:
-            return "bom"
-        elif score >= 40:
-            return "regular"
-        elif score >= 20:
-            return "ruim"
-        else:
-            return "crítico"
+        for threshold, level in TRUST_LEVELS:
+            if score >= threshold:
+                return level
+        return LOWEST_TRUST_LEVEL
     
     def _get_recommendations(self, score: float, factors: Dict) -> List[str]:
         """Gera recomendações baseadas no score"""
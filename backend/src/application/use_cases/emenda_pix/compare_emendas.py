@@ -1,11 +1,14 @@
 """
 Use case para análise comparativa de emendas
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import structlog
 
 from src.domain.entities.emenda_pix import EmendaPix
 from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
+from src.infrastructure.similarity import get_similarity_index
+from src.infrastructure.analytics import AnomalyDetector, PortfolioColumns, get_anomaly_cache
+from src.infrastructure.analytics.anomaly_detection import ANOMALY_COLUMNS
 
 logger = structlog.get_logger()
 
@@ -13,8 +16,13 @@ logger = structlog.get_logger()
 class CompareEmendasUseCase:
     """Compara emendas similares e gera análises comparativas"""
     
+    # Quantidade de emendas similares retornadas
+    SIMILAR_LIMIT = 10
+    
     def __init__(self, repository: EmendaPixRepository):
         self.repository = repository
+        self.similarity_index = get_similarity_index()
+        self.anomaly_cache = get_anomaly_cache()
     
     async def compare_similar_emendas(
         self,
@@ -42,12 +50,13 @@ class CompareEmendasUseCase:
                     "message": "Emenda não encontrada"
                 }
             
-            # Buscar emendas similares
-            similar_emendas = await self._find_similar_emendas(
+            # Buscar emendas similares (com o score calculado pelo índice)
+            similar = await self._find_similar_emendas(
                 emenda=emenda,
                 area=area,
                 valor_range=valor_range
             )
+            similar_emendas = [e for e, _ in similar]
             
             # Gerar análise comparativa
             analysis = self._generate_comparative_analysis(
@@ -81,9 +90,9 @@ class CompareEmendasUseCase:
                         "valor_aprovado": e.valor_aprovado,
                         "percentual_executado": e.percentual_executado,
                         "status_execucao": e.status_execucao,
-                        "similarity_score": self._calculate_similarity(emenda, e)
+                        "similarity_score": score
                     }
-                    for e in similar_emendas
+                    for e, score in similar
                 ],
                 "analysis": analysis
             }
@@ -113,50 +122,27 @@ class CompareEmendasUseCase:
             dict com benchmarking
         """
         try:
-            # Buscar todas as emendas
-            all_emendas = await self.repository.find_all()
-            
-            # Agrupar por deputado
-            by_deputado: Dict[str, List[EmendaPix]] = {}
-            for emenda in all_emendas:
-                if autor_nome and emenda.autor_nome != autor_nome:
-                    continue
-                if emenda.autor_nome not in by_deputado:
-                    by_deputado[emenda.autor_nome] = []
-                by_deputado[emenda.autor_nome].append(emenda)
-            
-            # Calcular métricas por deputado
-            benchmarks = []
-            for deputado, emendas in by_deputado.items():
-                total_valor = sum(e.valor_aprovado for e in emendas)
-                total_executado = sum(
-                    e.valor_aprovado * (e.percentual_executado / 100)
-                    for e in emendas
-                )
-                avg_percentual = sum(e.percentual_executado for e in emendas) / len(emendas)
-                
-                # Contar status
-                status_count = {}
-                for e in emendas:
-                    status = e.status_execucao
-                    status_count[status] = status_count.get(status, 0) + 1
-                
-                # Contar atrasadas
-                atrasadas = sum(1 for e in emendas if e.esta_atrasada())
-                
-                benchmarks.append({
-                    "deputado": deputado,
-                    "total_emendas": len(emendas),
-                    "valor_total_aprovado": total_valor,
-                    "valor_total_executado": total_executado,
-                    "percentual_medio_executado": round(avg_percentual, 2),
-                    "emendas_atrasadas": atrasadas,
-                    "taxa_atraso": round((atrasadas / len(emendas)) * 100, 2) if emendas else 0,
-                    "status_distribution": status_count
-                })
+            # Agregação feita no banco (GROUP BY), cobrindo todo o portfólio
+            rows = await self.repository.aggregate_execution(
+                group_by="autor_nome",
+                group_value=autor_nome
+            )
             
-            # Ordenar por percentual médio executado
-            benchmarks.sort(key=lambda x: x["percentual_medio_executado"], reverse=True)
+            benchmarks = [
+                {
+                    "deputado": row["grupo"],
+                    "total_emendas": row["total_emendas"],
+                    "valor_total_aprovado": row["valor_total_aprovado"],
+                    "valor_total_executado": row["valor_total_executado"],
+                    "percentual_medio_executado": round(row["percentual_medio_executado"], 2),
+                    "emendas_atrasadas": row["emendas_atrasadas"],
+                    "taxa_atraso": round(
+                        (row["emendas_atrasadas"] / row["total_emendas"]) * 100, 2
+                    ) if row["total_emendas"] else 0,
+                    "status_distribution": row["status_distribution"]
+                }
+                for row in rows
+            ]
             
             logger.info(
                 "benchmark_by_deputado",
@@ -197,43 +183,26 @@ class CompareEmendasUseCase:
             dict com benchmarking
         """
         try:
-            # Buscar todas as emendas
-            all_emendas = await self.repository.find_all()
-            
-            # Agrupar por município
-            by_municipio: Dict[str, List[EmendaPix]] = {}
-            for emenda in all_emendas:
-                if municipio and emenda.destinatario_nome != municipio:
-                    continue
-                if emenda.destinatario_nome not in by_municipio:
-                    by_municipio[emenda.destinatario_nome] = []
-                by_municipio[emenda.destinatario_nome].append(emenda)
-            
-            # Calcular métricas por município
-            benchmarks = []
-            for municipio_nome, emendas in by_municipio.items():
-                total_valor = sum(e.valor_aprovado for e in emendas)
-                total_executado = sum(
-                    e.valor_aprovado * (e.percentual_executado / 100)
-                    for e in emendas
-                )
-                avg_percentual = sum(e.percentual_executado for e in emendas) / len(emendas)
-                
-                # Contar atrasadas
-                atrasadas = sum(1 for e in emendas if e.esta_atrasada())
-                
-                benchmarks.append({
-                    "municipio": municipio_nome,
-                    "total_emendas": len(emendas),
-                    "valor_total_aprovado": total_valor,
-                    "valor_total_executado": total_executado,
-                    "percentual_medio_executado": round(avg_percentual, 2),
-                    "emendas_atrasadas": atrasadas,
-                    "taxa_atraso": round((atrasadas / len(emendas)) * 100, 2) if emendas else 0
-                })
+            # Agregação feita no banco (GROUP BY), cobrindo todo o portfólio
+            rows = await self.repository.aggregate_execution(
+                group_by="destinatario_nome",
+                group_value=municipio
+            )
             
-            # Ordenar por percentual médio executado
-            benchmarks.sort(key=lambda x: x["percentual_medio_executado"], reverse=True)
+            benchmarks = [
+                {
+                    "municipio": row["grupo"],
+                    "total_emendas": row["total_emendas"],
+                    "valor_total_aprovado": row["valor_total_aprovado"],
+                    "valor_total_executado": row["valor_total_executado"],
+                    "percentual_medio_executado": round(row["percentual_medio_executado"], 2),
+                    "emendas_atrasadas": row["emendas_atrasadas"],
+                    "taxa_atraso": round(
+                        (row["emendas_atrasadas"] / row["total_emendas"]) * 100, 2
+                    ) if row["total_emendas"] else 0
+                }
+                for row in rows
+            ]
             
             logger.info(
                 "benchmark_by_municipio",
@@ -262,112 +231,38 @@ class CompareEmendasUseCase:
     
     async def identify_patterns_and_anomalies(self) -> dict:
         """
-        Identifica padrões e anomalias nas emendas
+        Identifica padrões e anomalias em todo o portfólio de emendas
+        
+        Estatísticas robustas (mediana/MAD, quartis) por área e por UF sobre
+        valor aprovado, velocidade de execução e razão pago/empenhado. O
+        resultado fica em cache até a próxima alteração dos dados
+        (sincronização ou escrita).
         
         Returns:
-            dict com padrões e anomalias identificados
+            dict com padrões, anomalias e estatísticas por grupo
         """
         try:
-            all_emendas = await self.repository.find_all()
-            
-            patterns = []
-            anomalies = []
-            
-            # Padrão 1: Emendas com execução muito baixa
-            low_execution = [
-                e for e in all_emendas
-                if e.percentual_executado < 20 and e.status_execucao != "cancelada"
-            ]
-            if low_execution:
-                patterns.append({
-                    "type": "baixa_execucao",
-                    "description": f"{len(low_execution)} emendas com execução abaixo de 20%",
-                    "count": len(low_execution),
-                    "emendas": [
-                        {
-                            "id": e.id,
-                            "numero_emenda": e.numero_emenda,
-                            "percentual_executado": e.percentual_executado
-                        }
-                        for e in low_execution[:10]  # Limitar a 10
-                    ]
-                })
-            
-            # Padrão 2: Emendas atrasadas
-            delayed = [e for e in all_emendas if e.esta_atrasada()]
-            if delayed:
-                patterns.append({
-                    "type": "atraso",
-                    "description": f"{len(delayed)} emendas atrasadas",
-                    "count": len(delayed),
-                    "emendas": [
-                        {
-                            "id": e.id,
-                            "numero_emenda": e.numero_emenda,
-                            "dias_atraso": (e.data_prevista_conclusao - e.data_inicio).days if e.data_prevista_conclusao and e.data_inicio else None
-                        }
-                        for e in delayed[:10]
-                    ]
-                })
-            
-            # Anomalia 1: Valores muito altos
-            avg_valor = sum(e.valor_aprovado for e in all_emendas) / len(all_emendas) if all_emendas else 0
-            high_value = [
-                e for e in all_emendas
-                if e.valor_aprovado > avg_valor * 3
-            ]
-            if high_value:
-                anomalies.append({
-                    "type": "valor_alto",
-                    "description": f"{len(high_value)} emendas com valor muito acima da média",
-                    "count": len(high_value),
-                    "avg_valor": avg_valor,
-                    "emendas": [
-                        {
-                            "id": e.id,
-                            "numero_emenda": e.numero_emenda,
-                            "valor_aprovado": e.valor_aprovado,
-                            "diferenca_media": e.valor_aprovado - avg_valor
-                        }
-                        for e in high_value[:10]
-                    ]
-                })
-            
-            # Anomalia 2: Execução 100% muito rápida
-            fast_execution = [
-                e for e in all_emendas
-                if e.percentual_executado == 100 and e.status_execucao == "concluida"
-            ]
-            if fast_execution:
-                anomalies.append({
-                    "type": "execucao_rapida",
-                    "description": f"{len(fast_execution)} emendas concluídas rapidamente",
-                    "count": len(fast_execution),
-                    "emendas": [
-                        {
-                            "id": e.id,
-                            "numero_emenda": e.numero_emenda,
-                            "percentual_executado": e.percentual_executado
-                        }
-                        for e in fast_execution[:10]
-                    ]
-                })
+            version = await self.repository.get_data_version()
+            report = self.anomaly_cache.get(version)
+            cached = report is not None
+            if not cached:
+                columns = await PortfolioColumns.load(
+                    self.repository.stream_columns(ANOMALY_COLUMNS)
+                )
+                report = AnomalyDetector(columns).run()
+                self.anomaly_cache.set(version, report)
             
             logger.info(
                 "patterns_anomalies_identified",
-                patterns_count=len(patterns),
-                anomalies_count=len(anomalies)
+                patterns_count=report["summary"]["patterns_found"],
+                anomalies_count=report["summary"]["anomalies_found"],
+                cached=cached
             )
             
             return {
                 "success": True,
-                "patterns": patterns,
-                "anomalies": anomalies,
-                "summary": {
-                    "total_emendas": len(all_emendas),
-                    "patterns_found": len(patterns),
-                    "anomalies_found": len(anomalies)
-                }
+                **report,
+                "generated_at": self.anomaly_cache.generated_at.isoformat()
             }
             
         except Exception as e:
@@ -382,63 +277,19 @@ class CompareEmendasUseCase:
         emenda: EmendaPix,
         area: Optional[str] = None,
         valor_range: Optional[float] = None
-    ) -> List[EmendaPix]:
-        """Encontra emendas similares"""
-        all_emendas = await self.repository.find_all()
-        
-        similar = []
-        for e in all_emendas:
-            if e.id == emenda.id:
-                continue
-            
-            # Filtrar por área se especificado
-            if area and e.area and e.area != area:
-                continue
-            
-            # Filtrar por faixa de valor
-            if valor_range:
-                min_valor = emenda.valor_aprovado * (1 - valor_range / 100)
-                max_valor = emenda.valor_aprovado * (1 + valor_range / 100)
-                if not (min_valor <= e.valor_aprovado <= max_valor):
-                    continue
-            
-            similar.append(e)
+    ) -> List[Tuple[EmendaPix, float]]:
+        """Encontra as emendas mais similares (top k do índice em memória)"""
+        await self.similarity_index.ensure_loaded(self.repository)
         
-        # Ordenar por similaridade
-        similar.sort(
-            key=lambda x: self._calculate_similarity(emenda, x),
-            reverse=True
+        ranked = self.similarity_index.search(
+            emenda,
+            k=self.SIMILAR_LIMIT,
+            area=area,
+            valor_range=valor_range
         )
-        
-        return similar[:10]  # Retornar top 10
-    
-    def _calculate_similarity(self, emenda1: EmendaPix, emenda2: EmendaPix) -> float:
-        """Calcula score de similaridade entre duas emendas"""
-        score = 0.0
-        
-        # Mesma área temática (30%)
-        if emenda1.area and emenda2.area and emenda1.area == emenda2.area:
-            score += 0.3
-        elif not emenda1.area and not emenda2.area:
-            # Se ambas não têm área, dar pontuação parcial
-            score += 0.15
-        
-        # Valor similar (30%)
-        valor_diff = abs(emenda1.valor_aprovado - emenda2.valor_aprovado)
-        max_valor = max(emenda1.valor_aprovado, emenda2.valor_aprovado)
-        if max_valor > 0:
-            valor_similarity = 1 - (valor_diff / max_valor)
-            score += 0.3 * max(0, valor_similarity)
-        
-        # Mesmo município (20%)
-        if emenda1.destinatario_nome == emenda2.destinatario_nome:
-            score += 0.2
-        
-        # Status similar (20%)
-        if emenda1.status_execucao == emenda2.status_execucao:
-            score += 0.2
-        
-        return round(score, 2)
+        scores = dict(ranked)
+        emendas = await self.repository.find_by_ids([id for id, _ in ranked])
+        return [(e, scores[e.id]) for e in emendas]
     
     def _generate_comparative_analysis(
         self,
@@ -1,30 +1,49 @@
 """
 Use case para buscar e analisar notícias relacionadas a emendas
 """
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
+import asyncio
+import os
 import structlog
 from datetime import datetime
 
 from src.domain.entities.emenda_pix import EmendaPix
+from src.domain.entities.job import ProgressCallback
 from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
-from src.infrastructure.external.news_scraper.client import NewsScraperClient
+from src.infrastructure.external.news_scraper.client import (
+    NewsScraperClient,
+    emenda_news_query,
+    url_hash
+)
 from src.infrastructure.ai.sentiment_analyzer import SentimentAnalyzer
 
 logger = structlog.get_logger()
 
+# Buscas de notícias simultâneas na coleta em lote
+NEWS_FETCH_CONCURRENCY = int(os.getenv("NEWS_FETCH_CONCURRENCY", "5"))
+
 
 class FetchEmendaNewsUseCase:
     """Busca e analisa notícias relacionadas a uma emenda"""
     
+    # Linhas lidas por lote da projeção na coleta em lote
+    PAGE_SIZE = 1000
+    # Emendas carregadas e gravadas por transação na coleta em lote
+    WRITE_CHUNK_SIZE = 200
+    # Notícias mantidas por emenda (as mais recentes)
+    MAX_NEWS_PER_EMENDA = 50
+    
     def __init__(
         self,
         repository: EmendaPixRepository,
         news_client: Optional[NewsScraperClient] = None,
-        sentiment_analyzer: Optional[SentimentAnalyzer] = None
+        sentiment_analyzer: Optional[SentimentAnalyzer] = None,
+        concurrency: int = NEWS_FETCH_CONCURRENCY
     ):
         self.repository = repository
         self.news_client = news_client or NewsScraperClient()
         self.sentiment_analyzer = sentiment_analyzer or SentimentAnalyzer()
+        self.concurrency = max(1, concurrency)
     
     async def execute(
         self,
@@ -53,61 +72,10 @@ class FetchEmendaNewsUseCase:
                     "news": []
                 }
             
-            logger.info(
-                "fetch_news_started",
-                emenda_id=emenda_id,
-                numero_emenda=emenda.numero_emenda
-            )
-            
-            # Buscar notícias
-            news = await self.news_client.search_emenda_news(
-                numero_emenda=emenda.numero_emenda,
-                autor_nome=emenda.autor_nome,
-                destinatario_nome=emenda.destinatario_nome,
-                limit=limit
-            )
-            
-            if not news:
-                logger.info("no_news_found", emenda_id=emenda_id)
-                return {
-                    "success": True,
-                    "message": "Nenhuma notícia encontrada",
-                    "news": [],
-                    "overall_sentiment": None
-                }
-            
-            # Analisar sentimentos se solicitado
-            if analyze_sentiment:
-                news = await self.sentiment_analyzer.analyze_news_sentiment(news)
-                overall_sentiment = self.sentiment_analyzer.calculate_overall_sentiment(news)
-            else:
-                overall_sentiment = None
-            
-            # Atualizar emenda com notícias
-            emenda.noticias_relacionadas = news
-            emenda.tem_noticias = len(news) > 0
-            
-            # Adicionar sentimento geral à análise IA se existir
-            if overall_sentiment and emenda.analise_ia:
-                if "sentimento_noticias" not in emenda.analise_ia:
-                    emenda.analise_ia["sentimento_noticias"] = {}
-                emenda.analise_ia["sentimento_noticias"] = overall_sentiment
-            
-            await self.repository.save(emenda)
-            
-            logger.info(
-                "fetch_news_completed",
-                emenda_id=emenda_id,
-                news_count=len(news),
-                overall_sentiment=overall_sentiment.get("sentimento") if overall_sentiment else None
-            )
-            
-            return {
-                "success": True,
-                "message": f"{len(news)} notícia(s) encontrada(s)",
-                "news": news,
-                "overall_sentiment": overall_sentiment
-            }
+            result = await self._fetch_for_emenda(emenda, limit, analyze_sentiment)
+            if result["news"]:
+                await self.repository.save(emenda)
+            return result
             
         except Exception as e:
             logger.error(
@@ -124,64 +92,173 @@ class FetchEmendaNewsUseCase:
             }
         finally:
             await self.news_client.close()
+            await self.sentiment_analyzer.close()
+    
+    async def _fetch_for_emenda(
+        self,
+        emenda: EmendaPix,
+        limit: int,
+        analyze_sentiment: bool
+    ) -> dict:
+        """
+        Busca notícias e as aplica na entidade, sem salvar
+        
+        Returns:
+            dict de resultado; a emenda foi alterada quando "news" não é vazio
+        """
+        logger.info(
+            "fetch_news_started",
+            emenda_id=emenda.id,
+            numero_emenda=emenda.numero_emenda
+        )
+        
+        # Buscar notícias
+        news = await self.news_client.search_emenda_news(
+            numero_emenda=emenda.numero_emenda,
+            autor_nome=emenda.autor_nome,
+            destinatario_nome=emenda.destinatario_nome,
+            limit=limit
+        )
+        
+        if not news:
+            logger.info("no_news_found", emenda_id=emenda.id)
+            return {
+                "success": True,
+                "message": "Nenhuma notícia encontrada",
+                "news": [],
+                "overall_sentiment": None
+            }
+        
+        # Analisar sentimentos se solicitado
+        if analyze_sentiment:
+            news = await self.sentiment_analyzer.analyze_news_sentiment(news)
+            overall_sentiment = self.sentiment_analyzer.calculate_overall_sentiment(news)
+        else:
+            overall_sentiment = None
+        
+        # Atualizar emenda com notícias
+        emenda.noticias_relacionadas = news
+        emenda.tem_noticias = len(news) > 0
+        
+        # Adicionar sentimento geral à análise IA se existir
+        if overall_sentiment and emenda.analise_ia:
+            if "sentimento_noticias" not in emenda.analise_ia:
+                emenda.analise_ia["sentimento_noticias"] = {}
+            emenda.analise_ia["sentimento_noticias"] = overall_sentiment
+        
+        logger.info(
+            "fetch_news_completed",
+            emenda_id=emenda.id,
+            news_count=len(news),
+            overall_sentiment=overall_sentiment.get("sentimento") if overall_sentiment else None
+        )
+        
+        return {
+            "success": True,
+            "message": f"{len(news)} notícia(s) encontrada(s)",
+            "news": news,
+            "overall_sentiment": overall_sentiment
+        }
     
     async def fetch_all_emendas_news(
         self,
-        limit_per_emenda: int = 5
+        limit_per_emenda: int = 5,
+        progress: Optional[ProgressCallback] = None
     ) -> dict:
         """
-        Busca notícias para todas as emendas
+        Busca notícias para todas as emendas (coleta incremental)
+        
+        Emendas do mesmo autor e destinatário compartilham uma única busca;
+        as buscas rodam em paralelo (até `concurrency`). Notícias são
+        identificadas pelo hash da URL normalizada: as já associadas a alguma
+        emenda não são analisadas de novo. O portfólio é lido por projeções
+        de colunas; só as emendas que ganharam notícias são carregadas e
+        gravadas, em transações de WRITE_CHUNK_SIZE emendas.
         
         Args:
-            limit_per_emenda: Limite de notícias por emenda
+            limit_per_emenda: Limite de notícias por busca
+            progress: Callback (buscas concluídas, total de buscas)
         
         Returns:
             dict com estatísticas
         """
         try:
-            # Buscar todas as emendas
-            all_emendas = await self.repository.find_all(limit=1000)
+            total_emendas, groups = await self._group_by_query()
             
             logger.info(
                 "fetch_all_news_started",
-                total_emendas=len(all_emendas)
+                total_emendas=total_emendas,
+                queries=len(groups)
             )
             
             stats = {
-                "total_emendas": len(all_emendas),
+                "total_emendas": total_emendas,
+                "queries": len(groups),
                 "processed": 0,
                 "news_found": 0,
+                "new_articles": 0,
+                "known_articles": 0,
                 "errors": 0
             }
             
-            for emenda in all_emendas:
-                try:
-                    result = await self.execute(
-                        emenda.id,
-                        limit=limit_per_emenda,
-                        analyze_sentiment=True
-                    )
-                    
-                    if result["success"]:
-                        stats["processed"] += 1
-                        if result["news"]:
-                            stats["news_found"] += len(result["news"])
-                    else:
-                        stats["errors"] += 1
-                        
-                except Exception as e:
-                    logger.error(
-                        "fetch_news_error",
-                        emenda_id=emenda.id,
-                        error=str(e)
-                    )
-                    stats["errors"] += 1
+            # 1. Uma busca por consulta distinta
+            results = await self._harvest(list(groups), limit_per_emenda, progress)
+            
+            # 2. Deduplicação por URL: notícias já conhecidas são reaproveitadas
+            found = {a["url_hash"] for articles in results.values() for a in articles}
+            known, stored = await self._stored_articles(found)
+            new_articles: Dict[str, Dict] = {}
+            for articles in results.values():
+                for article in articles:
+                    key = article["url_hash"]
+                    if key in known:
+                        stats["known_articles"] += 1
+                    elif key not in new_articles:
+                        new_articles[key] = article
+            stats["new_articles"] = len(new_articles)
+            
+            # 3. Sentimento só das notícias novas, uma vez cada
+            if new_articles:
+                analyzed = await self.sentiment_analyzer.analyze_news_sentiment(
+                    list(new_articles.values())
+                )
+                known.update((article["url_hash"], article) for article in analyzed)
             
+            # 4. Emendas que ganham notícias, pelos hashes já gravados
+            pending: Dict[str, List[Dict]] = {}
+            for query, ids in groups.items():
+                if query not in results:
+                    stats["errors"] += len(ids)
+                    continue
+                articles = [known[a["url_hash"]] for a in results[query]]
+                for id in ids:
+                    stats["processed"] += 1
+                    has = stored.get(id, ())
+                    if any(a["url_hash"] not in has for a in articles):
+                        pending[id] = articles
+            
+            # 5. Carrega e grava só essas emendas, em lotes (blockchain/agregados
+            # após o commit de cada lote)
+            ids = list(pending)
+            for start in range(0, len(ids), self.WRITE_CHUNK_SIZE):
+                chunk = await self.repository.find_by_ids(ids[start:start + self.WRITE_CHUNK_SIZE])
+                async with self.repository.unit_of_work() as uow:
+                    for emenda in chunk:
+                        added = self._attach_news(emenda, pending[emenda.id])
+                        if added:
+                            stats["news_found"] += added
+                            uow.add(emenda)
+            
+            if progress:
+                await progress(stats["queries"], stats["queries"])
             logger.info("fetch_all_news_completed", **stats)
             
             return {
                 "success": True,
-                "message": f"Processadas {stats['processed']} emendas, {stats['news_found']} notícias encontradas",
+                "message": (
+                    f"Processadas {stats['processed']} emendas em {stats['queries']} buscas, "
+                    f"{stats['new_articles']} notícias novas"
+                ),
                 **stats
             }
             
@@ -195,4 +272,144 @@ class FetchEmendaNewsUseCase:
                 "news_found": 0,
                 "errors": 1
             }
-
+        finally:
+            await self.news_client.close()
+            await self.sentiment_analyzer.close()
+    
+    async def _group_by_query(self) -> Tuple[int, Dict[str, List[str]]]:
+        """
+        IDs das emendas agrupados pela consulta de notícias (autor + destinatário)
+        
+        Returns:
+            (total de emendas lidas, consulta -> IDs)
+        """
+        total = 0
+        groups: Dict[str, List[str]] = {}
+        by_key: Dict[str, str] = {}
+        async for rows in self.repository.stream_columns(
+            ["id", "autor_nome", "destinatario_nome"], batch_size=self.PAGE_SIZE
+        ):
+            for id, autor_nome, destinatario_nome in rows:
+                total += 1
+                query = emenda_news_query(autor_nome, destinatario_nome)
+                if not query:
+                    continue
+                # Mesma consulta independentemente de caixa e espaços
+                key = " ".join(query.lower().split())
+                groups.setdefault(by_key.setdefault(key, query), []).append(str(id))
+        return total, groups
+    
+    async def _stored_articles(
+        self,
+        hashes: Set[str]
+    ) -> Tuple[Dict[str, Dict], Dict[str, Set[str]]]:
+        """
+        Notícias já gravadas entre as encontradas (`hashes`)
+        
+        Returns:
+            (url_hash -> notícia já analisada, ID da emenda -> hashes que ela já tem)
+        """
+        known: Dict[str, Dict] = {}
+        stored: Dict[str, Set[str]] = {}
+        if not hashes:
+            return known, stored
+        async for rows in self.repository.stream_columns(
+            ["id", "noticias_relacionadas"], batch_size=self.PAGE_SIZE
+        ):
+            for id, noticias in rows:
+                has = set()
+                for article in noticias or []:
+                    if not (article.get("url_hash") or self._with_hash(article)):
+                        continue
+                    key = article["url_hash"]
+                    if key in hashes:
+                        has.add(key)
+                        known.setdefault(key, article)
+                if has:
+                    stored[str(id)] = has
+        return known, stored
+    
+    async def _harvest(
+        self,
+        queries: List[str],
+        limit: int,
+        progress: Optional[ProgressCallback]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Executa as buscas em paralelo (até `concurrency` por vez)
+        
+        Returns:
+            consulta -> notícias com url_hash; buscas com erro ficam de fora
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def search(query: str) -> List[Dict]:
+            async with semaphore:
+                return await self.news_client.search_news(query, limit=limit)
+        
+        tasks = {asyncio.ensure_future(search(query)): query for query in queries}
+        results: Dict[str, List[Dict]] = {}
+        try:
+            pending = set(tasks)
+            while pending:
+                if progress:
+                    await progress(len(queries) - len(pending), len(queries))
+                finished, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    query = tasks[task]
+                    try:
+                        articles = task.result()
+                    except Exception as e:
+                        logger.error("fetch_news_error", query=query, error=str(e))
+                        continue
+                    # Notícias sem link não têm como ser deduplicadas
+                    results[query] = [
+                        article for article in articles
+                        if article.get("url_hash") or self._with_hash(article)
+                    ]
+        finally:
+            # Cancelado no meio: descarta as buscas que não terminaram
+            for task in tasks:
+                task.cancel()
+        return results
+    
+    @staticmethod
+    def _with_hash(article: Dict) -> bool:
+        """Preenche url_hash a partir do link; False se a notícia não tem link"""
+        if not article.get("link"):
+            return False
+        article["url_hash"] = url_hash(article["link"])
+        return True
+    
+    def _attach_news(self, emenda: EmendaPix, articles: List[Dict]) -> int:
+        """
+        Acrescenta à emenda as notícias que ela ainda não tem, sem salvar
+        
+        Mantém as MAX_NEWS_PER_EMENDA mais recentes e recalcula o sentimento
+        geral. Returns: quantidade de notícias novas para a emenda.
+        """
+        current = emenda.noticias_relacionadas or []
+        seen = {
+            article["url_hash"] for article in current
+            if article.get("url_hash") or self._with_hash(article)
+        }
+        added = []
+        for article in articles:
+            if article["url_hash"] not in seen:
+                seen.add(article["url_hash"])
+                added.append(dict(article))
+        if not added:
+            return 0
+        
+        news = sorted(current + added, key=lambda a: a.get("data") or "", reverse=True)
+        emenda.noticias_relacionadas = news[:self.MAX_NEWS_PER_EMENDA]
+        emenda.tem_noticias = True
+        
+        # Adicionar sentimento geral à análise IA se existir
+        if emenda.analise_ia:
+            emenda.analise_ia["sentimento_noticias"] = (
+                self.sentiment_analyzer.calculate_overall_sentiment(emenda.noticias_relacionadas)
+            )
+        return len(added)
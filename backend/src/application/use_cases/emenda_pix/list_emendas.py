@@ -1,5 +1,5 @@
 """List Emendas Pix use case"""
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from src.domain.entities.emenda_pix import EmendaPix
 from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
 
@@ -18,9 +18,14 @@ class ListEmendasPixUseCase:
         destinatario_uf: Optional[str] = None,
         area: Optional[str] = None,
         status_execucao: Optional[str] = None,
-        tipo: Optional[str] = None
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at"
     ) -> List[EmendaPix]:
-        """List emendas with optional filters"""
+        """List emendas with optional filters, loading only `fields` when given"""
         return await self.repository.find_all(
             limit=limit,
             offset=offset,
@@ -28,6 +33,65 @@ class ListEmendasPixUseCase:
             destinatario_uf=destinatario_uf,
             area=area,
             status_execucao=status_execucao,
-            tipo=tipo
+            tipo=tipo,
+            trust_level=trust_level,
+            trust_score_min=trust_score_min,
+            trust_score_max=trust_score_max,
+            fields=fields,
+            sort=sort
         )
 
+    
+    async def execute_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        autor_nome: Optional[str] = None,
+        destinatario_uf: Optional[str] = None,
+        area: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at"
+    ) -> Tuple[List[EmendaPix], Optional[str]]:
+        """List a page of emendas using keyset pagination"""
+        return await self.repository.find_page(
+            limit=limit,
+            cursor=cursor,
+            autor_nome=autor_nome,
+            destinatario_uf=destinatario_uf,
+            area=area,
+            status_execucao=status_execucao,
+            tipo=tipo,
+            trust_level=trust_level,
+            trust_score_min=trust_score_min,
+            trust_score_max=trust_score_max,
+            fields=fields,
+            sort=sort
+        )
+    
+    async def count(
+        self,
+        autor_nome: Optional[str] = None,
+        destinatario_uf: Optional[str] = None,
+        area: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None
+    ) -> Tuple[int, bool]:
+        """Count emendas matching the filters (exact or estimated)"""
+        return await self.repository.count(
+            autor_nome=autor_nome,
+            destinatario_uf=destinatario_uf,
+            area=area,
+            status_execucao=status_execucao,
+            tipo=tipo,
+            trust_level=trust_level,
+            trust_score_min=trust_score_min,
+            trust_score_max=trust_score_max
+        )
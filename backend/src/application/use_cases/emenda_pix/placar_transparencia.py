@@ -0,0 +1,143 @@
+"""
+Use case para o Placar de Transparência (totais por município ou parlamentar)
+"""
+from typing import Optional
+import structlog
+
+from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
+
+logger = structlog.get_logger()
+
+
+class PlacarTransparenciaUseCase:
+    """Consulta o placar a partir das métricas pré-agregadas"""
+    
+    # Tipo de busca do placar -> dimensão dos agregados
+    TIPOS = {
+        "municipio": "destinatario",
+        "parlamentar": "autor"
+    }
+    
+    # Ranking de Trust Score: ordem -> ordenação do repositório
+    TRUST_ORDENS = {
+        "top": "-trust_score",
+        "bottom": "trust_score"
+    }
+    
+    TRUST_RANKING_FIELDS = (
+        "id", "numero_emenda", "ano", "autor_nome", "destinatario_nome", "destinatario_uf",
+        "area", "valor_aprovado", "status_execucao", "percentual_executado",
+        "trust_score", "trust_level",
+    )
+    
+    def __init__(self, repository: EmendaPixRepository):
+        self.repository = repository
+    
+    async def execute(
+        self,
+        tipo: str,
+        termo: Optional[str] = None,
+        uf: Optional[str] = None,
+        area: Optional[str] = None,
+        ano: Optional[int] = None,
+        limit: int = 50
+    ) -> dict:
+        """
+        Gera o placar de transparência
+        
+        Args:
+            tipo: 'municipio' ou 'parlamentar'
+            termo: Trecho do nome do município ou parlamentar (opcional)
+            uf: UF (opcional)
+            area: Área temática (opcional)
+            ano: Ano das emendas (opcional)
+            limit: Tamanho máximo do ranking
+        
+        Returns:
+            dict com resumo geral e ranking
+        """
+        dimensao = self.TIPOS.get(tipo)
+        if not dimensao:
+            return {
+                "success": False,
+                "message": f"Tipo de placar inválido: {tipo}. Use 'municipio' ou 'parlamentar'"
+            }
+        
+        try:
+            placar = await self.repository.get_scoreboard(
+                dimensao=dimensao,
+                termo=termo,
+                uf=uf,
+                area=area,
+                ano=ano,
+                limit=limit
+            )
+            
+            logger.info(
+                "placar_transparencia",
+                tipo=tipo,
+                termo=termo,
+                ranking_count=len(placar["ranking"])
+            )
+            
+            return {
+                "success": True,
+                "tipo": tipo,
+                **placar
+            }
+            
+        except Exception as e:
+            logger.error("placar_transparencia_error", tipo=tipo, error=str(e))
+            return {
+                "success": False,
+                "message": f"Erro ao gerar placar: {str(e)}"
+            }
+    
+    async def trust_ranking(
+        self,
+        ordem: str = "top",
+        uf: Optional[str] = None,
+        area: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        limit: int = 50
+    ) -> dict:
+        """
+        Emendas com maior ('top') ou menor ('bottom') Trust Score persistido
+        
+        Lido do índice (trust_score, id); emendas ainda sem score calculado
+        ficam de fora.
+        """
+        if ordem not in self.TRUST_ORDENS:
+            return {
+                "success": False,
+                "message": f"Ordem inválida: {ordem}. Use 'top' ou 'bottom'"
+            }
+        
+        try:
+            emendas, _ = await self.repository.find_page(
+                limit=limit,
+                destinatario_uf=uf,
+                area=area,
+                status_execucao=status_execucao,
+                fields=self.TRUST_RANKING_FIELDS,
+                sort=self.TRUST_ORDENS[ordem]
+            )
+            
+            return {
+                "success": True,
+                "ordem": ordem,
+                "ranking": [
+                    {
+                        "posicao": posicao,
+                        **{name: getattr(emenda, name) for name in self.TRUST_RANKING_FIELDS}
+                    }
+                    for posicao, emenda in enumerate(emendas, start=1)
+                ]
+            }
+            
+        except Exception as e:
+            logger.error("placar_trust_ranking_error", ordem=ordem, error=str(e))
+            return {
+                "success": False,
+                "message": f"Erro ao gerar ranking de Trust Score: {str(e)}"
+            }
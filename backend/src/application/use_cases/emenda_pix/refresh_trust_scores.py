@@ -0,0 +1,114 @@
+"""
+Use case para recalcular e persistir o Trust Score das emendas em lote
+"""
+from datetime import datetime
+from typing import Dict, List, Tuple
+import numpy as np
+import structlog
+
+from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
+from src.application.use_cases.emenda_pix.calculate_trust_score import (
+    TRUST_WEIGHTS,
+    calculate_trust_scores
+)
+
+logger = structlog.get_logger()
+
+
+class RefreshTrustScoresUseCase:
+    """
+    Calcula o Trust Score de todo o portfólio com NumPy e grava nas colunas
+    trust_* de emenda_pix
+
+    Só recalcula emendas cujas entradas mudaram desde o último cálculo
+    (incluindo as que passaram do prazo), comparando o hash das entradas.
+    """
+
+    # Emendas por lote (uma leitura, um cálculo e um UPDATE por lote)
+    BATCH_SIZE = 5000
+
+    def __init__(self, repository: EmendaPixRepository):
+        self.repository = repository
+
+    async def execute(self, force: bool = False) -> Dict:
+        """
+        Recalcula os Trust Scores desatualizados
+
+        Args:
+            force: Recalcula todas as emendas, mesmo sem mudança nas entradas
+                (ex.: após alterar pesos ou faixas do score)
+
+        Returns:
+            dict com quantidade de emendas atualizadas e lotes processados
+        """
+        started = datetime.utcnow()
+        now = datetime.now()  # mesma referência de EmendaPix.esta_atrasada()
+        updated = 0
+        batches = 0
+        after_id = None
+
+        try:
+            while True:
+                rows = await self.repository.find_trust_score_inputs(
+                    now=now,
+                    after_id=after_id,
+                    limit=self.BATCH_SIZE,
+                    only_changed=not force
+                )
+                if not rows:
+                    break
+
+                updated += await self.repository.save_trust_scores(self._score(rows))
+                batches += 1
+                after_id = rows[-1][0]
+                if len(rows) < self.BATCH_SIZE:
+                    break
+
+            elapsed = (datetime.utcnow() - started).total_seconds()
+            logger.info(
+                "trust_scores_refreshed",
+                updated=updated,
+                batches=batches,
+                force=force,
+                elapsed_seconds=round(elapsed, 2)
+            )
+            return {
+                "success": True,
+                "updated": updated,
+                "batches": batches,
+                "elapsed_seconds": round(elapsed, 2)
+            }
+
+        except Exception as e:
+            logger.error("refresh_trust_scores_error", updated=updated, error=str(e))
+            return {
+                "success": False,
+                "updated": updated,
+                "message": f"Erro ao recalcular Trust Scores: {str(e)}"
+            }
+
+    @staticmethod
+    def _score(rows: List[Tuple]) -> List[Dict]:
+        """Calcula os scores de um lote de entradas (ver find_trust_score_inputs)"""
+        ids, percentual, atrasada, documentos, risco, status, hashes = zip(*rows)
+        result = calculate_trust_scores(
+            percentual_executado=np.array(percentual, dtype=np.float64),
+            atrasada=np.array(atrasada, dtype=bool),
+            documentos=np.array(documentos, dtype=np.int64),
+            risco_desvio=np.array([np.nan if r is None else r for r in risco], dtype=np.float64),
+            status_execucao=np.array(status, dtype=object)
+        )
+
+        columns = {
+            "trust_score": np.round(result["trust_score"], 2).tolist(),
+            "trust_level": result["trust_level"].tolist(),
+            **{f"trust_{name}": result[name].tolist() for name in TRUST_WEIGHTS},
+        }
+        return [
+            {
+                "id": str(id),
+                "trust_inputs_hash": inputs_hash,
+                **{column: values[i] for column, values in columns.items()}
+            }
+            for i, (id, inputs_hash) in enumerate(zip(ids, hashes))
+        ]
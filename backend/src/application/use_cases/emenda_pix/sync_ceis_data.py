@@ -1,27 +1,39 @@
 """
 Use case para sincronizar dados do CEIS e processos eletrônicos
 """
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+import asyncio
+import os
 import structlog
 
 from src.domain.entities.emenda_pix import EmendaPix
+from src.domain.entities.job import ProgressCallback
 from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
 from src.infrastructure.external.ceis.client import CEISClient
 
 logger = structlog.get_logger()
 
+# Emendas sincronizadas em paralelo no lote (as chamadas ao CEIS/SEI são
+# limitadas por host no cliente)
+CEIS_SYNC_CONCURRENCY = int(os.getenv("CEIS_SYNC_CONCURRENCY", "10"))
+
 
 class SyncCEISDataUseCase:
     """Sincroniza dados do CEIS e processos eletrônicos para uma emenda"""
     
+    # Emendas lidas por página na sincronização em lote
+    PAGE_SIZE = 1000
+    
     def __init__(
         self,
         repository: EmendaPixRepository,
-        ceis_client: Optional[CEISClient] = None
+        ceis_client: Optional[CEISClient] = None,
+        concurrency: int = CEIS_SYNC_CONCURRENCY
     ):
         self.repository = repository
         self.ceis_client = ceis_client or CEISClient()
+        self.concurrency = max(1, concurrency)
     
     async def execute(self, emenda_id: str) -> dict:
         """
@@ -43,138 +55,11 @@ class SyncCEISDataUseCase:
                     "updated": False
                 }
             
-            if not emenda.processo_sei:
-                return {
-                    "success": False,
-                    "message": "Emenda não possui processo SEI vinculado",
-                    "updated": False
-                }
-            
-            logger.info(
-                "sync_ceis_started",
-                emenda_id=emenda_id,
-                processo_sei=emenda.processo_sei
-            )
-            
-            updates = {}
-            
-            # 1. Buscar plano de trabalho
-            plano_trabalho = await self.ceis_client.get_plano_trabalho(
-                emenda.processo_sei
-            )
-            if plano_trabalho:
-                updates["plano_trabalho"] = plano_trabalho.get("metas", [])
-                updates["numero_metas"] = len(updates["plano_trabalho"])
-                logger.info(
-                    "plano_trabalho_synced",
-                    emenda_id=emenda_id,
-                    metas_count=updates["numero_metas"]
-                )
-            
-            # 2. Buscar status das metas
-            metas_status = await self.ceis_client.get_metas_status(
-                emenda.processo_sei
-            )
-            if metas_status:
-                # Atualizar status das metas no plano de trabalho
-                if updates.get("plano_trabalho"):
-                    metas_dict = {m.get("meta"): m for m in metas_status}
-                    for meta in updates["plano_trabalho"]:
-                        meta_num = meta.get("meta")
-                        if meta_num in metas_dict:
-                            meta["status"] = metas_dict[meta_num].get("status")
-                            meta["data_conclusao"] = metas_dict[meta_num].get("data_conclusao")
-                    
-                    # Contar metas concluídas
-                    updates["metas_concluidas"] = sum(
-                        1 for m in updates["plano_trabalho"]
-                        if m.get("status") == "concluida"
-                    )
-                    logger.info(
-                        "metas_status_synced",
-                        emenda_id=emenda_id,
-                        concluidas=updates["metas_concluidas"]
-                    )
-            
-            # 3. Buscar entregas
-            entregas = await self.ceis_client.get_entregas(
-                emenda.processo_sei
-            )
-            if entregas:
-                updates["documentos_comprobatórios"] = [
-                    {
-                        "tipo": entrega.get("tipo"),
-                        "descricao": entrega.get("descricao"),
-                        "data": entrega.get("data"),
-                        "link": entrega.get("link")
-                    }
-                    for entrega in entregas
-                ]
-                logger.info(
-                    "entregas_synced",
-                    emenda_id=emenda_id,
-                    entregas_count=len(entregas)
-                )
-            
-            # 4. Verificar empresa no CEIS (se houver CNPJ)
-            if emenda.destinatario_cnpj:
-                ceis_info = await self.ceis_client.verificar_empresa_ceis(
-                    emenda.destinatario_cnpj
-                )
-                if ceis_info:
-                    # Adicionar alerta se empresa estiver no CEIS
-                    if not emenda.alertas:
-                        emenda.alertas = []
-                    
-                    alerta_ceis = {
-                        "tipo": "empresa_ceis",
-                        "severidade": "alta",
-                        "mensagem": f"Empresa destinatária está cadastrada no CEIS: {ceis_info.get('motivo', 'Não informado')}",
-                        "data": str(datetime.now().date())
-                    }
-                    emenda.alertas.append(alerta_ceis)
-                    updates["alertas"] = emenda.alertas
-                    logger.warning(
-                        "empresa_in_ceis",
-                        emenda_id=emenda_id,
-                        cnpj=emenda.destinatario_cnpj
-                    )
-            
-            # 5. Atualizar emenda com dados sincronizados
-            if updates:
-                # Atualizar campos da emenda
-                if "plano_trabalho" in updates:
-                    emenda.plano_trabalho = updates["plano_trabalho"]
-                if "numero_metas" in updates:
-                    emenda.numero_metas = updates["numero_metas"]
-                if "metas_concluidas" in updates:
-                    emenda.metas_concluidas = updates["metas_concluidas"]
-                if "documentos_comprobatórios" in updates:
-                    emenda.documentos_comprobatórios = updates["documentos_comprobatórios"]
-                if "alertas" in updates:
-                    emenda.alertas = updates["alertas"]
-                
+            result = await self._sync_emenda(emenda)
+            if result["updated"]:
                 # Salvar emenda atualizada
                 await self.repository.save(emenda)
-                
-                logger.info(
-                    "ceis_sync_completed",
-                    emenda_id=emenda_id,
-                    updates=list(updates.keys())
-                )
-                
-                return {
-                    "success": True,
-                    "message": "Dados do CEIS sincronizados com sucesso",
-                    "updated": True,
-                    "updates": list(updates.keys())
-                }
-            else:
-                return {
-                    "success": True,
-                    "message": "Nenhum dado novo encontrado no CEIS",
-                    "updated": False
-                }
+            return result
                 
         except Exception as e:
             logger.error(
@@ -191,24 +76,182 @@ class SyncCEISDataUseCase:
         finally:
             await self.ceis_client.close()
     
-    async def sync_all_emendas_with_ceis(self) -> dict:
+    async def _sync_emenda(self, emenda: EmendaPix) -> dict:
+        """
+        Aplica os dados do CEIS na entidade, sem salvar
+        
+        Returns:
+            dict de resultado; "updated" indica se a emenda foi alterada
+        """
+        emenda_id = emenda.id
+        if not emenda.processo_sei:
+            return {
+                "success": False,
+                "message": "Emenda não possui processo SEI vinculado",
+                "updated": False
+            }
+        
+        logger.info(
+            "sync_ceis_started",
+            emenda_id=emenda_id,
+            processo_sei=emenda.processo_sei
+        )
+        
+        updates = {}
+        
+        # Chamadas independentes em paralelo: plano de trabalho, status das
+        # metas, entregas e verificação no CEIS (se houver CNPJ)
+        plano_trabalho, metas_status, entregas, ceis_info = await asyncio.gather(
+            self.ceis_client.get_plano_trabalho(emenda.processo_sei),
+            self.ceis_client.get_metas_status(emenda.processo_sei),
+            self.ceis_client.get_entregas(emenda.processo_sei),
+            self._verificar_ceis(emenda)
+        )
+        
+        # 1. Plano de trabalho
+        if plano_trabalho:
+            updates["plano_trabalho"] = plano_trabalho.get("metas", [])
+            updates["numero_metas"] = len(updates["plano_trabalho"])
+            logger.info(
+                "plano_trabalho_synced",
+                emenda_id=emenda_id,
+                metas_count=updates["numero_metas"]
+            )
+        
+        # 2. Status das metas
+        if metas_status:
+            # Atualizar status das metas no plano de trabalho
+            if updates.get("plano_trabalho"):
+                metas_dict = {m.get("meta"): m for m in metas_status}
+                for meta in updates["plano_trabalho"]:
+                    meta_num = meta.get("meta")
+                    if meta_num in metas_dict:
+                        meta["status"] = metas_dict[meta_num].get("status")
+                        meta["data_conclusao"] = metas_dict[meta_num].get("data_conclusao")
+                
+                # Contar metas concluídas
+                updates["metas_concluidas"] = sum(
+                    1 for m in updates["plano_trabalho"]
+                    if m.get("status") == "concluida"
+                )
+                logger.info(
+                    "metas_status_synced",
+                    emenda_id=emenda_id,
+                    concluidas=updates["metas_concluidas"]
+                )
+        
+        # 3. Entregas
+        if entregas:
+            updates["documentos_comprobatórios"] = [
+                {
+                    "tipo": entrega.get("tipo"),
+                    "descricao": entrega.get("descricao"),
+                    "data": entrega.get("data"),
+                    "link": entrega.get("link")
+                }
+                for entrega in entregas
+            ]
+            logger.info(
+                "entregas_synced",
+                emenda_id=emenda_id,
+                entregas_count=len(entregas)
+            )
+        
+        # 4. Empresa no CEIS
+        if ceis_info:
+            # Adicionar alerta se empresa estiver no CEIS
+            if not emenda.alertas:
+                emenda.alertas = []
+            
+            alerta_ceis = {
+                "tipo": "empresa_ceis",
+                "severidade": "alta",
+                "mensagem": f"Empresa destinatária está cadastrada no CEIS: {ceis_info.get('motivo', 'Não informado')}",
+                "data": str(datetime.now().date())
+            }
+            emenda.alertas.append(alerta_ceis)
+            updates["alertas"] = emenda.alertas
+            logger.warning(
+                "empresa_in_ceis",
+                emenda_id=emenda_id,
+                cnpj=emenda.destinatario_cnpj
+            )
+        
+        # 5. Atualizar emenda com dados sincronizados
+        if updates:
+            # Atualizar campos da emenda
+            if "plano_trabalho" in updates:
+                emenda.plano_trabalho = updates["plano_trabalho"]
+            if "numero_metas" in updates:
+                emenda.numero_metas = updates["numero_metas"]
+            if "metas_concluidas" in updates:
+                emenda.metas_concluidas = updates["metas_concluidas"]
+            if "documentos_comprobatórios" in updates:
+                emenda.documentos_comprobatórios = updates["documentos_comprobatórios"]
+            if "alertas" in updates:
+                emenda.alertas = updates["alertas"]
+            
+            logger.info(
+                "ceis_sync_completed",
+                emenda_id=emenda_id,
+                updates=list(updates.keys())
+            )
+            
+            return {
+                "success": True,
+                "message": "Dados do CEIS sincronizados com sucesso",
+                "updated": True,
+                "updates": list(updates.keys())
+            }
+        else:
+            return {
+                "success": True,
+                "message": "Nenhum dado novo encontrado no CEIS",
+                "updated": False
+            }
+    
+    async def _verificar_ceis(self, emenda: EmendaPix) -> Optional[dict]:
+        """Registro da empresa destinatária no CEIS (None sem CNPJ ou se não consta)"""
+        if not emenda.destinatario_cnpj:
+            return None
+        return await self.ceis_client.verificar_empresa_ceis(emenda.destinatario_cnpj)
+    
+    async def _find_emendas_com_sei(self) -> List[EmendaPix]:
+        """Todas as emendas com processo SEI, lidas em páginas (filtro no banco)"""
+        emendas: List[EmendaPix] = []
+        cursor = None
+        while True:
+            page, cursor = await self.repository.find_page(
+                limit=self.PAGE_SIZE,
+                cursor=cursor,
+                com_processo_sei=True
+            )
+            emendas.extend(page)
+            if cursor is None:
+                return emendas
+    
+    async def sync_all_emendas_with_ceis(
+        self,
+        progress: Optional[ProgressCallback] = None
+    ) -> dict:
         """
         Sincroniza dados do CEIS para todas as emendas que possuem processo SEI
         
+        Args:
+            progress: Callback (processadas, total) chamado conforme as
+                emendas terminam
+        
         Returns:
             dict com estatísticas da sincronização
         """
         try:
             # Buscar todas as emendas com processo SEI
-            all_emendas = await self.repository.find_all(limit=1000)
-            emendas_com_sei = [
-                e for e in all_emendas
-                if e.processo_sei
-            ]
+            emendas_com_sei = await self._find_emendas_com_sei()
             
             logger.info(
                 "sync_all_ceis_started",
-                total_emendas=len(emendas_com_sei)
+                total_emendas=len(emendas_com_sei),
+                concurrency=self.concurrency
             )
             
             stats = {
@@ -218,15 +261,57 @@ class SyncCEISDataUseCase:
                 "errors": 0
             }
             
-            for emenda in emendas_com_sei:
-                result = await self.execute(emenda.id)
-                if result["success"]:
-                    stats["synced"] += 1
-                    if result["updated"]:
-                        stats["updated"] += 1
-                else:
-                    stats["errors"] += 1
+            # Emendas em paralelo, até `concurrency` por vez, com o mesmo
+            # cliente (pool e rate limit por host) para o lote todo
+            semaphore = asyncio.Semaphore(self.concurrency)
             
+            async def sync_one(emenda: EmendaPix) -> dict:
+                async with semaphore:
+                    return await self._sync_emenda(emenda)
+            
+            tasks = {
+                asyncio.ensure_future(sync_one(emenda)): emenda
+                for emenda in emendas_com_sei
+            }
+            
+            # Uma única transação para o lote; blockchain/agregados após o commit
+            try:
+                async with self.repository.unit_of_work(changed_by="ceis") as uow:
+                    pending = set(tasks)
+                    while pending:
+                        if progress:
+                            await progress(stats["total"] - len(pending), stats["total"])
+                        finished, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in finished:
+                            emenda = tasks[task]
+                            try:
+                                result = task.result()
+                            except Exception as e:
+                                logger.error(
+                                    "ceis_sync_error",
+                                    emenda_id=emenda.id,
+                                    error=str(e),
+                                    error_type=type(e).__name__
+                                )
+                                stats["errors"] += 1
+                                continue
+                            
+                            if result["success"]:
+                                stats["synced"] += 1
+                                if result["updated"]:
+                                    stats["updated"] += 1
+                                    uow.add(emenda)
+                            else:
+                                stats["errors"] += 1
+            finally:
+                # Cancelado ou com erro no meio: descarta o que não terminou
+                for task in tasks:
+                    task.cancel()
+            
+            if progress:
+                await progress(stats["total"], stats["total"])
             logger.info("sync_all_ceis_completed", **stats)
             
             return {
@@ -245,4 +330,6 @@ class SyncCEISDataUseCase:
                 "updated": 0,
                 "errors": 1
             }
+        finally:
+            await self.ceis_client.close()
 
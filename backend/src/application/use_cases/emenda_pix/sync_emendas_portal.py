@@ -7,6 +7,7 @@ import structlog
 import uuid
 
 from src.domain.entities.emenda_pix import EmendaPix
+from src.domain.entities.job import ProgressCallback
 from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
 from src.infrastructure.external.portal_transparencia.client import PortalTransparenciaClient
 
@@ -16,6 +17,19 @@ logger = structlog.get_logger()
 class SyncEmendasPortalUseCase:
     """Sincroniza emendas Pix do Portal da Transparência"""
     
+    # Colunas preenchidas por _map_portal_to_entity
+    PORTAL_COLUMNS = (
+        "ano", "tipo",
+        "autor_nome", "autor_partido", "autor_uf",
+        "destinatario_nome", "destinatario_uf", "destinatario_tipo",
+        "valor_aprovado", "valor_empenhado", "valor_liquidado", "valor_pago",
+        "percentual_executado", "status_execucao",
+        "objetivo", "descricao_detalhada", "area",
+        "processo_sei", "link_portal_transparencia",
+        "data_inicio", "data_prevista_conclusao", "plano_trabalho",
+        "last_sync",
+    )
+    
     def __init__(
         self,
         repository: EmendaPixRepository,
@@ -28,7 +42,8 @@ class SyncEmendasPortalUseCase:
         self,
         ano: Optional[int] = None,
         codigo_ibge: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        progress: Optional[ProgressCallback] = None
     ) -> dict:
         """
         Sincroniza emendas do Portal da Transparência
@@ -37,6 +52,8 @@ class SyncEmendasPortalUseCase:
             ano: Ano das emendas (padrão: ano atual)
             codigo_ibge: Código IBGE do município (opcional)
             limit: Limite de emendas a sincronizar
+            progress: Callback (gravadas, buscadas), chamado antes e depois
+                do upsert em lote
         
         Returns:
             dict com estatísticas da sincronização
@@ -67,11 +84,16 @@ class SyncEmendasPortalUseCase:
                     "total_fetched": 0,
                     "total_saved": 0,
                     "total_updated": 0,
+                    "total_unchanged": 0,
                     "total_errors": 0
                 }
             
             # Processar e salvar emendas
+            if progress:
+                await progress(0, len(emendas_portal))
             stats = await self._process_and_save_emendas(emendas_portal)
+            if progress:
+                await progress(len(emendas_portal), len(emendas_portal))
             
             logger.info(
                 "sync_emendas_portal_completed",
@@ -80,7 +102,7 @@ class SyncEmendasPortalUseCase:
             
             return {
                 "success": True,
-                "message": f"Sincronização concluída: {stats['total_saved']} novas, {stats['total_updated']} atualizadas",
+                "message": f"Sincronização concluída: {stats['total_saved']} novas, {stats['total_updated']} atualizadas, {stats['total_unchanged']} sem alteração",
                 **stats
             }
             
@@ -96,6 +118,7 @@ class SyncEmendasPortalUseCase:
                 "total_fetched": 0,
                 "total_saved": 0,
                 "total_updated": 0,
+                "total_unchanged": 0,
                 "total_errors": 1
             }
         finally:
@@ -139,42 +162,20 @@ class SyncEmendasPortalUseCase:
         self,
         emendas_portal: List[dict]
     ) -> dict:
-        """Processa e salva emendas do Portal"""
+        """Processa e salva emendas do Portal em lote (upsert por numero_emenda)"""
         stats = {
             "total_fetched": len(emendas_portal),
             "total_saved": 0,
             "total_updated": 0,
+            "total_unchanged": 0,
             "total_errors": 0
         }
         
+        entities = []
         for emenda_data in emendas_portal:
             try:
                 # Mapear dados do Portal para nossa entidade
-                emenda_entity = self._map_portal_to_entity(emenda_data)
-                
-                # Verificar se já existe
-                existing = await self.repository.find_by_numero_emenda(
-                    emenda_entity.numero_emenda
-                )
-                
-                if existing:
-                    # Atualizar emenda existente
-                    emenda_entity.id = existing.id
-                    await self.repository.save(emenda_entity)
-                    stats["total_updated"] += 1
-                    logger.debug(
-                        "emenda_updated",
-                        numero_emenda=emenda_entity.numero_emenda
-                    )
-                else:
-                    # Criar nova emenda
-                    await self.repository.save(emenda_entity)
-                    stats["total_saved"] += 1
-                    logger.debug(
-                        "emenda_saved",
-                        numero_emenda=emenda_entity.numero_emenda
-                    )
-                    
+                entities.append(self._map_portal_to_entity(emenda_data))
             except Exception as e:
                 stats["total_errors"] += 1
                 logger.error(
@@ -183,6 +184,21 @@ class SyncEmendasPortalUseCase:
                     emenda_data=emenda_data.get("numero", "unknown")
                 )
         
+        if not entities:
+            return stats
+        
+        # Só as colunas vindas do Portal são atualizadas; análise de IA,
+        # notícias e validações locais de emendas existentes são preservadas
+        result = await self.repository.upsert_many(
+            entities,
+            update_columns=self.PORTAL_COLUMNS,
+            changed_by="portal_transparencia"
+        )
+        stats["total_saved"] += result["inserted"]
+        stats["total_updated"] += result["updated"]
+        stats["total_unchanged"] += result["unchanged"]
+        stats["total_errors"] += result["errors"]
+        
         return stats
     
     def _map_portal_to_entity(self, portal_data: dict) -> EmendaPix:
@@ -3,11 +3,11 @@ Use case para rastrear histórico de execução de emendas
 """
 from typing import List, Optional, Dict
 import structlog
-import uuid
-from datetime import datetime
 
 from src.domain.entities.emenda_pix import EmendaPix
+from src.domain.entities.emenda_history import EmendaHistoryEntry
 from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
+from src.domain.repositories.emenda_history_repository import EmendaHistoryRepository
 
 logger = structlog.get_logger()
 
@@ -15,11 +15,13 @@ logger = structlog.get_logger()
 class TrackHistoryUseCase:
     """Rastreia histórico de execução de emendas"""
     
-    def __init__(self, repository: EmendaPixRepository):
+    def __init__(
+        self,
+        repository: EmendaPixRepository,
+        history_repository: EmendaHistoryRepository
+    ):
         self.repository = repository
-        # Em produção, usar banco de dados
-        # Por enquanto, armazenar em memória para demo
-        self.history: Dict[str, List[Dict]] = {}
+        self.history_repository = history_repository
     
     async def record_change(
         self,
@@ -43,38 +45,22 @@ class TrackHistoryUseCase:
         """
         try:
             # Verificar se houve mudança significativa
-            if old_status == emenda.status_execucao and \
-               old_percentual == emenda.percentual_executado and \
-               old_valor_pago == emenda.valor_pago:
+            entry = EmendaHistoryEntry.from_change(
+                emenda,
+                old_status,
+                old_percentual,
+                old_valor_pago,
+                changed_by=changed_by,
+                change_reason=change_reason
+            )
+            if entry is None:
                 return {
                     "success": False,
                     "message": "Nenhuma mudança detectada"
                 }
             
-            # Criar registro de histórico
-            history_entry = {
-                "id": str(uuid.uuid4()),
-                "emenda_id": emenda.id,
-                "timestamp": datetime.now().isoformat(),
-                "status_anterior": old_status,
-                "status_novo": emenda.status_execucao,
-                "percentual_anterior": old_percentual,
-                "percentual_novo": emenda.percentual_executado,
-                "valor_pago_anterior": old_valor_pago,
-                "valor_pago_novo": emenda.valor_pago,
-                "changed_by": changed_by,
-                "change_reason": change_reason,
-                "changes": self._detect_changes(
-                    old_status, emenda.status_execucao,
-                    old_percentual, emenda.percentual_executado,
-                    old_valor_pago, emenda.valor_pago
-                )
-            }
-            
-            # Armazenar (em produção, salvar no banco)
-            if emenda.id not in self.history:
-                self.history[emenda.id] = []
-            self.history[emenda.id].append(history_entry)
+            await self.history_repository.save(entry)
+            history_entry = self._to_dict(entry)
             
             logger.info(
                 "history_recorded",
@@ -101,37 +87,28 @@ class TrackHistoryUseCase:
     async def get_history(
         self,
         emenda_id: str,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None
     ) -> dict:
         """
-        Obtém histórico de uma emenda
+        Obtém histórico de uma emenda (mais recente primeiro, paginado por cursor)
         
         Args:
             emenda_id: ID da emenda
-            limit: Limite de registros
+            limit: Limite de registros por página
+            cursor: next_cursor de uma página anterior
+        
+        total_entries só é calculado na primeira página (sem cursor).
+        Raises ValueError se o cursor for inválido.
         """
         try:
-            # Buscar histórico (em produção, do banco)
-            history = self.history.get(emenda_id, [])
-            
-            # Ordenar por timestamp (mais recente primeiro)
-            history_sorted = sorted(
-                history,
-                key=lambda x: x["timestamp"],
-                reverse=True
-            )[:limit]
-            
-            # Gerar timeline
-            timeline = self._generate_timeline(history_sorted)
-            
-            return {
-                "success": True,
-                "emenda_id": emenda_id,
-                "total_entries": len(history),
-                "history": history_sorted,
-                "timeline": timeline
-            }
-            
+            entries, next_cursor = await self.history_repository.find_page(
+                emenda_id,
+                limit=limit,
+                cursor=cursor
+            )
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(
                 "get_history_error",
@@ -142,6 +119,41 @@ class TrackHistoryUseCase:
                 "success": False,
                 "message": f"Erro ao obter histórico: {str(e)}"
             }
+        
+        history = [self._to_dict(entry) for entry in entries]
+        
+        # Gerar timeline
+        timeline = self._generate_timeline(history)
+        
+        return {
+            "success": True,
+            "emenda_id": emenda_id,
+            "total_entries": None if cursor else await self.history_repository.count(emenda_id),
+            "history": history,
+            "timeline": timeline,
+            "next_cursor": next_cursor
+        }
+    
+    def _to_dict(self, entry: EmendaHistoryEntry) -> Dict:
+        """Registro de histórico no formato da API"""
+        return {
+            "id": entry.id,
+            "emenda_id": entry.emenda_id,
+            "timestamp": entry.created_at.isoformat() if entry.created_at else None,
+            "status_anterior": entry.status_anterior,
+            "status_novo": entry.status_novo,
+            "percentual_anterior": entry.percentual_anterior,
+            "percentual_novo": entry.percentual_novo,
+            "valor_pago_anterior": entry.valor_pago_anterior,
+            "valor_pago_novo": entry.valor_pago_novo,
+            "changed_by": entry.changed_by,
+            "change_reason": entry.change_reason,
+            "changes": self._detect_changes(
+                entry.status_anterior, entry.status_novo,
+                entry.percentual_anterior, entry.percentual_novo,
+                entry.valor_pago_anterior, entry.valor_pago_novo
+            )
+        }
     
     def _detect_changes(
         self,
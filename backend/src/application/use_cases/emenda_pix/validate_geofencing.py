@@ -2,11 +2,16 @@
 Use case para validar geofencing de fotos/documentos
 Conceito de Triangulação de Dados - Fonte Física
 """
+import math
 from typing import Dict, List, Optional
 import structlog
 from datetime import datetime
 
+import numpy as np
+
 from src.domain.entities.emenda_pix import EmendaPix
+from src.infrastructure.validation.gazetteer import MunicipioGazetteer, get_gazetteer
+from src.infrastructure.validation.geofencing import as_coordinate, haversine_km, valid_coordinates
 
 logger = structlog.get_logger()
 
@@ -14,6 +19,14 @@ logger = structlog.get_logger()
 class ValidateGeofencingUseCase:
     """Valida geofencing de fotos/documentos comprobatórios"""
     
+    def __init__(
+        self,
+        gazetteer: Optional[MunicipioGazetteer] = None,
+        tolerance_radius_km: float = 10.0
+    ):
+        self.gazetteer = gazetteer if gazetteer is not None else get_gazetteer()
+        self.tolerance_radius_km = tolerance_radius_km
+    
     def validate(self, emenda: EmendaPix, foto_data: Dict) -> Dict:
         """
         Valida se foto/documento está dentro do geofence esperado
@@ -27,10 +40,10 @@ class ValidateGeofencingUseCase:
         """
         try:
             # Extrair coordenadas da foto
-            latitude = foto_data.get('latitude')
-            longitude = foto_data.get('longitude')
+            latitude = as_coordinate(foto_data.get('latitude'))
+            longitude = as_coordinate(foto_data.get('longitude'))
             
-            if not latitude or not longitude:
+            if not valid_coordinates(latitude, longitude):
                 return {
                     "success": False,
                     "valid": False,
@@ -50,13 +63,12 @@ class ValidateGeofencingUseCase:
                 }
             
             # Calcular distância (Haversine)
-            distance_km = self._calculate_distance(
+            distance_km = float(haversine_km(
                 latitude, longitude,
                 expected_location['latitude'], expected_location['longitude']
-            )
+            ))
             
-            # Raio de tolerância (em km) - pode ser configurável
-            tolerance_radius_km = 10.0  # 10km de raio
+            tolerance_radius_km = self.tolerance_radius_km
             
             is_valid = distance_km <= tolerance_radius_km
             
@@ -101,70 +113,84 @@ class ValidateGeofencingUseCase:
         """
         Obtém localização esperada baseada no destinatário
         
-        TODO: Integrar com API de geocodificação ou banco de coordenadas
-        Por enquanto, retorna None (será implementado com dados reais)
+        Centroide do município destinatário no gazetteer do IBGE; None para
+        destinatários que não são municípios ou que não estão no gazetteer.
         """
-        # Placeholder - em produção, buscaria coordenadas do município/estado
-        # Exemplo: API do IBGE, Google Geocoding, etc.
-        
-        # Por enquanto, retorna None para indicar que precisa de implementação
-        return None
+        if emenda.destinatario_tipo != "municipio" or not emenda.destinatario_uf:
+            return None
+        return self.gazetteer.lookup(emenda.destinatario_nome, emenda.destinatario_uf)
     
-    def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    def validate_multiple(self, emenda: EmendaPix, fotos: List[Dict]) -> Dict:
         """
-        Calcula distância entre duas coordenadas usando fórmula de Haversine
+        Valida múltiplas fotos/documentos
+        
+        As distâncias de todas as fotos ao centroide esperado são calculadas
+        de uma vez (haversine_km sobre arrays NumPy).
         
         Returns:
-            Distância em quilômetros
+            dict com o veredito de cada foto e estatísticas do lote
         """
-        from math import radians, sin, cos, sqrt, atan2
-        
-        # Raio da Terra em km
-        R = 6371.0
-        
-        # Converter para radianos
-        lat1_rad = radians(lat1)
-        lon1_rad = radians(lon1)
-        lat2_rad = radians(lat2)
-        lon2_rad = radians(lon2)
-        
-        # Diferenças
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
+        expected_location = self._get_expected_location(emenda)
+        if not expected_location:
+            return {
+                "success": False,
+                "valid": False,
+                "message": "Não foi possível determinar localização esperada",
+                "reason": "missing_expected_location",
+                "total": len(fotos)
+            }
         
-        # Fórmula de Haversine
-        a = sin(dlat / 2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
+        latitudes = np.fromiter((as_coordinate(f.get('latitude')) for f in fotos), np.float64, len(fotos))
+        longitudes = np.fromiter((as_coordinate(f.get('longitude')) for f in fotos), np.float64, len(fotos))
+        has_coordinates = valid_coordinates(latitudes, longitudes)
         
-        distance = R * c
+        distances = haversine_km(
+            latitudes, longitudes,
+            expected_location['latitude'], expected_location['longitude']
+        )
+        distances[~has_coordinates] = np.nan
+        inside = has_coordinates & (distances <= self.tolerance_radius_km)
         
-        return distance
-    
-    def validate_multiple(self, emenda: EmendaPix, fotos: List[Dict]) -> Dict:
-        """
-        Valida múltiplas fotos/documentos
+        results = [
+            {
+                "foto_id": foto.get('id', 'unknown'),
+                "valid": bool(valid),
+                "distance_km": None if math.isnan(distance) else distance,
+                "reason": None if valid else ("outside_radius" if has_coords else "missing_coordinates")
+            }
+            for foto, valid, has_coords, distance in zip(
+                fotos, inside.tolist(), has_coordinates.tolist(), np.round(distances, 2).tolist()
+            )
+        ]
         
-        Returns:
-            dict com resultados de todas as validações
-        """
-        results = []
-        valid_count = 0
+        valid_count = int(inside.sum())
+        located = distances[has_coordinates]
+        distance_stats = None
+        if located.size:
+            distance_stats = {
+                "min_km": round(float(located.min()), 2),
+                "mean_km": round(float(located.mean()), 2),
+                "median_km": round(float(np.median(located)), 2),
+                "p90_km": round(float(np.percentile(located, 90)), 2),
+                "max_km": round(float(located.max()), 2),
+            }
         
-        for foto in fotos:
-            result = self.validate(emenda, foto)
-            results.append({
-                "foto_id": foto.get('id', 'unknown'),
-                **result
-            })
-            if result.get('valid'):
-                valid_count += 1
+        logger.info(
+            "geofencing_batch_validated",
+            emenda_id=emenda.id,
+            total=len(fotos),
+            valid=valid_count
+        )
         
         return {
             "success": True,
             "total": len(fotos),
             "valid": valid_count,
             "invalid": len(fotos) - valid_count,
+            "missing_coordinates": int((~has_coordinates).sum()),
+            "tolerance_radius_km": self.tolerance_radius_km,
+            "expected_location": expected_location,
+            "distance_stats": distance_stats,
             "results": results,
             "overall_valid": valid_count == len(fotos) and len(fotos) > 0
         }
-
@@ -1,10 +1,11 @@
 """Sync legislations from external APIs"""
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timedelta
 import uuid
 import asyncio
 import structlog
 
+from src.domain.entities.job import ProgressCallback
 from src.domain.entities.legislation import Legislation
 from src.domain.repositories.legislation_repository import LegislationRepository
 from src.infrastructure.external.camara_api import CamaraAPIClient, CamaraAPIAdapter
@@ -23,12 +24,17 @@ class SyncLegislationsUseCase:
         self.repository = repository
         self.camara_client = camara_client
     
-    async def execute(self, days: int = 30) -> List[Legislation]:
+    async def execute(
+        self,
+        days: int = 30,
+        progress: Optional[ProgressCallback] = None
+    ) -> List[Legislation]:
         """
         Sync legislations from external APIs
         
         Args:
             days: Number of days to look back
+            progress: Callback (processed, total) called as each proposal finishes
             
         Returns:
             List of synced legislations
@@ -62,15 +68,22 @@ class SyncLegislationsUseCase:
                 return await self._process_single_proposal(proposal)
         
         # Process all proposals concurrently (but limited)
-        tasks = [process_proposal(proposal) for proposal in proposals]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter successful results
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error("sync_proposal_failed", error=str(result))
-            elif result:
-                synced_legislations.append(result)
+        tasks = [asyncio.ensure_future(process_proposal(proposal)) for proposal in proposals]
+        try:
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                try:
+                    result = await task
+                except Exception as e:
+                    logger.error("sync_proposal_failed", error=str(e))
+                    result = None
+                if result:
+                    synced_legislations.append(result)
+                if progress:
+                    await progress(done, len(tasks))
+        finally:
+            # Cancelled mid-way: drop the proposals not processed yet
+            for task in tasks:
+                task.cancel()
         
         logger.info("sync_completed", synced_count=len(synced_legislations), total_proposals=len(proposals))
         return synced_legislations
@@ -1,15 +1,16 @@
 """
 Use case para geração de relatórios e exportação
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, AsyncIterator, Sequence
 import csv
 import io
-import json
 from datetime import datetime
 import structlog
 
 from src.domain.entities.emenda_pix import EmendaPix
 from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
+from src.infrastructure.storage.columnar_export import ColumnarExportWriter, COLUMNAR_FIELDS
+from src.infrastructure.storage.json_codec import dumps
 
 logger = structlog.get_logger()
 
@@ -17,128 +18,181 @@ logger = structlog.get_logger()
 class GenerateReportsUseCase:
     """Gera relatórios e exporta dados"""
     
+    # Linhas por trecho enviado nas exportações em streaming
+    EXPORT_CHUNK_ROWS = 500
+    
+    # Colunas lidas do banco por formato de exportação
+    CSV_FIELDS = (
+        "numero_emenda", "ano", "autor_nome", "destinatario_nome",
+        "valor_aprovado", "valor_pago", "percentual_executado", "status_execucao",
+        "data_inicio", "data_prevista_conclusao", "processo_sei", "link_portal_transparencia",
+    )
+    JSON_FIELDS = CSV_FIELDS + ("plano_trabalho",)
+    
+    # Linhas por record batch / row group nas exportações colunares
+    COLUMNAR_BATCH_ROWS = 10000
+    
     def __init__(self, repository: EmendaPixRepository):
         self.repository = repository
     
-    async def export_to_csv(
+    async def stream_csv(
         self,
         filters: Optional[Dict] = None
-    ) -> str:
+    ) -> AsyncIterator[str]:
         """
-        Exporta emendas para CSV
+        Exporta emendas para CSV em partes (streaming)
         
         Args:
             filters: Filtros opcionais (status, autor, destinatario, etc.)
         
-        Returns:
-            String CSV
+        Yields:
+            Trechos do CSV, começando pelo cabeçalho
         """
-        try:
-            # Buscar emendas
-            emendas = await self._get_filtered_emendas(filters)
-            
-            # Criar CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Cabeçalho
+        output = io.StringIO()
+        writer = csv.writer(output)
+        
+        # Cabeçalho
+        writer.writerow([
+            "Número Emenda",
+            "Ano",
+            "Autor",
+            "Destinatário",
+            "Valor Aprovado",
+            "Valor Pago",
+            "Percentual Executado",
+            "Status Execução",
+            "Data Início",
+            "Data Vencimento",
+            "Processo CEIS",
+            "Link Portal Transparência"
+        ])
+        
+        count = 0
+        async for emenda in self._stream_filtered_emendas(filters, self.CSV_FIELDS):
             writer.writerow([
-                "Número Emenda",
-                "Ano",
-                "Autor",
-                "Destinatário",
-                "Valor Aprovado",
-                "Valor Pago",
-                "Percentual Executado",
-                "Status Execução",
-                "Data Início",
-                "Data Vencimento",
-                "Processo CEIS",
-                "Link Portal Transparência"
+                emenda.numero_emenda,
+                emenda.ano,
+                emenda.autor_nome,
+                emenda.destinatario_nome,
+                emenda.valor_aprovado,
+                emenda.valor_pago,
+                emenda.percentual_executado,
+                emenda.status_execucao,
+                emenda.data_inicio.isoformat() if emenda.data_inicio else "",
+                emenda.data_prevista_conclusao.isoformat() if emenda.data_prevista_conclusao else "",
+                emenda.processo_sei or "",
+                emenda.link_portal_transparencia or ""
             ])
-            
-            # Dados
-            for emenda in emendas:
-                writer.writerow([
-                    emenda.numero_emenda,
-                    emenda.ano,
-                    emenda.autor_nome,
-                    emenda.destinatario_nome,
-                    emenda.valor_aprovado,
-                    emenda.valor_pago,
-                    emenda.percentual_executado,
-                    emenda.status_execucao,
-                    emenda.data_inicio.isoformat() if emenda.data_inicio else "",
-                    emenda.data_vencimento.isoformat() if emenda.data_vencimento else "",
-                    emenda.processo_ceis or "",
-                    emenda.link_portal_transparencia or ""
-                ])
-            
-            csv_content = output.getvalue()
-            output.close()
-            
-            logger.info(
-                "csv_exported",
-                emendas_count=len(emendas),
-                filters=filters
-            )
-            
-            return csv_content
-            
-        except Exception as e:
-            logger.error("csv_export_error", error=str(e))
-            raise
+            count += 1
+            if count % self.EXPORT_CHUNK_ROWS == 0:
+                yield self._drain(output)
+        
+        yield self._drain(output)
+        logger.info("csv_exported", emendas_count=count, filters=filters)
     
-    async def export_to_json(
+    async def stream_json(
         self,
         filters: Optional[Dict] = None
-    ) -> str:
+    ) -> AsyncIterator[bytes]:
         """
-        Exporta emendas para JSON
+        Exporta emendas para um array JSON em partes (streaming)
         
         Args:
             filters: Filtros opcionais
         
-        Returns:
-            String JSON
+        Yields:
+            Trechos (UTF-8) de um documento JSON válido
         """
-        try:
-            # Buscar emendas
-            emendas = await self._get_filtered_emendas(filters)
-            
-            # Converter para dict
-            data = []
-            for emenda in emendas:
-                data.append({
-                    "id": emenda.id,
-                    "numero_emenda": emenda.numero_emenda,
-                    "ano": emenda.ano,
-                    "autor_nome": emenda.autor_nome,
-                    "destinatario_nome": emenda.destinatario_nome,
-                    "valor_aprovado": emenda.valor_aprovado,
-                    "valor_pago": emenda.valor_pago,
-                    "percentual_executado": emenda.percentual_executado,
-                    "status_execucao": emenda.status_execucao,
-                    "data_inicio": emenda.data_inicio.isoformat() if emenda.data_inicio else None,
-                    "data_vencimento": emenda.data_vencimento.isoformat() if emenda.data_vencimento else None,
-                    "processo_ceis": emenda.processo_ceis,
-                    "link_portal_transparencia": emenda.link_portal_transparencia,
-                    "plano_trabalho": emenda.plano_trabalho
-                })
-            
-            json_content = json.dumps(data, indent=2, ensure_ascii=False)
-            
-            logger.info(
-                "json_exported",
-                emendas_count=len(emendas),
-                filters=filters
-            )
-            
-            return json_content
-            
-        except Exception as e:
-            logger.error("json_export_error", error=str(e))
-            raise
+        count = 0
+        chunk = [b"["]
+        async for emenda in self._stream_filtered_emendas(filters, self.JSON_FIELDS):
+            chunk.append((b"\n" if count == 0 else b",\n") + dumps(self._to_export_dict(emenda)))
+            count += 1
+            if count % self.EXPORT_CHUNK_ROWS == 0:
+                yield b"".join(chunk)
+                chunk = []
+        
+        chunk.append(b"\n]\n")
+        yield b"".join(chunk)
+        logger.info("json_exported", emendas_count=count, filters=filters)
+    
+    async def stream_ndjson(
+        self,
+        filters: Optional[Dict] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Exporta emendas em NDJSON (um objeto JSON por linha), em partes
+        
+        Args:
+            filters: Filtros opcionais
+        """
+        count = 0
+        chunk = []
+        async for emenda in self._stream_filtered_emendas(filters, self.JSON_FIELDS):
+            chunk.append(dumps(self._to_export_dict(emenda)) + b"\n")
+            count += 1
+            if count % self.EXPORT_CHUNK_ROWS == 0:
+                yield b"".join(chunk)
+                chunk = []
+        
+        yield b"".join(chunk)
+        logger.info("ndjson_exported", emendas_count=count, filters=filters)
+    
+    async def stream_columnar(
+        self,
+        format: str = "parquet",
+        filters: Optional[Dict] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Exporta emendas em formato colunar (Parquet ou Arrow IPC), em partes
+        
+        Cada lote de COLUMNAR_BATCH_ROWS emendas lido do cursor vira um
+        record batch tipado, escrito e enviado antes do próximo lote.
+        
+        Args:
+            format: 'parquet' ou 'arrow'
+            filters: Filtros opcionais
+        """
+        writer = ColumnarExportWriter(format=format)
+        batch: List[EmendaPix] = []
+        async for emenda in self._stream_filtered_emendas(
+            filters, COLUMNAR_FIELDS, batch_size=self.COLUMNAR_BATCH_ROWS
+        ):
+            batch.append(emenda)
+            if len(batch) == self.COLUMNAR_BATCH_ROWS:
+                yield writer.write_batch(batch)
+                batch = []
+        
+        yield writer.write_batch(batch)
+        yield writer.close()
+        logger.info("columnar_exported", format=format, emendas_count=writer.rows, filters=filters)
+    
+    def _to_export_dict(self, emenda: EmendaPix) -> Dict:
+        """Registro das exportações JSON/NDJSON"""
+        return {
+            "id": emenda.id,
+            "numero_emenda": emenda.numero_emenda,
+            "ano": emenda.ano,
+            "autor_nome": emenda.autor_nome,
+            "destinatario_nome": emenda.destinatario_nome,
+            "valor_aprovado": emenda.valor_aprovado,
+            "valor_pago": emenda.valor_pago,
+            "percentual_executado": emenda.percentual_executado,
+            "status_execucao": emenda.status_execucao,
+            "data_inicio": emenda.data_inicio.isoformat() if emenda.data_inicio else None,
+            "data_vencimento": emenda.data_prevista_conclusao.isoformat() if emenda.data_prevista_conclusao else None,
+            "processo_ceis": emenda.processo_sei,
+            "link_portal_transparencia": emenda.link_portal_transparencia,
+            "plano_trabalho": emenda.plano_trabalho
+        }
+    
+    @staticmethod
+    def _drain(output: io.StringIO) -> str:
+        """Retorna e limpa o conteúdo acumulado no buffer"""
+        content = output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+        return content
     
     async def generate_summary_report(
         self,
@@ -244,6 +298,25 @@ class GenerateReportsUseCase:
                 "message": f"Erro ao gerar relatório: {str(e)}"
             }
     
+    def _stream_filtered_emendas(
+        self,
+        filters: Optional[Dict],
+        fields: Sequence[str],
+        batch_size: int = 1000
+    ) -> AsyncIterator[EmendaPix]:
+        """Emendas filtradas no banco, lidas por cursor (memória constante)"""
+        filters = filters or {}
+        return self.repository.stream(
+            status_execucao=filters.get("status"),
+            autor_nome=filters.get("autor"),
+            destinatario_nome=filters.get("destinatario"),
+            ano=filters.get("ano"),
+            valor_min=filters.get("valor_min"),
+            valor_max=filters.get("valor_max"),
+            fields=fields,
+            batch_size=batch_size
+        )
+    
     async def _get_filtered_emendas(
         self,
         filters: Optional[Dict] = None
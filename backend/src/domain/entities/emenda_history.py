@@ -0,0 +1,60 @@
+"""Emenda execution history entity"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict
+import uuid
+
+from src.domain.entities.emenda_pix import EmendaPix
+
+
+@dataclass
+class EmendaHistoryEntry:
+    """One change of status, execution percentage or paid value of an emenda"""
+    id: str
+    emenda_id: str
+    status_novo: str
+    percentual_novo: float
+    status_anterior: Optional[str] = None
+    percentual_anterior: Optional[float] = None
+    valor_pago_anterior: Optional[float] = None
+    valor_pago_novo: Optional[float] = None
+    changed_by: Optional[str] = None
+    change_reason: Optional[str] = None
+    extra_data: Dict = field(default_factory=dict)
+    created_at: Optional[datetime] = None
+    
+    @classmethod
+    def from_change(
+        cls,
+        emenda: EmendaPix,
+        old_status: Optional[str],
+        old_percentual: Optional[float],
+        old_valor_pago: Optional[float],
+        changed_by: str = "system",
+        change_reason: Optional[str] = None
+    ) -> Optional["EmendaHistoryEntry"]:
+        """
+        Entrada de histórico para a emenda atualizada, ou None se nada mudou
+        
+        Compara status, percentual executado e valor pago com os valores anteriores.
+        """
+        new_percentual = emenda.percentual_executado or 0.0
+        new_valor_pago = emenda.valor_pago or 0.0
+        if old_status == emenda.status_execucao and \
+           (old_percentual or 0.0) == new_percentual and \
+           (old_valor_pago or 0.0) == new_valor_pago:
+            return None
+        
+        return cls(
+            id=str(uuid.uuid4()),
+            emenda_id=emenda.id,
+            status_anterior=old_status,
+            status_novo=emenda.status_execucao,
+            percentual_anterior=old_percentual,
+            percentual_novo=new_percentual,
+            valor_pago_anterior=old_valor_pago,
+            valor_pago_novo=new_valor_pago,
+            changed_by=changed_by,
+            change_reason=change_reason,
+            created_at=datetime.utcnow()
+        )
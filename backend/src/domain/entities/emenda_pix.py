@@ -46,6 +46,9 @@ class EmendaPix:
     validacao_geofencing: Optional[bool] = None  # Validação de geofencing
     processo_sei: Optional[str] = None  # Número do processo no CEIS
     link_portal_transparencia: Optional[str] = None
+    trust_score: Optional[float] = None  # Trust Score persistido (0-100)
+    trust_level: Optional[str] = None
+    trust_factors: Optional[Dict[str, float]] = None  # Score de cada fator
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     last_sync: Optional[datetime] = None
@@ -0,0 +1,53 @@
+"""Background job entity"""
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+import uuid
+
+# Estados de um job; os três últimos são finais
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+JOB_FINAL_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+# Callback de progresso passado aos use cases em lote: (processados, total)
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+@dataclass
+class Job:
+    """One enqueued batch operation, its progress and its result"""
+    name: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = JOB_QUEUED
+    progress_done: int = 0
+    progress_total: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in JOB_FINAL_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict (datetimes as ISO strings), used for storage and responses"""
+        data = asdict(self)
+        for key in ("created_at", "started_at", "finished_at"):
+            if data[key] is not None:
+                data[key] = data[key].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        data = dict(data)
+        for key in ("created_at", "started_at", "finished_at"):
+            if data.get(key):
+                data[key] = datetime.fromisoformat(data[key])
+        return cls(**data)
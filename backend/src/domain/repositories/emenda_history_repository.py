@@ -0,0 +1,32 @@
+"""Emenda history repository interface"""
+from typing import Protocol, Optional, List, Tuple, Sequence
+from src.domain.entities.emenda_history import EmendaHistoryEntry
+
+
+class EmendaHistoryRepository(Protocol):
+    """Repository interface for emenda execution history"""
+    
+    async def save(self, entry: EmendaHistoryEntry) -> None:
+        """Save a single entry"""
+        ...
+    
+    def add_many(self, entries: Sequence[EmendaHistoryEntry]) -> None:
+        """Stage entries in the current transaction (committed by the caller)"""
+        ...
+    
+    async def find_page(
+        self,
+        emenda_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[EmendaHistoryEntry], Optional[str]]:
+        """Timeline page (most recent first) and the cursor for the next one"""
+        ...
+    
+    async def count(self, emenda_id: str) -> int:
+        """Number of history entries of an emenda"""
+        ...
+    
+    async def delete_for_emenda(self, emenda_id: str) -> None:
+        """Stage removal of the history of an emenda"""
+        ...
@@ -1,8 +1,17 @@
 """Emenda Pix repository interface"""
-from typing import Protocol, Optional, List
+from datetime import datetime
+from typing import Protocol, Optional, List, Tuple, Dict, Sequence, AsyncContextManager, AsyncIterator
 from src.domain.entities.emenda_pix import EmendaPix
 
 
+class EmendaPixUnitOfWork(Protocol):
+    """Emenda changes committed together when the unit of work exits"""
+    
+    def add(self, emenda: EmendaPix) -> None:
+        """Register a new or changed emenda"""
+        ...
+
+
 class EmendaPixRepository(Protocol):
     """Repository interface for Emenda Pix"""
     
@@ -10,6 +19,10 @@ class EmendaPixRepository(Protocol):
         """Find emenda by ID"""
         ...
     
+    async def find_by_ids(self, ids: Sequence[str]) -> List[EmendaPix]:
+        """Find emendas by ID, in the given order"""
+        ...
+    
     async def find_by_numero(self, numero: str, ano: int) -> Optional[EmendaPix]:
         """Find emenda by number and year"""
         ...
@@ -22,16 +35,130 @@ class EmendaPixRepository(Protocol):
         destinatario_uf: Optional[str] = None,
         area: Optional[str] = None,
         status_execucao: Optional[str] = None,
-        tipo: Optional[str] = None
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at"
     ) -> List[EmendaPix]:
-        """Find all emendas with optional filters"""
+        """Find all emendas with optional filters (only `fields` loaded when given)"""
+        ...
+    
+    async def find_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        autor_nome: Optional[str] = None,
+        destinatario_uf: Optional[str] = None,
+        area: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None,
+        com_processo_sei: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at"
+    ) -> Tuple[List[EmendaPix], Optional[str]]:
+        """Find a page of emendas by opaque cursor, returning the next cursor (sort: -created_at, trust_score, -trust_score)"""
         ...
     
-    async def find_by_autor(self, autor_nome: str) -> List[EmendaPix]:
+    def stream(
+        self,
+        autor_nome: Optional[str] = None,
+        destinatario_nome: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        ano: Optional[int] = None,
+        valor_min: Optional[float] = None,
+        valor_max: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[EmendaPix]:
+        """Iterate over matching emendas with constant memory (server-side cursor)"""
+        ...
+    
+    def stream_columns(
+        self,
+        columns: Sequence[str],
+        batch_size: int = 10000
+    ) -> AsyncIterator[List[Tuple]]:
+        """Stream raw column tuples of every emenda, in batches"""
+        ...
+    
+    async def get_data_version(self) -> str:
+        """Token that changes whenever emendas change"""
+        ...
+    
+    async def get_last_modified(self, id: str) -> Optional[datetime]:
+        """Last change of one emenda (data or Trust Score), None if it does not exist"""
+        ...
+    
+    async def count(
+        self,
+        autor_nome: Optional[str] = None,
+        destinatario_uf: Optional[str] = None,
+        area: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None
+    ) -> Tuple[int, bool]:
+        """Count emendas matching the filters, returning (total, is_estimate)"""
+        ...
+    
+    async def aggregate_execution(
+        self,
+        group_by: str,
+        group_value: Optional[str] = None
+    ) -> List[Dict]:
+        """Aggregate execution metrics grouped by author or recipient"""
+        ...
+    
+    async def get_scoreboard(
+        self,
+        dimensao: str,
+        termo: Optional[str] = None,
+        uf: Optional[str] = None,
+        area: Optional[str] = None,
+        ano: Optional[int] = None,
+        limit: int = 50
+    ) -> Dict:
+        """Placar de Transparência totals and ranking by author or recipient"""
+        ...
+    
+    async def refresh_aggregates(self) -> None:
+        """Recompute the pre-aggregated execution metrics"""
+        ...
+    
+    async def find_trust_score_inputs(
+        self,
+        now: datetime,
+        after_id: Optional[str] = None,
+        limit: int = 5000,
+        only_changed: bool = True
+    ) -> List[Tuple]:
+        """Next batch (by id) of Trust Score inputs, optionally only rows whose inputs changed"""
+        ...
+    
+    async def save_trust_scores(self, scores: Sequence[Dict]) -> int:
+        """Store computed Trust Scores (id plus trust_* columns)"""
+        ...
+    
+    async def find_by_autor(
+        self,
+        autor_nome: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[EmendaPix]:
         """Find emendas by author"""
         ...
     
-    async def find_by_destinatario(self, destinatario_nome: str) -> List[EmendaPix]:
+    async def find_by_destinatario(
+        self,
+        destinatario_nome: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[EmendaPix]:
         """Find emendas by recipient"""
         ...
     
@@ -39,6 +166,20 @@ class EmendaPixRepository(Protocol):
         """Save or update emenda"""
         ...
     
+    async def upsert_many(
+        self,
+        emendas: Sequence[EmendaPix],
+        update_columns: Optional[Sequence[str]] = None,
+        chunk_size: Optional[int] = None,
+        changed_by: str = "system"
+    ) -> Dict[str, int]:
+        """Insert or update emendas by numero_emenda in chunks (inserted/updated/unchanged/errors)"""
+        ...
+    
+    def unit_of_work(self, changed_by: str = "system") -> AsyncContextManager[EmendaPixUnitOfWork]:
+        """Batch writes in one transaction, with side effects after the commit"""
+        ...
+    
     async def delete(self, id: str) -> None:
         """Delete emenda"""
         ...
@@ -1,6 +1,9 @@
-"""Cache service for AI simplifications"""
+"""Cache service for AI simplifications and news sentiment"""
 import hashlib
-from typing import Optional
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
 import structlog
 from src.domain.value_objects.complexity_level import ComplexityLevel
 
@@ -115,3 +118,106 @@ class SimplificationCache:
 def get_cache_service(redis_url: Optional[str] = None) -> SimplificationCache:
     """Factory function to get cache service"""
     return SimplificationCache(redis_url)
+
+
+class SentimentCache:
+    """
+    Cache of news sentiment results, keyed by a hash of the article text
+    
+    Uses Redis when available (shared by API and workers); otherwise keeps the
+    most recent `max_local_entries` results in process memory.
+    """
+    
+    KEY_PREFIX = "sentiment:"
+    
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl: int = 30 * 86400,  # 30 days
+        max_local_entries: int = 10000
+    ):
+        self.ttl = ttl
+        self.max_local_entries = max_local_entries
+        self.redis_client = None
+        self._local: "OrderedDict[str, Dict]" = OrderedDict()
+        
+        if REDIS_ASYNC_AVAILABLE and redis_url:
+            try:
+                self.redis_client = Redis.from_url(redis_url, decode_responses=True)
+                logger.info("sentiment_cache_enabled", backend="redis")
+            except Exception as e:
+                logger.warning("redis_connection_failed", error=str(e))
+                self.redis_client = None
+    
+    @staticmethod
+    def content_hash(titulo: str, resumo: str = "", conteudo: str = "") -> str:
+        """Hash of the text used for the analysis"""
+        return hashlib.sha256(f"{titulo}\n{resumo}\n{conteudo}".encode()).hexdigest()
+    
+    async def get_many(self, hashes: Iterable[str]) -> Dict[str, Dict]:
+        """Cached results for the given hashes (missing ones are left out)"""
+        hashes = list(dict.fromkeys(hashes))
+        if not hashes:
+            return {}
+        
+        if self.redis_client:
+            try:
+                values = await self.redis_client.mget([self.KEY_PREFIX + h for h in hashes])
+                return {h: json.loads(v) for h, v in zip(hashes, values) if v}
+            except Exception as e:
+                logger.error("cache_get_error", error=str(e))
+                return {}
+        
+        found = {}
+        for h in hashes:
+            if h in self._local:
+                self._local.move_to_end(h)
+                found[h] = self._local[h]
+        return found
+    
+    async def set_many(self, results: Dict[str, Dict]) -> None:
+        """Store results by hash"""
+        if not results:
+            return
+        
+        if self.redis_client:
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for h, result in results.items():
+                        pipe.setex(self.KEY_PREFIX + h, self.ttl, json.dumps(result))
+                    await pipe.execute()
+            except Exception as e:
+                logger.error("cache_set_error", error=str(e))
+            return
+        
+        for h, result in results.items():
+            self._local[h] = result
+            self._local.move_to_end(h)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+    
+    async def close(self):
+        """Close Redis connection"""
+        if self.redis_client:
+            await self.redis_client.close()
+
+
+# Cache em memória compartilhado pelo processo (sem Redis)
+_local_sentiment_cache: Optional[SentimentCache] = None
+
+
+def get_sentiment_cache() -> SentimentCache:
+    """
+    Cache de sentimento para um analisador
+    
+    Com REDIS_URL, um cliente novo a cada chamada (o chamador fecha; workers
+    rodam cada job em um loop próprio); sem Redis, o cache em memória do
+    processo.
+    """
+    global _local_sentiment_cache
+    redis_url = os.getenv("REDIS_URL")
+    if REDIS_ASYNC_AVAILABLE and redis_url:
+        return SentimentCache(redis_url)
+    if _local_sentiment_cache is None:
+        _local_sentiment_cache = SentimentCache()
+    return _local_sentiment_cache
@@ -162,5 +162,43 @@ TEXTO SIMPLIFICADO:"""
                 level=level.value
             )
             raise
-
-
+    
+    async def generate_text(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.3,
+        json_output: bool = False
+    ) -> str:
+        """
+        Generate a completion for a free-form prompt
+        
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens in the answer
+            temperature: Sampling temperature
+            json_output: Ask the model for a single JSON object (JSON mode)
+            
+        Returns:
+            Answer text
+        """
+        kwargs = {}
+        if json_output:
+            kwargs["response_format"] = {"type": "json_object"}
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            logger.info(
+                "openai_generate_complete",
+                tokens_used=response.usage.total_tokens if response.usage else None,
+                json_output=json_output
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error("openai_generate_error", error=str(e))
+            raise
@@ -3,9 +3,13 @@ Análise de Sentimentos para Notícias
 Usa IA para analisar o sentimento de notícias relacionadas a emendas
 """
 from typing import List, Dict, Optional
+import asyncio
+import json
 import structlog
 import os
 
+from src.infrastructure.ai.cache_service import SentimentCache, get_sentiment_cache
+
 logger = structlog.get_logger()
 
 # Tentar importar OpenAI, mas não falhar se não estiver disponível
@@ -17,10 +21,24 @@ except (ImportError, ValueError):
     logger.warning("OpenAI não disponível. Usando análise simples baseada em palavras-chave.")
 
 
+# Notícias classificadas por chamada à IA
+SENTIMENT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "10"))
+# Chamadas à IA simultâneas
+SENTIMENT_MAX_CONCURRENT_BATCHES = int(os.getenv("SENTIMENT_MAX_CONCURRENT_BATCHES", "4"))
+
+SENTIMENTOS = ("positivo", "negativo", "neutro")
+
+
 class SentimentAnalyzer:
     """Analisador de sentimentos para notícias"""
     
-    def __init__(self, openai_service: Optional['OpenAIService'] = None):
+    def __init__(
+        self,
+        openai_service: Optional['OpenAIService'] = None,
+        cache: Optional[SentimentCache] = None,
+        batch_size: int = SENTIMENT_BATCH_SIZE,
+        max_concurrent_batches: int = SENTIMENT_MAX_CONCURRENT_BATCHES
+    ):
         self.openai_service = None
         if OPENAI_AVAILABLE:
             try:
@@ -28,6 +46,10 @@ class SentimentAnalyzer:
             except (ImportError, ValueError):
                 logger.warning("OpenAI não configurado. Usando análise simples.")
                 self.openai_service = None
+        self.batch_size = max(1, batch_size)
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        # Só resultados da IA são guardados (a análise simples é local)
+        self.cache = (cache or get_sentiment_cache()) if self.openai_service else None
     
     async def analyze_news_sentiment(
         self,
@@ -36,95 +58,163 @@ class SentimentAnalyzer:
         """
         Analisa sentimento de uma lista de notícias
         
+        Notícias já analisadas (mesmo título e conteúdo) vêm do cache; as
+        demais são classificadas em lotes de `batch_size` por chamada à IA,
+        até `max_concurrent_batches` chamadas simultâneas.
+        
         Args:
             news: Lista de notícias
         
         Returns:
             Lista de notícias com análise de sentimento
         """
-        analyzed_news = []
+        if not news:
+            return news
         
-        for item in news:
-            try:
-                sentiment = await self._analyze_single_news(item)
-                item["sentimento"] = sentiment["sentimento"]
-                item["sentimento_score"] = sentiment["score"]
-                item["sentimento_explicacao"] = sentiment.get("explicacao", "")
-                analyzed_news.append(item)
-            except Exception as e:
-                logger.error(
-                    "sentiment_analysis_error",
-                    news_title=item.get("titulo", "unknown"),
-                    error=str(e)
-                )
-                # Manter notícia com sentimento neutro em caso de erro
-                item["sentimento"] = "neutro"
-                item["sentimento_score"] = 0.0
-                analyzed_news.append(item)
-        
-        return analyzed_news
-    
-    async def _analyze_single_news(self, news_item: Dict) -> Dict:
-        """
-        Analisa sentimento de uma notícia individual
+        if not self.openai_service:
+            for item in news:
+                self._apply(item, self._simple_sentiment_analysis(self._news_text(item)))
+            return news
         
-        Args:
-            news_item: Dicionário com dados da notícia
+        hashes = [self._content_hash(item) for item in news]
+        results = await self.cache.get_many(hashes)
         
-        Returns:
-            Dicionário com análise de sentimento
-        """
+        # Cada texto distinto é analisado uma vez, mesmo repetido na lista
+        pending = {
+            content_hash: item
+            for content_hash, item in zip(hashes, news)
+            if content_hash not in results
+        }
+        if pending:
+            analyzed = await self._analyze_in_batches(pending)
+            await self.cache.set_many(analyzed)
+            results.update(analyzed)
+        
+        for content_hash, item in zip(hashes, news):
+            result = results.get(content_hash)
+            if result is None:
+                # Fora da resposta da IA: análise simples baseada em palavras-chave
+                result = self._simple_sentiment_analysis(self._news_text(item))
+            self._apply(item, result)
+        
+        logger.info(
+            "news_sentiment_analyzed",
+            total=len(news),
+            cached=len(news) - len(pending),
+            analyzed=len(pending)
+        )
+        return news
+    
+    async def close(self) -> None:
+        """Libera o cache (conexão Redis, se houver)"""
+        if self.cache:
+            await self.cache.close()
+    
+    @staticmethod
+    def _news_text(news_item: Dict) -> str:
+        """Texto da notícia usado na análise"""
         titulo = news_item.get("titulo", "")
         resumo = news_item.get("resumo", "")
         conteudo = news_item.get("conteudo", "")
+        return f"{titulo}. {resumo}. {conteudo[:500]}"
+    
+    @staticmethod
+    def _content_hash(news_item: Dict) -> str:
+        return SentimentCache.content_hash(
+            news_item.get("titulo", ""),
+            news_item.get("resumo", ""),
+            news_item.get("conteudo", "")[:500]
+        )
+    
+    @staticmethod
+    def _apply(news_item: Dict, sentiment: Dict) -> None:
+        news_item["sentimento"] = sentiment["sentimento"]
+        news_item["sentimento_score"] = sentiment["score"]
+        news_item["sentimento_explicacao"] = sentiment.get("explicacao", "")
+    
+    async def _analyze_in_batches(self, pending: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Classifica as notícias em lotes concorrentes; hash -> resultado da IA"""
+        items = list(pending.items())
+        batches = [
+            items[start:start + self.batch_size]
+            for start in range(0, len(items), self.batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        
+        async def run(batch):
+            async with semaphore:
+                return await self._analyze_batch([item for _, item in batch])
         
-        # Combinar texto para análise
-        text = f"{titulo}. {resumo}. {conteudo[:500]}"
+        outputs = await asyncio.gather(*(run(batch) for batch in batches))
         
-        # Prompt para análise de sentimento
-        prompt = f"""Analise o sentimento da seguinte notícia sobre emenda parlamentar e retorne APENAS um JSON com:
+        results = {}
+        for batch, by_index in zip(batches, outputs):
+            for index, (content_hash, _) in enumerate(batch):
+                if index in by_index:
+                    results[content_hash] = by_index[index]
+        return results
+    
+    async def _analyze_batch(self, items: List[Dict]) -> Dict[int, Dict]:
+        """
+        Classifica um lote de notícias em uma única chamada à IA
+        
+        Returns:
+            índice da notícia no lote -> análise; índices ausentes ou
+            inválidos na resposta ficam de fora
+        """
+        noticias = "\n\n".join(
+            f"[{index}] {self._news_text(item)}" for index, item in enumerate(items)
+        )
+        prompt = f"""Analise o sentimento de cada notícia abaixo sobre emendas parlamentares e retorne APENAS um JSON no formato:
+{{"resultados": [{{"indice": 0, "sentimento": "positivo", "score": 0.8, "explicacao": "..."}}]}}
+
+Para cada notícia, pelo índice entre colchetes:
 - "sentimento": "positivo", "negativo" ou "neutro"
 - "score": número de 0.0 a 1.0 (0.0 = muito negativo, 0.5 = neutro, 1.0 = muito positivo)
 - "explicacao": breve explicação do sentimento
 
-Notícia:
-{text}
-
-Retorne APENAS o JSON, sem markdown, sem explicações adicionais."""
-
-        # Se OpenAI não estiver disponível, usar análise simples
-        if not self.openai_service:
-            return self._simple_sentiment_analysis(text)
+Notícias:
+{noticias}"""
         
         try:
             response = await self.openai_service.generate_text(
                 prompt=prompt,
-                max_tokens=150,
-                temperature=0.3
+                max_tokens=100 + 80 * len(items),
+                temperature=0.3,
+                json_output=True
             )
-            
-            # Parsear resposta JSON
-            import json
-            # Remover markdown se houver
-            response_clean = response.strip()
-            if response_clean.startswith("```"):
-                response_clean = response_clean.split("```")[1]
-                if response_clean.startswith("json"):
-                    response_clean = response_clean[4:]
-            response_clean = response_clean.strip()
-            
-            sentiment_data = json.loads(response_clean)
-            
-            return {
-                "sentimento": sentiment_data.get("sentimento", "neutro"),
-                "score": float(sentiment_data.get("score", 0.5)),
-                "explicacao": sentiment_data.get("explicacao", "")
-            }
-            
+            return self._parse_batch_response(response, len(items))
         except Exception as e:
-            logger.error("sentiment_analysis_failed", error=str(e))
-            # Fallback: análise simples baseada em palavras-chave
-            return self._simple_sentiment_analysis(text)
+            logger.error("sentiment_analysis_failed", error=str(e), batch_size=len(items))
+            return {}
+    
+    @staticmethod
+    def _parse_batch_response(response: str, size: int) -> Dict[int, Dict]:
+        """Resultados da resposta JSON, por índice"""
+        response_clean = response.strip()
+        # Remover markdown se houver
+        if response_clean.startswith("```"):
+            response_clean = response_clean.split("```")[1]
+            if response_clean.startswith("json"):
+                response_clean = response_clean[4:]
+        data = json.loads(response_clean.strip())
+        entries = data.get("resultados", []) if isinstance(data, dict) else data
+        
+        by_index = {}
+        for entry in entries:
+            try:
+                index = int(entry["indice"])
+                sentimento = entry.get("sentimento", "neutro")
+                score = min(max(float(entry.get("score", 0.5)), 0.0), 1.0)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= index < size and sentimento in SENTIMENTOS:
+                by_index[index] = {
+                    "sentimento": sentimento,
+                    "score": score,
+                    "explicacao": entry.get("explicacao", "")
+                }
+        return by_index
     
     def _simple_sentiment_analysis(self, text: str) -> Dict:
         """
@@ -0,0 +1,4 @@
+"""Portfolio analytics module"""
+from .anomaly_detection import AnomalyDetector, PortfolioColumns, get_anomaly_cache
+
+__all__ = ["AnomalyDetector", "PortfolioColumns", "get_anomaly_cache"]
@@ -0,0 +1,379 @@
+"""
+Detecção de padrões e anomalias sobre todo o portfólio de emendas
+
+As colunas numéricas são carregadas uma única vez em arrays NumPy e as
+estatísticas são robustas (mediana/MAD e quartis), calculadas por área e
+por UF do destinatário. Um valor é atípico quando o z-score robusto
+0.6745 * (x - mediana) / MAD passa de ROBUST_Z_THRESHOLD (Iglewicz e
+Hoaglin). Valores monetários e razões são comparados em escala log10.
+"""
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger()
+
+# Colunas lidas de emenda_pix, na ordem das tuplas recebidas
+ANOMALY_COLUMNS = (
+    "id", "numero_emenda", "area", "destinatario_uf", "status_execucao",
+    "valor_aprovado", "valor_empenhado", "valor_pago", "percentual_executado",
+    "data_inicio", "data_prevista_conclusao", "data_real_conclusao",
+)
+
+ROBUST_Z_THRESHOLD = 3.5
+# Grupos menores que isso não têm estatística confiável
+MIN_GROUP_SIZE = 10
+# Emendas de exemplo por padrão/anomalia na resposta
+EXAMPLES_LIMIT = 10
+# Patamar de "baixa execução" (%)
+LOW_EXECUTION_THRESHOLD = 20
+
+_SECONDS_PER_DAY = 86400.0
+
+# Colunas de agrupamento, guardadas como códigos inteiros (<coluna>_codes/_names)
+GROUP_COLUMNS = ("area", "destinatario_uf")
+
+
+# Colunas DateTime são naive; todas as datas são comparadas na mesma escala
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch_seconds(value: Optional[datetime]) -> float:
+    """Segundos desde a época (NaN quando ausente)"""
+    return np.nan if value is None else (value - _EPOCH).total_seconds()
+
+
+class PortfolioColumns:
+    """Colunas do portfólio como arrays NumPy (uma posição por emenda)"""
+
+    def __init__(self, rows: Sequence[Tuple] = ()):
+        self._chunks: Dict[str, List[np.ndarray]] = {name: [] for name in ANOMALY_COLUMNS}
+        self._group_codes: Dict[str, Dict[str, int]] = {name: {"": 0} for name in GROUP_COLUMNS}
+        self.size = 0
+        if rows:
+            self.append(rows)
+
+    @classmethod
+    async def load(cls, partitions: AsyncIterator[Sequence[Tuple]]) -> "PortfolioColumns":
+        """Monta as colunas a partir de lotes de linhas lidos por cursor"""
+        columns = cls()
+        async for rows in partitions:
+            columns.append(rows)
+        return columns.finish()
+
+    def append(self, rows: Sequence[Tuple]) -> None:
+        if not rows:
+            return
+        values = list(zip(*rows))
+        for name, column in zip(ANOMALY_COLUMNS, values):
+            if name in self._group_codes:
+                self._chunks[name].append(self._factorize(name, column))
+            else:
+                self._chunks[name].append(self._to_array(name, column))
+        self.size += len(rows)
+
+    def finish(self) -> "PortfolioColumns":
+        for name, chunks in self._chunks.items():
+            if name in self._group_codes:
+                codes = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32)
+                setattr(self, f"{name}_codes", codes)
+                setattr(self, f"{name}_names", np.array(list(self._group_codes[name]), dtype=object))
+                continue
+            if chunks:
+                array = np.concatenate(chunks)
+            else:
+                array = np.empty(0, dtype=self._to_array(name, ()).dtype)
+            setattr(self, name, array)
+        self._chunks = {}
+        return self
+
+    def _factorize(self, name: str, column) -> np.ndarray:
+        """Códigos inteiros do grupo de cada linha (0 = sem grupo)"""
+        index = self._group_codes[name]
+        return np.fromiter(
+            (index.setdefault(v or "", len(index)) for v in column),
+            dtype=np.int32,
+            count=len(column)
+        )
+
+    @staticmethod
+    def _to_array(name: str, column) -> np.ndarray:
+        if name.startswith("valor_") or name == "percentual_executado":
+            # None vira NaN
+            return np.array(column, dtype=np.float64)
+        if name.startswith("data_"):
+            return np.fromiter((_epoch_seconds(v) for v in column), dtype=np.float64, count=len(column))
+        return np.array([v or "" for v in column], dtype=object)
+
+
+def robust_z_scores(
+    values: np.ndarray,
+    codes: np.ndarray,
+    names: np.ndarray
+) -> Tuple[np.ndarray, Dict[str, Dict]]:
+    """
+    Z-score robusto de cada valor dentro do seu grupo
+
+    Args:
+        values: Valores (NaN = sem valor)
+        codes: Código do grupo de cada valor (índice em `names`)
+        names: Nomes dos grupos; o código 0 ("" = sem grupo) não recebe estatística
+
+    Returns:
+        (z-scores com NaN onde não há estatística, estatísticas por grupo)
+    """
+    z = np.full(len(values), np.nan)
+    stats = {}
+    valid = ~np.isnan(values) & (codes != 0)
+    if not valid.any():
+        return z, stats
+
+    positions = np.flatnonzero(valid)
+    order = np.argsort(codes[positions], kind="stable")
+    sorted_positions = positions[order]
+    boundaries = np.flatnonzero(np.diff(codes[sorted_positions])) + 1
+    for group_positions in np.split(sorted_positions, boundaries):
+        group = names[codes[group_positions[0]]]
+        sample = values[group_positions]
+        if len(sample) < MIN_GROUP_SIZE:
+            continue
+        median = np.median(sample)
+        deviation = np.abs(sample - median)
+        mad = np.median(deviation)
+        # MAD nulo (mais da metade dos valores iguais): usa o desvio absoluto médio
+        scale = mad / 0.6745 if mad > 0 else np.mean(deviation) * 1.2533
+        q1, q3 = np.percentile(sample, [25, 75])
+        stats[group] = {
+            "n": int(len(sample)),
+            "mediana": float(median),
+            "mad": float(mad),
+            "q1": float(q1),
+            "q3": float(q3),
+            "iqr": float(q3 - q1),
+        }
+        if scale > 0:
+            z[group_positions] = (sample - median) / scale
+    return z, stats
+
+
+def _log10(values: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(values > 0, np.log10(values), np.nan)
+
+
+def _from_log10_stats(stats: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Estatísticas calculadas em log10 de volta para a escala original"""
+    return {
+        group: {
+            "n": s["n"],
+            "mediana": round(10 ** s["mediana"], 2),
+            "q1": round(10 ** s["q1"], 2),
+            "q3": round(10 ** s["q3"], 2),
+        }
+        for group, s in stats.items()
+    }
+
+
+class AnomalyDetector:
+    """Padrões e anomalias do portfólio a partir de PortfolioColumns"""
+
+    def __init__(self, columns: PortfolioColumns, now: Optional[datetime] = None):
+        self.c = columns
+        self.now = _epoch_seconds(now or datetime.now())
+
+    def run(self) -> Dict:
+        c = self.c
+        patterns = self._patterns()
+        statistics = {}
+        anomalies = []
+
+        # Valor aprovado (log10) por área e por UF
+        valor_z, valor_uf, valor_stats = self._grouped_z(_log10(c.valor_aprovado))
+        statistics["valor_aprovado"] = valor_stats
+        anomalies += self._flag(
+            valor_z, valor_uf, "valor_alto", "valor_baixo",
+            "emendas com valor aprovado muito acima do típico da área/UF",
+            "emendas com valor aprovado muito abaixo do típico da área/UF",
+            extra={"valor_aprovado": c.valor_aprovado}
+        )
+
+        # Velocidade de execução: pontos percentuais por dia desde o início
+        fim = np.where(np.isnan(c.data_real_conclusao), self.now, c.data_real_conclusao)
+        dias = (fim - c.data_inicio) / _SECONDS_PER_DAY
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocidade = np.where(
+                (dias >= 0) & (c.percentual_executado > 0),
+                c.percentual_executado / np.maximum(dias, 1.0),
+                np.nan
+            )
+        velocidade_z, velocidade_uf, velocidade_stats = self._grouped_z(_log10(velocidade))
+        statistics["velocidade_execucao"] = velocidade_stats
+        anomalies += self._flag(
+            velocidade_z, velocidade_uf, "execucao_rapida", "execucao_lenta",
+            "emendas executadas muito mais rápido que o típico da área/UF",
+            "emendas executadas muito mais devagar que o típico da área/UF",
+            extra={"percentual_por_dia": velocidade, "percentual_executado": c.percentual_executado}
+        )
+
+        # Razão pago / empenhado
+        with np.errstate(divide="ignore", invalid="ignore"):
+            razao = np.where(c.valor_empenhado > 0, c.valor_pago / c.valor_empenhado, np.nan)
+        razao_z, razao_uf, razao_stats = self._grouped_z(_log10(razao))
+        statistics["razao_pago_empenhado"] = razao_stats
+        anomalies += self._flag(
+            razao_z, razao_uf, "razao_pagamento_alta", "razao_pagamento_baixa",
+            "emendas com pagamento/empenho muito acima do típico da área/UF",
+            "emendas com pagamento/empenho muito abaixo do típico da área/UF",
+            extra={"razao_pago_empenhado": razao}
+        )
+        # Pago acima do empenhado é sempre inconsistente, independente do grupo
+        acima = np.flatnonzero(razao > 1 + 1e-9)
+        if len(acima):
+            anomalies.append(self._entry(
+                "pagamento_acima_empenho",
+                f"{len(acima)} emendas com valor pago maior que o empenhado",
+                acima[np.argsort(-razao[acima], kind="stable")],
+                extra={"valor_empenhado": c.valor_empenhado, "valor_pago": c.valor_pago}
+            ))
+
+        return {
+            "patterns": patterns,
+            "anomalies": anomalies,
+            "statistics": statistics,
+            "summary": {
+                "total_emendas": c.size,
+                "patterns_found": len(patterns),
+                "anomalies_found": len(anomalies),
+                "z_threshold": ROBUST_Z_THRESHOLD,
+            }
+        }
+
+    def _grouped_z(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict]:
+        """
+        Z-score robusto por área e por UF; fica o de maior módulo
+
+        Returns:
+            (z-scores, máscara "veio do grupo de UF", estatísticas por grupo)
+        """
+        area_z, area_stats = robust_z_scores(values, self.c.area_codes, self.c.area_names)
+        uf_z, uf_stats = robust_z_scores(
+            values, self.c.destinatario_uf_codes, self.c.destinatario_uf_names
+        )
+        from_uf = np.isnan(area_z) | (np.abs(np.nan_to_num(uf_z)) > np.abs(np.nan_to_num(area_z)))
+        z = np.where(from_uf, uf_z, area_z)
+        return z, from_uf, {"area": _from_log10_stats(area_stats), "uf": _from_log10_stats(uf_stats)}
+
+    def _flag(
+        self,
+        z: np.ndarray,
+        from_uf: np.ndarray,
+        high_type: str,
+        low_type: str,
+        high_description: str,
+        low_description: str,
+        extra: Dict[str, np.ndarray]
+    ) -> List[Dict]:
+        entries = []
+        z_filled = np.nan_to_num(z)
+        for anomaly_type, description, positions in (
+            (high_type, high_description, np.flatnonzero(z_filled > ROBUST_Z_THRESHOLD)),
+            (low_type, low_description, np.flatnonzero(z_filled < -ROBUST_Z_THRESHOLD)),
+        ):
+            if not len(positions):
+                continue
+            ordered = positions[np.argsort(-np.abs(z_filled[positions]), kind="stable")]
+            entries.append(self._entry(
+                anomaly_type,
+                f"{len(positions)} {description}",
+                ordered,
+                extra={**extra, "z_score": z},
+                from_uf=from_uf
+            ))
+        return entries
+
+    def _entry(
+        self,
+        anomaly_type: str,
+        description: str,
+        positions: np.ndarray,
+        extra: Dict[str, np.ndarray],
+        from_uf: Optional[np.ndarray] = None
+    ) -> Dict:
+        examples = []
+        for i in positions[:EXAMPLES_LIMIT]:
+            example = {"id": self.c.id[i], "numero_emenda": self.c.numero_emenda[i]}
+            if from_uf is not None:
+                # Grupo cuja estatística marcou a emenda
+                example["grupo"] = (
+                    f"uf:{self.c.destinatario_uf_names[self.c.destinatario_uf_codes[i]]}"
+                    if from_uf[i]
+                    else f"area:{self.c.area_names[self.c.area_codes[i]]}"
+                )
+            for name, values in extra.items():
+                example[name] = round(float(values[i]), 4)
+            examples.append(example)
+        return {
+            "type": anomaly_type,
+            "description": description,
+            "count": int(len(positions)),
+            "emendas": examples,
+        }
+
+    def _patterns(self) -> List[Dict]:
+        c = self.c
+        patterns = []
+
+        percentual = np.nan_to_num(c.percentual_executado)
+        low = np.flatnonzero((percentual < LOW_EXECUTION_THRESHOLD) & (c.status_execucao != "cancelada"))
+        if len(low):
+            patterns.append(self._entry(
+                "baixa_execucao",
+                f"{len(low)} emendas com execução abaixo de {LOW_EXECUTION_THRESHOLD}%",
+                low[np.argsort(percentual[low], kind="stable")],
+                extra={"percentual_executado": percentual}
+            ))
+
+        # Mesma regra de EmendaPix.esta_atrasada()
+        dias_atraso = (self.now - c.data_prevista_conclusao) / _SECONDS_PER_DAY
+        delayed = np.flatnonzero((np.nan_to_num(dias_atraso, nan=-1) > 0) & (percentual < 100))
+        if len(delayed):
+            patterns.append(self._entry(
+                "atraso",
+                f"{len(delayed)} emendas atrasadas",
+                delayed[np.argsort(-dias_atraso[delayed], kind="stable")],
+                extra={"dias_atraso": np.floor(np.nan_to_num(dias_atraso))}
+            ))
+        return patterns
+
+
+class AnomalyReportCache:
+    """Último relatório calculado, válido enquanto a versão dos dados não muda"""
+
+    def __init__(self):
+        self.version: Optional[str] = None
+        self.report: Optional[Dict] = None
+        self.generated_at: Optional[datetime] = None
+
+    def get(self, version: str) -> Optional[Dict]:
+        if self.report is not None and self.version == version:
+            return self.report
+        return None
+
+    def set(self, version: str, report: Dict) -> None:
+        self.version = version
+        self.report = report
+        self.generated_at = datetime.utcnow()
+
+
+# Instância global do cache
+_global_cache: Optional[AnomalyReportCache] = None
+
+
+def get_anomaly_cache() -> AnomalyReportCache:
+    """Obtém instância global do cache de anomalias"""
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = AnomalyReportCache()
+    return _global_cache
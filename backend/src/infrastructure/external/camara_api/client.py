@@ -4,23 +4,17 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import structlog
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
 
 class CamaraAPIClient:
     """Client for Câmara dos Deputados API"""
     
-    BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
-    
-    def __init__(self, timeout: int = 10):  # Reduced from 30 to 10 seconds
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json"
-            },
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)  # Connection pooling
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared pooled client (keep-alive, HTTP/2), closed on app shutdown
+        self.client = client or get_http_client("camara")
     
     async def get_proposals(
         self,
@@ -148,8 +142,7 @@ class CamaraAPIClient:
             return None
     
     async def close(self):
-        """Close the client"""
-        await self.client.aclose()
+        """No-op: the HTTP client is shared and closed on app shutdown"""
 
 
 
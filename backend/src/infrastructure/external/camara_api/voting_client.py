@@ -3,22 +3,17 @@ import httpx
 from typing import List, Dict, Optional
 import structlog
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
 
 class CamaraVotingClient:
     """Client for fetching voting data from Câmara dos Deputados"""
     
-    BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
-    
-    def __init__(self, timeout: int = 30):
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json"
-            }
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared pooled client (keep-alive, HTTP/2), closed on app shutdown
+        self.client = client or get_http_client("camara")
     
     async def get_proposal_votings(self, proposal_id: int) -> List[Dict]:
         """
@@ -78,8 +73,7 @@ class CamaraVotingClient:
             return []
     
     async def close(self):
-        """Close the client"""
-        await self.client.aclose()
+        """No-op: the HTTP client is shared and closed on app shutdown"""
 
 
 
@@ -12,33 +12,23 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import structlog
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
 
 class CEISClient:
     """Cliente para API do Sistema CEIS e processos eletrônicos"""
     
-    # URLs base (ajustar conforme sistema real)
-    CEIS_BASE_URL = "https://ceis.gov.br/api"
-    SEI_BASE_URL = "https://sei.gov.br/api"  # Exemplo
-    
-    def __init__(self, timeout: int = 30):
-        self.ceis_client = httpx.AsyncClient(
-            base_url=self.CEIS_BASE_URL,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json",
-                "Authorization": ""  # Seria necessário token de autenticação
-            }
-        )
-        self.sei_client = httpx.AsyncClient(
-            base_url=self.SEI_BASE_URL,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json",
-                "Authorization": ""
-            }
-        )
+    def __init__(
+        self,
+        ceis_client: Optional[httpx.AsyncClient] = None,
+        sei_client: Optional[httpx.AsyncClient] = None
+    ):
+        # Clientes compartilhados do processo, com pool e rate limit por host
+        # (CEIS_REQUESTS_PER_SECOND), fechados no shutdown
+        self.ceis_client = ceis_client or get_http_client("ceis")
+        self.sei_client = sei_client or get_http_client("sei")
     
     async def get_plano_trabalho(
         self,
@@ -222,9 +212,7 @@ class CEISClient:
             return None
     
     async def close(self):
-        """Fecha os clientes"""
-        await self.ceis_client.aclose()
-        await self.sei_client.aclose()
+        """Nada a fechar: os clientes HTTP são compartilhados e fechados no shutdown"""
 
 
 # Nota para o pitch:
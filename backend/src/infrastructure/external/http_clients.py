@@ -0,0 +1,193 @@
+"""
+Clientes HTTP compartilhados para as integrações externas
+
+Um httpx.AsyncClient por upstream, com pool de conexões keep-alive, HTTP/2
+(se o pacote h2 estiver instalado), timeouts próprios e o transporte
+resiliente de resilience.py (circuit breaker, retry e orçamento de latência). Os clientes vivem
+enquanto a aplicação estiver de pé: a API os fecha no lifespan e o worker ao
+fim de cada job. Os clientes das integrações (CamaraAPIClient, CEISClient,
+...) usam get_http_client(nome) em vez de criar o próprio.
+"""
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Union
+import structlog
+
+import httpx
+
+from src.infrastructure.external.rate_limiter import HostRateLimiter
+from src.infrastructure.external.resilience import (
+    CircuitBreaker, HostCircuitBreakers, ResilientTransport
+)
+
+logger = structlog.get_logger()
+
+# Try to import h2 (HTTP/2 support for httpx)
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+    logger.warning("h2 not available. External HTTP clients will use HTTP/1.1.")
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Configuração do cliente de um upstream"""
+    base_url: str = ""
+    timeout: float = 30.0  # leitura, escrita e espera por conexão do pool
+    connect_timeout: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    headers: Dict[str, str] = field(default_factory=dict)
+    follow_redirects: bool = False
+    requests_per_second: float = 0.0  # 0 = sem limite
+    latency_budget: float = 15.0  # tempo total até a resposta, com retries (0 = sem limite)
+    max_retries: int = 2  # só GET/HEAD
+    failure_threshold: int = 5  # falhas seguidas que abrem o circuito
+    reset_timeout: float = 30.0  # tempo com o circuito aberto antes do teste
+
+
+JSON_HEADERS = {"Accept": "application/json"}
+
+UPSTREAMS: Dict[str, UpstreamConfig] = {
+    "camara": UpstreamConfig(
+        base_url="https://dadosabertos.camara.leg.br/api/v2",
+        timeout=10.0,
+        headers=JSON_HEADERS
+    ),
+    "senado": UpstreamConfig(
+        base_url="https://legis.senado.leg.br/dadosabertos",
+        headers=JSON_HEADERS
+    ),
+    "tse": UpstreamConfig(
+        base_url="https://dadosabertos.tse.jus.br",
+        headers=JSON_HEADERS
+    ),
+    "datajud": UpstreamConfig(
+        base_url="https://dadosabertos.cnj.jus.br",
+        headers=JSON_HEADERS
+    ),
+    "querido_diario": UpstreamConfig(
+        base_url="https://api.queridodiario.ok.org.br/api",
+        headers=JSON_HEADERS
+    ),
+    "portal_transparencia": UpstreamConfig(
+        base_url="https://portaldatransparencia.gov.br/api-de-dados",
+        timeout=10.0,
+        latency_budget=8.0,
+        headers={
+            "Accept": "application/json",
+            "chave-api-dados": os.getenv("PORTAL_TRANSPARENCIA_API_KEY", "")
+        }
+    ),
+    "ceis": UpstreamConfig(
+        base_url="https://ceis.gov.br/api",
+        headers={"Accept": "application/json", "Authorization": ""},
+        requests_per_second=float(os.getenv("CEIS_REQUESTS_PER_SECOND", "20"))
+    ),
+    "sei": UpstreamConfig(
+        base_url="https://sei.gov.br/api",
+        headers={"Accept": "application/json", "Authorization": ""},
+        requests_per_second=float(os.getenv("CEIS_REQUESTS_PER_SECOND", "20"))
+    ),
+    "transferegov": UpstreamConfig(
+        base_url="https://api.transferegov.gestao.gov.br",
+        latency_budget=30.0
+    ),
+    # Sites de notícias e URLs informadas pelo usuário (sem base_url: um
+    # circuito por host)
+    "news": UpstreamConfig(
+        headers={"User-Agent": "Mozilla/5.0 (compatible; VozCidadaBot/1.0)"},
+        follow_redirects=True
+    ),
+    "generic": UpstreamConfig(timeout=10.0, follow_redirects=True),
+}
+
+
+class HTTPClientRegistry:
+    """Cria sob demanda e guarda um cliente pooled por upstream"""
+
+    def __init__(self, upstreams: Optional[Dict[str, UpstreamConfig]] = None):
+        self.upstreams = upstreams if upstreams is not None else UPSTREAMS
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        # Sobrevivem ao fechamento dos clientes: o estado do upstream continua valendo
+        self._breakers: Dict[str, Union[CircuitBreaker, HostCircuitBreakers]] = {}
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """Cliente do upstream `name`; KeyError se não configurado"""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._clients[name] = self._create(name, self.upstreams[name])
+        return client
+
+    def breaker(self, name: str) -> Union[CircuitBreaker, HostCircuitBreakers]:
+        """
+        Circuit breaker do upstream `name`
+
+        Sem base_url o cliente fala com hosts arbitrários: cada host tem o seu
+        circuito, e falhas de um não recusam requisições aos outros.
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            config = self.upstreams[name]
+            breaker_class = CircuitBreaker if config.base_url else HostCircuitBreakers
+            breaker = self._breakers[name] = breaker_class(
+                name, config.failure_threshold, config.reset_timeout
+            )
+        return breaker
+
+    def _create(self, name: str, config: UpstreamConfig) -> httpx.AsyncClient:
+        event_hooks = {}
+        if config.requests_per_second:
+            event_hooks["request"] = [HostRateLimiter(config.requests_per_second)]
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections
+            ),
+            http2=H2_AVAILABLE
+        )
+        return httpx.AsyncClient(
+            base_url=config.base_url,
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            headers=config.headers,
+            follow_redirects=config.follow_redirects,
+            event_hooks=event_hooks,
+            transport=ResilientTransport(
+                transport,
+                self.breaker(name),
+                max_retries=config.max_retries,
+                latency_budget=config.latency_budget
+            )
+        )
+
+    def stats(self) -> Dict[str, Dict]:
+        """Estado dos circuit breakers por upstream, para monitoramento"""
+        return {name: self.breaker(name).stats() for name in self.upstreams}
+
+    async def close(self) -> None:
+        """Fecha todos os clientes (novos são criados se usados depois)"""
+        clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("http_client_close_failed", upstream=name, error=str(e))
+
+
+# Instância global do registro
+_global_registry: Optional[HTTPClientRegistry] = None
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Obtém instância global do registro de clientes HTTP"""
+    global _global_registry
+    if _global_registry is None:
+        _global_registry = HTTPClientRegistry()
+    return _global_registry
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """Cliente compartilhado do upstream `name`"""
+    return get_http_client_registry().get(name)
@@ -7,14 +7,55 @@ Estrutura preparada para integração futura com dados reais.
 Nota: Para o hackathon, estamos usando dados simulados para garantir
 uma demo estável. Esta estrutura está pronta para integração real em produção.
 """
+import hashlib
 import httpx
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import structlog
 import re
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
+# Parâmetros de rastreamento ignorados na comparação de URLs (além de utm_*)
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "amp", "outputtype"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Forma canônica da URL de uma notícia
+
+    Ignora esquema, "www.", fragmento, barra final e parâmetros de
+    rastreamento; a ordem dos parâmetros restantes não importa.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("", host, path, urlencode(query), ""))
+
+
+def url_hash(url: str) -> str:
+    """Identificador da notícia: hash da URL normalizada"""
+    return hashlib.sha256(normalize_url(url).encode()).hexdigest()[:32]
+
+
+def emenda_news_query(
+    autor_nome: Optional[str] = None,
+    destinatario_nome: Optional[str] = None
+) -> str:
+    """Consulta de notícias compartilhada pelas emendas do mesmo autor e destinatário"""
+    terms = [term.strip() for term in (autor_nome, destinatario_nome) if term and term.strip()]
+    return " ".join(terms)
+
 
 class NewsScraperClient:
     """Cliente para buscar notícias relacionadas a emendas"""
@@ -27,14 +68,9 @@ class NewsScraperClient:
         # Adicionar mais fontes conforme necessário
     ]
     
-    def __init__(self, timeout: int = 30):
-        self.client = httpx.AsyncClient(
-            timeout=timeout,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; VozCidadaBot/1.0)"
-            },
-            follow_redirects=True
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Cliente compartilhado do processo (keep-alive, HTTP/2), fechado no shutdown
+        self.client = client or get_http_client("news")
     
     async def search_news(
         self,
@@ -66,6 +102,9 @@ class NewsScraperClient:
             
             # Simular busca (em produção, fazer scraping real)
             news = self._simulate_news_search(query, limit, days_back)
+            for item in news:
+                if item.get("link"):
+                    item["url_hash"] = url_hash(item["link"])
             
             logger.info(
                 "news_search_completed",
@@ -129,6 +168,7 @@ class NewsScraperClient:
         
         # Extrair termos relevantes da query
         terms = query.lower().split()
+        slug = "-".join(re.findall(r"\w+", query.lower())) or "geral"
         
         # Simular algumas notícias
         for i in range(min(limit, 5)):
@@ -147,7 +187,7 @@ class NewsScraperClient:
                 "titulo": title,
                 "fonte": "Agência Brasil" if i % 2 == 0 else "Câmara dos Deputados",
                 "data": date.strftime("%Y-%m-%d"),
-                "link": f"https://example.com/noticia-{i+1}",
+                "link": f"https://example.com/noticia-{slug}-{i+1}",
                 "resumo": f"Notícia relacionada à {query[:30]}...",
                 "sentimento": "neutro" if i % 3 == 0 else ("positivo" if i % 2 == 0 else "negativo")
             })
@@ -203,8 +243,7 @@ class NewsScraperClient:
         return datetime.now().strftime("%Y-%m-%d")
     
     async def close(self):
-        """Fecha o cliente"""
-        await self.client.aclose()
+        """Nada a fechar: o cliente HTTP é compartilhado e fechado no shutdown"""
 
 
 # Nota para o pitch:
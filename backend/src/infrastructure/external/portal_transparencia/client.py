@@ -10,23 +10,17 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import structlog
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
 
 class PortalTransparenciaClient:
     """Cliente para API do Portal da Transparência"""
     
-    BASE_URL = "https://portaldatransparencia.gov.br/api-de-dados"
-    
-    def __init__(self, timeout: int = 30):
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json",
-                "chave-api-dados": ""  # Seria necessário obter chave da API
-            }
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Cliente compartilhado do processo (keep-alive, HTTP/2), fechado no shutdown
+        self.client = client or get_http_client("portal_transparencia")
     
     async def get_emendas_pix(
         self,
@@ -82,8 +76,7 @@ class PortalTransparenciaClient:
             return None
     
     async def close(self):
-        """Fecha o cliente"""
-        await self.client.aclose()
+        """Nada a fechar: o cliente HTTP é compartilhado e fechado no shutdown"""
 
 
 # Nota para o pitch:
@@ -4,22 +4,17 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import structlog
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
 
 class QueridoDiarioClient:
     """Client for Querido Diário API - Diários Oficiais de municípios brasileiros"""
     
-    BASE_URL = "https://api.queridodiario.ok.org.br/api"
-    
-    def __init__(self, timeout: int = 30):
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json"
-            }
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared pooled client (keep-alive, HTTP/2), closed on app shutdown
+        self.client = client or get_http_client("querido_diario")
     
     async def search_terms(
         self,
@@ -87,8 +82,7 @@ class QueridoDiarioClient:
             return None
     
     async def close(self):
-        """Close the client"""
-        await self.client.aclose()
+        """No-op: the HTTP client is shared and closed on app shutdown"""
 
 
 
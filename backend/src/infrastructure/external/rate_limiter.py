@@ -0,0 +1,39 @@
+"""
+Limite de requisições por host para clientes httpx
+
+Usado como event hook de requisição:
+
+    limiter = HostRateLimiter(requests_per_second=10)
+    httpx.AsyncClient(event_hooks={"request": [limiter]})
+
+Cada host tem a sua própria agenda; um limiter compartilhado entre clientes
+aplica o mesmo teto ao host, qualquer que seja o cliente.
+"""
+import asyncio
+import time
+from typing import Dict
+
+import httpx
+
+
+class HostRateLimiter:
+    """Espaça o início das requisições a cada host em 1/requests_per_second"""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        # host -> instante (monotonic) reservado para a próxima requisição
+        self._next_slot: Dict[str, float] = {}
+
+    async def __call__(self, request: httpx.Request) -> None:
+        await self.acquire(request.url.host)
+
+    async def acquire(self, host: str) -> None:
+        """Espera a vez de `host`; sem limite configurado, retorna direto"""
+        if not self.interval:
+            return
+        # Reserva o horário antes de dormir: chamadas concorrentes ficam em fila
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
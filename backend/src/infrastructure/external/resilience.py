@@ -0,0 +1,222 @@
+"""
+Resiliência das chamadas aos upstreams: circuit breaker, retry e orçamento de latência
+
+ResilientTransport envolve o transporte httpx de um upstream:
+
+- Circuit breaker: após `failure_threshold` falhas seguidas (erro de rede,
+  timeout ou 5xx) o circuito abre e as requisições falham na hora com
+  CircuitOpenError. Passado `reset_timeout`, uma requisição de teste é
+  liberada (half-open): sucesso fecha o circuito, falha reabre.
+- Retry: GET/HEAD são repetidos até `max_retries` vezes em erro de rede,
+  timeout, 429 ou 502/503/504, com backoff exponencial e jitter total.
+- Orçamento de latência: a requisição inteira (tentativas e esperas
+  incluídas) tem até `latency_budget` segundos para receber a resposta;
+  estourado, falha com LatencyBudgetExceeded.
+
+Upstreams sem base_url (notícias, URLs informadas pelo usuário) usam
+HostCircuitBreakers: um circuito por host, para que um site fora do ar não
+bloqueie os demais.
+
+Os clientes das integrações já tratam exceções caindo para dados mock ou
+listas vazias, então falhar rápido basta para liberar o worker.
+"""
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+import structlog
+
+import httpx
+
+logger = structlog.get_logger()
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+IDEMPOTENT_METHODS = {"GET", "HEAD"}
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Circuito do upstream aberto: requisição recusada sem chamar o upstream"""
+
+
+class LatencyBudgetExceeded(httpx.TimeoutException):
+    """Requisição excedeu o orçamento de latência do upstream"""
+
+
+class CircuitBreaker:
+    """Circuit breaker por contagem de falhas consecutivas"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Se a requisição pode seguir para o upstream"""
+        if self.state == CIRCUIT_CLOSED:
+            return True
+        if self.state == CIRCUIT_OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = CIRCUIT_HALF_OPEN
+        # half-open: uma requisição de teste por vez
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        if self.state != CIRCUIT_CLOSED:
+            logger.info("circuit_closed", upstream=self.name)
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.state == CIRCUIT_HALF_OPEN or (
+            self.state == CIRCUIT_CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = CIRCUIT_OPEN
+            self.opened_at = time.monotonic()
+            self.trips += 1
+            logger.warning(
+                "circuit_opened",
+                upstream=self.name,
+                consecutive_failures=self.consecutive_failures,
+                trips=self.trips
+            )
+
+    def release(self) -> None:
+        """Libera a vaga de teste de uma requisição que terminou sem veredito"""
+        self._trial_in_flight = False
+
+    def for_request(self, request: httpx.Request) -> "CircuitBreaker":
+        return self
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+        }
+
+
+class HostCircuitBreakers:
+    """Um CircuitBreaker por host, criado no primeiro uso (os `max_hosts` mais recentes)"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_hosts: int = 1000
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_hosts = max_hosts
+        self._breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+
+    def for_host(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                f"{self.name}:{host}", self.failure_threshold, self.reset_timeout
+            )
+            if len(self._breakers) > self.max_hosts:
+                self._breakers.popitem(last=False)
+        else:
+            self._breakers.move_to_end(host)
+        return breaker
+
+    def for_request(self, request: httpx.Request) -> CircuitBreaker:
+        return self.for_host(request.url.host)
+
+    def stats(self) -> Dict:
+        hosts = {host: breaker.stats() for host, breaker in self._breakers.items()}
+        return {
+            "open_hosts": sum(1 for s in hosts.values() if s["state"] != CIRCUIT_CLOSED),
+            "hosts": hosts,
+        }
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """Transporte com circuit breaker, retry e orçamento de latência"""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        breaker: Union[CircuitBreaker, HostCircuitBreakers],
+        max_retries: int = 2,
+        backoff_base: float = 0.2,
+        latency_budget: float = 0.0  # 0 = sem orçamento (só os timeouts do httpx)
+    ):
+        self.transport = transport
+        self.breaker = breaker
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.latency_budget = latency_budget
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self.breaker.for_request(request)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for upstream {breaker.name}", request=request)
+
+        try:
+            response = await self._send_within_budget(request, breaker.name)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelada ou erro inesperado: nada a concluir sobre o upstream
+            breaker.release()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def _send_within_budget(self, request: httpx.Request, upstream: str) -> httpx.Response:
+        if not self.latency_budget:
+            return await self._send_with_retries(request)
+        try:
+            async with asyncio.timeout(self.latency_budget):
+                return await self._send_with_retries(request)
+        except TimeoutError:
+            raise LatencyBudgetExceeded(
+                f"Latency budget of {self.latency_budget}s exceeded for upstream {upstream}",
+                request=request
+            ) from None
+
+    async def _send_with_retries(self, request: httpx.Request) -> httpx.Response:
+        retries = self.max_retries if request.method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError:
+                if attempt >= retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(random.uniform(0, self.backoff_base * 2 ** attempt))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
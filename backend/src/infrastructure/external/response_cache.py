@@ -0,0 +1,202 @@
+"""
+Cache das respostas das fontes de dados externas (/data-sources/*)
+
+Redis quando REDIS_URL está configurado (compartilhado entre processos), senão
+um LRU em memória. Cada fonte tem o seu CachePolicy:
+
+- até `ttl`: a entrada é servida direto (fresh);
+- até `ttl + stale_ttl`: a entrada é servida e atualizada em segundo plano
+  (stale-while-revalidate);
+- depois disso, ou sem entrada: a requisição espera o upstream (miss).
+
+Misses e atualizações concorrentes da mesma chave compartilham uma única
+chamada ao upstream. Resultados vazios não são gravados: os clientes devolvem
+lista vazia quando o upstream falha.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+import structlog
+
+from src.infrastructure.storage.json_codec import dumps
+
+logger = structlog.get_logger()
+
+# Try to import async redis
+try:
+    from redis.asyncio import Redis
+    REDIS_ASYNC_AVAILABLE = True
+except ImportError:
+    REDIS_ASYNC_AVAILABLE = False
+    logger.warning("Redis async not available. Data source cache will use process memory.")
+
+HOUR = 3600
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Tempos de cache de uma fonte, em segundos"""
+    ttl: float
+    stale_ttl: float
+
+
+SOURCE_POLICIES: Dict[str, CachePolicy] = {
+    "querido_diario": CachePolicy(ttl=1 * HOUR, stale_ttl=24 * HOUR),
+    "senado_matters": CachePolicy(ttl=1 * HOUR, stale_ttl=24 * HOUR),
+    "senado_senators": CachePolicy(ttl=24 * HOUR, stale_ttl=7 * 24 * HOUR),
+    "tse_election_results": CachePolicy(ttl=24 * HOUR, stale_ttl=7 * 24 * HOUR),
+    "datajud_processes": CachePolicy(ttl=6 * HOUR, stale_ttl=24 * HOUR),
+}
+
+# Estados devolvidos por get_or_fetch
+CACHE_HIT = "hit"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+
+
+class ResponseCache:
+    """Cache com TTL por fonte, stale-while-revalidate e coalescência de misses"""
+
+    KEY_PREFIX = "datasource:"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        policies: Optional[Dict[str, CachePolicy]] = None,
+        max_local_entries: int = 1000
+    ):
+        self.policies = policies if policies is not None else SOURCE_POLICIES
+        self.max_local_entries = max_local_entries
+        self.redis_client = None
+        self._local: "OrderedDict[str, Dict]" = OrderedDict()
+        # chave -> chamada ao upstream em andamento
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+
+        if REDIS_ASYNC_AVAILABLE and redis_url:
+            try:
+                self.redis_client = Redis.from_url(redis_url)
+                logger.info("data_source_cache_enabled", backend="redis")
+            except Exception as e:
+                logger.warning("redis_connection_failed", error=str(e))
+                self.redis_client = None
+
+    def make_key(self, source: str, params: Dict[str, Any]) -> str:
+        """Chave da requisição: fonte + hash dos parâmetros"""
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{self.KEY_PREFIX}{source}:{digest}"
+
+    async def get_or_fetch(
+        self,
+        source: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, str]:
+        """
+        Valor em cache para (source, params), buscando com `fetch` se preciso
+
+        Returns:
+            (valor, estado) com estado em CACHE_HIT, CACHE_STALE ou CACHE_MISS
+        """
+        policy = self.policies[source]
+        key = self.make_key(source, params)
+
+        entry = await self._read(key)
+        if entry is not None:
+            age = time.time() - entry["stored_at"]
+            if age < policy.ttl:
+                return entry["value"], CACHE_HIT
+            if age < policy.ttl + policy.stale_ttl:
+                if key not in self._inflight:
+                    self._start_fetch(key, policy, fetch, background=True)
+                return entry["value"], CACHE_STALE
+
+        task = self._inflight.get(key) or self._start_fetch(key, policy, fetch)
+        # shield: quem desiste da requisição não cancela a busca dos demais
+        return await asyncio.shield(task), CACHE_MISS
+
+    def _start_fetch(
+        self,
+        key: str,
+        policy: CachePolicy,
+        fetch: Callable[[], Awaitable[Any]],
+        background: bool = False
+    ) -> asyncio.Task:
+        task = asyncio.create_task(self._fetch_and_store(key, policy, fetch, background))
+        self._inflight[key] = task
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        policy: CachePolicy,
+        fetch: Callable[[], Awaitable[Any]],
+        background: bool
+    ) -> Any:
+        try:
+            value = await fetch()
+            if value:
+                await self._write(key, value, policy)
+            return value
+        except Exception as e:
+            if not background:
+                raise
+            # Mantém a entrada antiga; a próxima requisição tenta de novo
+            logger.warning("data_source_revalidation_failed", key=key, error=str(e))
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _read(self, key: str) -> Optional[Dict]:
+        if self.redis_client:
+            try:
+                raw = await self.redis_client.get(key)
+                return json.loads(raw) if raw else None
+            except Exception as e:
+                logger.error("cache_get_error", error=str(e))
+        entry = self._local.get(key)
+        if entry is not None:
+            self._local.move_to_end(key)
+        return entry
+
+    async def _write(self, key: str, value: Any, policy: CachePolicy) -> None:
+        entry = {"stored_at": time.time(), "value": value}
+        if self.redis_client:
+            try:
+                await self.redis_client.setex(key, int(policy.ttl + policy.stale_ttl), dumps(entry))
+                return
+            except Exception as e:
+                logger.error("cache_set_error", error=str(e))
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    async def close(self) -> None:
+        """Cancela atualizações pendentes e fecha a conexão com o Redis"""
+        for task in list(self._background):
+            task.cancel()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        if self.redis_client:
+            await self.redis_client.close()
+
+
+# Instância global do cache
+_global_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Obtém instância global do cache das fontes de dados"""
+    global _global_response_cache
+    if _global_response_cache is None:
+        _global_response_cache = ResponseCache(os.getenv("REDIS_URL"))
+    return _global_response_cache
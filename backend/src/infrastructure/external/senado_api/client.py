@@ -4,22 +4,17 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import structlog
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
 
 class SenadoAPIClient:
     """Client for Senado Federal API"""
     
-    BASE_URL = "https://legis.senado.leg.br/dadosabertos"
-    
-    def __init__(self, timeout: int = 30):
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json"
-            }
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared pooled client (keep-alive, HTTP/2), closed on app shutdown
+        self.client = client or get_http_client("senado")
     
     async def get_senators(self) -> List[Dict]:
         """Get list of senators"""
@@ -90,8 +85,7 @@ class SenadoAPIClient:
             return []
     
     async def close(self):
-        """Close the client"""
-        await self.client.aclose()
+        """No-op: the HTTP client is shared and closed on app shutdown"""
 
 
 
@@ -7,16 +7,22 @@ import structlog
 from typing import Dict, Optional, List
 from datetime import datetime, timedelta
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
 
 class TransferegovClient:
     """Cliente para API do Transferegov.br"""
     
-    BASE_URL = "https://api.transferegov.gestao.gov.br"
-    
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         self.timeout = timeout
+        # Cliente compartilhado do processo (keep-alive, HTTP/2), fechado no shutdown
+        self.client = client or get_http_client("transferegov")
     
     async def get_plano_acao(
         self,
@@ -32,39 +38,38 @@ class TransferegovClient:
             dict com dados do plano de ação ou None
         """
         try:
-            url = f"{self.BASE_URL}/plano_acao_especial"
+            url = "/plano_acao_especial"
             params = {
                 "codigo_emenda_parlamentar_formatado_plano_acao": codigo_emenda
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # A API pode retornar lista ou objeto único
-                    if isinstance(data, list):
-                        if len(data) > 0:
-                            return self._parse_plano_acao(data[0])
-                        return None
-                    return self._parse_plano_acao(data)
+            response = await self.client.get(url, params=params, timeout=self.timeout)
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                elif response.status_code == 404:
-                    logger.info(
-                        "plano_acao_not_found",
-                        codigo_emenda=codigo_emenda
-                    )
+                # A API pode retornar lista ou objeto único
+                if isinstance(data, list):
+                    if len(data) > 0:
+                        return self._parse_plano_acao(data[0])
                     return None
+                return self._parse_plano_acao(data)
+            
+            elif response.status_code == 404:
+                logger.info(
+                    "plano_acao_not_found",
+                    codigo_emenda=codigo_emenda
+                )
+                return None
+            
+            else:
+                logger.warning(
+                    "transferegov_api_error",
+                    status_code=response.status_code,
+                    codigo_emenda=codigo_emenda
+                )
+                return None
                 
-                else:
-                    logger.warning(
-                        "transferegov_api_error",
-                        status_code=response.status_code,
-                        codigo_emenda=codigo_emenda
-                    )
-                    return None
-                    
         except httpx.TimeoutException:
             logger.warning(
                 "transferegov_timeout",
@@ -154,7 +159,7 @@ class TransferegovClient:
             Lista de planos de ação
         """
         try:
-            url = f"{self.BASE_URL}/plano_acao_especial"
+            url = "/plano_acao_especial"
             params = {}
             
             if ano:
@@ -164,17 +169,16 @@ class TransferegovClient:
             if municipio:
                 params["municipio"] = municipio
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if isinstance(data, list):
-                        return [self._parse_plano_acao(item) for item in data]
-                    return [self._parse_plano_acao(data)]
-                
-                return []
-                
+            response = await self.client.get(url, params=params, timeout=self.timeout)
+            
+            if response.status_code == 200:
+                data = response.json()
+                if isinstance(data, list):
+                    return [self._parse_plano_acao(item) for item in data]
+                return [self._parse_plano_acao(data)]
+            
+            return []
+            
         except Exception as e:
             logger.error("transferegov_search_error", error=str(e))
             return []
@@ -3,22 +3,17 @@ import httpx
 from typing import List, Dict, Optional
 import structlog
 
+from src.infrastructure.external.http_clients import get_http_client
+
 logger = structlog.get_logger()
 
 
 class TSEClient:
     """Client for TSE (Tribunal Superior Eleitoral) API"""
     
-    BASE_URL = "https://dadosabertos.tse.jus.br"
-    
-    def __init__(self, timeout: int = 30):
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json"
-            }
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared pooled client (keep-alive, HTTP/2), closed on app shutdown
+        self.client = client or get_http_client("tse")
     
     async def get_candidate_assets(self, year: int, uf: Optional[str] = None) -> List[Dict]:
         """
@@ -103,8 +98,7 @@ class TSEClient:
             return None
     
     async def close(self):
-        """Close the client"""
-        await self.client.aclose()
+        """No-op: the HTTP client is shared and closed on app shutdown"""
 
 
 
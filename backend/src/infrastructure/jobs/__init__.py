@@ -0,0 +1,6 @@
+"""Background jobs module"""
+from . import handlers  # noqa: F401  (registra os handlers)
+from .queue import JobQueue, get_job_queue
+from .runner import JobCancelled, JobContext, job_handler, run_job
+
+__all__ = ["JobQueue", "get_job_queue", "JobCancelled", "JobContext", "job_handler", "run_job"]
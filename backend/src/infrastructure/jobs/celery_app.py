@@ -0,0 +1,46 @@
+"""
+Aplicação Celery do worker de jobs
+
+    celery -A src.infrastructure.jobs.celery_app worker --loglevel=info
+"""
+import asyncio
+import os
+
+from celery import Celery
+
+from src.infrastructure.external.http_clients import get_http_client_registry
+from src.infrastructure.jobs import handlers  # noqa: F401  (registra os handlers)
+from src.infrastructure.jobs.runner import run_job
+from src.infrastructure.jobs.store import create_job_store
+from src.infrastructure.persistence.postgres.database import close_db
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+celery_app = Celery("vigiapix", broker=REDIS_URL)
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    # Estado e resultado ficam no job store; o backend do Celery não é usado
+    task_ignore_result=True,
+    # Jobs longos: um por vez por processo, confirmados só ao terminar
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+)
+
+
+async def _run(job_id: str) -> None:
+    # asyncio.run cria um loop por task: store novo e pools do banco e dos
+    # clientes HTTP liberados ao fim, pois as conexões ficam presas ao loop
+    # que as abriu
+    store = create_job_store(REDIS_URL)
+    try:
+        await run_job(job_id, store)
+    finally:
+        await store.close()
+        await get_http_client_registry().close()
+        await close_db()
+
+
+@celery_app.task(name="jobs.run")
+def run_job_task(job_id: str) -> None:
+    asyncio.run(_run(job_id))
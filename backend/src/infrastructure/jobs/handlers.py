@@ -0,0 +1,87 @@
+"""
+Jobs em lote expostos pela API
+
+Cada handler abre a própria sessão do banco (o job sobrevive à requisição que
+o criou) e repassa ctx.progress ao use case. Sincronizações que alteram
+emendas recalculam em seguida os Trust Scores desatualizados, como os scripts
+periódicos.
+"""
+from typing import Optional
+
+from src.application.use_cases.emenda_pix.fetch_news import FetchEmendaNewsUseCase
+from src.application.use_cases.emenda_pix.refresh_trust_scores import RefreshTrustScoresUseCase
+from src.application.use_cases.emenda_pix.sync_ceis_data import SyncCEISDataUseCase
+from src.application.use_cases.emenda_pix.sync_emendas_portal import SyncEmendasPortalUseCase
+from src.application.use_cases.legislation import SyncLegislationsUseCase
+from src.infrastructure.external.camara_api import CamaraAPIClient
+from src.infrastructure.jobs.runner import JobContext, job_handler
+from src.infrastructure.persistence.postgres.database import AsyncSessionLocal
+from src.infrastructure.persistence.postgres.emenda_pix_repository_impl import PostgresEmendaPixRepository
+from src.infrastructure.persistence.postgres.legislation_repository_impl import PostgresLegislationRepository
+
+SYNC_CEIS_ALL = "emenda_pix.sync_ceis_all"
+FETCH_NEWS_ALL = "emenda_pix.fetch_news_all"
+SYNC_EMENDAS_PORTAL = "emenda_pix.sync_portal"
+SYNC_LEGISLATIONS = "legislation.sync"
+
+
+async def _refresh_trust_scores(repository: PostgresEmendaPixRepository, result: dict) -> dict:
+    """Recalcula os Trust Scores após uma sincronização bem-sucedida"""
+    if result.get("success"):
+        trust = await RefreshTrustScoresUseCase(repository).execute()
+        result["trust_scores_updated"] = trust.get("updated", 0)
+    return result
+
+
+@job_handler(SYNC_CEIS_ALL)
+async def sync_ceis_all(ctx: JobContext) -> dict:
+    async with AsyncSessionLocal() as session:
+        repository = PostgresEmendaPixRepository(session)
+        result = await SyncCEISDataUseCase(repository).sync_all_emendas_with_ceis(
+            progress=ctx.progress
+        )
+        return await _refresh_trust_scores(repository, result)
+
+
+@job_handler(FETCH_NEWS_ALL)
+async def fetch_news_all(ctx: JobContext, limit_per_emenda: int = 5) -> dict:
+    async with AsyncSessionLocal() as session:
+        use_case = FetchEmendaNewsUseCase(PostgresEmendaPixRepository(session))
+        return await use_case.fetch_all_emendas_news(
+            limit_per_emenda=limit_per_emenda,
+            progress=ctx.progress
+        )
+
+
+@job_handler(SYNC_EMENDAS_PORTAL)
+async def sync_emendas_portal(
+    ctx: JobContext,
+    ano: Optional[int] = None,
+    codigo_ibge: Optional[str] = None,
+    limit: int = 100
+) -> dict:
+    async with AsyncSessionLocal() as session:
+        repository = PostgresEmendaPixRepository(session)
+        result = await SyncEmendasPortalUseCase(repository).execute(
+            ano=ano,
+            codigo_ibge=codigo_ibge,
+            limit=limit,
+            progress=ctx.progress
+        )
+        return await _refresh_trust_scores(repository, result)
+
+
+@job_handler(SYNC_LEGISLATIONS)
+async def sync_legislations(ctx: JobContext, days: int = 30) -> dict:
+    camara_client = CamaraAPIClient()
+    try:
+        async with AsyncSessionLocal() as session:
+            use_case = SyncLegislationsUseCase(PostgresLegislationRepository(session), camara_client)
+            synced = await use_case.execute(days=days, progress=ctx.progress)
+    finally:
+        await camara_client.close()
+    return {
+        "success": True,
+        "message": f"Synced {len(synced)} legislations",
+        "count": len(synced)
+    }
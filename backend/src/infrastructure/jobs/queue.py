@@ -0,0 +1,103 @@
+"""
+Fila de jobs em lote
+
+Com REDIS_URL e Celery instalados, os jobs vão para o broker e rodam no
+worker (`celery -A src.infrastructure.jobs.celery_app worker`). Sem isso, rodam
+em segundo plano no próprio processo da API. JOB_BACKEND ("celery" ou
+"inprocess") força a escolha.
+"""
+import asyncio
+import os
+from typing import Any, Optional, Set
+import structlog
+
+from src.domain.entities.job import Job
+from src.infrastructure.jobs.runner import run_job
+from src.infrastructure.jobs.store import create_job_store
+
+logger = structlog.get_logger()
+
+# Try to import celery
+try:
+    import celery  # noqa: F401
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+    logger.warning("Celery not available. Jobs will run inside the API process.")
+
+
+BACKEND_CELERY = "celery"
+BACKEND_INPROCESS = "inprocess"
+
+
+class JobQueue:
+    """Enfileira jobs e consulta/cancela pelo id"""
+
+    def __init__(self, store, backend: str = BACKEND_INPROCESS):
+        self.store = store
+        self.backend = backend
+        # Referências às tasks em processo (o loop só guarda referências fracas)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def enqueue(self, name: str, **params: Any) -> Job:
+        """Cria o job `name` e o envia para execução"""
+        job = Job(name=name, params=params)
+        await self.store.save(job)
+
+        if self.backend == BACKEND_CELERY:
+            from src.infrastructure.jobs.celery_app import run_job_task
+            run_job_task.apply_async(args=[job.id], task_id=job.id)
+        else:
+            task = asyncio.create_task(run_job(job.id, self.store))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        logger.info("job_enqueued", job_id=job.id, name=name, backend=self.backend)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return await self.store.get(job_id)
+
+    async def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Pede o cancelamento do job
+
+        O cancelamento é cooperativo: o job para no próximo registro de
+        progresso; um job ainda na fila nem começa.
+        """
+        job = await self.store.get(job_id)
+        if job is None or job.is_finished:
+            return job
+        await self.store.request_cancel(job_id)
+        job.cancel_requested = True
+        return job
+
+    async def close(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        # Espera os jobs gravarem o estado final antes de fechar o store
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.store.close()
+
+
+def _default_backend(redis_url: Optional[str]) -> str:
+    backend = os.getenv("JOB_BACKEND")
+    if backend:
+        return backend
+    if redis_url and CELERY_AVAILABLE:
+        return BACKEND_CELERY
+    return BACKEND_INPROCESS
+
+
+# Instância global da fila
+_global_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Obtém instância global da fila de jobs"""
+    global _global_queue
+    if _global_queue is None:
+        redis_url = os.getenv("REDIS_URL")
+        _global_queue = JobQueue(create_job_store(redis_url), _default_backend(redis_url))
+    return _global_queue
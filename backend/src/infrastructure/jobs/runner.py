@@ -0,0 +1,139 @@
+"""
+Execução de jobs: registro de handlers, contexto de progresso e cancelamento
+
+O mesmo run_job é usado pelo worker Celery e pela execução em processo.
+Handlers recebem um JobContext e os parâmetros do job e devolvem um dict
+(o resultado do use case).
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+import structlog
+
+from src.domain.entities.job import (
+    Job,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JOB_FAILED,
+    JOB_CANCELLED
+)
+
+logger = structlog.get_logger()
+
+
+class JobCancelled(asyncio.CancelledError):
+    """
+    Levantada no job quando o cancelamento foi pedido
+
+    Deriva de CancelledError para atravessar os `except Exception` dos use
+    cases e desfazer a transação em andamento.
+    """
+
+
+JobHandler = Callable[..., Awaitable[Dict[str, Any]]]
+
+# Nome do job -> handler
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(name: str) -> Callable[[JobHandler], JobHandler]:
+    """Registra `handler(ctx, **params)` como o job `name`"""
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[name] = handler
+        return handler
+    return register
+
+
+class JobContext:
+    """Progresso e cancelamento de um job em execução"""
+
+    # Intervalo mínimo entre gravações de progresso no store
+    PROGRESS_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, job: Job, store):
+        self.job = job
+        self.store = store
+        self._last_flush = 0.0
+
+    async def progress(self, done: int, total: int) -> None:
+        """
+        Registra o progresso (processados, total) e verifica cancelamento
+
+        Compatível com ProgressCallback; levanta JobCancelled se o
+        cancelamento foi pedido e ainda há itens a processar.
+        """
+        self.job.progress_done = done
+        self.job.progress_total = total
+        now = time.monotonic()
+        if done < total and now - self._last_flush < self.PROGRESS_INTERVAL_SECONDS:
+            return
+        self._last_flush = now
+        if done < total:
+            await self.check_cancelled()
+        await self.store.save(self.job)
+
+    async def check_cancelled(self) -> None:
+        if await self.store.is_cancel_requested(self.job.id):
+            raise JobCancelled()
+
+
+async def run_job(job_id: str, store) -> Optional[Job]:
+    """Executa o job `job_id` até o fim, gravando estado e resultado no store"""
+    job = await store.get(job_id)
+    if job is None or job.is_finished:
+        return job
+
+    if job.cancel_requested:
+        return await _finish(store, job, JOB_CANCELLED)
+
+    handler = JOB_HANDLERS.get(job.name)
+    if handler is None:
+        return await _finish(store, job, JOB_FAILED, error=f"Job desconhecido: {job.name}")
+
+    job.status = JOB_RUNNING
+    job.started_at = datetime.utcnow()
+    await store.save(job)
+    logger.info("job_started", job_id=job.id, name=job.name)
+
+    try:
+        result = await handler(JobContext(job, store), **job.params)
+    except JobCancelled:
+        logger.info("job_cancelled", job_id=job.id, name=job.name, done=job.progress_done)
+        return await _finish(store, job, JOB_CANCELLED)
+    except asyncio.CancelledError:
+        # Tarefa cancelada de fora (JobQueue.close ao encerrar o servidor):
+        # grava o estado final para o job não ficar "running" para sempre
+        logger.warning("job_interrupted", job_id=job.id, name=job.name, done=job.progress_done)
+        await _finish(store, job, JOB_FAILED, error="Job interrompido pelo encerramento do servidor")
+        raise
+    except Exception as e:
+        logger.error("job_failed", job_id=job.id, name=job.name, error=str(e))
+        return await _finish(store, job, JOB_FAILED, error=str(e))
+
+    # Use cases sinalizam falha com success=False em vez de exceção
+    failed = isinstance(result, dict) and result.get("success") is False
+    return await _finish(
+        store,
+        job,
+        JOB_FAILED if failed else JOB_SUCCEEDED,
+        result=result,
+        error=result.get("message") if failed else None
+    )
+
+
+async def _finish(
+    store,
+    job: Job,
+    status: str,
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None
+) -> Job:
+    job.status = status
+    job.result = result
+    job.error = error
+    job.finished_at = datetime.utcnow()
+    await store.save(job)
+    if status == JOB_SUCCEEDED:
+        logger.info("job_succeeded", job_id=job.id, name=job.name)
+    return job
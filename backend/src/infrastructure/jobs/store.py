@@ -0,0 +1,96 @@
+"""
+Estado dos jobs: Redis (compartilhado entre API e workers) ou memória
+
+O pedido de cancelamento fica em uma chave separada do estado, para que a API
+e o worker nunca sobrescrevam a escrita um do outro.
+"""
+import json
+from typing import Dict, Optional, Set
+import structlog
+
+from src.domain.entities.job import Job
+from src.infrastructure.storage.json_codec import dumps
+
+logger = structlog.get_logger()
+
+# Try to import async redis
+try:
+    from redis.asyncio import Redis
+    REDIS_ASYNC_AVAILABLE = True
+except ImportError:
+    REDIS_ASYNC_AVAILABLE = False
+    logger.warning("Redis async not available. Job state will be kept in memory.")
+
+
+# Jobs finalizados ou não são descartados após este período
+JOB_TTL_SECONDS = 7 * 24 * 3600
+
+
+class InMemoryJobStore:
+    """Estado dos jobs no próprio processo (testes e execução sem Redis)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict] = {}
+        self._cancelled: Set[str] = set()
+
+    async def save(self, job: Job) -> None:
+        # Mesmo formato do Redis: o resultado passa por JSON
+        self._jobs[job.id] = json.loads(dumps(job.to_dict()))
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        data = self._jobs.get(job_id)
+        if data is None:
+            return None
+        job = Job.from_dict(data)
+        job.cancel_requested = job_id in self._cancelled
+        return job
+
+    async def request_cancel(self, job_id: str) -> None:
+        self._cancelled.add(job_id)
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return job_id in self._cancelled
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisJobStore:
+    """Estado dos jobs no Redis, visível para todos os processos da API e workers"""
+
+    KEY_PREFIX = "jobs:"
+
+    def __init__(self, redis_url: str):
+        self.redis = Redis.from_url(redis_url, decode_responses=True)
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    async def save(self, job: Job) -> None:
+        data = job.to_dict()
+        data.pop("cancel_requested")
+        await self.redis.set(self._key(job.id), dumps(data), ex=JOB_TTL_SECONDS)
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        raw, cancel = await self.redis.mget(self._key(job_id), self._key(job_id) + ":cancel")
+        if raw is None:
+            return None
+        job = Job.from_dict(json.loads(raw))
+        job.cancel_requested = cancel is not None
+        return job
+
+    async def request_cancel(self, job_id: str) -> None:
+        await self.redis.set(self._key(job_id) + ":cancel", "1", ex=JOB_TTL_SECONDS)
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return bool(await self.redis.exists(self._key(job_id) + ":cancel"))
+
+    async def close(self) -> None:
+        await self.redis.close()
+
+
+def create_job_store(redis_url: Optional[str] = None):
+    """Redis store when a URL is given (and redis is installed), memory otherwise"""
+    if redis_url and REDIS_ASYNC_AVAILABLE:
+        return RedisJobStore(redis_url)
+    return InMemoryJobStore()
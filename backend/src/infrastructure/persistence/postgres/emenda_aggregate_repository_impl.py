@@ -0,0 +1,286 @@
+"""PostgreSQL maintenance and reads of the Emenda Pix aggregate tables"""
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, delete, func, insert, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.persistence.postgres.models.emenda_pix import EmendaPixModel
+from src.infrastructure.persistence.postgres.models.emenda_pix_aggregate import EmendaPixAggregateModel
+from src.infrastructure.persistence.postgres.search import normalize_search_text
+
+
+# Dimensão -> (coluna de chave, coluna de chave normalizada, coluna de UF) em emenda_pix
+DIMENSIONS = {
+    "autor": (
+        EmendaPixModel.autor_nome,
+        EmendaPixModel.autor_nome_busca,
+        EmendaPixModel.autor_uf
+    ),
+    "destinatario": (
+        EmendaPixModel.destinatario_nome,
+        EmendaPixModel.destinatario_nome_busca,
+        EmendaPixModel.destinatario_uf
+    ),
+}
+
+STATUS_VALUES = ("pendente", "em_execucao", "concluida", "atrasada", "cancelada")
+
+# Alertas de severidade alta/média por emenda (mesma regra do Placar no frontend)
+_ALERTAS_GRAVES = literal_column(
+    "(SELECT count(*) FROM json_array_elements("
+    "CASE WHEN json_typeof(emenda_pix.alertas) = 'array' "
+    "THEN emenda_pix.alertas ELSE '[]'::json END) AS alerta "
+    "WHERE alerta->>'severidade' IN ('alta', 'media'))"
+)
+
+
+def _lock_id(*parts: str) -> int:
+    """Chave bigint de advisory lock para as partes informadas"""
+    digest = hashlib.blake2b(":".join(("emenda_pix_aggregates",) + parts).encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "big", signed=True)
+
+
+class PostgresEmendaAggregateRepository:
+    """Refreshes and queries emenda_pix_aggregates"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def refresh_all(self) -> None:
+        """Recalcula todos os agregados em uma única transação"""
+        # Exclusivo por dimensão: espera refresh_keys em andamento e os bloqueia
+        for dimensao in DIMENSIONS:
+            await self._lock(dimensao)
+        await self.session.execute(delete(EmendaPixAggregateModel))
+        for dimensao in DIMENSIONS:
+            await self.session.execute(self._build_refresh(dimensao))
+        await self.session.commit()
+
+    async def refresh_keys(
+        self,
+        autores: Iterable[Optional[str]] = (),
+        destinatarios: Iterable[Optional[str]] = ()
+    ) -> None:
+        """
+        Recalcula apenas os agregados das chaves informadas
+
+        Usado após alterações pontuais: passe os valores antigos e novos de
+        autor_nome/destinatario_nome para que ambos os grupos sejam corrigidos.
+        """
+        changed = False
+        for dimensao, chaves in (("autor", autores), ("destinatario", destinatarios)):
+            chaves = sorted({c for c in chaves if c})
+            if not chaves:
+                continue
+            # Delete + insert serializados por chave (senão dois saves da mesma
+            # chave inserem o grupo duas vezes); ordem fixa evita deadlock
+            await self._lock(dimensao, shared=True)
+            for chave in chaves:
+                await self._lock(dimensao, chave)
+            await self.session.execute(
+                delete(EmendaPixAggregateModel).where(
+                    and_(
+                        EmendaPixAggregateModel.dimensao == dimensao,
+                        EmendaPixAggregateModel.chave.in_(chaves)
+                    )
+                )
+            )
+            await self.session.execute(self._build_refresh(dimensao, chaves))
+            changed = True
+        if changed:
+            await self.session.commit()
+
+    async def _lock(self, dimensao: str, chave: Optional[str] = None, shared: bool = False) -> None:
+        """Advisory lock da dimensão ou de uma chave, liberado no fim da transação"""
+        lock_fn = func.pg_advisory_xact_lock_shared if shared else func.pg_advisory_xact_lock
+        parts = (dimensao,) if chave is None else (dimensao, chave)
+        await self.session.execute(select(lock_fn(_lock_id(*parts))))
+
+    async def is_empty(self) -> bool:
+        """Indica se os agregados ainda não foram calculados"""
+        result = await self.session.execute(select(EmendaPixAggregateModel.id).limit(1))
+        return result.first() is None
+
+    async def version(self) -> str:
+        """Marca da última alteração dos agregados (refresh, inclusão ou remoção)"""
+        agg = EmendaPixAggregateModel
+        row = (await self.session.execute(
+            select(
+                func.max(agg.refreshed_at),
+                func.count(),
+                func.coalesce(func.sum(agg.total_emendas), 0)
+            )
+        )).one()
+        refreshed_at, groups, total = row
+        return f"{refreshed_at.isoformat() if refreshed_at else '-'}:{groups}:{total}"
+
+    async def execution_by(
+        self,
+        dimensao: str,
+        chave: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Métricas de execução por autor ou destinatário (todas as UFs, áreas e anos)
+
+        Returns one dict per chave ordered by percentual_medio_executado desc.
+        """
+        self._check_dimension(dimensao)
+        agg = EmendaPixAggregateModel
+        percentual_medio = func.sum(agg.soma_percentual_executado) / func.sum(agg.total_emendas)
+
+        stmt = select(
+            agg.chave,
+            func.sum(agg.total_emendas).label("total_emendas"),
+            func.sum(agg.valor_total_aprovado).label("valor_total_aprovado"),
+            func.sum(agg.valor_total_executado).label("valor_total_executado"),
+            percentual_medio.label("percentual_medio_executado"),
+            func.sum(agg.emendas_atrasadas).label("emendas_atrasadas"),
+            *[func.sum(getattr(agg, f"status_{s}")).label(f"status_{s}") for s in STATUS_VALUES],
+        ).where(agg.dimensao == dimensao).group_by(agg.chave).order_by(percentual_medio.desc())
+        if chave:
+            stmt = stmt.where(agg.chave == chave)
+
+        result = await self.session.execute(stmt)
+        return [
+            {
+                "grupo": row.chave,
+                "total_emendas": int(row.total_emendas),
+                "valor_total_aprovado": float(row.valor_total_aprovado or 0.0),
+                "valor_total_executado": float(row.valor_total_executado or 0.0),
+                "percentual_medio_executado": float(row.percentual_medio_executado or 0.0),
+                "emendas_atrasadas": int(row.emendas_atrasadas),
+                "status_distribution": self._status_distribution(row),
+            }
+            for row in result.all()
+        ]
+
+    async def scoreboard(
+        self,
+        dimensao: str,
+        termo: Optional[str] = None,
+        uf: Optional[str] = None,
+        area: Optional[str] = None,
+        ano: Optional[int] = None,
+        limit: int = 50
+    ) -> Dict:
+        """
+        Placar de Transparência: totais gerais e ranking por nome/UF
+
+        Args:
+            dimensao: 'autor' (parlamentar) ou 'destinatario' (município)
+            termo: Trecho do nome buscado
+            uf, area, ano: Filtros opcionais
+            limit: Tamanho máximo do ranking
+        """
+        self._check_dimension(dimensao)
+        agg = EmendaPixAggregateModel
+
+        conditions = [agg.dimensao == dimensao]
+        if termo:
+            conditions.append(agg.chave_busca.contains(normalize_search_text(termo), autoescape=True))
+        if uf:
+            conditions.append(agg.uf == uf)
+        if area:
+            conditions.append(agg.area == area)
+        if ano:
+            conditions.append(agg.ano == ano)
+        where = and_(*conditions)
+
+        metrics = [
+            func.coalesce(func.sum(agg.total_emendas), 0).label("total_emendas"),
+            func.coalesce(func.sum(agg.valor_total_aprovado), 0.0).label("valor_total_aprovado"),
+            func.coalesce(func.sum(agg.valor_total_pago), 0.0).label("valor_total_pago"),
+            func.coalesce(func.sum(agg.valor_total_executado), 0.0).label("valor_total_executado"),
+            func.coalesce(func.sum(agg.soma_percentual_executado), 0.0).label("soma_percentual"),
+            func.coalesce(func.sum(agg.emendas_atrasadas), 0).label("emendas_atrasadas"),
+            func.coalesce(func.sum(agg.total_alertas), 0).label("total_alertas"),
+        ]
+
+        totals = (await self.session.execute(
+            select(*metrics, func.max(agg.refreshed_at).label("refreshed_at")).where(where)
+        )).one()
+
+        ranking_stmt = select(agg.chave, agg.uf, *metrics).where(where).group_by(
+            agg.chave, agg.uf
+        ).order_by(func.sum(agg.valor_total_aprovado).desc()).limit(limit)
+        ranking = (await self.session.execute(ranking_stmt)).all()
+
+        return {
+            "resumo": self._scoreboard_metrics(totals),
+            "ranking": [
+                {"nome": row.chave, "uf": row.uf, **self._scoreboard_metrics(row)}
+                for row in ranking
+            ],
+            "atualizado_em": totals.refreshed_at.isoformat() if totals.refreshed_at else None,
+        }
+
+    def _build_refresh(self, dimensao: str, chaves: Optional[Iterable[str]] = None):
+        """INSERT ... SELECT com o GROUP BY de uma dimensão"""
+        chave_col, busca_col, uf_col = DIMENSIONS[dimensao]
+        percentual = func.coalesce(EmendaPixModel.percentual_executado, 0.0)
+        # Mesma regra de EmendaPix.esta_atrasada(), avaliada no momento do
+        # refresh: prazos vencidos sem escrita só entram no próximo refresh_all
+        # (scripts/refresh_aggregates_periodic.py, diário)
+        atrasada = and_(
+            EmendaPixModel.data_prevista_conclusao < datetime.now(),
+            percentual < 100
+        )
+
+        source = select(
+            literal(dimensao),
+            chave_col,
+            busca_col,
+            uf_col,
+            EmendaPixModel.area,
+            EmendaPixModel.ano,
+            func.count(),
+            func.sum(EmendaPixModel.valor_aprovado),
+            func.sum(func.coalesce(EmendaPixModel.valor_pago, 0.0)),
+            func.sum(EmendaPixModel.valor_aprovado * percentual / 100),
+            func.sum(percentual),
+            func.count().filter(atrasada),
+            func.sum(_ALERTAS_GRAVES),
+            *[func.count().filter(EmendaPixModel.status_execucao == s) for s in STATUS_VALUES],
+            literal(datetime.utcnow()),
+        ).group_by(chave_col, busca_col, uf_col, EmendaPixModel.area, EmendaPixModel.ano)
+        if chaves is not None:
+            source = source.where(chave_col.in_(list(chaves)))
+
+        agg = EmendaPixAggregateModel
+        return insert(agg).from_select(
+            [
+                agg.dimensao, agg.chave, agg.chave_busca, agg.uf, agg.area, agg.ano,
+                agg.total_emendas, agg.valor_total_aprovado, agg.valor_total_pago,
+                agg.valor_total_executado, agg.soma_percentual_executado,
+                agg.emendas_atrasadas, agg.total_alertas,
+                *[getattr(agg, f"status_{s}") for s in STATUS_VALUES],
+                agg.refreshed_at,
+            ],
+            source
+        )
+
+    def _check_dimension(self, dimensao: str) -> None:
+        if dimensao not in DIMENSIONS:
+            raise ValueError(f"Dimensão não suportada: {dimensao}")
+
+    def _status_distribution(self, row) -> Dict[str, int]:
+        distribution = {}
+        for status in STATUS_VALUES:
+            count = int(getattr(row, f"status_{status}") or 0)
+            if count:
+                distribution[status] = count
+        return distribution
+
+    def _scoreboard_metrics(self, row) -> Dict:
+        total = int(row.total_emendas)
+        return {
+            "total_emendas": total,
+            "valor_total_aprovado": round(float(row.valor_total_aprovado), 2),
+            "valor_total_pago": round(float(row.valor_total_pago), 2),
+            "valor_total_executado": round(float(row.valor_total_executado), 2),
+            "percentual_medio_executado": round(float(row.soma_percentual) / total, 2) if total else 0,
+            "emendas_atrasadas": int(row.emendas_atrasadas),
+            "total_alertas": int(row.total_alertas),
+        }
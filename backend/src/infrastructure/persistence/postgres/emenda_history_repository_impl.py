@@ -0,0 +1,111 @@
+"""PostgreSQL implementation of EmendaHistoryRepository"""
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func, tuple_, literal
+
+from src.domain.entities.emenda_history import EmendaHistoryEntry
+from src.infrastructure.persistence.postgres.models.emenda_history import EmendaHistoryModel
+from src.infrastructure.persistence.postgres.pagination import encode_cursor, decode_cursor
+
+
+class PostgresEmendaHistoryRepository:
+    """PostgreSQL implementation of EmendaHistoryRepository"""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def save(self, entry: EmendaHistoryEntry) -> None:
+        """Save a single entry"""
+        self.session.add(self._to_model(entry))
+        await self.session.commit()
+    
+    def add_many(self, entries: Sequence[EmendaHistoryEntry]) -> None:
+        """Stage entries in the current transaction (committed by the caller)"""
+        self.session.add_all([self._to_model(entry) for entry in entries])
+    
+    async def find_page(
+        self,
+        emenda_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[EmendaHistoryEntry], Optional[str]]:
+        """
+        Timeline page (most recent first), seeking on (emenda_id, created_at)
+        
+        Raises ValueError if the cursor is malformed.
+        """
+        stmt = select(EmendaHistoryModel).where(EmendaHistoryModel.emenda_id == emenda_id)
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(EmendaHistoryModel.created_at, EmendaHistoryModel.id)
+                < tuple_(
+                    literal(cursor_created_at, EmendaHistoryModel.created_at.type),
+                    literal(cursor_id, EmendaHistoryModel.id.type)
+                )
+            )
+        
+        # Busca uma linha a mais para saber se existe próxima página
+        stmt = stmt.order_by(
+            EmendaHistoryModel.created_at.desc(),
+            EmendaHistoryModel.id.desc()
+        ).limit(limit + 1)
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        
+        has_next = len(models) > limit
+        models = models[:limit]
+        next_cursor = (
+            encode_cursor(models[-1].created_at, models[-1].id)
+            if has_next else None
+        )
+        return [self._to_entity(model) for model in models], next_cursor
+    
+    async def count(self, emenda_id: str) -> int:
+        """Number of history entries of an emenda"""
+        result = await self.session.execute(
+            select(func.count()).select_from(EmendaHistoryModel).where(
+                EmendaHistoryModel.emenda_id == emenda_id
+            )
+        )
+        return result.scalar_one()
+    
+    async def delete_for_emenda(self, emenda_id: str) -> None:
+        """Stage removal of the history of an emenda"""
+        await self.session.execute(
+            delete(EmendaHistoryModel).where(EmendaHistoryModel.emenda_id == emenda_id)
+        )
+    
+    def _to_entity(self, model: EmendaHistoryModel) -> EmendaHistoryEntry:
+        """Convert model to entity"""
+        return EmendaHistoryEntry(
+            id=str(model.id),
+            emenda_id=str(model.emenda_id),
+            status_anterior=model.status_anterior,
+            status_novo=model.status_novo,
+            percentual_anterior=model.percentual_anterior,
+            percentual_novo=model.percentual_novo,
+            valor_pago_anterior=model.valor_pago_anterior,
+            valor_pago_novo=model.valor_pago_novo,
+            changed_by=model.changed_by,
+            change_reason=model.change_reason,
+            extra_data=model.extra_data or {},
+            created_at=model.created_at
+        )
+    
+    def _to_model(self, entity: EmendaHistoryEntry) -> EmendaHistoryModel:
+        """Convert entity to model"""
+        return EmendaHistoryModel(
+            id=entity.id,
+            emenda_id=entity.emenda_id,
+            status_anterior=entity.status_anterior,
+            status_novo=entity.status_novo,
+            percentual_anterior=entity.percentual_anterior,
+            percentual_novo=entity.percentual_novo,
+            valor_pago_anterior=entity.valor_pago_anterior,
+            valor_pago_novo=entity.valor_pago_novo,
+            changed_by=entity.changed_by,
+            change_reason=entity.change_reason,
+            extra_data=entity.extra_data or None,
+            created_at=entity.created_at
+        )
@@ -1,24 +1,88 @@
 """PostgreSQL implementation of EmendaPixRepository"""
-from typing import Optional, List
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Sequence, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import JSON, Text, select, update, and_, or_, func, text, tuple_, literal, literal_column, cast, case, bindparam
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert, JSONB
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.domain.entities.emenda_pix import EmendaPix
 from src.domain.repositories.emenda_pix_repository import EmendaPixRepository
 from src.infrastructure.persistence.postgres.models.emenda_pix import EmendaPixModel
+from src.infrastructure.persistence.postgres.models.emenda_pix_data_version import EmendaPixDataVersionModel
+from src.infrastructure.persistence.postgres.pagination import (
+    encode_cursor,
+    decode_cursor,
+    encode_score_cursor,
+    decode_score_cursor
+)
+from src.infrastructure.persistence.postgres.search import normalize_search_text
+from src.infrastructure.persistence.postgres.emenda_aggregate_repository_impl import PostgresEmendaAggregateRepository
+from src.infrastructure.persistence.postgres.emenda_history_repository_impl import PostgresEmendaHistoryRepository
+from src.infrastructure.similarity import get_similarity_index
+from src.domain.entities.emenda_history import EmendaHistoryEntry
 
 
 class PostgresEmendaPixRepository(EmendaPixRepository):
     """PostgreSQL implementation of EmendaPixRepository"""
     
+    # Acima deste número de linhas (segundo as estatísticas do planner),
+    # contagens sem filtro usam a estimativa de pg_class em vez de COUNT(*)
+    COUNT_ESTIMATE_THRESHOLD = 100_000
+    
+    # Coluna de agrupamento dos benchmarks -> dimensão em emenda_pix_aggregates
+    BENCHMARK_DIMENSIONS = {
+        "autor_nome": "autor",
+        "destinatario_nome": "destinatario",
+    }
+    
+    # Linhas por INSERT ... ON CONFLICT em upsert_many. Com ~40 colunas fica
+    # abaixo do limite de 32767 parâmetros por comando do asyncpg
+    UPSERT_CHUNK_SIZE = 500
+    
+    # Trust Score persistido: escrito apenas por save_trust_scores
+    TRUST_COLUMNS = (
+        "trust_score", "trust_level", "trust_execucao", "trust_tempo", "trust_documentacao",
+        "trust_risco", "trust_historico", "trust_inputs_hash", "trust_computed_at",
+    )
+    
+    # Colunas nunca sobrescritas por upsert_many em emendas já existentes
+    UPSERT_IMMUTABLE_COLUMNS = ("id", "numero_emenda", "created_at", "updated_at") + TRUST_COLUMNS
+    
+    # Ordenações de find_all/find_page: nome -> (coluna, descendente).
+    # Desempate sempre por id, no mesmo sentido
+    SORTS = {
+        "-created_at": ("created_at", True),
+        "trust_score": ("trust_score", False),
+        "-trust_score": ("trust_score", True),
+    }
+    
+    # Cache por processo: extensão pg_trgm instalada (None = ainda não verificado)
+    _trigram_available: Optional[bool] = None
+    
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.aggregates = PostgresEmendaAggregateRepository(session)
+        self.history = PostgresEmendaHistoryRepository(session)
     
     async def find_by_id(self, id: str) -> Optional[EmendaPix]:
         """Find emenda by ID"""
         result = await self.session.get(EmendaPixModel, id)
         return self._to_entity(result) if result else None
     
+    async def find_by_ids(self, ids: Sequence[str]) -> List[EmendaPix]:
+        """Find emendas by ID, in the given order (missing IDs are skipped)"""
+        if not ids:
+            return []
+        result = await self.session.execute(
+            select(EmendaPixModel).where(EmendaPixModel.id.in_(list(ids)))
+        )
+        by_id = {str(model.id): model for model in result.scalars().all()}
+        return [self._to_entity(by_id[id]) for id in ids if id in by_id]
+    
     async def find_by_numero(self, numero: str, ano: int) -> Optional[EmendaPix]:
         """Find emenda by number and year"""
         stmt = select(EmendaPixModel).where(
@@ -48,14 +112,445 @@ class PostgresEmendaPixRepository(EmendaPixRepository):
         destinatario_uf: Optional[str] = None,
         area: Optional[str] = None,
         status_execucao: Optional[str] = None,
-        tipo: Optional[str] = None
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at"
     ) -> List[EmendaPix]:
-        """Find all emendas with optional filters"""
-        stmt = select(EmendaPixModel)
+        """Find all emendas with optional filters (only `fields` loaded when given)"""
+        column, descending = self._sort_column(sort)
+        stmt = self._select(fields)
+        
+        conditions = self._build_conditions(
+            autor_nome=autor_nome,
+            destinatario_uf=destinatario_uf,
+            area=area,
+            status_execucao=status_execucao,
+            tipo=tipo,
+            trust_level=trust_level,
+            trust_score_min=trust_score_min,
+            trust_score_max=trust_score_max
+        )
+        if column is not EmendaPixModel.created_at:
+            conditions.append(column.isnot(None))
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        
+        stmt = stmt.limit(limit).offset(offset).order_by(
+            *self._sort_order(column, descending)
+        )
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        return self._to_entities(models, fields)
+    
+    async def find_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        autor_nome: Optional[str] = None,
+        destinatario_uf: Optional[str] = None,
+        area: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None,
+        com_processo_sei: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at"
+    ) -> Tuple[List[EmendaPix], Optional[str]]:
+        """
+        Find a page of emendas using keyset pagination on (sort column, id)
+        
+        Returns the page and the cursor for the next page (None on the last page).
+        Only `fields` are loaded when given. Sorting by trust score skips
+        emendas not scored yet and is served by ix_emenda_pix_trust_score_id.
+        com_processo_sei keeps only emendas with a SEI process number.
+        Raises ValueError if the cursor or the sort is invalid.
+        """
+        column, descending = self._sort_column(sort)
+        by_score = column is not EmendaPixModel.created_at
+        if by_score and fields is not None:
+            # A chave do cursor precisa estar carregada
+            fields = list(fields) + ["trust_score"]
+        stmt = self._select(fields)
+        
+        conditions = self._build_conditions(
+            autor_nome=autor_nome,
+            destinatario_uf=destinatario_uf,
+            area=area,
+            status_execucao=status_execucao,
+            tipo=tipo,
+            trust_level=trust_level,
+            trust_score_min=trust_score_min,
+            trust_score_max=trust_score_max,
+            com_processo_sei=com_processo_sei
+        )
+        if by_score:
+            conditions.append(column.isnot(None))
+        if cursor:
+            cursor_key, cursor_id = (decode_score_cursor if by_score else decode_cursor)(cursor)
+            key = tuple_(column, EmendaPixModel.id)
+            bound = tuple_(
+                literal(cursor_key, column.type),
+                literal(cursor_id, EmendaPixModel.id.type)
+            )
+            conditions.append(key < bound if descending else key > bound)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        
+        # Busca uma linha a mais para saber se existe próxima página
+        stmt = stmt.order_by(*self._sort_order(column, descending)).limit(limit + 1)
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        
+        has_next = len(models) > limit
+        models = models[:limit]
+        next_cursor = None
+        if has_next:
+            last = models[-1]
+            next_cursor = (
+                encode_score_cursor(last.trust_score, last.id) if by_score
+                else encode_cursor(last.created_at, last.id)
+            )
+        return self._to_entities(models, fields), next_cursor
+    
+    def _sort_column(self, sort: str):
+        """Resolve a sort name into (column, descending)"""
+        if sort not in self.SORTS:
+            raise ValueError(f"Ordenação inválida: {sort}. Use: {', '.join(self.SORTS)}")
+        name, descending = self.SORTS[sort]
+        return getattr(EmendaPixModel, name), descending
+    
+    @staticmethod
+    def _sort_order(column, descending: bool) -> list:
+        """ORDER BY (column, id), both in the same direction"""
+        keys = [column, EmendaPixModel.id]
+        return [key.desc() if descending else key.asc() for key in keys]
+    
+    async def stream(
+        self,
+        autor_nome: Optional[str] = None,
+        destinatario_nome: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        ano: Optional[int] = None,
+        valor_min: Optional[float] = None,
+        valor_max: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[EmendaPix]:
+        """
+        Stream matching emendas through a server-side cursor
+        
+        Rows are fetched `batch_size` at a time (yield_per) and detached from
+        the session after conversion, so memory stays constant regardless of
+        the number of rows. Only `fields` are loaded when given.
+        """
+        stmt = self._select(fields)
+        conditions = self._build_conditions(
+            autor_nome=autor_nome,
+            destinatario_nome=destinatario_nome,
+            status_execucao=status_execucao,
+            ano=ano,
+            valor_min=valor_min,
+            valor_max=valor_max
+        )
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        stmt = stmt.order_by(
+            EmendaPixModel.created_at.desc(),
+            EmendaPixModel.id.desc()
+        ).execution_options(yield_per=batch_size)
+        
+        result = await self.session.stream_scalars(stmt)
+        async for models in result.partitions():
+            entities = self._to_entities(models, fields)
+            for model in models:
+                if model in self.session:
+                    self.session.expunge(model)
+            for entity in entities:
+                yield entity
+    
+    async def stream_columns(
+        self,
+        columns: Sequence[str],
+        batch_size: int = 10000
+    ) -> AsyncIterator[List[Tuple]]:
+        """
+        Stream raw column tuples of every emenda, `batch_size` rows at a time
+        
+        Sem montar entidades: usado por análises que só precisam de algumas
+        colunas do portfólio inteiro.
+        """
+        table = EmendaPixModel.__table__
+        unknown = [name for name in columns if name not in table.columns]
+        if unknown:
+            raise ValueError(f"Colunas desconhecidas: {', '.join(unknown)}")
+        
+        stmt = select(*[table.c[name] for name in columns]).execution_options(yield_per=batch_size)
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            yield [tuple(row) for row in rows]
+    
+    async def get_data_version(self) -> str:
+        """
+        Token that changes whenever emendas change
+        
+        Gravado junto com as próprias escritas: max(updated_at) cobre
+        inclusões e alterações, max(trust_computed_at) o recálculo de Trust
+        Score (que preserva updated_at) e o contador de emenda_pix_data_version
+        as remoções. Cada parte é uma subconsulta separada para que os dois
+        max() usem os índices (um agregado que não seja min/max na mesma
+        consulta força a varredura da tabela). Não depende do refresh dos
+        agregados, que roda depois do commit e pode falhar; a versão dos
+        agregados entra só para refletir um refresh tardio.
+        """
+        updated_at, trust_computed_at, deletions = (await self.session.execute(
+            select(
+                select(func.max(EmendaPixModel.updated_at)).scalar_subquery(),
+                select(func.max(EmendaPixModel.trust_computed_at)).scalar_subquery(),
+                select(EmendaPixDataVersionModel.deletions)
+                .where(EmendaPixDataVersionModel.id == 1)
+                .scalar_subquery()
+            )
+        )).one()
+        parts = [
+            updated_at.isoformat() if updated_at else "-",
+            trust_computed_at.isoformat() if trust_computed_at else "-",
+            str(deletions or 0),
+            await self.aggregates.version(),
+        ]
+        return ":".join(parts)
+    
+    async def get_last_modified(self, id: str) -> Optional[datetime]:
+        """
+        Last change of one emenda (data or Trust Score), None if it does not exist
+        
+        Lê só duas colunas pela chave primária, sem montar a entidade.
+        """
+        result = await self.session.execute(
+            select(
+                func.greatest(EmendaPixModel.updated_at, EmendaPixModel.trust_computed_at)
+            ).where(EmendaPixModel.id == literal(id, EmendaPixModel.id.type))
+        )
+        return result.scalar()
+    
+    async def count(
+        self,
+        autor_nome: Optional[str] = None,
+        destinatario_uf: Optional[str] = None,
+        area: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        tipo: Optional[str] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None
+    ) -> Tuple[int, bool]:
+        """
+        Count emendas matching the filters
+        
+        Returns (total, is_estimate). Without filters on a large table the
+        planner statistics are used instead of a full COUNT(*).
+        """
+        conditions = self._build_conditions(
+            autor_nome=autor_nome,
+            destinatario_uf=destinatario_uf,
+            area=area,
+            status_execucao=status_execucao,
+            tipo=tipo,
+            trust_level=trust_level,
+            trust_score_min=trust_score_min,
+            trust_score_max=trust_score_max
+        )
+        
+        if not conditions:
+            estimate = await self._estimate_row_count()
+            if estimate >= self.COUNT_ESTIMATE_THRESHOLD:
+                return estimate, True
+        
+        stmt = select(func.count()).select_from(EmendaPixModel)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        result = await self.session.execute(stmt)
+        return result.scalar_one(), False
+    
+    async def aggregate_execution(
+        self,
+        group_by: str,
+        group_value: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Aggregate execution metrics per group
         
+        Args:
+            group_by: Grouping column ('autor_nome' or 'destinatario_nome')
+            group_value: Restrict to a single group (exact match)
+        
+        Returns one dict per group with total_emendas, valor_total_aprovado,
+        valor_total_executado, percentual_medio_executado, emendas_atrasadas
+        and status_distribution, ordered by percentual_medio_executado desc.
+        Read from the pre-aggregated emenda_pix_aggregates table.
+        """
+        dimensao = self.BENCHMARK_DIMENSIONS.get(group_by)
+        if dimensao is None:
+            raise ValueError(f"Agrupamento não suportado: {group_by}")
+        return await self.aggregates.execution_by(dimensao, group_value)
+    
+    async def get_scoreboard(
+        self,
+        dimensao: str,
+        termo: Optional[str] = None,
+        uf: Optional[str] = None,
+        area: Optional[str] = None,
+        ano: Optional[int] = None,
+        limit: int = 50
+    ) -> Dict:
+        """Placar de Transparência read from the aggregate tables"""
+        return await self.aggregates.scoreboard(
+            dimensao=dimensao,
+            termo=termo,
+            uf=uf,
+            area=area,
+            ano=ano,
+            limit=limit
+        )
+    
+    async def refresh_aggregates(self) -> None:
+        """Fully recompute the aggregate tables (after sync batches)"""
+        await self.aggregates.refresh_all()
+    
+    async def find_trust_score_inputs(
+        self,
+        now: datetime,
+        after_id: Optional[str] = None,
+        limit: int = 5000,
+        only_changed: bool = True
+    ) -> List[Tuple]:
+        """
+        Next batch (by id) of Trust Score inputs
+        
+        Each row is (id, percentual_executado, atrasada, documentos,
+        risco_desvio, status_execucao, inputs_hash). inputs_hash is an md5 of
+        the inputs, including whether the emenda is late at `now`; with
+        `only_changed` rows whose stored trust_inputs_hash still matches are
+        skipped, so only new, changed or newly late emendas are returned.
+        """
+        model = EmendaPixModel
+        percentual = func.coalesce(model.percentual_executado, 0.0)
+        atrasada = and_(
+            model.data_prevista_conclusao.isnot(None),
+            model.data_prevista_conclusao < literal(now, model.data_prevista_conclusao.type),
+            percentual < 100
+        )
+        documentos = case(
+            (
+                func.json_typeof(model.documentos_comprobatórios) == "array",
+                func.json_array_length(model.documentos_comprobatórios)
+            ),
+            else_=0
+        )
+        inputs_hash = func.md5(func.concat_ws(
+            "|",
+            cast(percentual, Text),
+            cast(atrasada, Text),
+            cast(documentos, Text),
+            func.coalesce(cast(model.risco_desvio, Text), "-"),
+            model.status_execucao
+        ))
+        
+        stmt = select(
+            model.id,
+            percentual,
+            atrasada,
+            documentos,
+            model.risco_desvio,
+            model.status_execucao,
+            inputs_hash
+        )
+        conditions = []
+        if after_id:
+            conditions.append(model.id > literal(after_id, model.id.type))
+        if only_changed:
+            conditions.append(model.trust_inputs_hash.is_distinct_from(inputs_hash))
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        result = await self.session.execute(stmt.order_by(model.id).limit(limit))
+        return [tuple(row) for row in result.all()]
+    
+    async def save_trust_scores(self, scores: Sequence[Dict]) -> int:
+        """
+        Store computed Trust Scores in one executemany UPDATE and commit
+        
+        Each dict has id plus the TRUST_COLUMNS values (except
+        trust_computed_at). updated_at is kept: a recomputed score is not a
+        change to the emenda.
+        """
+        if not scores:
+            return 0
+        table = EmendaPixModel.__table__
+        stmt = update(table).where(table.c.id == bindparam("b_id")).values(
+            trust_computed_at=datetime.utcnow(),
+            updated_at=table.c.updated_at
+        )
+        params = []
+        for row in scores:
+            row = dict(row)
+            row["b_id"] = row.pop("id")
+            params.append(row)
+        await self.session.execute(stmt, params)
+        await self.session.commit()
+        return len(params)
+    
+    async def _estimate_row_count(self) -> int:
+        """Row count estimate from pg_class (updated by ANALYZE/autovacuum)"""
+        result = await self.session.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE relname = :table AND relkind = 'r'"
+            ),
+            {"table": EmendaPixModel.__tablename__}
+        )
+        estimate = result.scalar()
+        # reltuples = -1 quando a tabela nunca foi analisada
+        return max(int(estimate or 0), 0)
+    
+    def _build_conditions(
+        self,
+        autor_nome: Optional[str] = None,
+        destinatario_uf: Optional[str] = None,
+        area: Optional[str] = None,
+        status_execucao: Optional[str] = None,
+        tipo: Optional[str] = None,
+        destinatario_nome: Optional[str] = None,
+        ano: Optional[int] = None,
+        valor_min: Optional[float] = None,
+        valor_max: Optional[float] = None,
+        trust_level: Optional[str] = None,
+        trust_score_min: Optional[float] = None,
+        trust_score_max: Optional[float] = None,
+        com_processo_sei: bool = False
+    ) -> list:
+        """Build WHERE conditions shared by list, page, count and stream queries"""
         conditions = []
         if autor_nome:
-            conditions.append(EmendaPixModel.autor_nome.ilike(f"%{autor_nome}%"))
+            conditions.append(
+                self._contains(EmendaPixModel.autor_nome_busca, normalize_search_text(autor_nome))
+            )
+        if destinatario_nome:
+            conditions.append(
+                self._contains(
+                    EmendaPixModel.destinatario_nome_busca,
+                    normalize_search_text(destinatario_nome)
+                )
+            )
+        if ano:
+            conditions.append(EmendaPixModel.ano == ano)
+        if valor_min is not None:
+            conditions.append(EmendaPixModel.valor_aprovado >= valor_min)
+        if valor_max is not None:
+            conditions.append(EmendaPixModel.valor_aprovado <= valor_max)
         if destinatario_uf:
             conditions.append(EmendaPixModel.destinatario_uf == destinatario_uf)
         if area:
@@ -64,41 +559,118 @@ class PostgresEmendaPixRepository(EmendaPixRepository):
             conditions.append(EmendaPixModel.status_execucao == status_execucao)
         if tipo:
             conditions.append(EmendaPixModel.tipo == tipo)
+        if trust_level:
+            conditions.append(EmendaPixModel.trust_level == trust_level)
+        if trust_score_min is not None:
+            conditions.append(EmendaPixModel.trust_score >= trust_score_min)
+        if trust_score_max is not None:
+            conditions.append(EmendaPixModel.trust_score <= trust_score_max)
+        if com_processo_sei:
+            conditions.append(
+                and_(EmendaPixModel.processo_sei.isnot(None), EmendaPixModel.processo_sei != "")
+            )
+        return conditions
+    
+    async def find_by_autor(
+        self,
+        autor_nome: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[EmendaPix]:
+        """Find emendas by author (accent/case-insensitive, ranked by similarity)"""
+        return await self._search_by_name(EmendaPixModel.autor_nome_busca, autor_nome, fields)
+    
+    async def find_by_destinatario(
+        self,
+        destinatario_nome: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[EmendaPix]:
+        """Find emendas by recipient (accent/case-insensitive, ranked by similarity)"""
+        return await self._search_by_name(
+            EmendaPixModel.destinatario_nome_busca, destinatario_nome, fields
+        )
+    
+    async def _search_by_name(
+        self,
+        column,
+        term: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[EmendaPix]:
+        """Partial-name search on a *_busca column, served by its trigram index"""
+        normalized = normalize_search_text(term)
+        stmt = self._select(fields).where(self._contains(column, normalized))
         
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
+        order_by = [EmendaPixModel.ano.desc(), EmendaPixModel.valor_aprovado.desc()]
+        if await self._has_trigram():
+            order_by.insert(0, func.similarity(column, normalized).desc())
+        stmt = stmt.order_by(*order_by)
         
-        stmt = stmt.limit(limit).offset(offset).order_by(EmendaPixModel.created_at.desc())
         result = await self.session.execute(stmt)
         models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        return self._to_entities(models, fields)
     
-    async def find_by_autor(self, autor_nome: str) -> List[EmendaPix]:
-        """Find emendas by author"""
-        stmt = select(EmendaPixModel).where(
-            EmendaPixModel.autor_nome.ilike(f"%{autor_nome}%")
-        ).order_by(EmendaPixModel.ano.desc(), EmendaPixModel.valor_aprovado.desc())
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+    def _select(self, fields: Optional[Sequence[str]] = None):
+        """
+        SELECT on emenda_pix, restricted to `fields` (plus id/created_at) when given
+        
+        Colunas fora da projeção ficam com raiseload: nunca geram lazy loads.
+        """
+        stmt = select(EmendaPixModel)
+        if fields is None:
+            return stmt
+        
+        table = EmendaPixModel.__table__
+        unknown = [name for name in fields if name not in table.columns]
+        if unknown:
+            raise ValueError(f"Colunas desconhecidas: {', '.join(unknown)}")
+        columns = {"id", "created_at", *fields}
+        return stmt.options(
+            load_only(*[getattr(EmendaPixModel, name) for name in columns], raiseload=True)
+        )
     
-    async def find_by_destinatario(self, destinatario_nome: str) -> List[EmendaPix]:
-        """Find emendas by recipient"""
-        stmt = select(EmendaPixModel).where(
-            EmendaPixModel.destinatario_nome.ilike(f"%{destinatario_nome}%")
-        ).order_by(EmendaPixModel.ano.desc(), EmendaPixModel.valor_aprovado.desc())
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+    def _to_entities(
+        self,
+        models: List[EmendaPixModel],
+        fields: Optional[Sequence[str]] = None
+    ) -> List[EmendaPix]:
+        """Convert models to entities; unloaded columns become None"""
+        if fields is None:
+            return [self._to_entity(model) for model in models]
+        
+        entities = []
+        for model in models:
+            unloaded = sa_inspect(model).unloaded
+            # Fora do identity map para que os None não vazem para outras leituras
+            self.session.expunge(model)
+            for key in unloaded:
+                set_committed_value(model, key, None)
+            entities.append(self._to_entity(model))
+        return entities
+    
+    async def _has_trigram(self) -> bool:
+        """Check once per process whether pg_trgm (similarity()) is installed"""
+        if PostgresEmendaPixRepository._trigram_available is None:
+            result = await self.session.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            )
+            PostgresEmendaPixRepository._trigram_available = result.first() is not None
+        return PostgresEmendaPixRepository._trigram_available
+    
+    @staticmethod
+    def _contains(column, normalized: str):
+        """LIKE '%term%' with the whole pattern in one parameter (trigram-indexable)"""
+        escaped = normalized.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return column.like(f"%{escaped}%", escape="\\")
     
     async def save(self, emenda: EmendaPix) -> None:
         """Save or update emenda"""
         try:
             model = await self.session.get(EmendaPixModel, emenda.id)
             is_new = model is None
+            old_keys = (None, None) if is_new else (model.autor_nome, model.destinatario_nome)
             
             if model:
-                # Update
+                # Update (histórico de execução na mesma transação)
+                self._record_history(model, emenda)
                 self._update_model(model, emenda)
             else:
                 # Create
@@ -108,51 +680,279 @@ class PostgresEmendaPixRepository(EmendaPixRepository):
             await self.session.commit()
             await self.session.refresh(model)
             
+            await self._refresh_aggregates_for(
+                autores=(old_keys[0], emenda.autor_nome),
+                destinatarios=(old_keys[1], emenda.destinatario_nome)
+            )
+            
             # Registrar na blockchain (após commit bem-sucedido)
+            self._register_blockchain(
+                created=[emenda] if is_new else [],
+                updated=[] if is_new else [emenda]
+            )
+            get_similarity_index().upsert(emenda)
+                
+        except Exception as e:
+            await self.session.rollback()
+            raise
+    
+    async def upsert_many(
+        self,
+        emendas: Sequence[EmendaPix],
+        update_columns: Optional[Sequence[str]] = None,
+        chunk_size: Optional[int] = None,
+        changed_by: str = "system"
+    ) -> Dict[str, int]:
+        """
+        Bulk insert/update by numero_emenda using INSERT ... ON CONFLICT DO UPDATE
+        
+        Cada bloco de `chunk_size` emendas é um único comando e um único commit.
+        Linhas existentes só são reescritas quando algum valor de
+        `update_columns` mudou (padrão: todas as colunas de dados), então
+        campos que não vêm da fonte, como analise_ia e noticias_relacionadas,
+        são preservados quando omitidos da lista. Um bloco com erro é
+        desfeito e contado em "errors"; os demais seguem. Mudanças de status,
+        percentual ou valor pago entram em emenda_history no mesmo commit.
+        
+        Returns:
+            dict com inserted, updated, unchanged e errors
+        """
+        table = EmendaPixModel.__table__
+        if update_columns is None:
+            update_columns = [
+                c.name for c in table.columns
+                if c.name not in self.UPSERT_IMMUTABLE_COLUMNS
+            ]
+        else:
+            update_columns = list(update_columns)
+            # Colunas de busca acompanham os nomes
+            for nome, busca in (
+                ("autor_nome", "autor_nome_busca"),
+                ("destinatario_nome", "destinatario_nome_busca"),
+            ):
+                if nome in update_columns and busca not in update_columns:
+                    update_columns.append(busca)
+        invalid = set(update_columns) - set(table.columns.keys())
+        invalid |= set(update_columns) & set(self.UPSERT_IMMUTABLE_COLUMNS)
+        if invalid:
+            raise ValueError(f"Colunas inválidas para upsert: {sorted(invalid)}")
+        
+        # Mesmo numero_emenda repetido no lote: vale o último
+        unique = list({e.numero_emenda: e for e in emendas}.values())
+        chunk_size = chunk_size or self.UPSERT_CHUNK_SIZE
+        stats = {"inserted": 0, "updated": 0, "unchanged": 0, "errors": 0}
+        autores, destinatarios = set(), set()
+        
+        for start in range(0, len(unique), chunk_size):
+            chunk = unique[start:start + chunk_size]
+            by_numero = {e.numero_emenda: e for e in chunk}
+            created, updated = [], []
             try:
-                from src.infrastructure.blockchain.tracker import get_blockchain_tracker
-                blockchain = get_blockchain_tracker()
+                previous = await self._tracked_values(list(by_numero))
+                stmt = self._build_upsert(chunk, update_columns)
+                rows = (await self.session.execute(stmt)).all()
                 
-                if is_new:
-                    # Registrar criação
-                    blockchain.register_emenda_creation(
-                        emenda_id=emenda.id,
-                        emenda_data={
-                            "numero_emenda": emenda.numero_emenda,
-                            "ano": emenda.ano,
-                            "autor_nome": emenda.autor_nome,
-                            "destinatario_nome": emenda.destinatario_nome,
-                            "valor_aprovado": emenda.valor_aprovado,
-                            "plano_trabalho": emenda.plano_trabalho or []
-                        }
+                history = []
+                for row in rows:
+                    emenda = by_numero[row.numero_emenda]
+                    emenda.id = str(row.id)
+                    if row.inserted:
+                        created.append(emenda)
+                        continue
+                    updated.append(emenda)
+                    entry = EmendaHistoryEntry.from_change(
+                        emenda, *previous[emenda.numero_emenda], changed_by=changed_by
                     )
-                else:
-                    # Registrar atualização de execução
-                    blockchain.register_execution_update(
-                        emenda_id=emenda.id,
-                        execution_data={
-                            "valor_pago": emenda.valor_pago,
-                            "percentual_executado": emenda.percentual_executado,
-                            "status_execucao": emenda.status_execucao,
-                            "metas_concluidas": emenda.metas_concluidas
-                        }
-                    )
-            except Exception as blockchain_error:
-                # Não falhar se blockchain falhar (pode não estar configurado)
+                    if entry:
+                        history.append(entry)
+                # Histórico no mesmo commit do bloco
+                self.history.add_many(history)
+                await self.session.commit()
+            except Exception as e:
+                await self.session.rollback()
+                stats["errors"] += len(chunk)
                 import structlog
                 logger = structlog.get_logger()
-                logger.warning("blockchain_registration_failed", error=str(blockchain_error))
-                
-        except Exception as e:
-            await self.session.rollback()
-            raise
+                logger.error("emenda_upsert_chunk_failed", size=len(chunk), error=str(e))
+                continue
+            
+            for emenda in created + updated:
+                autores.add(emenda.autor_nome)
+                destinatarios.add(emenda.destinatario_nome)
+            stats["inserted"] += len(created)
+            stats["updated"] += len(updated)
+            stats["unchanged"] += len(chunk) - len(rows)
+            self._register_blockchain(created=created, updated=updated)
+            get_similarity_index().upsert_many(created + updated)
+        
+        # Chaves antigas de emendas renomeadas são corrigidas pelo refresh completo
+        # (refresh_aggregates) executado após a sincronização
+        if autores or destinatarios:
+            await self._refresh_aggregates_for(autores=autores, destinatarios=destinatarios)
+        
+        return stats
+    
+    async def _tracked_values(self, numeros: Sequence[str]) -> Dict[str, Tuple]:
+        """(status, percentual, valor pago) atuais por numero_emenda, para o histórico"""
+        result = await self.session.execute(
+            select(
+                EmendaPixModel.numero_emenda,
+                EmendaPixModel.status_execucao,
+                EmendaPixModel.percentual_executado,
+                EmendaPixModel.valor_pago
+            ).where(EmendaPixModel.numero_emenda.in_(list(numeros)))
+        )
+        return {row[0]: tuple(row[1:]) for row in result.all()}
+    
+    def _record_history(
+        self,
+        model: EmendaPixModel,
+        emenda: EmendaPix,
+        changed_by: str = "system"
+    ) -> None:
+        """Stage a history entry if status/percentual/valor pago changed (before _update_model)"""
+        entry = EmendaHistoryEntry.from_change(
+            emenda,
+            model.status_execucao,
+            model.percentual_executado,
+            model.valor_pago,
+            changed_by=changed_by
+        )
+        if entry:
+            self.history.add_many([entry])
+    
+    def _build_upsert(self, chunk: Sequence[EmendaPix], update_columns: Sequence[str]):
+        """INSERT ... ON CONFLICT (numero_emenda) DO UPDATE ... WHERE <mudou> RETURNING"""
+        table = EmendaPixModel.__table__
+        now = datetime.utcnow()
+        values = []
+        for emenda in chunk:
+            model = self._to_model(emenda)
+            row = {c.name: getattr(model, c.key) for c in table.columns}
+            row["last_sync"] = emenda.last_sync
+            row["created_at"] = emenda.created_at or now
+            row["updated_at"] = now
+            values.append(row)
+        
+        stmt = pg_insert(table).values(values)
+        excluded = stmt.excluded
+        
+        def changed(name: str):
+            current, incoming = table.c[name], excluded[name]
+            if isinstance(current.type, JSON):
+                # json não tem operador de igualdade; compara como jsonb
+                current, incoming = cast(current, JSONB), cast(incoming, JSONB)
+            return current.is_distinct_from(incoming)
+        
+        # last_sync muda a cada execução e não conta como alteração
+        compared = [name for name in update_columns if name != "last_sync"]
+        set_ = {name: excluded[name] for name in update_columns}
+        set_["updated_at"] = excluded.updated_at
+        
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.numero_emenda],
+            set_=set_,
+            where=or_(*[changed(name) for name in compared]) if compared else None
+        ).returning(
+            table.c.id,
+            table.c.numero_emenda,
+            # xmax = 0 apenas em linhas recém-inseridas
+            literal_column("(xmax = 0)").label("inserted")
+        )
+    
+    @asynccontextmanager
+    async def unit_of_work(
+        self,
+        changed_by: str = "system"
+    ) -> AsyncIterator["PostgresEmendaPixUnitOfWork"]:
+        """
+        Collect emenda changes and commit them in a single transaction
+        
+        Usage:
+            async with repository.unit_of_work() as uow:
+                uow.add(emenda)
+        
+        Nothing is written if the block raises. History entries go in the
+        same transaction; blockchain entries and aggregate refreshes run
+        once, in bulk, after the commit.
+        """
+        uow = PostgresEmendaPixUnitOfWork(self, changed_by)
+        yield uow
+        await uow.commit()
     
     async def delete(self, id: str) -> None:
         """Delete emenda"""
         model = await self.session.get(EmendaPixModel, id)
         if model:
+            autor_nome, destinatario_nome = model.autor_nome, model.destinatario_nome
+            await self.history.delete_for_emenda(id)
             await self.session.delete(model)
+            await self._record_deletion()
             await self.session.commit()
+            get_similarity_index().remove(id)
+            await self._refresh_aggregates_for(
+                autores=(autor_nome,),
+                destinatarios=(destinatario_nome,)
+            )
+    
+    def _register_blockchain(self, created: List[EmendaPix], updated: List[EmendaPix]) -> None:
+        """Registra criações e atualizações de execução na blockchain"""
+        try:
+            from src.infrastructure.blockchain.tracker import get_blockchain_tracker
+            blockchain = get_blockchain_tracker()
+            
+            for emenda in created:
+                # Registrar criação
+                blockchain.register_emenda_creation(
+                    emenda_id=emenda.id,
+                    emenda_data={
+                        "numero_emenda": emenda.numero_emenda,
+                        "ano": emenda.ano,
+                        "autor_nome": emenda.autor_nome,
+                        "destinatario_nome": emenda.destinatario_nome,
+                        "valor_aprovado": emenda.valor_aprovado,
+                        "plano_trabalho": emenda.plano_trabalho or []
+                    }
+                )
+            for emenda in updated:
+                # Registrar atualização de execução
+                blockchain.register_execution_update(
+                    emenda_id=emenda.id,
+                    execution_data={
+                        "valor_pago": emenda.valor_pago,
+                        "percentual_executado": emenda.percentual_executado,
+                        "status_execucao": emenda.status_execucao,
+                        "metas_concluidas": emenda.metas_concluidas
+                    }
+                )
+        except Exception as blockchain_error:
+            # Não falhar se blockchain falhar (pode não estar configurado)
+            import structlog
+            logger = structlog.get_logger()
+            logger.warning("blockchain_registration_failed", error=str(blockchain_error))
+    
+    async def _refresh_aggregates_for(self, autores, destinatarios) -> None:
+        """Refresh aggregates of the touched groups without failing the write"""
+        try:
+            await self.aggregates.refresh_keys(autores=autores, destinatarios=destinatarios)
+        except Exception as aggregate_error:
+            # A escrita principal já foi confirmada; o refresh completo periódico corrige
+            await self.session.rollback()
+            import structlog
+            logger = structlog.get_logger()
+            logger.warning("aggregate_refresh_failed", error=str(aggregate_error))
+    
+    async def _record_deletion(self) -> None:
+        """Incrementa o contador de remoções (versão dos dados) na transação atual"""
+        now = datetime.utcnow()
+        stmt = pg_insert(EmendaPixDataVersionModel).values(id=1, deletions=1, last_deleted_at=now)
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=[EmendaPixDataVersionModel.id],
+            set_={
+                "deletions": EmendaPixDataVersionModel.deletions + 1,
+                "last_deleted_at": now,
+            }
+        ))
     
     def _to_entity(self, model: EmendaPixModel) -> EmendaPix:
         """Convert model to entity"""
@@ -194,11 +994,25 @@ class PostgresEmendaPixRepository(EmendaPixRepository):
             validacao_geofencing=model.validacao_geofencing,
             processo_sei=model.processo_sei,
             link_portal_transparencia=model.link_portal_transparencia,
+            trust_score=model.trust_score,
+            trust_level=model.trust_level,
+            trust_factors=self._trust_factors(model),
             created_at=model.created_at,
             updated_at=model.updated_at,
             last_sync=model.last_sync
         )
     
+    @staticmethod
+    def _trust_factors(model: EmendaPixModel) -> Optional[Dict[str, float]]:
+        """Per-factor Trust Scores, or None when the emenda was not scored"""
+        factors = {
+            name: getattr(model, f"trust_{name}")
+            for name in ("execucao", "tempo", "documentacao", "risco", "historico")
+        }
+        if all(value is None for value in factors.values()):
+            return None
+        return factors
+    
     def _to_model(self, entity: EmendaPix) -> EmendaPixModel:
         """Convert entity to model"""
         return EmendaPixModel(
@@ -213,6 +1027,8 @@ class PostgresEmendaPixRepository(EmendaPixRepository):
             destinatario_nome=entity.destinatario_nome,
             destinatario_uf=entity.destinatario_uf,
             destinatario_cnpj=entity.destinatario_cnpj,
+            autor_nome_busca=normalize_search_text(entity.autor_nome),
+            destinatario_nome_busca=normalize_search_text(entity.destinatario_nome),
             valor_aprovado=entity.valor_aprovado,
             valor_empenhado=entity.valor_empenhado,
             valor_liquidado=entity.valor_liquidado,
@@ -252,6 +1068,8 @@ class PostgresEmendaPixRepository(EmendaPixRepository):
         model.destinatario_nome = entity.destinatario_nome
         model.destinatario_uf = entity.destinatario_uf
         model.destinatario_cnpj = entity.destinatario_cnpj
+        model.autor_nome_busca = normalize_search_text(entity.autor_nome)
+        model.destinatario_nome_busca = normalize_search_text(entity.destinatario_nome)
         model.valor_aprovado = entity.valor_aprovado
         model.valor_empenhado = entity.valor_empenhado
         model.valor_liquidado = entity.valor_liquidado
@@ -278,3 +1096,58 @@ class PostgresEmendaPixRepository(EmendaPixRepository):
         model.processo_sei = entity.processo_sei
         model.link_portal_transparencia = entity.link_portal_transparencia
 
+
+
+class PostgresEmendaPixUnitOfWork:
+    """Pending emenda changes of PostgresEmendaPixRepository.unit_of_work()"""
+    
+    def __init__(self, repository: PostgresEmendaPixRepository, changed_by: str = "system"):
+        self.repository = repository
+        self.session = repository.session
+        self.changed_by = changed_by
+        self._pending: Dict[str, EmendaPix] = {}
+    
+    def add(self, emenda: EmendaPix) -> None:
+        """Register a new or changed emenda (the last version of each id wins)"""
+        self._pending[emenda.id] = emenda
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+    
+    async def commit(self) -> Dict[str, int]:
+        """Write all pending emendas in one transaction, then run side effects"""
+        if not self._pending:
+            return {"created": 0, "updated": 0}
+        
+        result = await self.session.execute(
+            select(EmendaPixModel).where(EmendaPixModel.id.in_(list(self._pending)))
+        )
+        existing = {str(model.id): model for model in result.scalars().all()}
+        
+        created, updated = [], []
+        autores, destinatarios = set(), set()
+        try:
+            for emenda in self._pending.values():
+                model = existing.get(emenda.id)
+                if model:
+                    autores.add(model.autor_nome)
+                    destinatarios.add(model.destinatario_nome)
+                    self.repository._record_history(model, emenda, self.changed_by)
+                    self.repository._update_model(model, emenda)
+                    updated.append(emenda)
+                else:
+                    self.session.add(self.repository._to_model(emenda))
+                    created.append(emenda)
+                autores.add(emenda.autor_nome)
+                destinatarios.add(emenda.destinatario_nome)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        finally:
+            self._pending.clear()
+        
+        await self.repository._refresh_aggregates_for(autores=autores, destinatarios=destinatarios)
+        self.repository._register_blockchain(created=created, updated=updated)
+        get_similarity_index().upsert_many(created + updated)
+        return {"created": len(created), "updated": len(updated)}
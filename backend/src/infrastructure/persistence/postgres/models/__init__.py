@@ -3,6 +3,15 @@ from src.infrastructure.persistence.postgres.models.legislation import Legislati
 from src.infrastructure.persistence.postgres.models.emenda_pix import EmendaPixModel
 from src.infrastructure.persistence.postgres.models.user_preferences import UserPreferencesModel
 from src.infrastructure.persistence.postgres.models.emenda_history import EmendaHistoryModel
+from src.infrastructure.persistence.postgres.models.emenda_pix_aggregate import EmendaPixAggregateModel
+from src.infrastructure.persistence.postgres.models.emenda_pix_data_version import EmendaPixDataVersionModel
 
-__all__ = ["LegislationModel", "EmendaPixModel", "UserPreferencesModel", "EmendaHistoryModel"]
+__all__ = [
+    "LegislationModel",
+    "EmendaPixModel",
+    "UserPreferencesModel",
+    "EmendaHistoryModel",
+    "EmendaPixAggregateModel",
+    "EmendaPixDataVersionModel",
+]
 
@@ -1,5 +1,5 @@
 """Emenda execution history model"""
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, String, Float, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -11,9 +11,13 @@ from src.infrastructure.persistence.postgres.database import Base
 class EmendaHistoryModel(Base):
     """History of emenda execution changes"""
     __tablename__ = "emenda_history"
+    __table_args__ = (
+        # Timeline por emenda: WHERE emenda_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_emenda_history_emenda_id_created_at", "emenda_id", "created_at"),
+    )
     
     id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
-    emenda_id = Column(UUID(as_uuid=False), ForeignKey("emenda_pix.id"), nullable=False, index=True)
+    emenda_id = Column(UUID(as_uuid=False), ForeignKey("emenda_pix.id"), nullable=False)
     
     # Dados do histórico
     status_anterior = Column(String(50), nullable=True)
@@ -1,5 +1,5 @@
 """Emenda Pix SQLAlchemy model"""
-from sqlalchemy import Column, String, Text, DateTime, Float, JSON, Integer, Boolean
+from sqlalchemy import Column, String, Text, DateTime, Float, JSON, Integer, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from src.infrastructure.persistence.postgres.database import Base
 from datetime import datetime
@@ -9,6 +9,16 @@ import uuid
 class EmendaPixModel(Base):
     """Emenda Pix database model"""
     __tablename__ = "emenda_pix"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_emenda_pix_created_at_id", "created_at", "id"),
+        # Rankings top/bottom N: ORDER BY trust_score, id
+        Index("ix_emenda_pix_trust_score_id", "trust_score", "id"),
+        Index("ix_emenda_pix_trust_level", "trust_level"),
+        # get_data_version: max(trust_computed_at) e max(updated_at) pelo índice
+        Index("ix_emenda_pix_trust_computed_at", "trust_computed_at"),
+        Index("ix_emenda_pix_updated_at", "updated_at"),
+    )
 
     id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
     
@@ -28,6 +38,11 @@ class EmendaPixModel(Base):
     destinatario_uf = Column(String(2), nullable=True)
     destinatario_cnpj = Column(String(18), nullable=True)
     
+    # Busca por nome sem acento/caixa (lower(unaccent(...))), com índices
+    # GIN pg_trgm criados pela migração 7d2e4f6a8b10
+    autor_nome_busca = Column(String(200), nullable=True)
+    destinatario_nome_busca = Column(String(200), nullable=True)
+    
     # Valores
     valor_aprovado = Column(Float, nullable=False)
     valor_empenhado = Column(Float, nullable=True, default=0.0)
@@ -69,6 +84,17 @@ class EmendaPixModel(Base):
     processo_sei = Column(String(100), nullable=True)  # Número do processo no CEIS
     link_portal_transparencia = Column(Text, nullable=True)
     
+    # Trust Score persistido (calculado em lote por RefreshTrustScoresUseCase)
+    trust_score = Column(Float, nullable=True)  # 0-100
+    trust_level = Column(String(20), nullable=True)  # 'excelente', 'bom', 'regular', 'ruim', 'crítico'
+    trust_execucao = Column(Float, nullable=True)  # Scores (0-100) de cada fator
+    trust_tempo = Column(Float, nullable=True)
+    trust_documentacao = Column(Float, nullable=True)
+    trust_risco = Column(Float, nullable=True)
+    trust_historico = Column(Float, nullable=True)
+    trust_inputs_hash = Column(String(32), nullable=True)  # md5 das entradas usadas no cálculo
+    trust_computed_at = Column(DateTime, nullable=True)
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,47 @@
+"""Materialized aggregates of Emenda Pix execution (Placar de Transparência)"""
+from sqlalchemy import Column, String, DateTime, Float, Integer, Index
+from src.infrastructure.persistence.postgres.database import Base
+from datetime import datetime
+
+
+class EmendaPixAggregateModel(Base):
+    """
+    Métricas pré-agregadas por autor ou destinatário, UF, área e ano
+
+    Mantida pelo repositório: recalculada por chave a cada save e por completo
+    após sincronizações em lote. Leituras do placar e dos benchmarks usam
+    apenas esta tabela.
+    """
+    __tablename__ = "emenda_pix_aggregates"
+    __table_args__ = (
+        Index("ix_emenda_pix_aggregates_dimensao_chave", "dimensao", "chave"),
+        Index("ix_emenda_pix_aggregates_dimensao_ano", "dimensao", "ano"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Chave do agregado
+    dimensao = Column(String(20), nullable=False)  # 'autor' ou 'destinatario'
+    chave = Column(String(200), nullable=False)  # autor_nome ou destinatario_nome
+    chave_busca = Column(String(200), nullable=True)  # chave sem acento/caixa
+    uf = Column(String(2), nullable=True)  # autor_uf ou destinatario_uf
+    area = Column(String(100), nullable=True)
+    ano = Column(Integer, nullable=False)
+
+    # Métricas
+    total_emendas = Column(Integer, nullable=False, default=0)
+    valor_total_aprovado = Column(Float, nullable=False, default=0.0)
+    valor_total_pago = Column(Float, nullable=False, default=0.0)
+    valor_total_executado = Column(Float, nullable=False, default=0.0)
+    soma_percentual_executado = Column(Float, nullable=False, default=0.0)  # média = soma / total
+    emendas_atrasadas = Column(Integer, nullable=False, default=0)
+    total_alertas = Column(Integer, nullable=False, default=0)  # severidade alta ou média
+
+    # Distribuição de status
+    status_pendente = Column(Integer, nullable=False, default=0)
+    status_em_execucao = Column(Integer, nullable=False, default=0)
+    status_concluida = Column(Integer, nullable=False, default=0)
+    status_atrasada = Column(Integer, nullable=False, default=0)
+    status_cancelada = Column(Integer, nullable=False, default=0)
+
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,19 @@
+"""Emenda Pix data version counter"""
+from sqlalchemy import Column, Integer, BigInteger, DateTime
+from src.infrastructure.persistence.postgres.database import Base
+
+
+class EmendaPixDataVersionModel(Base):
+    """
+    Contador de remoções de emendas (linha única, id = 1)
+
+    Inclusões e alterações aparecem em max(updated_at) e recálculos de Trust
+    Score em max(trust_computed_at), ambos lidos por índice; uma remoção não
+    deixa rastro na emenda_pix, então delete() incrementa este contador na
+    mesma transação.
+    """
+    __tablename__ = "emenda_pix_data_version"
+
+    id = Column(Integer, primary_key=True)
+    deletions = Column(BigInteger, nullable=False, default=0)
+    last_deleted_at = Column(DateTime, nullable=True)
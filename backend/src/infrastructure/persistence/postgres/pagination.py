@@ -0,0 +1,57 @@
+"""Keyset (cursor) pagination helpers"""
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """
+    Gera cursor opaco a partir da chave de ordenação (created_at, id)
+
+    O cursor é um JSON codificado em base64 url-safe, sem padding,
+    para poder trafegar em query strings.
+    """
+    payload = json.dumps(
+        {"c": created_at.isoformat(), "i": str(id)},
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decodifica cursor opaco gerado por encode_cursor
+
+    Raises:
+        ValueError: se o cursor estiver malformado
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        # id validado aqui: um valor que não é UUID falharia só no banco (500)
+        return datetime.fromisoformat(payload["c"]), str(uuid.UUID(payload["i"]))
+    except Exception as e:
+        raise ValueError(f"Cursor inválido: {cursor}") from e
+
+
+def encode_score_cursor(score: float, id: str) -> str:
+    """Gera cursor opaco a partir da chave de ordenação (trust_score, id)"""
+    payload = json.dumps({"s": float(score), "i": str(id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, str]:
+    """
+    Decodifica cursor opaco gerado por encode_score_cursor
+
+    Raises:
+        ValueError: se o cursor estiver malformado
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return float(payload["s"]), str(uuid.UUID(payload["i"]))
+    except Exception as e:
+        raise ValueError(f"Cursor inválido: {cursor}") from e
@@ -0,0 +1,16 @@
+"""Normalização de texto para busca por nome (sem acento e sem caixa)"""
+import unicodedata
+from typing import Optional
+
+
+def normalize_search_text(value: Optional[str]) -> Optional[str]:
+    """
+    Remove acentos e converte para minúsculas
+
+    Equivale a lower(unaccent(value)) no PostgreSQL, usado no backfill das
+    colunas *_busca, para que "Sao Paulo" encontre "São Paulo".
+    """
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
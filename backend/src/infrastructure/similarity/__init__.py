@@ -0,0 +1,4 @@
+"""Similarity index module"""
+from .emenda_index import EmendaSimilarityIndex, get_similarity_index
+
+__all__ = ["EmendaSimilarityIndex", "get_similarity_index"]
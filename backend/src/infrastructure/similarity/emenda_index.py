@@ -0,0 +1,370 @@
+"""
+Índice em memória de similaridade entre emendas
+
+Cada emenda vira um vetor numérico compacto (valor aprovado e códigos de
+área, status e destinatário) guardado em arrays NumPy. As linhas ficam em
+buckets por (área, status, faixa de log10 do valor); a busca visita os
+buckets em ordem decrescente de pontuação máxima possível, calcula os
+scores de cada bucket de forma vetorizada e para assim que nenhum bucket
+restante pode superar o top k já encontrado.
+"""
+import asyncio
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import structlog
+
+from src.domain.entities.emenda_pix import EmendaPix
+
+logger = structlog.get_logger()
+
+# Pesos do score de similaridade (somam 1.0)
+AREA_WEIGHT = 0.3
+AREA_BOTH_EMPTY_WEIGHT = 0.15
+VALOR_WEIGHT = 0.3
+DESTINATARIO_WEIGHT = 0.2
+STATUS_WEIGHT = 0.2
+
+# Faixas de valor: 10 por década (razão de ~1.26 entre os limites de cada faixa)
+VALOR_BINS_PER_DECADE = 10
+# Faixa das emendas com valor aprovado <= 0
+NON_POSITIVE_BIN = -10_000
+
+_NONE_CODE = 0  # área/destinatário ausente
+_UNKNOWN_CODE = -1  # valor da consulta que não existe no índice
+
+BucketKey = Tuple[int, int, int]
+
+
+class _Vocabulary:
+    """Códigos inteiros estáveis para valores textuais (0 = ausente)"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: Optional[str]) -> int:
+        if not value:
+            return _NONE_CODE
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes) + 1
+        return code
+
+    def lookup(self, value: Optional[str]) -> int:
+        if not value:
+            return _NONE_CODE
+        return self.codes.get(value, _UNKNOWN_CODE)
+
+
+def valor_bin(valor: float) -> int:
+    """Faixa de log10(valor) da emenda"""
+    if not valor or valor <= 0:
+        return NON_POSITIVE_BIN
+    return math.floor(math.log10(valor) * VALOR_BINS_PER_DECADE)
+
+
+def valor_similarity(a, b):
+    """1 - |a - b| / max(a, b), limitado a [0, 1] (aceita arrays)"""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    largest = np.maximum(a, b)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        similarity = np.where(largest > 0, 1 - np.abs(a - b) / largest, 0.0)
+    return np.clip(similarity, 0.0, 1.0)
+
+
+class EmendaSimilarityIndex:
+    """
+    Índice de similaridade com atualização incremental
+
+    Carregado por completo na primeira consulta (ou quando fica mais velho
+    que max_age_seconds, cobrindo escritas feitas por outros processos) e
+    atualizado pelo repositório a cada save/upsert/delete neste processo.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    # Colunas lidas do banco na carga completa
+    LOAD_FIELDS = ("area", "status_execucao", "valor_aprovado", "destinatario_nome")
+
+    def __init__(self, max_age_seconds: float = 900):
+        self.max_age_seconds = max_age_seconds
+        self.loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._loading = False
+        self._pending: List[Tuple[str, Optional[EmendaPix]]] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        capacity = self.INITIAL_CAPACITY
+        self._valor = np.zeros(capacity, dtype=np.float64)
+        self._area = np.zeros(capacity, dtype=np.int32)
+        self._status = np.zeros(capacity, dtype=np.int16)
+        self._destinatario = np.zeros(capacity, dtype=np.int32)
+        self._ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._keys: Dict[int, BucketKey] = {}
+        self._buckets: Dict[BucketKey, Set[int]] = {}
+        self._bucket_arrays: Dict[BucketKey, np.ndarray] = {}
+        self._free: List[int] = []
+        self._areas = _Vocabulary()
+        self._statuses = _Vocabulary()
+        self._destinatarios = _Vocabulary()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def is_stale(self) -> bool:
+        return (
+            self.loaded_at is None
+            or time.monotonic() - self.loaded_at > self.max_age_seconds
+        )
+
+    async def ensure_loaded(self, repository) -> None:
+        """Carrega (ou recarrega, se expirado) todas as emendas do repositório"""
+        if not self.is_stale():
+            return
+        async with self._lock:
+            if not self.is_stale():
+                return
+            started = time.perf_counter()
+            self._loading = True
+            try:
+                fresh = EmendaSimilarityIndex(self.max_age_seconds)
+                async for emenda in repository.stream(fields=self.LOAD_FIELDS, batch_size=5000):
+                    fresh._apply(emenda)
+                self._swap(fresh)
+            finally:
+                self._loading = False
+            self.loaded_at = time.monotonic()
+            # Escritas ocorridas durante a carga
+            pending, self._pending = self._pending, []
+            for emenda_id, emenda in pending:
+                if emenda is None:
+                    self.remove(emenda_id)
+                else:
+                    self.upsert(emenda)
+            logger.info(
+                "similarity_index_loaded",
+                emendas=len(self),
+                buckets=len(self._buckets),
+                duration_ms=round((time.perf_counter() - started) * 1000, 1)
+            )
+
+    def _swap(self, other: "EmendaSimilarityIndex") -> None:
+        for name in (
+            "_valor", "_area", "_status", "_destinatario", "_ids", "_rows", "_keys",
+            "_buckets", "_bucket_arrays", "_free", "_areas", "_statuses", "_destinatarios",
+        ):
+            setattr(self, name, getattr(other, name))
+
+    def upsert(self, emenda: EmendaPix) -> None:
+        """Inclui ou atualiza uma emenda"""
+        if self._loading:
+            self._pending.append((emenda.id, emenda))
+        elif not self.is_loaded:
+            # Ainda não carregado: a carga completa já vai ler esta emenda
+            return
+        self._apply(emenda)
+
+    def upsert_many(self, emendas: Iterable[EmendaPix]) -> None:
+        for emenda in emendas:
+            self.upsert(emenda)
+
+    def _apply(self, emenda: EmendaPix) -> None:
+        row = self._rows.get(emenda.id)
+        if row is None:
+            row = self._allocate(emenda.id)
+
+        area = self._areas.encode(emenda.area)
+        status = self._statuses.encode(emenda.status_execucao)
+        self._valor[row] = emenda.valor_aprovado or 0.0
+        self._area[row] = area
+        self._status[row] = status
+        self._destinatario[row] = self._destinatarios.encode(emenda.destinatario_nome)
+
+        key = (area, status, valor_bin(emenda.valor_aprovado))
+        old_key = self._keys.get(row)
+        if old_key != key:
+            if old_key is not None:
+                self._discard_from_bucket(old_key, row)
+            self._buckets.setdefault(key, set()).add(row)
+            self._bucket_arrays.pop(key, None)
+            self._keys[row] = key
+
+    def remove(self, emenda_id: str) -> None:
+        """Remove uma emenda do índice"""
+        if self._loading:
+            self._pending.append((emenda_id, None))
+        elif not self.is_loaded:
+            return
+        row = self._rows.pop(emenda_id, None)
+        if row is None:
+            return
+        self._discard_from_bucket(self._keys.pop(row), row)
+        self._ids[row] = None
+        self._free.append(row)
+
+    def search(
+        self,
+        emenda: EmendaPix,
+        k: int = 10,
+        area: Optional[str] = None,
+        valor_range: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Top k emendas mais similares a `emenda` (exceto ela mesma)
+
+        Args:
+            emenda: Emenda de referência (não precisa estar no índice)
+            k: Quantidade de resultados
+            area: Exclui emendas com outra área (emendas sem área são mantidas)
+            valor_range: Faixa de valor aceita, em % do valor da emenda
+
+        Returns:
+            Lista de (id, score) em ordem decrescente de score
+        """
+        valor = emenda.valor_aprovado or 0.0
+        query_area = self._areas.lookup(emenda.area)
+        query_status = self._statuses.lookup(emenda.status_execucao)
+        query_destinatario = self._destinatarios.lookup(emenda.destinatario_nome)
+        query_row = self._rows.get(emenda.id, -1)
+
+        allowed_areas = None
+        if area:
+            allowed_areas = {_NONE_CODE, self._areas.lookup(area)}
+        valor_bounds = None
+        if valor_range:
+            valor_bounds = (valor * (1 - valor_range / 100), valor * (1 + valor_range / 100))
+
+        candidates = []
+        for key in self._buckets:
+            bucket_area, bucket_status, bucket_bin = key
+            if allowed_areas is not None and bucket_area not in allowed_areas:
+                continue
+            if valor_bounds is not None and not self._bin_overlaps(bucket_bin, *valor_bounds):
+                continue
+            base = self._area_score(query_area, bucket_area)
+            if bucket_status == query_status:
+                base += STATUS_WEIGHT
+            bound = base + DESTINATARIO_WEIGHT + VALOR_WEIGHT * self._bin_valor_bound(valor, bucket_bin)
+            candidates.append((bound, base, key))
+        candidates.sort(key=lambda c: c[0], reverse=True)
+
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float64)
+        for bound, base, key in candidates:
+            if len(best_scores) >= k and bound <= best_scores.min():
+                break
+            rows = self._bucket_rows(key)
+            mask = rows != query_row
+            if valor_bounds is not None:
+                values = self._valor[rows]
+                mask &= (values >= valor_bounds[0]) & (values <= valor_bounds[1])
+            rows = rows[mask]
+            if not len(rows):
+                continue
+
+            scores = (
+                base
+                + VALOR_WEIGHT * valor_similarity(valor, self._valor[rows])
+                + DESTINATARIO_WEIGHT * (self._destinatario[rows] == query_destinatario)
+            )
+            best_rows = np.concatenate((best_rows, rows))
+            best_scores = np.concatenate((best_scores, scores))
+            if len(best_scores) > k:
+                top = np.argpartition(-best_scores, k - 1)[:k]
+                best_rows, best_scores = best_rows[top], best_scores[top]
+
+        order = np.argsort(-best_scores, kind="stable")
+        return [
+            (self._ids[row], round(float(score), 2))
+            for row, score in zip(best_rows[order], best_scores[order])
+        ]
+
+    def _allocate(self, emenda_id: str) -> int:
+        if self._free:
+            row = self._free.pop()
+            self._ids[row] = emenda_id
+        else:
+            row = len(self._ids)
+            if row == len(self._valor):
+                self._grow()
+            self._ids.append(emenda_id)
+        self._rows[emenda_id] = row
+        return row
+
+    def _grow(self) -> None:
+        capacity = len(self._valor) * 2
+        for name in ("_valor", "_area", "_status", "_destinatario"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def _discard_from_bucket(self, key: BucketKey, row: int) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return
+        bucket.discard(row)
+        if not bucket:
+            del self._buckets[key]
+        self._bucket_arrays.pop(key, None)
+
+    def _bucket_rows(self, key: BucketKey) -> np.ndarray:
+        rows = self._bucket_arrays.get(key)
+        if rows is None:
+            bucket = self._buckets[key]
+            rows = self._bucket_arrays[key] = np.fromiter(bucket, dtype=np.int64, count=len(bucket))
+        return rows
+
+    @staticmethod
+    def _area_score(query_area: int, bucket_area: int) -> float:
+        if query_area == _NONE_CODE:
+            return AREA_BOTH_EMPTY_WEIGHT if bucket_area == _NONE_CODE else 0.0
+        return AREA_WEIGHT if bucket_area == query_area else 0.0
+
+    @staticmethod
+    def _bin_limits(bucket_bin: int) -> Tuple[float, float]:
+        if bucket_bin == NON_POSITIVE_BIN:
+            return -math.inf, 0.0
+        return (
+            10 ** (bucket_bin / VALOR_BINS_PER_DECADE),
+            10 ** ((bucket_bin + 1) / VALOR_BINS_PER_DECADE)
+        )
+
+    def _bin_overlaps(self, bucket_bin: int, low: float, high: float) -> bool:
+        bin_low, bin_high = self._bin_limits(bucket_bin)
+        # Folga para arredondamento de ponto flutuante nos limites
+        return bin_low <= high * (1 + 1e-9) and bin_high >= low * (1 - 1e-9)
+
+    def _bin_valor_bound(self, valor: float, bucket_bin: int) -> float:
+        """Maior similaridade de valor possível entre `valor` e a faixa"""
+        if valor <= 0 or bucket_bin == NON_POSITIVE_BIN:
+            return 0.0 if valor > 0 else 1.0
+        low, high = self._bin_limits(bucket_bin)
+        if valor < low:
+            bound = valor / low
+        elif valor > high:
+            bound = high / valor
+        else:
+            return 1.0
+        return min(1.0, bound * (1 + 1e-9))
+
+
+# Instância global do índice
+_global_index: Optional[EmendaSimilarityIndex] = None
+
+
+def get_similarity_index() -> EmendaSimilarityIndex:
+    """Obtém instância global do índice de similaridade"""
+    global _global_index
+    if _global_index is None:
+        _global_index = EmendaSimilarityIndex()
+    return _global_index
@@ -0,0 +1,167 @@
+"""
+Exportação colunar (Parquet e Arrow IPC) de emendas
+
+Os arquivos são escritos em record batches: cada lote de emendas vira um
+row group (Parquet) ou um batch (Arrow) e os bytes produzidos são devolvidos
+imediatamente, sem acumular o arquivo inteiro em memória.
+"""
+from typing import List, Sequence
+import structlog
+
+from src.domain.entities.emenda_pix import EmendaPix
+from src.infrastructure.persistence.postgres.emenda_aggregate_repository_impl import STATUS_VALUES
+
+logger = structlog.get_logger()
+
+# Try to import pyarrow
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    logger.warning("pyarrow not available. Parquet/Arrow exports will be disabled.")
+
+
+COLUMNAR_FORMATS = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+# Colunas exportadas, na ordem do arquivo
+COLUMNAR_FIELDS = (
+    "numero_emenda", "ano", "tipo", "autor_nome", "autor_partido", "autor_uf",
+    "destinatario_tipo", "destinatario_nome", "destinatario_uf", "destinatario_cnpj", "area",
+    "valor_aprovado", "valor_empenhado", "valor_liquidado", "valor_pago", "percentual_executado",
+    "status_execucao", "data_inicio", "data_prevista_conclusao", "data_real_conclusao",
+    "numero_metas", "metas_concluidas", "risco_desvio", "processo_sei",
+    "link_portal_transparencia", "created_at", "updated_at",
+)
+
+
+def _build_schema():
+    timestamp = pa.timestamp("us")
+    types = {
+        "id": pa.string(),
+        "ano": pa.int16(),
+        "valor_aprovado": pa.float64(),
+        "valor_empenhado": pa.float64(),
+        "valor_liquidado": pa.float64(),
+        "valor_pago": pa.float64(),
+        "percentual_executado": pa.float64(),
+        "risco_desvio": pa.float64(),
+        # Dicionário fixo: o mesmo em todos os batches do arquivo
+        "status_execucao": pa.dictionary(pa.int8(), pa.string()),
+        "data_inicio": timestamp,
+        "data_prevista_conclusao": timestamp,
+        "data_real_conclusao": timestamp,
+        "numero_metas": pa.int32(),
+        "metas_concluidas": pa.int32(),
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
+    return pa.schema(
+        [pa.field(name, types.get(name, pa.string())) for name in ("id",) + COLUMNAR_FIELDS],
+        metadata={"source": "emenda_pix"}
+    )
+
+
+class _ChunkSink:
+    """Destino em memória que entrega os bytes escritos a cada drain()"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.closed = False
+        self.position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+class ColumnarExportWriter:
+    """
+    Escreve emendas em Parquet ou Arrow IPC (arquivo Feather v2), lote a lote
+
+    Uso: write_batch() para cada lote e close() no final; ambos retornam os
+    bytes produzidos desde a chamada anterior.
+    """
+
+    def __init__(self, format: str = "parquet", compression: str = "zstd"):
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow não está instalado")
+        if format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Formato não suportado: {format}")
+
+        self.format = format
+        self.schema = _build_schema()
+        self.status_dictionary = pa.array(STATUS_VALUES, type=pa.string())
+        self.status_index = {status: i for i, status in enumerate(STATUS_VALUES)}
+        self.rows = 0
+        self.unknown_status = 0
+
+        self._sink = _ChunkSink()
+        if format == "parquet":
+            self._writer = pq.ParquetWriter(self._sink, self.schema, compression=compression)
+        else:
+            self._writer = pa.ipc.new_file(
+                self._sink,
+                self.schema,
+                options=pa.ipc.IpcWriteOptions(compression=compression)
+            )
+
+    @property
+    def media_type(self) -> str:
+        return COLUMNAR_FORMATS[self.format]
+
+    def write_batch(self, emendas: Sequence[EmendaPix]) -> bytes:
+        """Escreve um lote como um record batch e retorna os bytes gerados"""
+        if emendas:
+            self._writer.write_batch(self._to_record_batch(emendas))
+            self.rows += len(emendas)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Finaliza o arquivo (rodapé/metadados) e retorna os últimos bytes"""
+        self._writer.close()
+        if self.unknown_status:
+            logger.warning("columnar_export_unknown_status", rows=self.unknown_status)
+        return self._sink.drain()
+
+    def _to_record_batch(self, emendas: Sequence[EmendaPix]):
+        arrays = []
+        for field in self.schema:
+            if field.name == "status_execucao":
+                arrays.append(self._encode_status(emendas))
+            else:
+                values = [getattr(emenda, field.name) for emenda in emendas]
+                arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def _encode_status(self, emendas: Sequence[EmendaPix]):
+        indices = []
+        for emenda in emendas:
+            index = self.status_index.get(emenda.status_execucao)
+            if index is None:
+                self.unknown_status += 1
+            indices.append(index)
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=pa.int8()),
+            self.status_dictionary
+        )
@@ -0,0 +1,41 @@
+"""
+Serialização JSON rápida (orjson), com fallback para a biblioteca padrão
+
+Usada nas respostas da API e nas exportações JSON/NDJSON. Datas viram
+ISO 8601 nos dois caminhos.
+"""
+import json
+from datetime import date, datetime
+from typing import Any
+import structlog
+
+logger = structlog.get_logger()
+
+# Try to import orjson
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available. Falling back to the standard json module.")
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "tolist"):  # escalares e arrays NumPy
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """Serializa `value` em JSON UTF-8 (sem escapar acentos)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            value,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
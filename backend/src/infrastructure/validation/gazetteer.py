@@ -0,0 +1,135 @@
+"""
+Gazetteer local dos municípios do IBGE
+
+Tabela com código IBGE, nome, UF e centroide de cada município, carregada uma
+vez em memória a partir de data/municipios.csv.gz (versionado no repositório;
+regenerado com scripts/build_ibge_gazetteer.py). As buscas por nome ignoram acentos, caixa e
+pontuação ("Santa Bárbara D'Oeste" == "santa barbara d oeste") e não fazem
+chamadas de rede.
+
+O arquivo é obrigatório: a API o carrega no startup e não sobe sem ele
+(IBGE_GAZETTEER_PATH aponta para outro arquivo, se necessário).
+"""
+import csv
+import gzip
+import os
+import re
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_GAZETTEER_PATH = Path(__file__).parent / "data" / "municipios.csv.gz"
+GAZETTEER_PATH = Path(os.getenv("IBGE_GAZETTEER_PATH", str(DEFAULT_GAZETTEER_PATH)))
+
+# Colunas do arquivo
+FIELDS = ["codigo_ibge", "nome", "uf", "latitude", "longitude"]
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(nome: str) -> str:
+    """Nome sem acentos, em minúsculas, com pontuação e espaços colapsados"""
+    decomposed = unicodedata.normalize("NFKD", nome)
+    ascii_only = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", ascii_only.lower()).strip()
+
+
+class GazetteerMissingError(RuntimeError):
+    """Arquivo do gazetteer não encontrado"""
+
+
+class MunicipioGazetteer:
+    """Tabelas de busca de municípios por (UF, nome) e por código IBGE"""
+
+    def __init__(self):
+        # Colunas em arrays compactos; o índice da linha liga as tabelas
+        self.codes = array("i")
+        self.latitudes = array("d")
+        self.longitudes = array("d")
+        self.names: List[str] = []
+        self.ufs: List[str] = []
+        self._by_name: Dict[str, int] = {}
+        self._by_code: Dict[int, int] = {}
+
+    @classmethod
+    def load(cls, path: Path = GAZETTEER_PATH) -> "MunicipioGazetteer":
+        """Carrega o gazetteer do CSV (gzip ou texto)"""
+        gazetteer = cls()
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                gazetteer.add(
+                    int(row["codigo_ibge"]), row["nome"], row["uf"],
+                    float(row["latitude"]), float(row["longitude"])
+                )
+        return gazetteer
+
+    def add(self, codigo_ibge: int, nome: str, uf: str, latitude: float, longitude: float) -> None:
+        index = len(self.codes)
+        uf = uf.upper()
+        self.codes.append(codigo_ibge)
+        self.latitudes.append(latitude)
+        self.longitudes.append(longitude)
+        self.names.append(nome)
+        self.ufs.append(uf)
+        self._by_name[self._key(nome, uf)] = index
+        self._by_code[codigo_ibge] = index
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @staticmethod
+    def _key(nome: str, uf: str) -> str:
+        return f"{uf.strip().upper()}:{normalize_name(nome)}"
+
+    def lookup(self, municipio: str, uf: str) -> Optional[Dict]:
+        """Município pelo nome e UF; None se não existir"""
+        index = self._by_name.get(self._key(municipio, uf))
+        return self._row(index) if index is not None else None
+
+    def by_code(self, codigo_ibge: int) -> Optional[Dict]:
+        """Município pelo código IBGE; None se não existir"""
+        index = self._by_code.get(codigo_ibge)
+        return self._row(index) if index is not None else None
+
+    def _row(self, index: int) -> Dict:
+        return {
+            "codigo_ibge": self.codes[index],
+            "municipio": self.names[index],
+            "uf": self.ufs[index],
+            "latitude": self.latitudes[index],
+            "longitude": self.longitudes[index],
+        }
+
+
+# Instância global (None até a primeira carga)
+_global_gazetteer: Optional[MunicipioGazetteer] = None
+
+
+def get_gazetteer() -> MunicipioGazetteer:
+    """
+    Obtém o gazetteer global, carregando o arquivo na primeira chamada
+
+    Raises:
+        GazetteerMissingError: se o arquivo não existir
+    """
+    global _global_gazetteer
+    if _global_gazetteer is None:
+        try:
+            _global_gazetteer = MunicipioGazetteer.load(GAZETTEER_PATH)
+        except FileNotFoundError:
+            logger.error(
+                "ibge_gazetteer_missing",
+                path=str(GAZETTEER_PATH),
+                hint="check IBGE_GAZETTEER_PATH or restore data/municipios.csv.gz"
+            )
+            raise GazetteerMissingError(
+                f"Gazetteer de municípios não encontrado em {GAZETTEER_PATH}; "
+                "confira IBGE_GAZETTEER_PATH ou restaure data/municipios.csv.gz do repositório"
+            ) from None
+        logger.info("ibge_gazetteer_loaded", municipios=len(_global_gazetteer))
+    return _global_gazetteer
@@ -8,14 +8,60 @@ import asyncio
 from pathlib import Path
 import json
 
+import numpy as np
+
+from src.infrastructure.validation.gazetteer import MunicipioGazetteer, get_gazetteer
+
 logger = structlog.get_logger()
 
+# Raio médio da Terra em km
+EARTH_RADIUS_KM = 6371.0
+
+
+def as_coordinate(value) -> float:
+    """Coordenada como float; NaN se ausente ou inválida (0.0 é uma coordenada válida)"""
+    if value is None or value == "":
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def valid_coordinates(latitude, longitude):
+    """
+    Se o par (já convertido por as_coordinate) é uma posição válida
+    
+    Escalares ou arrays: NaN (ausente) ou fora de ±90/±180 é inválido.
+    """
+    latitude, longitude = np.asarray(latitude), np.asarray(longitude)
+    return (
+        ~np.isnan(latitude) & ~np.isnan(longitude)
+        & (np.abs(latitude) <= 90) & (np.abs(longitude) <= 180)
+    )
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Distância de Haversine em km, elemento a elemento
+    
+    Aceita escalares ou arrays (com broadcasting): um lote inteiro de fotos
+    contra o centroide esperado é uma única operação NumPy. NaN na entrada
+    resulta em NaN na saída.
+    """
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2)
+    )
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
 
 class GeofencingValidator:
     """Validador de geofencing com suporte a EXIF"""
     
-    def __init__(self):
+    def __init__(self, gazetteer: Optional[MunicipioGazetteer] = None):
         self.tolerance_radius_km = 10.0  # Raio de tolerância padrão (10km)
+        self.gazetteer = gazetteer if gazetteer is not None else get_gazetteer()
     
     def validate_photo_location(
         self,
@@ -55,18 +101,17 @@ class GeofencingValidator:
         """Implementação interna da validação"""
         try:
             # Se já temos coordenadas nos dados, usar diretamente
-            if photo_data and photo_data.get('latitude') and photo_data.get('longitude'):
-                latitude = photo_data['latitude']
-                longitude = photo_data['longitude']
-                source = 'provided'
-            else:
+            photo_data = photo_data or {}
+            latitude = as_coordinate(photo_data.get('latitude'))
+            longitude = as_coordinate(photo_data.get('longitude'))
+            source = 'provided'
+            if not valid_coordinates(latitude, longitude):
                 # Tentar extrair do EXIF
-                exif_data = self._extract_exif_data(photo_path)
-                if exif_data and exif_data.get('latitude') and exif_data.get('longitude'):
-                    latitude = exif_data['latitude']
-                    longitude = exif_data['longitude']
-                    source = 'exif'
-                else:
+                exif_data = self._extract_exif_data(photo_path) or {}
+                latitude = as_coordinate(exif_data.get('latitude'))
+                longitude = as_coordinate(exif_data.get('longitude'))
+                source = 'exif'
+                if not valid_coordinates(latitude, longitude):
                     return {
                         "success": False,
                         "valid": False,
@@ -75,10 +120,8 @@ class GeofencingValidator:
                         "source": "none"
                     }
             
-            # Obter coordenadas esperadas do município
-            # Usar versão síncrona com mock (para compatibilidade)
-            # Em produção, pode usar versão assíncrona
-            expected_coords = self._get_mock_municipio_coordinates(expected_municipio, expected_uf)
+            # Obter coordenadas esperadas do município (gazetteer local)
+            expected_coords = self._lookup_municipio_coordinates(expected_municipio, expected_uf)
             
             if not expected_coords:
                 return {
@@ -93,10 +136,10 @@ class GeofencingValidator:
                 }
             
             # Calcular distância
-            distance_km = self._calculate_distance(
+            distance_km = float(haversine_km(
                 latitude, longitude,
                 expected_coords['latitude'], expected_coords['longitude']
-            )
+            ))
             
             # Validar se está dentro do raio
             is_valid = distance_km <= self.tolerance_radius_km
@@ -311,62 +354,30 @@ class GeofencingValidator:
         """
         Obtém coordenadas do município
         
-        Implementação com fallback para mock
-        Tenta usar API do IBGE, se não disponível usa dados mockados
+        Mantida assíncrona por compatibilidade; a busca é local (ver
+        _lookup_municipio_coordinates) e não faz chamadas de rede.
         """
-        try:
-            # Tentar usar API do IBGE
-            try:
-                import httpx
-                
-                # Buscar código IBGE do município
-                # Primeiro, buscar municípios do estado
-                ibge_url = f"https://servicodados.ibge.gov.br/api/v1/localidades/estados/{uf}/municipios"
-                
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    response = await client.get(ibge_url)
-                    if response.status_code == 200:
-                        municipios = response.json()
-                        
-                        # Encontrar o município pelo nome
-                        municipio_encontrado = None
-                        for m in municipios:
-                            if m['nome'].upper() == municipio.upper():
-                                municipio_encontrado = m
-                                break
-                        
-                        if municipio_encontrado:
-                            codigo_ibge = municipio_encontrado['id']
-                            
-                            # Buscar coordenadas (usando API de localidades)
-                            # Nota: API do IBGE não retorna coordenadas diretamente
-                            # Usar mock baseado no código IBGE para consistência
-                            return self._get_mock_municipio_coordinates(municipio, uf, codigo_ibge)
-                
-                # Se não encontrou, usar mock
-                return self._get_mock_municipio_coordinates(municipio, uf)
-                
-            except ImportError:
-                # httpx não disponível
-                logger.info("httpx_not_available_using_mock", municipio=municipio, uf=uf)
-                return self._get_mock_municipio_coordinates(municipio, uf)
-            except Exception as e:
-                logger.warning(
-                    "ibge_api_error_using_mock",
-                    municipio=municipio,
-                    uf=uf,
-                    error=str(e)
-                )
-                return self._get_mock_municipio_coordinates(municipio, uf)
-                
-        except Exception as e:
-            logger.error(
-                "municipio_coordinates_error",
-                municipio=municipio,
-                uf=uf,
-                error=str(e)
-            )
+        return self._lookup_municipio_coordinates(municipio, uf)
+    
+    def _lookup_municipio_coordinates(
+        self,
+        municipio: str,
+        uf: str
+    ) -> Optional[Dict]:
+        """
+        Centroide do município no gazetteer do IBGE
+        
+        Sem o arquivo do gazetteer, usa coordenadas mockadas; com ele, um
+        município inexistente retorna None.
+        """
+        if not len(self.gazetteer):
             return self._get_mock_municipio_coordinates(municipio, uf)
+        
+        found = self.gazetteer.lookup(municipio, uf)
+        if found is None:
+            logger.warning("municipio_not_in_gazetteer", municipio=municipio, uf=uf)
+            return None
+        return {**found, "is_mock": False}
     
     def _get_mock_municipio_coordinates(
         self,
@@ -415,42 +426,6 @@ class GeofencingValidator:
             "is_mock": True  # Flag para indicar que são dados mockados
         }
     
-    def _calculate_distance(
-        self,
-        lat1: float,
-        lon1: float,
-        lat2: float,
-        lon2: float
-    ) -> float:
-        """
-        Calcula distância entre duas coordenadas usando fórmula de Haversine
-        
-        Returns:
-            Distância em quilômetros
-        """
-        from math import radians, sin, cos, sqrt, atan2
-        
-        # Raio da Terra em km
-        R = 6371.0
-        
-        # Converter para radianos
-        lat1_rad = radians(lat1)
-        lon1_rad = radians(lon1)
-        lat2_rad = radians(lat2)
-        lon2_rad = radians(lon2)
-        
-        # Diferenças
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        # Fórmula de Haversine
-        a = sin(dlat / 2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        
-        distance = R * c
-        
-        return distance
-    
     def extract_exif_metadata(self, photo_path: str) -> Dict:
         """
         Extrai todos os metadados EXIF da foto
@@ -5,25 +5,50 @@ from fastapi.responses import JSONResponse
 import structlog
 from contextlib import asynccontextmanager
 
-from src.presentation.api.v1.routes import legislation, alerts, participation, whatsapp, data_sources, emenda_pix, notifications, reports
+from src.presentation.api.compression import CompressionMiddleware
+from src.presentation.api.v1.responses import FastJSONResponse
+from src.presentation.api.v1.routes import legislation, alerts, participation, whatsapp, data_sources, emenda_pix, notifications, reports, jobs
 from src.infrastructure.logging.structured_logger import setup_logging
-from src.infrastructure.persistence.postgres.database import init_db, close_db
+from src.infrastructure.persistence.postgres.database import init_db, close_db, AsyncSessionLocal
+from src.infrastructure.persistence.postgres.emenda_aggregate_repository_impl import PostgresEmendaAggregateRepository
+from src.infrastructure.jobs import get_job_queue
+from src.infrastructure.external.http_clients import get_http_client_registry
+from src.infrastructure.external.response_cache import get_response_cache
+from src.infrastructure.validation.gazetteer import get_gazetteer
 
 # Setup logging
 setup_logging()
 logger = structlog.get_logger()
 
 
+async def backfill_aggregates():
+    """Calcula os agregados do placar na primeira subida com dados existentes"""
+    try:
+        async with AsyncSessionLocal() as session:
+            aggregates = PostgresEmendaAggregateRepository(session)
+            if await aggregates.is_empty():
+                await aggregates.refresh_all()
+                logger.info("Emenda aggregates backfilled")
+    except Exception as e:
+        logger.warning("aggregate_backfill_failed", error=str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events"""
     # Startup
     logger.info("Starting application")
+    # Geofencing depende do gazetteer do IBGE: sem o arquivo, a API não sobe
+    get_gazetteer()
     await init_db()
     logger.info("Database initialized")
+    await backfill_aggregates()
     yield
     # Shutdown
     logger.info("Shutting down application")
+    await get_job_queue().close()
+    await get_response_cache().close()
+    await get_http_client_registry().close()
     await close_db()
     logger.info("Database connections closed")
 
@@ -57,6 +82,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     contact={
         "name": "Voz Cidadã",
         "url": "https://vozcidada.org",
@@ -91,6 +117,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compressão brotli/gzip negociada (respostas textuais a partir de 1 KB)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(legislation.router, prefix="/api/v1", tags=["legislation"])
 app.include_router(alerts.router, prefix="/api/v1", tags=["alerts"])
@@ -100,6 +129,7 @@ app.include_router(data_sources.router, prefix="/api/v1", tags=["data-sources"])
 app.include_router(emenda_pix.router, prefix="/api/v1", tags=["emenda-pix"])
 app.include_router(notifications.router, prefix="/api/v1", tags=["notifications"])
 app.include_router(reports.router, prefix="/api/v1", tags=["reports"])
+app.include_router(jobs.router, prefix="/api/v1", tags=["jobs"])
 
 
 @app.get("/")
@@ -114,6 +144,12 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/upstreams")
+async def upstreams_health():
+    """Circuit breaker state and trip counts per external upstream"""
+    return {"upstreams": get_http_client_registry().stats()}
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
@@ -0,0 +1,216 @@
+"""
+Compressão das respostas (brotli ou gzip), negociada por Accept-Encoding
+
+Middleware ASGI: comprime só tipos textuais (JSON, NDJSON, CSV, ...) a
+partir de um tamanho mínimo. Respostas em streaming são comprimidas trecho a
+trecho, com flush a cada trecho para o cliente receber os dados sem esperar
+o fim da exportação.
+"""
+import zlib
+from typing import Optional, Tuple
+import structlog
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = structlog.get_logger()
+
+# Try to import brotli
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    logger.warning("brotli not available. Responses will be compressed with gzip only.")
+
+
+# Tipos comprimidos (Parquet/Arrow já saem comprimidos com zstd)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+    )
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Codificação escolhida para o Accept-Encoding do cliente
+
+    Preferência: br (se instalado), depois gzip; q=0 exclui a codificação.
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            weights[name.strip().lower()] = quality
+
+    available = (["br"] if BROTLI_AVAILABLE else []) + ["gzip"]
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor:
+    """Compressor incremental com a mesma interface para gzip e brotli"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits 16+: cabeçalho e trailer gzip
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Comprime um trecho e descarrega o que já pode ser enviado"""
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """
+    Comprime respostas textuais com brotli ou gzip, conforme Accept-Encoding
+
+    Args:
+        minimum_size: Respostas de um só trecho menores que isso seguem sem
+            compressão (streaming é sempre comprimido)
+        gzip_level: Nível do gzip (1-9)
+        brotli_quality: Qualidade do brotli (0-11); valores baixos são os
+            adequados para respostas dinâmicas
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Intercepta a resposta de uma requisição e decide se comprime"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Segura o início até ver o primeiro trecho do corpo
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            decision, headers = self._should_compress(start, body, more_body)
+            if not decision:
+                self.passthrough = True
+                await self.downstream(start)
+                await self.downstream(message)
+                return
+
+            self.compressor = _Compressor(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            headers["Content-Encoding"] = self.encoding
+            compressed = self.compressor.compress(body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                compressed += self.compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+            await self.downstream(start)
+            await self.downstream({
+                "type": "http.response.body", "body": compressed, "more_body": more_body
+            })
+            return
+
+        if self.passthrough or self.compressor is None:
+            await self.downstream(message)
+            return
+
+        compressed = self.compressor.compress(body)
+        if not more_body:
+            compressed += self.compressor.finish()
+        await self.downstream({
+            "type": "http.response.body", "body": compressed, "more_body": more_body
+        })
+
+    def _should_compress(
+        self,
+        start: Message,
+        body: bytes,
+        more_body: bool
+    ) -> Tuple[bool, MutableHeaders]:
+        headers = MutableHeaders(raw=start["headers"])
+        if start["status"] < 200 or start["status"] in (204, 304):
+            return False, headers
+        if "content-encoding" in headers or not is_compressible(headers.get("content-type", "")):
+            return False, headers
+
+        # A representação varia com Accept-Encoding, comprimida ou não
+        vary = headers.get("vary")
+        if not vary:
+            headers["Vary"] = "Accept-Encoding"
+        elif "accept-encoding" not in vary.lower():
+            headers["Vary"] = f"{vary}, Accept-Encoding"
+
+        if not more_body and len(body) < self.middleware.minimum_size:
+            return False, headers
+        return True, headers
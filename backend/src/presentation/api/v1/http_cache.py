@@ -0,0 +1,91 @@
+"""
+Cache HTTP condicional (ETag / Last-Modified) para endpoints de leitura
+
+As rotas calculam um validador barato (updated_at da emenda ou a versão dos
+dados) antes de executar o use case; se o cliente já tem a representação
+atual, respondem 304 sem consultar nem serializar nada.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Navegadores e proxies guardam a resposta, mas revalidam a cada uso
+DEFAULT_CACHE_CONTROL = "public, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """
+    ETag fraco a partir das partes que identificam a representação
+
+    Fraco (W/) porque o corpo pode variar em bytes (ex.: compressão) sem
+    mudar de conteúdo.
+    """
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _http_date(value: datetime) -> str:
+    """datetime (UTC, naive ou não) no formato de data HTTP"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comparação fraca de If-None-Match (RFC 9110)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # Datas HTTP têm resolução de segundos
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = DEFAULT_CACHE_CONTROL
+) -> Optional[Response]:
+    """
+    Aplica os validadores à resposta e trata requisições condicionais
+
+    Define ETag, Last-Modified e Cache-Control em `response` (a resposta
+    injetada na rota). Retorna uma resposta 304 quando a cópia do cliente
+    ainda vale; a rota deve devolvê-la sem executar o use case.
+    If-Modified-Since só é considerado sem If-None-Match.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = _http_date(last_modified)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        fresh = bool(
+            if_modified_since and last_modified is not None
+            and _not_modified_since(if_modified_since, last_modified)
+        )
+
+    if fresh:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
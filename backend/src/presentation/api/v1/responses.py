@@ -0,0 +1,36 @@
+"""
+Resposta JSON padrão da API (orjson)
+
+FastJSONResponse é a default_response_class da aplicação. Rotas com
+payloads grandes montam o conteúdo já serializável e devolvem
+json_response(), sem a revalidação do response_model pelo FastAPI.
+"""
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from src.infrastructure.storage.json_codec import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse serializada com orjson (quando instalado)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(
+    content: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200
+) -> FastJSONResponse:
+    """
+    Resposta JSON direta, levando os headers já definidos em `response`
+
+    `response` é a Response injetada na rota (ex.: ETag e Cache-Control de
+    conditional_response), que o FastAPI ignora quando a rota devolve uma
+    Response pronta.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
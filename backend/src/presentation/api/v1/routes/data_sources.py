@@ -1,6 +1,6 @@
 """Data sources routes - Integration with external APIs"""
-from fastapi import APIRouter, Query, HTTPException
-from typing import Optional, List
+from fastapi import APIRouter, Query, HTTPException, Response
+from typing import Any, Awaitable, Callable, Dict, Optional, List
 from datetime import datetime, timedelta
 import structlog
 
@@ -8,13 +8,27 @@ from src.infrastructure.external.querido_diario.client import QueridoDiarioClien
 from src.infrastructure.external.senado_api.client import SenadoAPIClient
 from src.infrastructure.external.tse.client import TSEClient
 from src.infrastructure.external.cnj_datjud.client import DataJudClient
+from src.infrastructure.external.response_cache import get_response_cache
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/data-sources", tags=["data-sources"])
 
 
+async def _cached(
+    response: Response,
+    source: str,
+    params: Dict[str, Any],
+    fetch: Callable[[], Awaitable[List[Dict]]]
+) -> List[Dict]:
+    """Resultado da fonte via cache; o estado (hit/stale/miss) vai no header X-Cache"""
+    results, status = await get_response_cache().get_or_fetch(source, params, fetch)
+    response.headers["X-Cache"] = status
+    return results
+
+
 @router.get("/querido-diario/search")
 async def search_querido_diario(
+    response: Response,
     terms: str = Query(..., description="Terms to search (comma-separated)"),
     cities: Optional[str] = Query(None, description="City codes (comma-separated)"),
     days: int = Query(30, ge=1, le=365, description="Number of days to look back")
@@ -27,20 +41,23 @@ async def search_querido_diario(
     - **days**: Number of days to look back (1-365)
     """
     try:
-        client = QueridoDiarioClient()
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
         terms_list = [t.strip() for t in terms.split(",")]
         cities_list = [c.strip() for c in cities.split(",")] if cities else None
         
-        results = await client.search_terms(
-            terms=terms_list,
-            cities=cities_list,
-            start_date=start_date,
-            end_date=end_date
+        async def fetch():
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days)
+            return await QueridoDiarioClient().search_terms(
+                terms=terms_list,
+                cities=cities_list,
+                start_date=start_date,
+                end_date=end_date
+            )
+        
+        results = await _cached(
+            response, "querido_diario",
+            {"terms": terms_list, "cities": cities_list, "days": days}, fetch
         )
-        await client.close()
         
         return {
             "source": "querido-diario",
@@ -55,6 +72,7 @@ async def search_querido_diario(
 
 @router.get("/senado/matters")
 async def get_senado_matters(
+    response: Response,
     days: int = Query(30, ge=1, le=365, description="Number of days to look back")
 ):
     """
@@ -63,12 +81,12 @@ async def get_senado_matters(
     - **days**: Number of days to look back (1-365)
     """
     try:
-        client = SenadoAPIClient()
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        async def fetch():
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days)
+            return await SenadoAPIClient().get_matters(start_date=start_date, end_date=end_date)
         
-        matters = await client.get_matters(start_date=start_date, end_date=end_date)
-        await client.close()
+        matters = await _cached(response, "senado_matters", {"days": days}, fetch)
         
         return {
             "source": "senado-federal",
@@ -81,12 +99,12 @@ async def get_senado_matters(
 
 
 @router.get("/senado/senators")
-async def get_senators():
+async def get_senators(response: Response):
     """Get list of senators"""
     try:
-        client = SenadoAPIClient()
-        senators = await client.get_senators()
-        await client.close()
+        senators = await _cached(
+            response, "senado_senators", {}, lambda: SenadoAPIClient().get_senators()
+        )
         
         return {
             "source": "senado-federal",
@@ -100,6 +118,7 @@ async def get_senators():
 
 @router.get("/tse/election-results")
 async def get_election_results(
+    response: Response,
     year: int = Query(2022, ge=2000, le=2030, description="Election year"),
     uf: Optional[str] = Query(None, description="State code (optional)")
 ):
@@ -110,9 +129,10 @@ async def get_election_results(
     - **uf**: State code (optional)
     """
     try:
-        client = TSEClient()
-        results = await client.get_election_results(year=year, uf=uf)
-        await client.close()
+        results = await _cached(
+            response, "tse_election_results", {"year": year, "uf": uf},
+            lambda: TSEClient().get_election_results(year=year, uf=uf)
+        )
         
         return {
             "source": "tse",
@@ -127,6 +147,7 @@ async def get_election_results(
 
 @router.get("/datjud/processes")
 async def get_judicial_processes(
+    response: Response,
     uf: Optional[str] = Query(None, description="State code (optional)"),
     days: int = Query(30, ge=1, le=365, description="Number of days to look back")
 ):
@@ -137,16 +158,16 @@ async def get_judicial_processes(
     - **days**: Number of days to look back (1-365)
     """
     try:
-        client = DataJudClient()
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        async def fetch():
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days)
+            return await DataJudClient().get_judicial_processes(
+                uf=uf,
+                start_date=start_date,
+                end_date=end_date
+            )
         
-        processes = await client.get_judicial_processes(
-            uf=uf,
-            start_date=start_date,
-            end_date=end_date
-        )
-        await client.close()
+        processes = await _cached(response, "datajud_processes", {"uf": uf, "days": days}, fetch)
         
         return {
             "source": "datjud-cnj",
@@ -1,24 +1,39 @@
 """Emenda Pix routes"""
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List, Dict
 
 from src.infrastructure.persistence.postgres.database import get_db
 from src.infrastructure.persistence.postgres.emenda_pix_repository_impl import PostgresEmendaPixRepository
+from src.infrastructure.persistence.postgres.emenda_history_repository_impl import PostgresEmendaHistoryRepository
 from src.application.use_cases.emenda_pix import (
     GetEmendaPixUseCase,
     ListEmendasPixUseCase,
     AnalyzeEmendaPixIAUseCase
 )
 from src.application.use_cases.emenda_pix.calculate_trust_score import CalculateTrustScoreUseCase
-from src.application.use_cases.emenda_pix.sync_emendas_portal import SyncEmendasPortalUseCase
+from src.application.use_cases.emenda_pix.refresh_trust_scores import RefreshTrustScoresUseCase
 from src.application.use_cases.emenda_pix.sync_ceis_data import SyncCEISDataUseCase
 from src.application.use_cases.emenda_pix.fetch_news import FetchEmendaNewsUseCase
 from src.application.use_cases.emenda_pix.register_blockchain import RegisterBlockchainUseCase
 from src.application.use_cases.emenda_pix.compare_emendas import CompareEmendasUseCase
+from src.application.use_cases.emenda_pix.placar_transparencia import PlacarTransparenciaUseCase
+from src.application.use_cases.emenda_pix.share_emenda import ShareEmendaUseCase
+from src.application.use_cases.emenda_pix.track_history import TrackHistoryUseCase
 from src.application.use_cases.emenda_pix.validate_geofencing import ValidateGeofencingUseCase
 from src.application.use_cases.emenda_pix.upload_photo import UploadPhotoUseCase
-from src.application.dto.emenda_pix_dto import EmendaPixDTO, EmendaPixListResponse
+from src.infrastructure.jobs import get_job_queue
+from src.infrastructure.external.http_clients import get_http_client
+from src.infrastructure.jobs.handlers import SYNC_CEIS_ALL, FETCH_NEWS_ALL, SYNC_EMENDAS_PORTAL
+from src.presentation.api.v1.http_cache import make_etag, conditional_response
+from src.presentation.api.v1.routes.jobs import job_accepted
+from src.presentation.api.v1.responses import json_response
+from src.application.dto.emenda_pix_dto import (
+    EmendaPixDTO,
+    EmendaPixListResponse,
+    resolve_fields,
+    to_list_response
+)
 
 router = APIRouter(prefix="/emenda-pix", tags=["emenda-pix"])
 
@@ -44,56 +59,234 @@ def get_list_emendas_use_case(
     return ListEmendasPixUseCase(repository)
 
 
+def get_fields(
+    fields: Optional[str] = Query(
+        None,
+        description=(
+            "Campos retornados, separados por vírgula (ex.: id,numero_emenda,valor_pago). "
+            "Padrão: campos da listagem; 'all' retorna todos"
+        )
+    )
+) -> List[str]:
+    """Dependency that resolves the fields= sparse fieldset"""
+    try:
+        return resolve_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/", response_model=EmendaPixListResponse)
 async def list_emendas(
+    request: Request,
+    response: Response,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado em next_cursor"),
     autor_nome: Optional[str] = Query(None),
     destinatario_uf: Optional[str] = Query(None),
     area: Optional[str] = Query(None),
     status_execucao: Optional[str] = Query(None),
     tipo: Optional[str] = Query(None, description="Tipo de emenda: 'individual' ou 'bancada'"),
+    trust_level: Optional[str] = Query(None, description="Nível do Trust Score (excelente, bom, regular, ruim, crítico)"),
+    trust_score_min: Optional[float] = Query(None, ge=0, le=100),
+    trust_score_max: Optional[float] = Query(None, ge=0, le=100),
+    sort: str = Query("-created_at", description="Ordenação: -created_at, trust_score ou -trust_score"),
+    fields: List[str] = Depends(get_fields),
+    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository),
     use_case: ListEmendasPixUseCase = Depends(get_list_emendas_use_case)
 ):
     """
     List Emendas Pix with pagination and filters
-    
+
     - **limit**: Maximum number of results (1-1000)
-    - **offset**: Number of results to skip
+    - **offset**: Number of results to skip (ignored when cursor is given)
+    - **cursor**: Keyset cursor from a previous response's next_cursor
     - **autor_nome**: Filter by author name (partial match)
     - **destinatario_uf**: Filter by recipient state (UF)
     - **area**: Filter by area (saude, educacao, infraestrutura, etc.)
     - **status_execucao**: Filter by execution status
     - **tipo**: Filter by emenda type ('individual' or 'bancada')
+    - **trust_level**, **trust_score_min**, **trust_score_max**: Filter by persisted Trust Score
+    - **sort**: '-created_at' (default), 'trust_score' (bottom first) or '-trust_score' (top first)
+    - **fields**: Comma-separated fields to return (default: list view fields; 'all' for every field)
+
+    Prefer cursor pagination for deep pages: it seeks on (sort key, id)
+    instead of skipping rows. Trust Score sorts only list emendas already
+    scored. `total` may be an estimate on very large unfiltered listings
+    (see `total_is_estimate`). Answers If-None-Match with 304 while the
+    data version is unchanged.
     """
-    emendas = await use_case.execute(
-        limit=limit,
-        offset=offset,
+    etag = make_etag("emendas", await repository.get_data_version(), request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    filters = dict(
         autor_nome=autor_nome,
         destinatario_uf=destinatario_uf,
         area=area,
         status_execucao=status_execucao,
-        tipo=tipo
+        tipo=tipo,
+        trust_level=trust_level,
+        trust_score_min=trust_score_min,
+        trust_score_max=trust_score_max
+    )
+
+    if cursor or offset == 0:
+        try:
+            emendas, next_cursor = await use_case.execute_page(
+                limit=limit,
+                cursor=cursor,
+                fields=fields,
+                sort=sort,
+                **filters
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        # Compatibilidade com clientes que ainda paginam por offset
+        try:
+            emendas = await use_case.execute(
+                limit=limit, offset=offset, fields=fields, sort=sort, **filters
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        next_cursor = None
+
+    total, total_is_estimate = await use_case.count(**filters)
+
+    return json_response(
+        to_list_response(
+            emendas,
+            fields,
+            total=total,
+            limit=limit,
+            offset=0 if cursor else offset,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate
+        ),
+        response
     )
+
+
+@router.get("/patterns-anomalies")
+async def identify_patterns_anomalies(
+    request: Request,
+    response: Response,
+    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
+):
+    """
+    Identifica padrões e anomalias nas emendas
     
-    return EmendaPixListResponse(
-        items=[EmendaPixDTO.model_validate(e) for e in emendas],
-        total=len(emendas),
-        limit=limit,
-        offset=offset
+    Retorna análise de padrões (baixa execução, atrasos) e anomalias de todo
+    o portfólio: valor aprovado, velocidade de execução e razão
+    pago/empenhado fora do típico da área ou UF (z-score robusto), além de
+    pagamentos acima do empenhado. Em cache até a próxima sincronização.
+    """
+    etag = make_etag("anomalias", await repository.get_data_version(), request.url.path, request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    use_case = CompareEmendasUseCase(repository)
+    
+    try:
+        result = await use_case.identify_patterns_and_anomalies()
+        if not result["success"]:
+            raise HTTPException(status_code=400, detail=result["message"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erro ao identificar padrões: {str(e)}"
+        )
+
+
+@router.get("/trust-score/ranking")
+async def get_trust_score_ranking(
+    request: Request,
+    response: Response,
+    ordem: str = Query("top", description="'top' (maiores scores) ou 'bottom' (menores)"),
+    limit: int = Query(50, ge=1, le=500, description="Tamanho do ranking"),
+    uf: Optional[str] = Query(None, description="UF do destinatário"),
+    area: Optional[str] = Query(None, description="Área temática"),
+    status_execucao: Optional[str] = Query(None, description="Status de execução"),
+    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
+):
+    """
+    Top/bottom N emendas por Trust Score persistido
+
+    - **ordem**: 'top' ou 'bottom'
+    - **limit**: Tamanho do ranking (1-500)
+    - **uf**, **area**, **status_execucao**: Filtros opcionais
+
+    Lido do índice (trust_score, id). Scores são recalculados em lote
+    (POST /trust-score/refresh e sincronização periódica).
+    """
+    etag = make_etag("trust_ranking", await repository.get_data_version(), request.url.path, request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    use_case = PlacarTransparenciaUseCase(repository)
+
+    result = await use_case.trust_ranking(
+        ordem=ordem,
+        uf=uf,
+        area=area,
+        status_execucao=status_execucao,
+        limit=limit
     )
+    if not result["success"]:
+        status_code = 400 if ordem not in use_case.TRUST_ORDENS else 500
+        raise HTTPException(status_code=status_code, detail=result["message"])
+    return result
+
+
+@router.post("/trust-score/refresh")
+async def refresh_trust_scores(
+    force: bool = Query(False, description="Recalcula todas as emendas, mesmo sem mudanças"),
+    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
+):
+    """
+    Recalcula em lote os Trust Scores persistidos
+
+    Só emendas novas, alteradas ou que passaram do prazo desde o último
+    cálculo, a menos que **force** seja informado.
+    """
+    result = await RefreshTrustScoresUseCase(repository).execute(force=force)
+    if not result["success"]:
+        raise HTTPException(status_code=500, detail=result["message"])
+    return result
 
 
 @router.get("/{emenda_id}", response_model=EmendaPixDTO)
 async def get_emenda(
     emenda_id: str,
+    request: Request,
+    response: Response,
+    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository),
     use_case: GetEmendaPixUseCase = Depends(get_get_emenda_use_case)
 ):
     """
     Get Emenda Pix by ID
     
     - **emenda_id**: ID of the emenda
+    
+    Sends ETag/Last-Modified from the emenda's last change and answers
+    conditional requests with 304 without loading the emenda.
     """
+    last_modified = await repository.get_last_modified(emenda_id)
+    if last_modified is None:
+        raise HTTPException(status_code=404, detail="Emenda not found")
+    not_modified = conditional_response(
+        request, response, make_etag("emenda", emenda_id, last_modified.isoformat()), last_modified
+    )
+    if not_modified:
+        return not_modified
+    
     emenda = await use_case.execute(emenda_id)
     if not emenda:
         raise HTTPException(status_code=404, detail="Emenda not found")
@@ -174,74 +367,86 @@ async def analyze_emenda(
 @router.get("/autor/{autor_nome}", response_model=EmendaPixListResponse)
 async def get_emendas_by_autor(
     autor_nome: str,
+    request: Request,
+    response: Response,
+    fields: List[str] = Depends(get_fields),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
     """
     Get all Emendas Pix by author name
     
     - **autor_nome**: Name of the author (deputado)
+    - **fields**: Comma-separated fields to return (default: list view fields)
     """
-    emendas = await repository.find_by_autor(autor_nome)
+    etag = make_etag(
+        "emendas", await repository.get_data_version(), request.url.path, request.url.query
+    )
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    emendas = await repository.find_by_autor(autor_nome, fields=fields)
     
-    return EmendaPixListResponse(
-        items=[EmendaPixDTO.model_validate(e) for e in emendas],
-        total=len(emendas),
-        limit=len(emendas),
-        offset=0
+    return json_response(
+        to_list_response(emendas, fields, total=len(emendas), limit=len(emendas)),
+        response
     )
 
 
 @router.get("/destinatario/{destinatario_nome}", response_model=EmendaPixListResponse)
 async def get_emendas_by_destinatario(
     destinatario_nome: str,
+    request: Request,
+    response: Response,
+    fields: List[str] = Depends(get_fields),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
     """
     Get all Emendas Pix by recipient name
     
     - **destinatario_nome**: Name of the recipient (município, estado, órgão)
+    - **fields**: Comma-separated fields to return (default: list view fields)
     """
-    emendas = await repository.find_by_destinatario(destinatario_nome)
+    etag = make_etag(
+        "emendas", await repository.get_data_version(), request.url.path, request.url.query
+    )
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    emendas = await repository.find_by_destinatario(destinatario_nome, fields=fields)
     
-    return EmendaPixListResponse(
-        items=[EmendaPixDTO.model_validate(e) for e in emendas],
-        total=len(emendas),
-        limit=len(emendas),
-        offset=0
+    return json_response(
+        to_list_response(emendas, fields, total=len(emendas), limit=len(emendas)),
+        response
     )
 
 
-@router.post("/sync")
+@router.post("/sync", status_code=202)
 async def sync_emendas_portal(
     ano: Optional[int] = Query(None, description="Ano das emendas (padrão: ano atual)"),
     codigo_ibge: Optional[str] = Query(None, description="Código IBGE do município (opcional)"),
-    limit: int = Query(100, ge=1, le=1000, description="Limite de emendas a sincronizar"),
-    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
+    limit: int = Query(100, ge=1, le=1000, description="Limite de emendas a sincronizar")
 ):
     """
-    Sincroniza emendas Pix do Portal da Transparência
+    Sincroniza emendas Pix do Portal da Transparência (job em segundo plano)
     
     - **ano**: Ano das emendas (padrão: ano atual)
     - **codigo_ibge**: Código IBGE do município (opcional)
     - **limit**: Limite de emendas a sincronizar (1-1000)
     
+    Retorna 202 com o `job_id`; progresso e resultado em `GET /jobs/{job_id}`.
+    
     Nota: Esta funcionalidade está preparada para integração com dados reais.
     Para a demo, pode retornar dados simulados se a API não estiver disponível.
     """
-    use_case = SyncEmendasPortalUseCase(repository)
-    
-    try:
-        result = await use_case.execute(
-            ano=ano,
-            codigo_ibge=codigo_ibge,
-            limit=limit
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Erro ao sincronizar emendas: {str(e)}"
-        )
+    job = await get_job_queue().enqueue(
+        SYNC_EMENDAS_PORTAL,
+        ano=ano,
+        codigo_ibge=codigo_ibge,
+        limit=limit
+    )
+    return job_accepted(job)
 
 
 @router.post("/{emenda_id}/sync-ceis")
@@ -278,10 +483,8 @@ async def sync_ceis_data(
         )
 
 
-@router.post("/sync-ceis/all")
-async def sync_all_ceis_data(
-    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
-):
+@router.post("/sync-ceis/all", status_code=202)
+async def sync_all_ceis_data():
     """
     Sincroniza dados do CEIS para todas as emendas que possuem processo SEI
     
@@ -290,17 +493,12 @@ async def sync_all_ceis_data(
     - Status das metas
     - Entregas e documentos
     - Verificação de empresas no CEIS
-    """
-    use_case = SyncCEISDataUseCase(repository)
     
-    try:
-        result = await use_case.sync_all_emendas_with_ceis()
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Erro ao sincronizar dados do CEIS: {str(e)}"
-        )
+    Roda em segundo plano: retorna 202 com o `job_id`; progresso e resultado
+    em `GET /jobs/{job_id}`.
+    """
+    job = await get_job_queue().enqueue(SYNC_CEIS_ALL)
+    return job_accepted(job)
 
 
 @router.post("/{emenda_id}/fetch-news")
@@ -343,29 +541,22 @@ async def fetch_emenda_news(
         )
 
 
-@router.post("/fetch-news/all")
+@router.post("/fetch-news/all", status_code=202)
 async def fetch_all_emendas_news(
-    limit_per_emenda: int = Query(5, ge=1, le=20, description="Limite de notícias por emenda"),
-    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
+    limit_per_emenda: int = Query(5, ge=1, le=20, description="Limite de notícias por emenda")
 ):
     """
     Busca notícias para todas as emendas
     
-    - **limit_per_emenda**: Limite de notícias por emenda (1-20)
+    - **limit_per_emenda**: Limite de notícias por busca (1-20)
     
-    Esta funcionalidade processa todas as emendas em lote, buscando e analisando
-    notícias relacionadas a cada uma.
+    Esta funcionalidade processa todas as emendas em lote: uma busca por par
+    autor/destinatário, notícias deduplicadas pela URL e só as novas são
+    analisadas e gravadas. Roda em segundo plano: retorna 202 com o `job_id`;
+    progresso e resultado em `GET /jobs/{job_id}`.
     """
-    use_case = FetchEmendaNewsUseCase(repository)
-    
-    try:
-        result = await use_case.fetch_all_emendas_news(limit_per_emenda=limit_per_emenda)
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Erro ao buscar notícias: {str(e)}"
-        )
+    job = await get_job_queue().enqueue(FETCH_NEWS_ALL, limit_per_emenda=limit_per_emenda)
+    return job_accepted(job)
 
 
 @router.post("/{emenda_id}/register-blockchain")
@@ -550,6 +741,8 @@ async def compare_emendas(
 
 @router.get("/benchmark/deputado")
 async def benchmark_by_deputado(
+    request: Request,
+    response: Response,
     autor: Optional[str] = Query(None, description="Nome do deputado (opcional)"),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
@@ -560,6 +753,11 @@ async def benchmark_by_deputado(
     
     Retorna métricas de execução agrupadas por deputado.
     """
+    etag = make_etag("benchmark", await repository.get_data_version(), request.url.path, request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
     use_case = CompareEmendasUseCase(repository)
     
     try:
@@ -578,6 +776,8 @@ async def benchmark_by_deputado(
 
 @router.get("/benchmark/municipio")
 async def benchmark_by_municipio(
+    request: Request,
+    response: Response,
     municipio: Optional[str] = Query(None, description="Nome do município (opcional)"),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
@@ -588,6 +788,11 @@ async def benchmark_by_municipio(
     
     Retorna métricas de execução agrupadas por município.
     """
+    etag = make_etag("benchmark", await repository.get_data_version(), request.url.path, request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
     use_case = CompareEmendasUseCase(repository)
     
     try:
@@ -604,29 +809,55 @@ async def benchmark_by_municipio(
         )
 
 
-@router.get("/patterns-anomalies")
-async def identify_patterns_anomalies(
+@router.get("/placar/{tipo}")
+async def get_placar_transparencia(
+    tipo: str,
+    request: Request,
+    response: Response,
+    q: Optional[str] = Query(None, description="Trecho do nome do município ou parlamentar"),
+    uf: Optional[str] = Query(None, description="UF"),
+    area: Optional[str] = Query(None, description="Área temática"),
+    ano: Optional[int] = Query(None, description="Ano das emendas"),
+    limit: int = Query(50, ge=1, le=500, description="Tamanho do ranking"),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
     """
-    Identifica padrões e anomalias nas emendas
-    
-    Retorna análise de padrões (baixa execução, atrasos) e anomalias
-    (valores muito altos, execução muito rápida).
+    Placar de Transparência por município ou parlamentar
+
+    - **tipo**: 'municipio' ou 'parlamentar'
+    - **q**: Trecho do nome (opcional)
+    - **uf**, **area**, **ano**: Filtros opcionais
+    - **limit**: Tamanho do ranking (1-500)
+
+    Servido a partir das métricas pré-agregadas (emenda_pix_aggregates),
+    sem varrer a tabela de emendas a cada requisição.
     """
-    use_case = CompareEmendasUseCase(repository)
-    
+    etag = make_etag("placar", await repository.get_data_version(), request.url.path, request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    use_case = PlacarTransparenciaUseCase(repository)
+
     try:
-        result = await use_case.identify_patterns_and_anomalies()
+        result = await use_case.execute(
+            tipo=tipo,
+            termo=q,
+            uf=uf,
+            area=area,
+            ano=ano,
+            limit=limit
+        )
         if not result["success"]:
-            raise HTTPException(status_code=400, detail=result["message"])
+            status_code = 400 if tipo not in use_case.TIPOS else 500
+            raise HTTPException(status_code=status_code, detail=result["message"])
         return result
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Erro ao identificar padrões: {str(e)}"
+            detail=f"Erro ao gerar placar: {str(e)}"
         )
 
 
@@ -694,23 +925,28 @@ async def get_share_preview(
 async def get_emenda_history(
     emenda_id: str,
     limit: int = Query(50, ge=1, le=200, description="Limite de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado em next_cursor"),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
     """
     Obtém histórico completo de execução da emenda
     
     - **emenda_id**: ID da emenda
-    - **limit**: Limite de registros (1-200)
+    - **limit**: Limite de registros por página (1-200)
+    - **cursor**: Cursor da página seguinte (next_cursor da resposta anterior)
     
-    Retorna timeline completa de mudanças de status e execução.
+    Retorna timeline de mudanças de status e execução, da mais recente para
+    a mais antiga. total_entries vem apenas na primeira página.
     """
-    use_case = TrackHistoryUseCase(repository)
+    use_case = TrackHistoryUseCase(repository, PostgresEmendaHistoryRepository(repository.session))
     
     try:
-        result = await use_case.get_history(emenda_id, limit)
+        result = await use_case.get_history(emenda_id, limit, cursor)
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -822,10 +1058,14 @@ async def validate_geofencing_batch(
     Valida geofencing de múltiplas fotos/documentos
     
     - **emenda_id**: ID da emenda
-    - **fotos**: Lista de fotos com coordenadas GPS
+    - **fotos**: Lista de fotos com coordenadas GPS (id, latitude, longitude)
+    
+    As distâncias do lote são calculadas de uma vez (NumPy), o que mantém
+    lotes de milhares de fotos baratos.
     
     Returns:
-        dict com resultados de todas as validações
+        dict com o veredito de cada foto (valid, distance_km, reason) e
+        estatísticas do lote (contagens e distribuição das distâncias)
     """
     validate_use_case = ValidateGeofencingUseCase()
     get_use_case = GetEmendaPixUseCase(repository)
@@ -836,6 +1076,10 @@ async def validate_geofencing_batch(
             raise HTTPException(status_code=404, detail="Emenda não encontrada")
         
         result = validate_use_case.validate_multiple(emenda, fotos)
+        
+        if not result.get("success"):
+            raise HTTPException(status_code=400, detail=result.get("message", "Erro na validação"))
+        
         return result
         
     except HTTPException:
@@ -1013,11 +1257,9 @@ async def analyze_invoice(
         xml_final = xml_content
         if not xml_final and xml_url:
             try:
-                import httpx
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(xml_url)
-                    if response.status_code == 200:
-                        xml_final = response.text
+                response = await get_http_client("generic").get(xml_url)
+                if response.status_code == 200:
+                    xml_final = response.text
             except Exception as e:
                 raise HTTPException(
                     status_code=400,
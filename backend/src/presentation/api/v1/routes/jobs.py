@@ -0,0 +1,45 @@
+"""Background job routes"""
+from fastapi import APIRouter, HTTPException
+
+from src.domain.entities.job import Job
+from src.infrastructure.jobs import get_job_queue
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def job_accepted(job: Job) -> dict:
+    """Corpo das respostas 202 dos endpoints que enfileiram jobs"""
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/v1/jobs/{job.id}"
+    }
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """
+    Estado de um job em lote
+
+    - **status**: queued, running, succeeded, failed ou cancelled
+    - **progress_done / progress_total**: itens processados / total
+    - **result**: resultado do use case quando o job termina
+    """
+    job = await get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job não encontrado")
+    return job.to_dict()
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    """
+    Pede o cancelamento de um job
+
+    O job para no próximo item processado (lotes gravados em uma transação
+    única são desfeitos); jobs já finalizados não são alterados.
+    """
+    job = await get_job_queue().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job não encontrado")
+    return job.to_dict()
@@ -1,6 +1,5 @@
 """Legislation routes"""
 from fastapi import APIRouter, Depends, HTTPException, Query
-import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
@@ -9,10 +8,11 @@ from src.infrastructure.persistence.postgres.legislation_repository_impl import
 from src.application.use_cases.legislation import (
     GetLegislationUseCase, 
     ListLegislationsUseCase,
-    SyncLegislationsUseCase,
     SimplifyLegislationUseCase
 )
-from src.infrastructure.external.camara_api import CamaraAPIClient
+from src.infrastructure.jobs import get_job_queue
+from src.infrastructure.jobs.handlers import SYNC_LEGISLATIONS
+from src.presentation.api.v1.routes.jobs import job_accepted
 from src.infrastructure.external.camara_api.voting_client import CamaraVotingClient
 from src.domain.value_objects.complexity_level import ComplexityLevel
 from src.application.dto.legislation_dto import LegislationDTO, LegislationListResponse
@@ -81,42 +81,19 @@ async def get_legislation(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.post("/sync")
+@router.post("/sync", status_code=202)
 async def sync_legislations(
-    days: int = Query(30, ge=1, le=365),
-    repository: PostgresLegislationRepository = Depends(get_legislation_repository)
+    days: int = Query(30, ge=1, le=365)
 ):
     """
-    Sync legislations from external APIs
+    Sync legislations from external APIs (background job)
     
     - **days**: Number of days to look back (1-365)
     
-    Note: This endpoint may take some time as it fetches data from external APIs.
-    For large date ranges, consider using smaller values (e.g., days=7).
+    Returns 202 with a `job_id`; progress and result at `GET /jobs/{job_id}`.
     """
-    camara_client = CamaraAPIClient()
-    use_case = SyncLegislationsUseCase(repository, camara_client)
-    
-    try:
-        # Add timeout to prevent hanging
-        synced = await asyncio.wait_for(
-            use_case.execute(days=days),
-            timeout=120.0  # 2 minutes max
-        )
-        await camara_client.close()
-        return {
-            "message": f"Synced {len(synced)} legislations",
-            "count": len(synced)
-        }
-    except asyncio.TimeoutError:
-        await camara_client.close()
-        raise HTTPException(
-            status_code=504,
-            detail="Sync operation timed out. Try with fewer days (e.g., days=7)."
-        )
-    except Exception as e:
-        await camara_client.close()
-        raise HTTPException(status_code=500, detail=f"Error syncing: {str(e)}")
+    job = await get_job_queue().enqueue(SYNC_LEGISLATIONS, days=days)
+    return job_accepted(job)
 
 
 @router.post("/{legislation_id}/simplify")
@@ -1,12 +1,14 @@
 """Reports and export routes"""
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response, StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
 from src.infrastructure.persistence.postgres.database import get_db
 from src.infrastructure.persistence.postgres.emenda_pix_repository_impl import PostgresEmendaPixRepository
 from src.application.use_cases.reports.generate_reports import GenerateReportsUseCase
+from src.infrastructure.storage.columnar_export import COLUMNAR_FORMATS, PYARROW_AVAILABLE
+from src.presentation.api.v1.http_cache import make_etag, conditional_response
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -18,14 +20,34 @@ def get_emenda_pix_repository(
     return PostgresEmendaPixRepository(session)
 
 
-@router.get("/export/csv")
-async def export_csv(
+def get_report_filters(
     status: Optional[str] = Query(None, description="Filtrar por status"),
     autor: Optional[str] = Query(None, description="Filtrar por autor"),
     destinatario: Optional[str] = Query(None, description="Filtrar por destinatário"),
     ano: Optional[int] = Query(None, description="Filtrar por ano"),
     valor_min: Optional[float] = Query(None, description="Valor mínimo"),
-    valor_max: Optional[float] = Query(None, description="Valor máximo"),
+    valor_max: Optional[float] = Query(None, description="Valor máximo")
+) -> Optional[dict]:
+    """Dependency with the report filters shared by exports and summary"""
+    filters = {}
+    if status:
+        filters["status"] = status
+    if autor:
+        filters["autor"] = autor
+    if destinatario:
+        filters["destinatario"] = destinatario
+    if ano:
+        filters["ano"] = ano
+    if valor_min is not None:
+        filters["valor_min"] = valor_min
+    if valor_max is not None:
+        filters["valor_max"] = valor_max
+    return filters if filters else None
+
+
+@router.get("/export/csv")
+async def export_csv(
+    filters: Optional[dict] = Depends(get_report_filters),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
     """
@@ -38,53 +60,27 @@ async def export_csv(
     - **valor_min**: Valor mínimo (opcional)
     - **valor_max**: Valor máximo (opcional)
     
-    Retorna arquivo CSV para download.
+    O arquivo é enviado em partes, lido do banco por cursor: o consumo de
+    memória não depende da quantidade de emendas exportadas.
     """
     use_case = GenerateReportsUseCase(repository)
     
-    try:
-        filters = {}
-        if status:
-            filters["status"] = status
-        if autor:
-            filters["autor"] = autor
-        if destinatario:
-            filters["destinatario"] = destinatario
-        if ano:
-            filters["ano"] = ano
-        if valor_min:
-            filters["valor_min"] = valor_min
-        if valor_max:
-            filters["valor_max"] = valor_max
-        
-        csv_content = await use_case.export_to_csv(filters=filters if filters else None)
-        
-        return Response(
-            content=csv_content,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": "attachment; filename=emendas_pix_export.csv"
-            }
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Erro ao exportar CSV: {str(e)}"
-        )
+    return StreamingResponse(
+        use_case.stream_csv(filters=filters),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": "attachment; filename=emendas_pix_export.csv"
+        }
+    )
 
 
 @router.get("/export/json")
 async def export_json(
-    status: Optional[str] = Query(None, description="Filtrar por status"),
-    autor: Optional[str] = Query(None, description="Filtrar por autor"),
-    destinatario: Optional[str] = Query(None, description="Filtrar por destinatário"),
-    ano: Optional[int] = Query(None, description="Filtrar por ano"),
-    valor_min: Optional[float] = Query(None, description="Valor mínimo"),
-    valor_max: Optional[float] = Query(None, description="Valor máximo"),
+    filters: Optional[dict] = Depends(get_report_filters),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
     """
-    Exporta emendas para JSON
+    Exporta emendas para JSON (array)
     
     - **status**: Status da execução (opcional)
     - **autor**: Nome do autor (opcional)
@@ -93,49 +89,89 @@ async def export_json(
     - **valor_min**: Valor mínimo (opcional)
     - **valor_max**: Valor máximo (opcional)
     
-    Retorna arquivo JSON para download.
+    O arquivo é enviado em partes, lido do banco por cursor: o consumo de
+    memória não depende da quantidade de emendas exportadas.
     """
     use_case = GenerateReportsUseCase(repository)
     
-    try:
-        filters = {}
-        if status:
-            filters["status"] = status
-        if autor:
-            filters["autor"] = autor
-        if destinatario:
-            filters["destinatario"] = destinatario
-        if ano:
-            filters["ano"] = ano
-        if valor_min:
-            filters["valor_min"] = valor_min
-        if valor_max:
-            filters["valor_max"] = valor_max
-        
-        json_content = await use_case.export_to_json(filters=filters if filters else None)
-        
-        return Response(
-            content=json_content,
-            media_type="application/json",
-            headers={
-                "Content-Disposition": "attachment; filename=emendas_pix_export.json"
-            }
-        )
-    except Exception as e:
+    return StreamingResponse(
+        use_case.stream_json(filters=filters),
+        media_type="application/json",
+        headers={
+            "Content-Disposition": "attachment; filename=emendas_pix_export.json"
+        }
+    )
+
+
+@router.get("/export/ndjson")
+async def export_ndjson(
+    filters: Optional[dict] = Depends(get_report_filters),
+    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
+):
+    """
+    Exporta emendas para NDJSON (um objeto JSON por linha)
+    
+    - **status**: Status da execução (opcional)
+    - **autor**: Nome do autor (opcional)
+    - **destinatario**: Nome do destinatário (opcional)
+    - **ano**: Ano da emenda (opcional)
+    - **valor_min**: Valor mínimo (opcional)
+    - **valor_max**: Valor máximo (opcional)
+    
+    O arquivo é enviado em partes, lido do banco por cursor: o consumo de
+    memória não depende da quantidade de emendas exportadas.
+    """
+    use_case = GenerateReportsUseCase(repository)
+    
+    return StreamingResponse(
+        use_case.stream_ndjson(filters=filters),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": "attachment; filename=emendas_pix_export.ndjson"
+        }
+    )
+
+
+@router.get("/export/{format}")
+async def export_columnar(
+    format: str,
+    filters: Optional[dict] = Depends(get_report_filters),
+    repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
+):
+    """
+    Exporta emendas em formato colunar
+    
+    - **format**: 'parquet' ou 'arrow' (Arrow IPC / Feather v2)
+    - Mesmos filtros das demais exportações
+    
+    Colunas tipadas (valores em float64, datas em timestamp, status com
+    dictionary encoding), escritas em record batches a partir do cursor.
+    O arquivo pode ser lido diretamente no pandas, polars ou DuckDB.
+    """
+    if format not in COLUMNAR_FORMATS:
+        raise HTTPException(status_code=404, detail=f"Formato não suportado: {format}")
+    if not PYARROW_AVAILABLE:
         raise HTTPException(
-            status_code=500,
-            detail=f"Erro ao exportar JSON: {str(e)}"
+            status_code=501,
+            detail="Exportação Parquet/Arrow indisponível: pyarrow não está instalado"
         )
+    
+    use_case = GenerateReportsUseCase(repository)
+    
+    return StreamingResponse(
+        use_case.stream_columnar(format=format, filters=filters),
+        media_type=COLUMNAR_FORMATS[format],
+        headers={
+            "Content-Disposition": f"attachment; filename=emendas_pix_export.{format}"
+        }
+    )
 
 
 @router.get("/summary")
 async def generate_summary_report(
-    status: Optional[str] = Query(None, description="Filtrar por status"),
-    autor: Optional[str] = Query(None, description="Filtrar por autor"),
-    destinatario: Optional[str] = Query(None, description="Filtrar por destinatário"),
-    ano: Optional[int] = Query(None, description="Filtrar por ano"),
-    valor_min: Optional[float] = Query(None, description="Valor mínimo"),
-    valor_max: Optional[float] = Query(None, description="Valor máximo"),
+    request: Request,
+    response: Response,
+    filters: Optional[dict] = Depends(get_report_filters),
     repository: PostgresEmendaPixRepository = Depends(get_emenda_pix_repository)
 ):
     """
@@ -148,26 +184,18 @@ async def generate_summary_report(
     - **valor_min**: Valor mínimo (opcional)
     - **valor_max**: Valor máximo (opcional)
     
-    Retorna relatório resumo com estatísticas e análises.
+    Retorna relatório resumo com estatísticas e análises. Responde 304 a
+    If-None-Match enquanto os dados não mudarem.
     """
+    etag = make_etag("summary", await repository.get_data_version(), request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
     use_case = GenerateReportsUseCase(repository)
     
     try:
-        filters = {}
-        if status:
-            filters["status"] = status
-        if autor:
-            filters["autor"] = autor
-        if destinatario:
-            filters["destinatario"] = destinatario
-        if ano:
-            filters["ano"] = ano
-        if valor_min:
-            filters["valor_min"] = valor_min
-        if valor_max:
-            filters["valor_max"] = valor_max
-        
-        result = await use_case.generate_summary_report(filters=filters if filters else None)
+        result = await use_case.generate_summary_report(filters=filters)
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
         return result
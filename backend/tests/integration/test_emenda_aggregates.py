@@ -0,0 +1,160 @@
+"""Testes de integração dos agregados de Emenda Pix (placar e benchmarks)"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import delete
+
+from src.main import app
+from src.infrastructure.persistence.postgres.database import AsyncSessionLocal, init_db, close_db
+from src.infrastructure.persistence.postgres.emenda_aggregate_repository_impl import PostgresEmendaAggregateRepository
+from src.infrastructure.persistence.postgres.models.emenda_pix import EmendaPixModel
+from src.infrastructure.persistence.postgres.models.emenda_pix_aggregate import EmendaPixAggregateModel
+from src.infrastructure.persistence.postgres.search import normalize_search_text
+
+
+@pytest.fixture
+async def tagged_emendas():
+    """Emendas com nomes exclusivos deste teste, removidas ao final"""
+    try:
+        await init_db()
+    except Exception as e:
+        pytest.skip(f"Banco de dados indisponível: {e}")
+
+    tag = f"Agregado {uuid.uuid4().hex[:8]}"
+    autor_a = f"{tag} Joao"
+    autor_b = f"{tag} Maria"
+    municipio = f"{tag} São José"
+    vencida = datetime.now() - timedelta(days=30)
+
+    rows = [
+        # (autor, valor_aprovado, percentual, data_prevista_conclusao, status)
+        (autor_a, 1000.0, 50.0, vencida, "em_execucao"),  # atrasada
+        (autor_a, 3000.0, 100.0, vencida, "concluida"),   # vencida, mas concluída
+        (autor_a, 2000.0, 0.0, None, "pendente"),
+        (autor_b, 500.0, 20.0, None, "em_execucao"),
+    ]
+    async with AsyncSessionLocal() as session:
+        for i, (autor, valor, percentual, prazo, status) in enumerate(rows):
+            session.add(EmendaPixModel(
+                id=str(uuid.uuid4()),
+                numero_emenda=f"{tag[-8:]}-{i}",
+                ano=2024,
+                tipo="individual",
+                autor_nome=autor,
+                autor_nome_busca=normalize_search_text(autor),
+                autor_uf="SP",
+                destinatario_tipo="municipio",
+                destinatario_nome=municipio,
+                destinatario_nome_busca=normalize_search_text(municipio),
+                destinatario_uf="SP",
+                valor_aprovado=valor,
+                percentual_executado=percentual,
+                data_prevista_conclusao=prazo,
+                status_execucao=status,
+                area="saude"
+            ))
+        await session.commit()
+
+    yield {"tag": tag, "autor_a": autor_a, "autor_b": autor_b, "municipio": municipio}
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            delete(EmendaPixAggregateModel).where(EmendaPixAggregateModel.chave.startswith(tag))
+        )
+        await session.execute(
+            delete(EmendaPixModel).where(EmendaPixModel.autor_nome.startswith(tag))
+        )
+        await session.commit()
+    # Cada teste roda em um event loop novo: conexões do pool não podem ser reaproveitadas
+    await close_db()
+
+
+@pytest.mark.asyncio
+async def test_refresh_keys_only_touches_given_keys(tagged_emendas):
+    """refresh_keys recalcula apenas as chaves informadas"""
+    async with AsyncSessionLocal() as session:
+        repository = PostgresEmendaAggregateRepository(session)
+        await repository.refresh_keys(autores=[tagged_emendas["autor_a"], None])
+
+        rows = await repository.execution_by("autor", tagged_emendas["autor_a"])
+        assert len(rows) == 1
+        assert rows[0]["total_emendas"] == 3
+        assert rows[0]["valor_total_aprovado"] == 6000.0
+        assert rows[0]["valor_total_executado"] == 3500.0
+        assert rows[0]["emendas_atrasadas"] == 1
+        assert rows[0]["status_distribution"] == {"em_execucao": 1, "concluida": 1, "pendente": 1}
+
+        assert await repository.execution_by("autor", tagged_emendas["autor_b"]) == []
+        assert await repository.execution_by("destinatario", tagged_emendas["municipio"]) == []
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_totals_and_ranking(tagged_emendas):
+    """scoreboard soma os agregados filtrados e ordena o ranking por valor aprovado"""
+    async with AsyncSessionLocal() as session:
+        repository = PostgresEmendaAggregateRepository(session)
+        await repository.refresh_keys(
+            autores=[tagged_emendas["autor_a"], tagged_emendas["autor_b"]],
+            destinatarios=[tagged_emendas["municipio"]]
+        )
+
+        # Busca sem acento/caixa, como no placar
+        placar = await repository.scoreboard("autor", termo=tagged_emendas["tag"].upper())
+        assert placar["resumo"]["total_emendas"] == 4
+        assert placar["resumo"]["valor_total_aprovado"] == 6500.0
+        assert placar["resumo"]["emendas_atrasadas"] == 1
+        assert placar["resumo"]["percentual_medio_executado"] == 42.5
+        assert placar["atualizado_em"] is not None
+        assert [r["nome"] for r in placar["ranking"]] == [
+            tagged_emendas["autor_a"], tagged_emendas["autor_b"]
+        ]
+        assert placar["ranking"][0]["uf"] == "SP"
+
+        municipio = await repository.scoreboard("destinatario", termo=f"{tagged_emendas['tag']} sao jose")
+        assert municipio["resumo"]["total_emendas"] == 4
+        assert len(municipio["ranking"]) == 1
+
+        vazio = await repository.scoreboard("autor", termo=tagged_emendas["tag"], ano=1999)
+        assert vazio["resumo"]["total_emendas"] == 0
+        assert vazio["resumo"]["percentual_medio_executado"] == 0
+        assert vazio["ranking"] == []
+
+        with pytest.raises(ValueError):
+            await repository.scoreboard("partido")
+
+
+@pytest.mark.asyncio
+async def test_placar_and_benchmark_endpoints(tagged_emendas):
+    """Endpoints do placar e dos benchmarks leem os agregados"""
+    async with AsyncSessionLocal() as session:
+        await PostgresEmendaAggregateRepository(session).refresh_keys(
+            autores=[tagged_emendas["autor_a"], tagged_emendas["autor_b"]]
+        )
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test", follow_redirects=True) as client:
+        response = await client.get(
+            "/api/v1/emenda-pix/placar/parlamentar",
+            params={"q": tagged_emendas["tag"], "limit": 1}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["resumo"]["total_emendas"] == 4
+        assert [r["nome"] for r in data["ranking"]] == [tagged_emendas["autor_a"]]
+
+        response = await client.get("/api/v1/emenda-pix/placar/partido")
+        assert response.status_code == 400
+
+        response = await client.get(
+            "/api/v1/emenda-pix/benchmark/deputado",
+            params={"autor": tagged_emendas["autor_a"]}
+        )
+        assert response.status_code == 200
+        benchmarks = response.json()["benchmarks"]
+        assert len(benchmarks) == 1
+        assert benchmarks[0]["deputado"] == tagged_emendas["autor_a"]
+        assert benchmarks[0]["emendas_atrasadas"] == 1
+        assert benchmarks[0]["taxa_atraso"] == pytest.approx(33.33)
@@ -48,11 +48,12 @@ async def test_sync_legislations():
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test", follow_redirects=True) as client:
         response = await client.post("/api/v1/legislation/sync?days=7")
-        # Pode retornar 200, 500 ou 307 (redirect) se API externa estiver fora
-        assert response.status_code in [200, 500, 307]
+        # A sincronização roda em segundo plano: 202 com o id do job
+        assert response.status_code == 202
+        data = response.json()
+        assert "job_id" in data
         
-        if response.status_code == 200:
-            data = response.json()
-            assert "message" in data
-            assert "count" in data
+        job_response = await client.get(data["status_url"])
+        assert job_response.status_code == 200
+        assert job_response.json()["status"] in ["queued", "running", "succeeded", "failed"]
 
@@ -0,0 +1,29 @@
+"""Fixtures compartilhadas pelos testes unitários"""
+import pytest
+
+from src.domain.entities.emenda_pix import EmendaPix
+
+
+@pytest.fixture
+def make_emenda():
+    """
+    Factory de EmendaPix válidas: make_emenda(i, **campos)
+
+    `i` define id e numero_emenda; os demais campos obrigatórios têm valores
+    padrão e qualquer campo pode ser sobrescrito.
+    """
+    def make(i: int = 1, **fields) -> EmendaPix:
+        values = dict(
+            id=str(i),
+            numero_emenda=f"E{i}",
+            ano=2024,
+            tipo="individual",
+            autor_nome="Autor",
+            destinatario_tipo="municipio",
+            destinatario_nome="Cidade",
+            valor_aprovado=1000.0,
+        )
+        values.update(fields)
+        return EmendaPix(**values)
+
+    return make
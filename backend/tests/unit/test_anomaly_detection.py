@@ -0,0 +1,48 @@
+"""Unit tests for the portfolio anomaly detection engine"""
+from datetime import datetime, timedelta
+
+from src.infrastructure.analytics.anomaly_detection import AnomalyDetector, PortfolioColumns
+
+NOW = datetime(2025, 1, 1)
+
+
+def _row(i, area="saude", uf="SP", valor=None, empenhado=100_000.0, pago=50_000.0, percentual=50.0):
+    return (
+        f"id-{i}", f"E{i}", area, uf, "em_execucao",
+        valor if valor is not None else 100_000.0 + (i % 10) * 5_000,
+        empenhado, pago, percentual,
+        NOW - timedelta(days=100 + i % 7), NOW + timedelta(days=30), None,
+    )
+
+
+def _report(rows):
+    return AnomalyDetector(PortfolioColumns(rows).finish(), now=NOW).run()
+
+
+def _by_type(report):
+    return {a["type"]: a for a in report["anomalies"]}
+
+
+def test_flags_outliers_within_their_group_only():
+    rows = [_row(i) for i in range(40)]
+    # Normal em educação (valores altos são típicos lá), atípico em saúde
+    rows += [_row(100 + i, area="educacao", uf="RJ", valor=5_000_000.0 + i * 10_000) for i in range(40)]
+    rows.append(_row(999, valor=5_000_000.0))
+
+    anomalies = _by_type(_report(rows))
+
+    assert [e["numero_emenda"] for e in anomalies["valor_alto"]["emendas"]] == ["E999"]
+    assert anomalies["valor_alto"]["emendas"][0]["grupo"] == "area:saude"
+
+
+def test_payment_above_commitment_and_summary():
+    rows = [_row(i) for i in range(30)]
+    rows.append(_row(500, pago=300_000.0))
+
+    report = _report(rows)
+    anomalies = _by_type(report)
+
+    assert anomalies["pagamento_acima_empenho"]["count"] == 1
+    assert anomalies["razao_pagamento_alta"]["emendas"][0]["numero_emenda"] == "E500"
+    assert report["summary"]["total_emendas"] == 31
+    assert report["statistics"]["valor_aprovado"]["area"]["saude"]["n"] == 31
@@ -0,0 +1,112 @@
+"""Unit tests for the concurrent CEIS/SEI batch sync"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from src.application.use_cases.emenda_pix.sync_ceis_data import SyncCEISDataUseCase
+from src.infrastructure.external.rate_limiter import HostRateLimiter
+
+
+class FakeCEISClient:
+    """Each call sleeps; records the peak of concurrent calls"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.closed = False
+
+    async def _call(self, value):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return value
+
+    async def get_plano_trabalho(self, processo_sei):
+        return await self._call({"metas": [{"meta": 1}, {"meta": 2}]})
+
+    async def get_metas_status(self, processo_sei):
+        return await self._call([{"meta": 1, "status": "concluida"}])
+
+    async def get_entregas(self, processo_sei):
+        return await self._call([])
+
+    async def verificar_empresa_ceis(self, cnpj):
+        return await self._call(None)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeRepository:
+    def __init__(self, emendas):
+        self.emendas = emendas
+        self.saved = []
+        self.pages = 0
+
+    async def find_page(self, limit, cursor=None, com_processo_sei=False):
+        # Como no banco: o filtro vem antes da paginação
+        emendas = [e for e in self.emendas if e.processo_sei or not com_processo_sei]
+        start = int(cursor or 0)
+        page = emendas[start:start + limit]
+        end = start + limit
+        self.pages += 1
+        return page, (str(end) if end < len(emendas) else None)
+
+    @asynccontextmanager
+    async def unit_of_work(self, changed_by="system"):
+        added = []
+
+        class UoW:
+            def add(self, emenda):
+                added.append(emenda)
+
+        yield UoW()
+        self.saved.extend(added)
+
+
+async def test_batch_runs_emendas_concurrently_under_the_limit(make_emenda):
+    emendas = [
+        make_emenda(
+            i, destinatario_uf="SP", destinatario_cnpj="00000000000100",
+            processo_sei=f"SEI-{i}" if i % 5 else None
+        )
+        for i in range(50)
+    ]
+    repository = FakeRepository(emendas)
+    client = FakeCEISClient()
+    use_case = SyncCEISDataUseCase(repository, ceis_client=client, concurrency=4)
+    use_case.PAGE_SIZE = 7
+    progress = []
+
+    async def on_progress(done, total):
+        progress.append((done, total))
+
+    started = time.monotonic()
+    result = await use_case.sync_all_emendas_with_ceis(progress=on_progress)
+    elapsed = time.monotonic() - started
+
+    assert result["success"] and result["total"] == 40
+    # Só as 40 emendas com processo SEI são paginadas
+    assert repository.pages == 6
+    assert result["synced"] == 40 and result["errors"] == 0
+    assert len(repository.saved) == 40
+    assert repository.saved[0].metas_concluidas == 1
+    # 4 emendas por vez, 4 chamadas paralelas cada
+    assert client.peak == 16
+    assert elapsed < 40 * 0.02
+    assert progress[0] == (0, 40) and progress[-1] == (40, 40)
+    assert client.closed
+
+
+async def test_rate_limiter_spaces_requests_per_host():
+    limiter = HostRateLimiter(requests_per_second=100)
+
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("sei.gov.br") for _ in range(5)))
+    assert time.monotonic() - started >= 0.035
+
+    started = time.monotonic()
+    await limiter.acquire("ceis.gov.br")
+    assert time.monotonic() - started < 0.01
@@ -0,0 +1,48 @@
+"""Unit tests for the Parquet/Arrow export writer"""
+import io
+from datetime import datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.infrastructure.storage.columnar_export import ColumnarExportWriter
+
+
+def _fields(i: int, status: str = "pendente") -> dict:
+    return dict(
+        autor_nome="João Silva",
+        destinatario_nome="Campinas",
+        valor_aprovado=1000.0 * i,
+        status_execucao=status,
+        data_inicio=datetime(2024, 1, i + 1),
+    )
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_batches_round_trip_with_typed_columns(format, make_emenda):
+    writer = ColumnarExportWriter(format=format)
+    content = writer.write_batch([make_emenda(1, **_fields(1)), make_emenda(2, **_fields(2, "concluida"))])
+    content += writer.write_batch([make_emenda(3, **_fields(3, "em_execucao"))])
+    content += writer.close()
+
+    if format == "parquet":
+        table = pq.read_table(io.BytesIO(content))
+    else:
+        table = pa.ipc.open_file(io.BytesIO(content)).read_all()
+
+    assert table.num_rows == 3
+    assert pa.types.is_dictionary(table.schema.field("status_execucao").type)
+    assert table.schema.field("data_inicio").type == pa.timestamp("us")
+    assert table.column("status_execucao").to_pylist() == ["pendente", "concluida", "em_execucao"]
+    assert table.column("valor_aprovado").to_pylist() == [1000.0, 2000.0, 3000.0]
+
+
+def test_unknown_status_is_written_as_null(make_emenda):
+    writer = ColumnarExportWriter(format="parquet")
+    content = writer.write_batch([make_emenda(1, **_fields(1, "desconhecido"))]) + writer.close()
+
+    table = pq.read_table(io.BytesIO(content))
+    assert table.column("status_execucao").to_pylist() == [None]
+    assert writer.unknown_status == 1
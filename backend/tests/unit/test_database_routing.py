@@ -0,0 +1,55 @@
+"""Unit tests for read-replica session routing (SQLite stand-ins)"""
+from sqlalchemy import create_engine, delete, select, literal
+
+from src.infrastructure.persistence.postgres.database import create_routing_session_class
+from src.infrastructure.persistence.postgres.models.emenda_pix import EmendaPixModel
+
+
+def _engines():
+    return create_engine("sqlite://"), create_engine("sqlite://")
+
+
+def test_reads_go_to_replica_and_writes_to_primary():
+    primary, replica = _engines()
+    session = create_routing_session_class(primary, [replica])()
+
+    assert session.get_bind(clause=select(literal(1))) is replica
+    assert session.get_bind(clause=delete(EmendaPixModel)) is primary
+    # Depois de escrever, a sessão não volta para a réplica
+    assert session.get_bind(clause=select(literal(1))) is primary
+
+
+def test_pinned_session_and_missing_replicas_use_primary():
+    primary, replica = _engines()
+
+    pinned = create_routing_session_class(primary, [replica])(info={"primary": True})
+    assert pinned.get_bind(clause=select(literal(1))) is primary
+
+    no_replicas = create_routing_session_class(primary)()
+    assert no_replicas.get_bind(clause=select(literal(1))) is primary
+
+
+def test_read_your_writes_window_is_per_client():
+    primary, replica = _engines()
+    session_class = create_routing_session_class(primary, [replica], read_your_writes_seconds=60)
+
+    writer = session_class(info={"client": "10.0.0.1"})
+    writer.get_bind(clause=delete(EmendaPixModel))
+    writer.commit()
+
+    assert session_class(info={"client": "10.0.0.1"}).get_bind(clause=select(literal(1))) is primary
+    # Outros clientes (e sessões sem cliente) seguem lendo da réplica
+    assert session_class(info={"client": "10.0.0.2"}).get_bind(clause=select(literal(1))) is replica
+    assert session_class().get_bind(clause=select(literal(1))) is replica
+
+    session_class.read_your_writes_seconds = 0
+    assert session_class(info={"client": "10.0.0.1"}).get_bind(clause=select(literal(1))) is replica
+
+
+def test_session_sticks_to_one_replica():
+    primary = create_engine("sqlite://")
+    replicas = [create_engine("sqlite://") for _ in range(4)]
+    session = create_routing_session_class(primary, replicas)()
+
+    binds = {session.get_bind(clause=select(literal(1))) for _ in range(20)}
+    assert len(binds) == 1 and binds <= set(replicas)
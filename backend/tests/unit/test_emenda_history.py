@@ -0,0 +1,21 @@
+"""Unit tests for emenda history change detection"""
+from src.domain.entities.emenda_history import EmendaHistoryEntry
+
+
+def test_no_entry_without_tracked_changes(make_emenda):
+    emenda = make_emenda(status_execucao="em_execucao", percentual_executado=50.0, valor_pago=500.0)
+
+    assert EmendaHistoryEntry.from_change(emenda, "em_execucao", 50.0, 500.0) is None
+
+
+def test_entry_records_previous_and_new_values(make_emenda):
+    emenda = make_emenda(status_execucao="concluida", percentual_executado=100.0, valor_pago=1000.0)
+
+    entry = EmendaHistoryEntry.from_change(emenda, "em_execucao", 50.0, 500.0, changed_by="ceis")
+
+    assert entry.emenda_id == "1"
+    assert (entry.status_anterior, entry.status_novo) == ("em_execucao", "concluida")
+    assert (entry.percentual_anterior, entry.percentual_novo) == (50.0, 100.0)
+    assert (entry.valor_pago_anterior, entry.valor_pago_novo) == (500.0, 1000.0)
+    assert entry.changed_by == "ceis"
+    assert entry.created_at is not None
@@ -0,0 +1,81 @@
+"""Unit tests for the local IBGE municipality gazetteer"""
+import csv
+import gzip
+
+import pytest
+
+from src.infrastructure.validation import gazetteer as gazetteer_module
+from src.infrastructure.validation.gazetteer import (
+    FIELDS, GazetteerMissingError, MunicipioGazetteer, get_gazetteer, normalize_name
+)
+from src.infrastructure.validation.geofencing import GeofencingValidator
+
+ROWS = [
+    (3550308, "São Paulo", "SP", -23.5329, -46.6395),
+    (3545803, "Santa Bárbara d'Oeste", "SP", -22.7553, -47.4143),
+    (1505536, "Pau D'Arco", "PA", -7.8397, -50.0429),
+    (1716307, "Pau D'Arco", "TO", -7.5386, -49.367),
+]
+
+
+def _gazetteer(tmp_path):
+    path = tmp_path / "municipios.csv.gz"
+    with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        writer.writerows(ROWS)
+    return MunicipioGazetteer.load(path)
+
+
+def test_normalize_name_ignores_accents_case_and_punctuation():
+    assert normalize_name("Santa Bárbara D'Oeste") == "santa barbara d oeste"
+    assert normalize_name("  SÃO   paulo ") == "sao paulo"
+
+
+def test_lookup_by_name_and_uf_or_by_code(tmp_path):
+    gazetteer = _gazetteer(tmp_path)
+
+    assert len(gazetteer) == 4
+    assert gazetteer.lookup("santa barbara d oeste", "sp")["codigo_ibge"] == 3545803
+    assert gazetteer.lookup("Pau d'Arco", "TO")["latitude"] == -7.5386
+    assert gazetteer.lookup("São Paulo", "RJ") is None
+    assert gazetteer.by_code(3550308)["municipio"] == "São Paulo"
+
+
+async def test_validator_uses_gazetteer_centroids(tmp_path):
+    validator = GeofencingValidator(gazetteer=_gazetteer(tmp_path))
+
+    coords = await validator._get_municipio_coordinates("Sao Paulo", "SP")
+    assert coords["is_mock"] is False and coords["longitude"] == -46.6395
+
+    near = validator.validate_photo_location(
+        "foto.jpg", "SÃO PAULO", "SP", {"latitude": -23.55, "longitude": -46.63}
+    )
+    assert near["valid"] and near["distance_km"] < 3
+
+    unknown = validator.validate_photo_location(
+        "foto.jpg", "Cidade Inexistente", "SP", {"latitude": -23.55, "longitude": -46.63}
+    )
+    assert unknown["reason"] == "municipio_not_found"
+
+
+def test_shipped_gazetteer_covers_every_uf():
+    gazetteer = MunicipioGazetteer.load(gazetteer_module.DEFAULT_GAZETTEER_PATH)
+
+    assert len(gazetteer) > 5500
+    assert len(set(gazetteer.ufs)) == 27
+    assert gazetteer.lookup("Campinas", "SP")["codigo_ibge"] == 3509502
+    assert gazetteer.by_code(5300108)["uf"] == "DF"
+
+
+def test_missing_gazetteer_file_is_an_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(gazetteer_module, "GAZETTEER_PATH", tmp_path / "ausente.csv.gz")
+    monkeypatch.setattr(gazetteer_module, "_global_gazetteer", None)
+
+    with pytest.raises(GazetteerMissingError, match="IBGE_GAZETTEER_PATH"):
+        get_gazetteer()
+
+
+def test_validator_with_empty_gazetteer_falls_back_to_mock():
+    validator = GeofencingValidator(gazetteer=MunicipioGazetteer())
+    assert validator._lookup_municipio_coordinates("Campinas", "SP")["is_mock"] is True
@@ -0,0 +1,108 @@
+"""Unit tests for vectorized batch geofencing"""
+import math
+
+import numpy as np
+
+from src.application.use_cases.emenda_pix.validate_geofencing import ValidateGeofencingUseCase
+from src.infrastructure.validation.gazetteer import MunicipioGazetteer
+from src.infrastructure.validation.geofencing import GeofencingValidator, haversine_km
+
+CENTRO = (-22.9056, -47.0608)
+
+
+def _use_case():
+    gazetteer = MunicipioGazetteer()
+    gazetteer.add(3509502, "Campinas", "SP", *CENTRO)
+    return ValidateGeofencingUseCase(gazetteer=gazetteer)
+
+
+CAMPINAS = dict(destinatario_nome="CAMPINAS", destinatario_uf="SP")
+
+
+def _scalar_haversine(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371.0 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def test_haversine_matches_scalar_formula_and_broadcasts():
+    lats = np.array([-23.5505, -22.9068, 0.0])
+    lons = np.array([-46.6333, -43.1729, 0.0])
+    distances = haversine_km(lats, lons, *CENTRO)
+
+    for lat, lon, distance in zip(lats, lons, distances):
+        assert math.isclose(distance, _scalar_haversine(lat, lon, *CENTRO), rel_tol=1e-9)
+
+
+def test_batch_returns_verdicts_and_stats(make_emenda):
+    fotos = [
+        {"id": "a", "latitude": -22.91, "longitude": -47.06},
+        {"id": "b", "latitude": "-22.95", "longitude": "-47.10"},
+        {"id": "c", "latitude": -23.5505, "longitude": -46.6333},
+        {"id": "d", "latitude": None, "longitude": -47.0},
+        {"id": "e", "latitude": 123.0, "longitude": -47.0},
+    ]
+    result = _use_case().validate_multiple(make_emenda(**CAMPINAS), fotos)
+
+    assert result["success"] and result["total"] == 5
+    assert (result["valid"], result["invalid"], result["missing_coordinates"]) == (2, 3, 2)
+    assert [r["valid"] for r in result["results"]] == [True, True, False, False, False]
+    assert [r["reason"] for r in result["results"]] == [
+        None, None, "outside_radius", "missing_coordinates", "missing_coordinates"
+    ]
+    assert result["results"][3]["distance_km"] is None
+    assert result["distance_stats"]["max_km"] == result["results"][2]["distance_km"] > 70
+    assert result["expected_location"]["codigo_ibge"] == 3509502
+    assert not result["overall_valid"]
+
+
+def test_batch_scales_to_ten_thousand_photos(make_emenda):
+    rng = np.random.default_rng(0)
+    fotos = [
+        {"id": i, "latitude": CENTRO[0] + dlat, "longitude": CENTRO[1] + dlon}
+        for i, (dlat, dlon) in enumerate(rng.uniform(-0.2, 0.2, size=(10000, 2)))
+    ]
+    result = _use_case().validate_multiple(make_emenda(**CAMPINAS), fotos)
+
+    assert result["total"] == 10000 and len(result["results"]) == 10000
+    assert 0 < result["valid"] < 10000
+    assert result["distance_stats"]["max_km"] < 32
+
+
+def test_zero_is_a_valid_coordinate(make_emenda):
+    gazetteer = MunicipioGazetteer()
+    # Macapá fica praticamente sobre o Equador
+    gazetteer.add(1600303, "Macapá", "AP", 0.0349, -51.0694)
+    use_case = ValidateGeofencingUseCase(gazetteer=gazetteer)
+    fotos = [
+        {"latitude": 0.0, "longitude": -51.07},
+        {"latitude": "0", "longitude": "-51.07"},
+        {"latitude": "", "longitude": -51.07},
+    ]
+
+    result = use_case.validate_multiple(make_emenda(destinatario_nome="Macapá", destinatario_uf="AP"), fotos)
+    assert [r["valid"] for r in result["results"]] == [True, True, False]
+    assert result["missing_coordinates"] == 1
+
+
+def test_batch_without_expected_location_fails(make_emenda):
+    result = _use_case().validate_multiple(make_emenda(destinatario_tipo="estado", **CAMPINAS), [{"latitude": 1, "longitude": 1}])
+    assert not result["success"] and result["reason"] == "missing_expected_location"
+
+
+def test_single_photo_accepts_zero_and_rejects_missing_coordinates(make_emenda):
+    gazetteer = MunicipioGazetteer()
+    gazetteer.add(1600303, "Macapá", "AP", 0.0349, -51.0694)
+    emenda = make_emenda(destinatario_nome="Macapá", destinatario_uf="AP")
+
+    result = ValidateGeofencingUseCase(gazetteer=gazetteer).validate(emenda, {"latitude": 0.0, "longitude": "-51.07"})
+    assert result["success"] and result["valid"]
+    assert result["foto_location"] == {"latitude": 0.0, "longitude": -51.07}
+
+    for foto in ({"latitude": None, "longitude": -51.07}, {"latitude": "x", "longitude": -51.07}, {}):
+        result = ValidateGeofencingUseCase(gazetteer=gazetteer).validate(emenda, foto)
+        assert result["reason"] == "missing_coordinates"
+
+    validator = GeofencingValidator(gazetteer=gazetteer)
+    result = validator.validate_photo_location("foto.jpg", "Macapá", "AP", {"latitude": 0, "longitude": -51.07})
+    assert result["valid"] and result["photo_location"]["source"] == "provided"
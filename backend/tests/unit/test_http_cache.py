@@ -0,0 +1,46 @@
+"""Unit tests for conditional HTTP caching helpers"""
+from datetime import datetime
+
+from fastapi import Response
+from starlette.requests import Request
+
+from src.presentation.api.v1.http_cache import make_etag, conditional_response
+
+
+def _request(**headers) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_etag_match_returns_304_with_validators():
+    etag = make_etag("emendas", "v1")
+    response = Response()
+
+    result = conditional_response(_request(if_none_match=f'"x", {etag}'), response, etag)
+    assert result.status_code == 304
+    assert result.headers["etag"] == etag
+    # Comparação fraca: o mesmo valor sem W/ também vale
+    assert conditional_response(_request(if_none_match=etag[2:]), Response(), etag) is not None
+
+
+def test_changed_etag_sets_headers_and_continues():
+    response = Response()
+    etag = make_etag("emendas", "v2")
+
+    assert conditional_response(_request(if_none_match=make_etag("emendas", "v1")), response, etag) is None
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "public, no-cache"
+
+
+def test_if_modified_since_only_without_if_none_match():
+    last_modified = datetime(2026, 10, 16, 12, 0, 0, 500000)
+    etag = make_etag("emenda", "1")
+    since = "Fri, 16 Oct 2026 12:00:00 GMT"
+
+    assert conditional_response(_request(if_modified_since=since), Response(), etag, last_modified) is not None
+    assert conditional_response(
+        _request(if_modified_since=since, if_none_match='"other"'), Response(), etag, last_modified
+    ) is None
+    assert conditional_response(
+        _request(if_modified_since="Fri, 16 Oct 2026 11:59:59 GMT"), Response(), etag, last_modified
+    ) is None
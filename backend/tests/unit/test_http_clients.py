@@ -0,0 +1,45 @@
+"""Unit tests for the shared HTTP client registry"""
+from src.infrastructure.external.http_clients import HTTPClientRegistry, UpstreamConfig
+from src.infrastructure.external.rate_limiter import HostRateLimiter
+
+
+def _registry():
+    return HTTPClientRegistry({
+        "api": UpstreamConfig(base_url="https://api.example.com", headers={"Accept": "application/json"}),
+        "limited": UpstreamConfig(base_url="https://slow.example.com", requests_per_second=5),
+    })
+
+
+async def test_registry_reuses_one_client_per_upstream():
+    registry = _registry()
+
+    first = registry.get("api")
+    assert registry.get("api") is first
+    assert registry.get("limited") is not first
+    assert str(first.base_url) == "https://api.example.com"
+    assert first.headers["Accept"] == "application/json"
+    await registry.close()
+    assert first.is_closed
+    # Usado depois de fechado: um cliente novo é criado
+    second = registry.get("api")
+    assert second is not first and not second.is_closed
+    await registry.close()
+
+
+async def test_rate_limit_is_installed_as_request_hook():
+    registry = _registry()
+
+    hooks = registry.get("limited").event_hooks["request"]
+    assert len(hooks) == 1 and isinstance(hooks[0], HostRateLimiter)
+    assert registry.get("api").event_hooks["request"] == []
+    await registry.close()
+
+
+def test_unknown_upstream_raises_key_error():
+    registry = _registry()
+    try:
+        registry.get("missing")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("expected KeyError")
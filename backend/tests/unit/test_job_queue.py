@@ -0,0 +1,133 @@
+"""Unit tests for the in-process background job queue"""
+import asyncio
+from contextlib import asynccontextmanager
+
+from src.domain.entities.job import JOB_CANCELLED, JOB_FAILED, JOB_SUCCEEDED
+from src.infrastructure.jobs import JobContext, JobQueue, job_handler, handlers
+from src.infrastructure.jobs.store import InMemoryJobStore
+
+# Liberado pelo teste de cancelamento depois de pedir o cancelamento
+_release = None
+
+
+@job_handler("test.count")
+async def _count(ctx, total: int = 3) -> dict:
+    for done in range(total):
+        await ctx.progress(done, total)
+        if _release is not None:
+            await _release.wait()
+    await ctx.progress(total, total)
+    return {"success": True, "count": total}
+
+
+@job_handler("test.fail")
+async def _fail(ctx) -> dict:
+    return {"success": False, "message": "fonte indisponível"}
+
+
+async def _wait(queue: JobQueue, job_id: str):
+    for _ in range(100):
+        job = await queue.get(job_id)
+        if job.is_finished:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+async def test_job_runs_and_reports_result():
+    queue = JobQueue(InMemoryJobStore())
+    job = await queue.enqueue("test.count", total=5)
+    assert job.status == "queued"
+
+    job = await _wait(queue, job.id)
+    assert job.status == JOB_SUCCEEDED
+    assert (job.progress_done, job.progress_total) == (5, 5)
+    assert job.result == {"success": True, "count": 5}
+    assert job.to_dict()["finished_at"] is not None
+
+    failed = await _wait(queue, (await queue.enqueue("test.fail")).id)
+    assert failed.status == JOB_FAILED
+    assert failed.error == "fonte indisponível"
+
+
+async def test_cancel_stops_job_at_next_progress(monkeypatch):
+    global _release
+    monkeypatch.setattr(JobContext, "PROGRESS_INTERVAL_SECONDS", 0.0)
+    _release = asyncio.Event()
+    try:
+        queue = JobQueue(InMemoryJobStore())
+        job = await queue.enqueue("test.count", total=3)
+        await asyncio.sleep(0.01)
+        assert (await queue.cancel(job.id)).cancel_requested
+        _release.set()
+
+        job = await _wait(queue, job.id)
+        assert job.status == JOB_CANCELLED
+        assert job.result is None
+        assert job.progress_done < 3
+        assert await queue.cancel("inexistente") is None
+    finally:
+        _release = None
+
+
+async def test_close_marks_running_jobs_as_interrupted():
+    global _release
+    _release = asyncio.Event()
+    try:
+        store = InMemoryJobStore()
+        queue = JobQueue(store)
+        job = await queue.enqueue("test.count", total=3)
+        await asyncio.sleep(0.01)
+        assert (await queue.get(job.id)).status == "running"
+
+        await queue.close()
+        job = await store.get(job.id)
+        assert job.status == JOB_FAILED
+        assert "interrompido" in job.error
+        assert job.finished_at is not None
+    finally:
+        _release = None
+
+
+async def test_sync_handlers_refresh_trust_scores(monkeypatch):
+    refreshed = []
+
+    @asynccontextmanager
+    async def session_local():
+        yield object()
+
+    class FakeSync:
+        def __init__(self, repository):
+            pass
+
+        async def sync_all_emendas_with_ceis(self, progress=None):
+            return {"success": True, "synced": 2}
+
+        async def execute(self, ano=None, codigo_ibge=None, limit=100, progress=None):
+            return {"success": ano != 1999, "message": "portal indisponível"}
+
+    class FakeRefresh:
+        def __init__(self, repository):
+            pass
+
+        async def execute(self):
+            refreshed.append(True)
+            return {"success": True, "updated": 7}
+
+    monkeypatch.setattr(handlers, "AsyncSessionLocal", session_local)
+    monkeypatch.setattr(handlers, "PostgresEmendaPixRepository", lambda session: session)
+    monkeypatch.setattr(handlers, "SyncCEISDataUseCase", FakeSync)
+    monkeypatch.setattr(handlers, "SyncEmendasPortalUseCase", FakeSync)
+    monkeypatch.setattr(handlers, "RefreshTrustScoresUseCase", FakeRefresh)
+    queue = JobQueue(InMemoryJobStore())
+
+    job = await _wait(queue, (await queue.enqueue(handlers.SYNC_CEIS_ALL)).id)
+    assert job.result == {"success": True, "synced": 2, "trust_scores_updated": 7}
+
+    job = await _wait(queue, (await queue.enqueue(handlers.SYNC_EMENDAS_PORTAL, ano=2024)).id)
+    assert job.result["trust_scores_updated"] == 7
+
+    # Sincronização com falha não recalcula
+    job = await _wait(queue, (await queue.enqueue(handlers.SYNC_EMENDAS_PORTAL, ano=1999)).id)
+    assert job.status == JOB_FAILED
+    assert len(refreshed) == 2
@@ -0,0 +1,129 @@
+"""Unit tests for the grouped, incremental news harvest"""
+from contextlib import asynccontextmanager
+
+from src.application.use_cases.emenda_pix.fetch_news import FetchEmendaNewsUseCase
+from src.infrastructure.external.news_scraper.client import normalize_url, url_hash
+
+
+class FakeNewsClient:
+    def __init__(self):
+        self.queries = []
+
+    async def search_news(self, query, limit=10):
+        self.queries.append(query)
+        # Mesma matéria com e sem rastreamento, mais uma por consulta
+        return [
+            {"titulo": "Geral", "link": "https://www.example.com/geral/?utm_source=x", "data": "2024-01-02"},
+            {"titulo": "Geral", "link": "http://example.com/geral", "data": "2024-01-02"},
+            {"titulo": query, "link": f"https://example.com/{query.split()[0]}", "data": "2024-01-01"},
+        ]
+
+    async def close(self):
+        pass
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.analyzed = 0
+
+    async def analyze_news_sentiment(self, news):
+        self.analyzed += len(news)
+        for item in news:
+            item["sentimento"], item["sentimento_score"] = "neutro", 0.5
+        return news
+
+    def calculate_overall_sentiment(self, news):
+        return {"sentimento": "neutro", "total_noticias": len(news)}
+
+    async def close(self):
+        pass
+
+
+class FakeRepository:
+    def __init__(self, emendas):
+        self.emendas = emendas
+        self.saved = []
+        self.loaded = []
+        self.transactions = 0
+
+    async def stream_columns(self, columns, batch_size=10000):
+        rows = [tuple(getattr(e, c) for c in columns) for e in self.emendas]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    async def find_by_ids(self, ids):
+        self.loaded.extend(ids)
+        return [e for e in self.emendas if e.id in ids]
+
+    @asynccontextmanager
+    async def unit_of_work(self, changed_by="system"):
+        self.transactions += 1
+
+        class UoW:
+            def add(uow, emenda):
+                self.saved.append(emenda)
+
+        yield UoW()
+
+
+def test_normalize_url_ignores_tracking_and_cosmetics():
+    assert normalize_url("HTTPS://www.G1.com/a/b/?utm_source=x&z=1&a=2#frag") == "//g1.com/a/b?a=2&z=1"
+    assert url_hash("https://example.com/x?fbclid=1") == url_hash("http://www.example.com/x/")
+
+
+async def test_harvest_groups_queries_and_skips_known_articles(make_emenda):
+    emendas = [
+        make_emenda(1, autor_nome="Maria Souza", destinatario_nome="Campinas"),
+        make_emenda(2, autor_nome="maria  souza", destinatario_nome="campinas"),
+        make_emenda(3, autor_nome="José Pereira", destinatario_nome="Niterói"),
+    ]
+    repository = FakeRepository(emendas)
+    client, analyzer = FakeNewsClient(), FakeAnalyzer()
+    use_case = FetchEmendaNewsUseCase(repository, news_client=client, sentiment_analyzer=analyzer)
+
+    use_case.PAGE_SIZE = 2
+    use_case.WRITE_CHUNK_SIZE = 2
+
+    result = await use_case.fetch_all_emendas_news()
+    assert len(client.queries) == 2
+    assert result["total_emendas"] == 3
+    assert result["new_articles"] == 3 and analyzer.analyzed == 3
+    assert len(repository.saved) == 3
+    # Gravação em lotes de WRITE_CHUNK_SIZE emendas
+    assert repository.transactions == 2
+    assert [n["titulo"] for n in emendas[0].noticias_relacionadas] == ["Geral", "Maria Souza Campinas"]
+
+    # Segunda rodada: nada novo, nada analisado, carregado nem gravado
+    repository.saved.clear()
+    repository.loaded.clear()
+    result = await use_case.fetch_all_emendas_news()
+    assert result["new_articles"] == 0 and result["known_articles"] == 6
+    assert analyzer.analyzed == 3
+    assert repository.loaded == [] and repository.saved == []
+
+
+async def test_harvest_reuses_analyzed_copy_and_loads_only_emendas_gaining_news(make_emenda):
+    emendas = [
+        make_emenda(1, autor_nome="Maria Souza", destinatario_nome="Campinas"),
+        make_emenda(2, autor_nome="José Pereira", destinatario_nome="Niterói"),
+    ]
+    analyzed_copy = {
+        "titulo": "Geral", "link": "https://example.com/geral", "data": "2024-01-02",
+        "sentimento": "positivo", "sentimento_score": 0.9
+    }
+    # Emenda 1 já tem todas as notícias que a busca vai trazer
+    emendas[0].noticias_relacionadas = [
+        analyzed_copy,
+        {"titulo": "Maria", "link": "https://example.com/Maria", "data": "2024-01-01"},
+    ]
+    repository = FakeRepository(emendas)
+    analyzer = FakeAnalyzer()
+    use_case = FetchEmendaNewsUseCase(repository, news_client=FakeNewsClient(), sentiment_analyzer=analyzer)
+
+    result = await use_case.fetch_all_emendas_news()
+    assert repository.loaded == ["2"]
+    assert result["known_articles"] == 5 and result["new_articles"] == 1
+    # Notícia já conhecida entra na emenda 2 com a análise existente
+    geral = next(n for n in emendas[1].noticias_relacionadas if n["titulo"] == "Geral")
+    assert geral["sentimento"] == "positivo"
+    assert analyzer.analyzed == 1
@@ -0,0 +1,33 @@
+"""Testes unitários dos cursores de paginação keyset"""
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.persistence.postgres.pagination import (
+    encode_cursor, decode_cursor, encode_score_cursor, decode_score_cursor
+)
+
+
+def test_cursor_roundtrip():
+    """Cursor codificado volta à mesma chave (created_at, id)"""
+    created_at = datetime(2025, 3, 14, 15, 9, 26, 535897)
+    emenda_id = "6f1c7a52-3f0e-4d0b-9a7e-2b1f5f3c8d11"
+
+    cursor = encode_cursor(created_at, emenda_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, emenda_id)
+
+
+def test_invalid_cursor_raises_value_error():
+    """Cursor malformado gera ValueError (mapeado para 400 na rota)"""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_cursor_with_non_uuid_id_raises_value_error():
+    """Id que não é UUID é rejeitado na decodificação, antes de chegar ao banco"""
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(datetime(2025, 1, 1), "1; drop"))
+    with pytest.raises(ValueError):
+        decode_score_cursor(encode_score_cursor(80.0, "abc"))
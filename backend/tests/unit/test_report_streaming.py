@@ -0,0 +1,81 @@
+"""Unit tests for the streaming CSV/JSON/NDJSON exports"""
+import csv
+import io
+import json
+from datetime import datetime
+
+from src.application.use_cases.reports.generate_reports import GenerateReportsUseCase
+
+ROWS = 2 * GenerateReportsUseCase.EXPORT_CHUNK_ROWS + 1
+
+
+class FakeRepository:
+    def __init__(self, emendas):
+        self.emendas = emendas
+        self.calls = []
+
+    async def stream(self, fields=None, batch_size=1000, **filters):
+        self.calls.append({"fields": fields, **filters})
+        for emenda in self.emendas:
+            yield emenda
+
+
+def _emendas(make_emenda, total: int = ROWS):
+    return [
+        make_emenda(
+            i, autor_nome="João, \"Silva\"", valor_aprovado=1000.0 * i,
+            data_inicio=datetime(2024, 1, 1) if i % 2 else None,
+            plano_trabalho={"metas": [i]} if i % 3 == 0 else None
+        )
+        for i in range(total)
+    ]
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+async def test_csv_streams_in_chunks(make_emenda):
+    repository = FakeRepository(_emendas(make_emenda))
+    use_case = GenerateReportsUseCase(repository)
+
+    chunks = await _collect(use_case.stream_csv({"status": "pendente", "ano": 2024}))
+    assert len(chunks) == 3
+
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0][0] == "Número Emenda" and len(rows) == ROWS + 1
+    assert rows[1][:3] == ["E0", "2024", "João, \"Silva\""]
+    assert rows[2][8] == "2024-01-01T00:00:00"
+    assert repository.calls == [{
+        "fields": GenerateReportsUseCase.CSV_FIELDS, "status_execucao": "pendente",
+        "autor_nome": None, "destinatario_nome": None, "ano": 2024,
+        "valor_min": None, "valor_max": None
+    }]
+
+
+async def test_json_and_ndjson_stream_in_chunks_and_parse(make_emenda):
+    emendas = _emendas(make_emenda)
+    use_case = GenerateReportsUseCase(FakeRepository(emendas))
+
+    chunks = await _collect(use_case.stream_json())
+    assert len(chunks) == 3
+    data = json.loads(b"".join(chunks))
+    assert [item["numero_emenda"] for item in data] == [e.numero_emenda for e in emendas]
+    assert data[3]["plano_trabalho"] == {"metas": [3]}
+    assert data[1]["data_inicio"] == "2024-01-01T00:00:00" and data[0]["data_inicio"] is None
+
+    chunks = await _collect(use_case.stream_ndjson())
+    assert len(chunks) == 3
+    # Cada trecho termina em fim de linha: nenhum objeto é cortado ao meio
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    lines = b"".join(chunks).splitlines()
+    assert [json.loads(line) for line in lines] == data
+
+
+async def test_empty_exports_are_valid():
+    use_case = GenerateReportsUseCase(FakeRepository([]))
+
+    csv_rows = list(csv.reader(io.StringIO("".join(await _collect(use_case.stream_csv())))))
+    assert len(csv_rows) == 1 and csv_rows[0][0] == "Número Emenda"
+    assert json.loads(b"".join(await _collect(use_case.stream_json()))) == []
+    assert b"".join(await _collect(use_case.stream_ndjson())) == b""
@@ -0,0 +1,114 @@
+"""Unit tests for circuit breakers, retries and latency budgets on upstream calls"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.infrastructure.external.http_clients import HTTPClientRegistry, UpstreamConfig
+from src.infrastructure.external.resilience import (
+    CIRCUIT_CLOSED, CIRCUIT_OPEN, CircuitBreaker, CircuitOpenError,
+    HostCircuitBreakers, LatencyBudgetExceeded, ResilientTransport
+)
+
+
+class FakeUpstream:
+    """In-process fake server: answers from a script of (delay, status) pairs"""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+
+    async def handler(self, request):
+        self.calls += 1
+        delay, status = self.script.pop(0) if self.script else (0, 200)
+        await asyncio.sleep(delay)
+        if status is None:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(status, json={"call": self.calls})
+
+
+def _client(upstream, breaker=None, **options):
+    options.setdefault("backoff_base", 0.001)
+    transport = ResilientTransport(
+        httpx.MockTransport(upstream.handler),
+        breaker or CircuitBreaker("fake", failure_threshold=3, reset_timeout=0.05),
+        **options
+    )
+    return httpx.AsyncClient(transport=transport, base_url="http://fake")
+
+
+async def test_idempotent_requests_are_retried_and_posts_are_not():
+    upstream = FakeUpstream([(0, 503), (0, None), (0, 200), (0, 503)])
+
+    async with _client(upstream, max_retries=2) as client:
+        got = await client.get("/x")
+        posted = await client.post("/x")
+
+    assert got.status_code == 200 and got.json() == {"call": 3}
+    assert posted.status_code == 503
+    assert upstream.calls == 4
+
+
+async def test_latency_budget_fails_fast():
+    upstream = FakeUpstream([(5, 200)])
+
+    started = time.monotonic()
+    async with _client(upstream, latency_budget=0.1) as client:
+        with pytest.raises(LatencyBudgetExceeded):
+            await client.get("/slow")
+    assert time.monotonic() - started < 1
+
+
+async def test_breaker_opens_rejects_and_recovers_after_reset_timeout():
+    upstream = FakeUpstream([(0, 500)] * 3)
+    breaker = CircuitBreaker("fake", failure_threshold=3, reset_timeout=0.05)
+
+    async with _client(upstream, breaker=breaker, max_retries=0) as client:
+        for _ in range(3):
+            await client.get("/x")
+        assert breaker.state == CIRCUIT_OPEN
+        with pytest.raises(CircuitOpenError):
+            await client.get("/x")
+        assert upstream.calls == 3
+        await asyncio.sleep(0.06)
+        # Requisição de teste (half-open) bem-sucedida fecha o circuito
+        response = await client.get("/x")
+
+    assert response.status_code == 200
+    assert breaker.stats() == {"state": CIRCUIT_CLOSED, "consecutive_failures": 0, "trips": 1}
+
+
+def test_registry_exposes_breaker_stats_per_upstream():
+    registry = HTTPClientRegistry({
+        "a": UpstreamConfig(base_url="https://a.example.com"),
+        "b": UpstreamConfig(base_url="https://b.example.com", failure_threshold=1),
+    })
+    registry.breaker("b").record_failure()
+
+    stats = registry.stats()
+    assert stats["a"]["state"] == CIRCUIT_CLOSED
+    assert stats["b"] == {"state": CIRCUIT_OPEN, "consecutive_failures": 1, "trips": 1}
+
+
+async def test_upstream_without_base_url_has_one_circuit_per_host():
+    registry = HTTPClientRegistry({"generic": UpstreamConfig(failure_threshold=2)})
+    breakers = registry.breaker("generic")
+    assert isinstance(breakers, HostCircuitBreakers)
+
+    async def handler(request):
+        return httpx.Response(500 if request.url.host == "down.example.com" else 200)
+
+    transport = ResilientTransport(httpx.MockTransport(handler), breakers, max_retries=0)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(2):
+            await client.get("http://down.example.com/feed.xml")
+        with pytest.raises(CircuitOpenError):
+            await client.get("http://down.example.com/feed.xml")
+        # Outro host segue liberado
+        assert (await client.get("http://up.example.com/feed.xml")).status_code == 200
+
+    stats = registry.stats()["generic"]
+    assert stats["open_hosts"] == 1
+    assert stats["hosts"]["down.example.com"]["state"] == CIRCUIT_OPEN
+    assert stats["hosts"]["up.example.com"]["state"] == CIRCUIT_CLOSED
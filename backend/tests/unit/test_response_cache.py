@@ -0,0 +1,76 @@
+"""Unit tests for the data-source response cache"""
+import asyncio
+
+from src.infrastructure.external.response_cache import (
+    CACHE_HIT, CACHE_MISS, CACHE_STALE, CachePolicy, ResponseCache
+)
+
+
+class FakeSource:
+    def __init__(self, results=None, delay=0.02):
+        self.calls = 0
+        self.results = results if results is not None else [{"id": 1}]
+        self.delay = delay
+        self.fail = False
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return [dict(item, call=self.calls) for item in self.results]
+
+
+def _cache(ttl=60.0, stale_ttl=60.0):
+    return ResponseCache(policies={"src": CachePolicy(ttl=ttl, stale_ttl=stale_ttl)})
+
+
+async def test_concurrent_misses_share_one_upstream_call():
+    cache, source = _cache(), FakeSource()
+
+    answers = await asyncio.gather(*(
+        cache.get_or_fetch("src", {"uf": "SP"}, source.fetch) for _ in range(10)
+    ))
+    again = await cache.get_or_fetch("src", {"uf": "SP"}, source.fetch)
+    other = await cache.get_or_fetch("src", {"uf": "RJ"}, source.fetch)
+
+    assert source.calls == 2
+    assert all(status == CACHE_MISS for _, status in answers)
+    assert again == ([{"id": 1, "call": 1}], CACHE_HIT)
+    assert other[1] == CACHE_MISS
+
+
+async def test_stale_entry_is_served_while_refreshing_in_background():
+    cache, source = _cache(ttl=0.0), FakeSource()
+
+    await cache.get_or_fetch("src", {}, source.fetch)
+    stale = await cache.get_or_fetch("src", {}, source.fetch)
+    # A atualização em andamento não é disparada de novo
+    await cache.get_or_fetch("src", {}, source.fetch)
+    await asyncio.sleep(0.05)
+    refreshed = await cache.get_or_fetch("src", {}, source.fetch)
+    # Contado antes do close(), que cancela a atualização disparada agora
+    calls = source.calls
+    await cache.close()
+
+    assert stale == ([{"id": 1, "call": 1}], CACHE_STALE)
+    assert refreshed[0] == [{"id": 1, "call": 2}]
+    assert calls == 2
+
+
+async def test_failed_refresh_keeps_stale_entry_and_empty_results_are_not_stored():
+    cache, source = _cache(ttl=0.0), FakeSource()
+
+    await cache.get_or_fetch("src", {}, source.fetch)
+    source.fail = True
+    await cache.get_or_fetch("src", {}, source.fetch)
+    await asyncio.sleep(0.05)
+    kept = await cache.get_or_fetch("src", {}, source.fetch)
+
+    empty = FakeSource(results=[])
+    await cache.get_or_fetch("src", {"uf": "AC"}, empty.fetch)
+    await cache.get_or_fetch("src", {"uf": "AC"}, empty.fetch)
+    await cache.close()
+
+    assert kept == ([{"id": 1, "call": 1}], CACHE_STALE)
+    assert empty.calls == 2
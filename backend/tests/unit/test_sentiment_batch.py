@@ -0,0 +1,63 @@
+"""Unit tests for batched, cached news sentiment analysis"""
+import asyncio
+import json
+import re
+
+from src.infrastructure.ai.cache_service import SentimentCache
+from src.infrastructure.ai.sentiment_analyzer import SentimentAnalyzer
+
+
+class FakeOpenAIService:
+    """Answers every indexed item of the prompt, except indices in `skip`"""
+
+    def __init__(self, skip=()):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.skip = set(skip)
+
+    async def generate_text(self, prompt, max_tokens=500, temperature=0.3, json_output=False):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        indices = [int(i) for i in re.findall(r"^\[(\d+)\]", prompt, re.MULTILINE)]
+        return json.dumps({"resultados": [
+            {"indice": i, "sentimento": "positivo", "score": 0.9, "explicacao": "ok"}
+            for i in indices if i not in self.skip
+        ]})
+
+
+def _news(n):
+    return [{"titulo": f"Notícia {i % (n - 3)}", "resumo": "obra entregue"} for i in range(n)]
+
+
+async def test_batches_run_concurrently_and_results_are_cached():
+    service = FakeOpenAIService()
+    analyzer = SentimentAnalyzer(
+        openai_service=service, cache=SentimentCache(), batch_size=10, max_concurrent_batches=2
+    )
+
+    news = await analyzer.analyze_news_sentiment(_news(50))
+    # 47 textos distintos -> 5 chamadas, no máximo 2 ao mesmo tempo
+    assert service.calls == 5 and service.peak == 2
+    assert all(item["sentimento"] == "positivo" and item["sentimento_score"] == 0.9 for item in news)
+
+    again = await analyzer.analyze_news_sentiment(_news(50))
+    assert service.calls == 5
+    assert again[0]["sentimento_explicacao"] == "ok"
+
+
+async def test_items_missing_from_the_answer_fall_back_to_keywords():
+    service = FakeOpenAIService(skip={1})
+    analyzer = SentimentAnalyzer(openai_service=service, cache=SentimentCache(), batch_size=5)
+    news = [
+        {"titulo": "Obra concluída", "resumo": "entregue"},
+        {"titulo": "Investigação de desvio", "resumo": "atraso e irregularidade"},
+    ]
+
+    await analyzer.analyze_news_sentiment(news)
+    assert news[0]["sentimento"] == "positivo" and news[0]["sentimento_score"] == 0.9
+    assert news[1]["sentimento"] == "negativo"
+    assert "palavras-chave" in news[1]["sentimento_explicacao"]
@@ -0,0 +1,80 @@
+"""Unit tests for the in-memory emenda similarity index"""
+import random
+
+from src.domain.entities.emenda_pix import EmendaPix
+from src.infrastructure.similarity.emenda_index import EmendaSimilarityIndex
+
+
+def _random_fields(rng: random.Random) -> dict:
+    return dict(
+        destinatario_nome=rng.choice(["Campinas", "Niterói", "Recife"]),
+        valor_aprovado=rng.choice([0.0, round(10 ** rng.uniform(3, 7), 2)]),
+        area=rng.choice(["saude", "educacao", None]),
+        status_execucao=rng.choice(["pendente", "em_execucao", "concluida"]),
+    )
+
+
+def _reference_score(a: EmendaPix, b: EmendaPix) -> float:
+    score = 0.0
+    if a.area and b.area and a.area == b.area:
+        score += 0.3
+    elif not a.area and not b.area:
+        score += 0.15
+    maior = max(a.valor_aprovado, b.valor_aprovado)
+    if maior > 0:
+        score += 0.3 * max(0, 1 - abs(a.valor_aprovado - b.valor_aprovado) / maior)
+    if a.destinatario_nome == b.destinatario_nome:
+        score += 0.2
+    if a.status_execucao == b.status_execucao:
+        score += 0.2
+    return round(score, 2)
+
+
+def _loaded_index(emendas):
+    index = EmendaSimilarityIndex()
+    index.loaded_at = 0.0
+    index.max_age_seconds = float("inf")
+    index.upsert_many(emendas)
+    return index
+
+
+def test_search_matches_brute_force_scores(make_emenda):
+    rng = random.Random(7)
+    emendas = [make_emenda(i, **_random_fields(rng)) for i in range(600)]
+    index = _loaded_index(emendas)
+
+    for query in emendas[:40]:
+        for area, valor_range in ((None, None), ("saude", None), (None, 30.0)):
+            expected = sorted(
+                (
+                    _reference_score(query, e) for e in emendas
+                    if e.id != query.id
+                    and not (area and e.area and e.area != area)
+                    and not (
+                        valor_range
+                        and not query.valor_aprovado * (1 - valor_range / 100)
+                        <= e.valor_aprovado
+                        <= query.valor_aprovado * (1 + valor_range / 100)
+                    )
+                ),
+                reverse=True
+            )[:10]
+            result = index.search(query, k=10, area=area, valor_range=valor_range)
+            assert [score for _, score in result] == expected
+
+
+def test_incremental_update_and_remove(make_emenda):
+    rng = random.Random(1)
+    emendas = [make_emenda(i, **_random_fields(rng)) for i in range(50)]
+    index = _loaded_index(emendas)
+    query = emendas[0]
+
+    twin = EmendaPix(**{**emendas[1].__dict__})
+    twin.area, twin.status_execucao = query.area, query.status_execucao
+    twin.destinatario_nome, twin.valor_aprovado = query.destinatario_nome, query.valor_aprovado
+    index.upsert(twin)
+    assert index.search(query, k=1)[0][0] == twin.id
+
+    index.remove(twin.id)
+    assert twin.id not in [id for id, _ in index.search(query, k=50)]
+    assert len(index) == 49
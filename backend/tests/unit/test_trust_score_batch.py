@@ -0,0 +1,65 @@
+"""Unit tests for the vectorized Trust Score"""
+import random
+from datetime import datetime, timedelta
+
+from src.application.use_cases.emenda_pix.calculate_trust_score import (
+    CalculateTrustScoreUseCase,
+    calculate_trust_scores
+)
+from src.application.use_cases.emenda_pix.refresh_trust_scores import RefreshTrustScoresUseCase
+
+
+def _random_fields(rng: random.Random) -> dict:
+    prazo = datetime.now() + timedelta(days=rng.choice([-90, -1, 30, 365]))
+    return dict(
+        valor_aprovado=100000.0,
+        status_execucao=rng.choice(["pendente", "em_execucao", "concluida", "atrasada", "cancelada", "outro"]),
+        percentual_executado=rng.choice([0.0, 19.9, 20.0, 50.0, 79.5, 80.0, 99.9, 100.0]),
+        data_prevista_conclusao=rng.choice([None, prazo]),
+        risco_desvio=rng.choice([None, 0.0, 0.35, 0.7, 1.0]),
+        documentos_comprobatórios=rng.choice([None, [], [{}], [{}] * 2, [{}] * 4, [{}] * 6]),
+    )
+
+
+def _inputs(emendas):
+    return [
+        (
+            emenda.id,
+            emenda.percentual_executado,
+            emenda.esta_atrasada(),
+            len(emenda.documentos_comprobatórios or []),
+            emenda.risco_desvio,
+            emenda.status_execucao,
+            f"hash-{emenda.id}",
+        )
+        for emenda in emendas
+    ]
+
+
+def test_batch_scores_match_single_calculation(make_emenda):
+    rng = random.Random(7)
+    emendas = [make_emenda(i, **_random_fields(rng)) for i in range(300)]
+    single = CalculateTrustScoreUseCase()
+
+    rows = RefreshTrustScoresUseCase._score(_inputs(emendas))
+
+    for emenda, row in zip(emendas, rows):
+        expected = single.calculate(emenda)
+        assert row["id"] == emenda.id
+        assert row["trust_score"] == expected["trust_score"]
+        assert row["trust_level"] == expected["level"]
+        for name, factor in expected["factors"].items():
+            assert row[f"trust_{name}"] == factor["score"]
+        assert row["trust_inputs_hash"] == f"hash-{emenda.id}"
+
+
+def test_level_boundaries():
+    result = calculate_trust_scores(
+        percentual_executado=[100.0, 100.0],
+        atrasada=[False, False],
+        documentos=[5, 0],
+        risco_desvio=[0.0, float("nan")],
+        status_execucao=["concluida", "cancelada"]
+    )
+    assert result["trust_score"].tolist() == [100.0, 66.0]
+    assert result["trust_level"].tolist() == ["excelente", "bom"]
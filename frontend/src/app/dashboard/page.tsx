@@ -9,6 +9,12 @@ import { Input } from '@/shared/components/ui/input'
 import { Select } from '@/shared/components/ui/select'
 import { api } from '@/core/api/client'
 
+interface SyncJob {
+  status: 'queued' | 'running' | 'succeeded' | 'failed' | 'cancelled'
+  result?: { count?: number } | null
+  error?: string | null
+}
+
 export default function DashboardPage() {
   const [page, setPage] = useState(0)
   const limit = 12
@@ -68,8 +74,17 @@ export default function DashboardPage() {
   const handleSync = async () => {
     setIsSyncing(true)
     try {
-      const response = await api.post<{ message: string; count: number }>('/legislation/sync?days=30')
-      const count = response.count || 0
+      // A sincronização roda em segundo plano: acompanha o job até terminar
+      const { job_id } = await api.post<{ job_id: string }>('/legislation/sync?days=30')
+      let job = await api.get<SyncJob>(`/jobs/${job_id}`)
+      while (job.status === 'queued' || job.status === 'running') {
+        await new Promise((resolve) => setTimeout(resolve, 2000))
+        job = await api.get<SyncJob>(`/jobs/${job_id}`)
+      }
+      if (job.status !== 'succeeded') {
+        throw new Error(job.error || `Sincronização ${job.status}`)
+      }
+      const count = job.result?.count || 0
       if (count > 0) {
         alert(`✅ ${count} nova(s) legislação(ões) sincronizada(s) com sucesso!`)
       } else {
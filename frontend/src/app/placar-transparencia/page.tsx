@@ -1,29 +1,27 @@
 'use client'
 
 import { useState } from 'react'
-import { useEmendasPix } from '@/features/emenda-pix/hooks/useEmendasPix'
-import { PlacarCard } from '@/shared/components/PlacarCard'
+import { usePlacar } from '@/features/emenda-pix/hooks/usePlacar'
 import { Input } from '@/shared/components/ui/input'
 import { Button } from '@/shared/components/ui/button'
 
 export default function PlacarTransparenciaPage() {
   const [searchType, setSearchType] = useState<'municipio' | 'parlamentar'>('municipio')
   const [searchQuery, setSearchQuery] = useState<string>('')
-  const [isSearching, setIsSearching] = useState(false)
 
-  const { data, isLoading, error } = useEmendasPix({
-    limit: 50,
-    offset: 0,
-    autor_nome: searchType === 'parlamentar' && searchQuery ? searchQuery : undefined,
-    // Para município, usamos destinatario_uf como aproximação
-    // (em produção, seria necessário adicionar filtro por destinatario_nome)
-  })
+  // Termo efetivamente buscado (atualizado ao clicar em Buscar / Enter)
+  const [submittedQuery, setSubmittedQuery] = useState<string>('')
+  const isSearching = submittedQuery !== ''
+
+  // Totais e ranking vêm dos agregados do backend (todas as emendas, não só uma página)
+  const { data, isLoading, error } = usePlacar(
+    searchType,
+    { q: submittedQuery, limit: 50 },
+    isSearching
+  )
 
   const handleSearch = () => {
-    if (searchQuery.trim()) {
-      setIsSearching(true)
-      // A busca será feita automaticamente pelo useQuery quando os parâmetros mudarem
-    }
+    setSubmittedQuery(searchQuery.trim())
   }
 
   const handleKeyPress = (e: React.KeyboardEvent<HTMLInputElement>) => {
@@ -32,19 +30,8 @@ export default function PlacarTransparenciaPage() {
     }
   }
 
-  // Filtrar por município no frontend (temporário até backend ter filtro)
-  const filteredData = searchType === 'municipio' && searchQuery
-    ? data?.items.filter(emenda => 
-        emenda.destinatario_nome.toLowerCase().includes(searchQuery.toLowerCase())
-      )
-    : data?.items
-
-  const totalEmendas = filteredData?.length || 0
-  const totalValor = filteredData?.reduce((sum, e) => sum + e.valor_aprovado, 0) || 0
-  const totalPago = filteredData?.reduce((sum, e) => sum + e.valor_pago, 0) || 0
-  const totalAlertas = filteredData?.reduce((sum, e) => 
-    sum + (e.alertas?.filter(a => a.severidade === 'alta' || a.severidade === 'media').length || 0), 0
-  ) || 0
+  const resumo = data?.resumo
+  const ranking = data?.ranking
 
   const formatCurrency = (value: number) => {
     return new Intl.NumberFormat('pt-BR', {
@@ -73,7 +60,7 @@ export default function PlacarTransparenciaPage() {
             {/* Tipo de Busca */}
             <div className="flex gap-2">
               <button
-                onClick={() => setSearchType('municipio')}
+                onClick={() => { setSearchType('municipio'); setSubmittedQuery('') }}
                 className={`px-4 py-2 rounded-lg text-sm font-medium transition-colors ${
                   searchType === 'municipio'
                     ? 'bg-blue-600 text-white'
@@ -83,7 +70,7 @@ export default function PlacarTransparenciaPage() {
                 Município
               </button>
               <button
-                onClick={() => setSearchType('parlamentar')}
+                onClick={() => { setSearchType('parlamentar'); setSubmittedQuery('') }}
                 className={`px-4 py-2 rounded-lg text-sm font-medium transition-colors ${
                   searchType === 'parlamentar'
                     ? 'bg-blue-600 text-white'
@@ -116,33 +103,33 @@ export default function PlacarTransparenciaPage() {
         </div>
 
         {/* Estatísticas */}
-        {isSearching && filteredData && filteredData.length > 0 && (
+        {isSearching && resumo && resumo.total_emendas > 0 && (
           <div className="grid grid-cols-1 sm:grid-cols-4 gap-4 mb-8">
             <div className="bg-white border border-[#E5E7EB] rounded-xl shadow-sm p-4">
               <p className="text-xs font-semibold text-[#6B7280] uppercase tracking-wide mb-1">Total de Emendas</p>
-              <p className="text-2xl font-bold text-[#1F2937]">{totalEmendas}</p>
+              <p className="text-2xl font-bold text-[#1F2937]">{resumo.total_emendas}</p>
             </div>
             <div className="bg-white border border-[#E5E7EB] rounded-xl shadow-sm p-4">
               <p className="text-xs font-semibold text-[#6B7280] uppercase tracking-wide mb-1">Valor Aprovado</p>
               <p className="text-2xl font-bold text-[#1F2937]">
-                {formatCurrency(totalValor)}
+                {formatCurrency(resumo.valor_total_aprovado)}
               </p>
             </div>
             <div className="bg-white border border-[#E5E7EB] rounded-xl shadow-sm p-4">
               <p className="text-xs font-semibold text-[#6B7280] uppercase tracking-wide mb-1">Valor Pago</p>
               <p className="text-2xl font-bold text-[#1F2937]">
-                {formatCurrency(totalPago)}
+                {formatCurrency(resumo.valor_total_pago)}
               </p>
             </div>
             <div className="bg-white border border-[#E5E7EB] rounded-xl shadow-sm p-4">
               <p className="text-xs font-semibold text-[#6B7280] uppercase tracking-wide mb-1">Total de Alertas</p>
-              <p className="text-2xl font-bold text-red-600">{totalAlertas}</p>
+              <p className="text-2xl font-bold text-red-600">{resumo.total_alertas}</p>
             </div>
           </div>
         )}
 
         {/* Resultados */}
-        {isLoading && (
+        {isSearching && isLoading && (
           <div className="text-center py-12">
             <p className="text-gray-600">Carregando...</p>
           </div>
@@ -156,7 +143,7 @@ export default function PlacarTransparenciaPage() {
           </div>
         )}
 
-        {!isLoading && !error && (
+        {!(isSearching && isLoading) && !error && (
           <>
             {!isSearching && (
               <div className="bg-blue-50 border border-blue-200 rounded-lg p-6 text-center">
@@ -166,24 +153,46 @@ export default function PlacarTransparenciaPage() {
               </div>
             )}
 
-            {isSearching && filteredData && filteredData.length === 0 && (
+            {isSearching && ranking && ranking.length === 0 && (
               <div className="bg-yellow-50 border border-yellow-200 rounded-lg p-6 text-center">
                 <p className="text-yellow-800">
-                  Nenhuma emenda encontrada para "{searchQuery}"
+                  Nenhuma emenda encontrada para "{submittedQuery}"
                 </p>
               </div>
             )}
 
-            {isSearching && filteredData && filteredData.length > 0 && (
+            {isSearching && ranking && ranking.length > 0 && (
               <div>
                 <div className="mb-4">
                   <h2 className="text-xl font-semibold text-gray-900">
-                    Resultados ({filteredData.length})
+                    {searchType === 'municipio' ? 'Municípios' : 'Parlamentares'} ({ranking.length})
                   </h2>
                 </div>
                 <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-                  {filteredData.map((emenda) => (
-                    <PlacarCard key={emenda.id} emenda={emenda} />
+                  {ranking.map((item) => (
+                    <div
+                      key={`${item.nome}-${item.uf ?? ''}`}
+                      className="bg-white border border-[#E5E7EB] rounded-xl shadow-sm p-5"
+                    >
+                      <h3 className="text-lg font-semibold text-[#1F2937] mb-1">
+                        {item.nome}{item.uf ? ` - ${item.uf}` : ''}
+                      </h3>
+                      <p className="text-sm text-[#6B7280] mb-3">
+                        {item.total_emendas} {item.total_emendas === 1 ? 'emenda' : 'emendas'}
+                      </p>
+                      <dl className="grid grid-cols-2 gap-2 text-sm">
+                        <dt className="text-[#6B7280]">Aprovado</dt>
+                        <dd className="text-right font-medium">{formatCurrency(item.valor_total_aprovado)}</dd>
+                        <dt className="text-[#6B7280]">Pago</dt>
+                        <dd className="text-right font-medium">{formatCurrency(item.valor_total_pago)}</dd>
+                        <dt className="text-[#6B7280]">Execução média</dt>
+                        <dd className="text-right font-medium">{item.percentual_medio_executado.toFixed(1)}%</dd>
+                        <dt className="text-[#6B7280]">Atrasadas</dt>
+                        <dd className="text-right font-medium">{item.emendas_atrasadas}</dd>
+                        <dt className="text-[#6B7280]">Alertas</dt>
+                        <dd className="text-right font-medium text-red-600">{item.total_alertas}</dd>
+                      </dl>
+                    </div>
                   ))}
                 </div>
               </div>
@@ -0,0 +1,48 @@
+import { useQuery } from '@tanstack/react-query'
+import { api } from '@/core/api/client'
+
+export type PlacarTipo = 'municipio' | 'parlamentar'
+
+export interface PlacarMetricas {
+  total_emendas: number
+  valor_total_aprovado: number
+  valor_total_pago: number
+  valor_total_executado: number
+  percentual_medio_executado: number
+  emendas_atrasadas: number
+  total_alertas: number
+}
+
+export interface PlacarResponse {
+  success: boolean
+  tipo: PlacarTipo
+  resumo: PlacarMetricas
+  ranking: Array<PlacarMetricas & { nome: string; uf?: string | null }>
+  atualizado_em?: string | null
+}
+
+export interface PlacarParams {
+  q?: string
+  uf?: string
+  area?: string
+  ano?: number
+  limit?: number
+}
+
+export function usePlacar(tipo: PlacarTipo, params: PlacarParams = {}, enabled = true) {
+  return useQuery<PlacarResponse>({
+    queryKey: ['placar', tipo, params],
+    queryFn: async () => {
+      const searchParams = new URLSearchParams()
+      Object.entries(params).forEach(([key, value]) => {
+        if (value !== undefined && value !== null && value !== '') {
+          searchParams.append(key, String(value))
+        }
+      })
+      const query = searchParams.toString()
+      return api.get<PlacarResponse>(`/emenda-pix/placar/${tipo}${query ? `?${query}` : ''}`)
+    },
+    enabled,
+    staleTime: 60000, // 1 minuto
+  })
+}
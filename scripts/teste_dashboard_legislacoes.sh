@@ -111,13 +111,13 @@ echo ""
 # Teste de sincronização
 echo -n "Testando: POST /legislation/sync... "
 SYNC_RESPONSE=$(curl -s -X POST "$API_URL/sync?days=7" 2>/dev/null)
-if echo "$SYNC_RESPONSE" | grep -q "count\|message"; then
+if echo "$SYNC_RESPONSE" | grep -q "job_id"; then
     echo -e "${GREEN}✅ PASSOU${NC}"
     ((PASSED++))
     
-    # Verificar resposta
-    COUNT=$(echo "$SYNC_RESPONSE" | python3 -c "import sys, json; d=json.load(sys.stdin); print(d.get('count', 0))" 2>/dev/null)
-    echo "   Sincronizadas: $COUNT legislação(ões)"
+    # A sincronização roda em segundo plano: mostra o job criado
+    JOB_ID=$(echo "$SYNC_RESPONSE" | python3 -c "import sys, json; d=json.load(sys.stdin); print(d.get('job_id', ''))" 2>/dev/null)
+    echo "   Job: $JOB_ID (acompanhe em /api/v1/jobs/$JOB_ID)"
 else
     echo -e "${RED}❌ FALHOU${NC}"
     echo "   Resposta: ${SYNC_RESPONSE:0:200}..."